@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+순차 전사와 배치 전사의 처리량 비교 (CPU)
+
+같은 디렉토리의 오디오를 기존 순차 루프(transcribe_audio_with_model)와
+BatchedTranscriber로 각각 전사하고, 벽시계 1시간당 처리한 오디오 시간(audio h / wall h)을 출력합니다.
+
+사용법:
+    python benchmarks/batched_transcription_benchmark.py --input data/preprocessed --model small --batch-sizes 4 8 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.batched_transcription import BatchedTranscriber
+from src.transcription import (DECODING_OPTIONS, VAD_OPTIONS, build_transcript, load_whisper_model,
+                               transcribe_audio_with_model)
+
+
+def collect_audio_files(input_dir: str, limit: int):
+    """벤치마크 대상 오디오 파일과 총 길이(초)"""
+    audio_files = sorted(
+        str(path) for path in Path(input_dir).rglob("*")
+        if path.suffix.lower() in (".wav", ".flac", ".ogg")
+    )[:limit]
+    total_seconds = sum(sf.info(path).duration for path in audio_files)
+    return audio_files, total_seconds
+
+
+def run_sequential(audio_files, model, model_size, language, output_dir):
+    start = time.perf_counter()
+    for audio_file in audio_files:
+        transcribe_audio_with_model(audio_file, model, output_dir, model_size, language)
+    return time.perf_counter() - start
+
+
+def run_batched(audio_files, model, model_size, language, output_dir, batch_size):
+    start = time.perf_counter()
+    transcriber = BatchedTranscriber(model, batch_size, language, DECODING_OPTIONS, VAD_OPTIONS)
+    for result in transcriber.transcribe((path, path) for path in audio_files):
+        if result.error is None:
+            build_transcript(result.key, result.segments, result.info, model_size,
+                             result.processing_time).save_to_json(output_dir)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='순차 전사와 배치 전사의 처리량 비교')
+    parser.add_argument('--input', '-i', required=True, help='오디오 파일 디렉토리')
+    parser.add_argument('--model', '-m', default='small', help='Whisper 모델 크기 (기본값: small)')
+    parser.add_argument('--language', '-l', default='ko', help='언어 설정 (기본값: ko)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[4, 8, 16], help='비교할 배치 크기')
+    parser.add_argument('--limit', type=int, default=20, help='사용할 최대 파일 수 (기본값: 20)')
+    parser.add_argument('--cpu-threads', type=int, default=os.cpu_count() or 1, help='CTranslate2 CPU 스레드 수')
+    args = parser.parse_args()
+
+    audio_files, total_seconds = collect_audio_files(args.input, args.limit)
+    if not audio_files:
+        print(f"❌ 오디오 파일이 없습니다: {args.input}")
+        sys.exit(1)
+
+    model = load_whisper_model(args.model, "cpu", cpu_threads=args.cpu_threads)
+    print(f"파일 {len(audio_files)}개, 총 {total_seconds / 3600:.2f}시간, 모델={args.model}, CPU 스레드={args.cpu_threads}\n")
+    print(f"{'방식':<16} {'시간(초)':>10} {'audio h / wall h':>18}")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        elapsed = run_sequential(audio_files, model, args.model, args.language, output_dir)
+        print(f"{'순차':<16} {elapsed:10.1f} {total_seconds / elapsed:18.1f}")
+        baseline = elapsed
+
+        for batch_size in args.batch_sizes:
+            elapsed = run_batched(audio_files, model, args.model, args.language, output_dir, batch_size)
+            print(f"{f'배치 {batch_size}':<16} {elapsed:10.1f} {total_seconds / elapsed:18.1f}"
+                  f"  (순차 대비 {baseline / elapsed:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+볼륨 정규화 마이크로벤치마크
+pydub(AudioSegment.apply_gain) 경로와 numpy 제자리 정규화 경로의 시간/메모리 비교
+
+사용법:
+    python benchmarks/normalization_benchmark.py --minutes 60
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from pydub import AudioSegment
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.loudness import normalize_loudness
+from src.preprocessing import normalize_pcm, normalize_volume
+
+SAMPLE_RATE = 16000
+
+
+def make_audio(minutes: float) -> np.ndarray:
+    """통화 녹음과 비슷한 레벨의 16kHz 모노 테스트 신호 생성"""
+    rng = np.random.default_rng(0)
+    n = int(minutes * 60 * SAMPLE_RATE)
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+    speech = 0.2 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 0.1 * t) > 0)
+    return (speech + 0.01 * rng.standard_normal(n)).astype(np.float32)
+
+
+def measure(name: str, func, repeat: int):
+    """가장 빠른 실행 시간과 최대 추가 메모리 측정"""
+    best = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    print(f"{name:<32} {best * 1000:10.1f} ms {peak / 2 ** 20:10.1f} MiB")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='볼륨 정규화 마이크로벤치마크')
+    parser.add_argument('--minutes', type=float, default=60.0, help='테스트 오디오 길이 (분, 기본값: 60)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    audio = make_audio(args.minutes)
+    pcm = (audio * 32767).astype(np.int16)
+    segment = AudioSegment(pcm.tobytes(), frame_rate=SAMPLE_RATE, sample_width=2, channels=1)
+    print(f"테스트 오디오: {args.minutes:.0f}분, {SAMPLE_RATE}Hz 모노 ({audio.nbytes / 2 ** 20:.0f} MiB float32)\n")
+    print(f"{'방식':<32} {'시간':>13} {'추가 메모리':>13}")
+
+    # 기존 경로는 파일당 두 번 호출되므로 두 번 정규화를 한 단위로 측정
+    baseline = measure("pydub apply_gain (x2)",
+                       lambda: normalize_volume(normalize_volume(segment)), args.repeat)
+    measure("numpy pcm (pydub 호환, x2)",
+            lambda: normalize_pcm(normalize_pcm(pcm, 2, -20.0), 2, -20.0), args.repeat)
+
+    results = {}
+    for name, kwargs in [
+        ("numpy rms (x2, in-place)", {"method": "rms"}),
+        ("numpy ebu_r128 (x2, in-place)", {"method": "ebu_r128"}),
+        ("numpy rms + true-peak (x2)", {"method": "rms", "true_peak_limit": -1.0}),
+    ]:
+        work = audio.copy()
+        results[name] = measure(
+            name,
+            lambda: [normalize_loudness(work, SAMPLE_RATE, -20.0, **kwargs) for _ in range(2)],
+            args.repeat,
+        )
+
+    print()
+    for name, elapsed in results.items():
+        print(f"{name}: pydub 대비 {baseline / elapsed:.1f}배")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+CLI 시작 시간 벤치마크
+각 진입점 모듈의 import 시간(python -X importtime)과 `--help` 실행 시간을 측정하고,
+무거운 의존성(faster-whisper, librosa, noisereduce 등)이 시작 시점에 import되는지 확인합니다.
+
+사용법:
+    python benchmarks/startup_benchmark.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# (모듈, 스크립트) - 스크립트 실행 시와 같이 src도 import 경로에 포함
+ENTRY_POINTS = [
+    ("src.transcription", "src/transcription.py"),
+    ("src.preprocessing", "src/preprocessing.py"),
+    ("src.export", "src/export.py"),
+    ("src.extraction", "src/extraction.py"),
+    ("src.transcription_daemon", "src/transcription_daemon.py"),
+]
+
+# 시작 시점에 import되면 안 되는 무거운 의존성 (실제로 사용하는 코드 경로에서만 import)
+HEAVY_MODULES = ("faster_whisper", "ctranslate2", "av", "librosa", "noisereduce", "pydub",
+                 "scipy", "soxr", "requests", "torch")
+
+# 예산 (초) - 느린 CI에서도 통과할 수 있도록 현재 측정값(0.1~0.3초)보다 넉넉하게 설정
+IMPORT_BUDGET_S = 1.0
+HELP_BUDGET_S = 2.0
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """
+    새 인터프리터에서 모듈 하나를 import하는 시간 측정
+
+    Returns:
+        Tuple[float, List[str]]: (누적 import 시간(초), import된 모듈 이름 목록)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=_env(), capture_output=True, text=True, check=True,
+    )
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        if name.strip() == module:
+            total_us = int(cumulative)
+    return total_us / 1e6, modules
+
+
+def heavy_imports(modules: List[str]) -> List[str]:
+    """import된 모듈 중 HEAVY_MODULES에 속하는 최상위 패키지 목록"""
+    return sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+
+
+def measure_help(script: str, repeat: int = 3) -> float:
+    """`python <script> --help` 실행 시간 (가장 빠른 값, 초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, "--help"], cwd=ROOT, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI 시작 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=3, help='--help 반복 횟수 (기본값: 3)')
+    args = parser.parse_args()
+
+    print(f"{'진입점':<28} {'import':>10} {'--help':>10}  무거운 의존성")
+    for module, script in ENTRY_POINTS:
+        import_s, modules = measure_import(module)
+        help_s = measure_help(script, args.repeat)
+        heavy = ", ".join(heavy_imports(modules)) or "-"
+        print(f"{module:<28} {import_s * 1000:8.0f}ms {help_s * 1000:8.0f}ms  {heavy}")
+    print(f"\n예산: import {IMPORT_BUDGET_S:.1f}초, --help {HELP_BUDGET_S:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
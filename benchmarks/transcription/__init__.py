@@ -0,0 +1,8 @@
+"""
+전사 설정별 실시간 배율(RTF) 벤치마크
+
+model_size × compute_type × cpu_threads × num_workers × beam_size 조합을 고정된 코퍼스로 측정합니다.
+
+사용법:
+    python -m benchmarks.transcription --models small medium --beam-sizes 1 5
+"""
@@ -0,0 +1,4 @@
+from benchmarks.transcription.run import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+벤치마크 코퍼스
+
+- 합성 코퍼스: 음성과 비슷한 하모닉 신호(기본 주파수 변화, 음절 단위 포락선, 휴지 구간)로
+  VAD를 통과하는 테스트 톤을 만듭니다. 참조 텍스트가 없으므로 WER은 측정하지 않습니다.
+- 로컬 코퍼스: 오디오 파일과 같은 이름의 .txt(참조 텍스트)가 있는 디렉토리,
+  또는 [{"audio": ..., "reference": ...}] 형식의 JSON 매니페스트
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import soundfile as sf
+
+SAMPLE_RATE = 16000
+
+# 로컬 코퍼스로 인식할 오디오 확장자
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3", ".m4a")
+
+
+@dataclass
+class CorpusItem:
+    """벤치마크 오디오 한 개"""
+    audio_path: str
+    duration: float
+    reference: Optional[str] = None
+
+
+def synthesize_speech_like(seconds: float, seed: int = 0) -> np.ndarray:
+    """
+    음성과 비슷한 16kHz float32 테스트 신호 생성 (TTS 없이 재현 가능)
+
+    Args:
+        seconds (float): 길이 (초)
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: float32 모노 오디오
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    f0 = 120 + (20 * seed) % 60 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 12))
+    syllables = np.sqrt(np.clip(np.sin(2 * np.pi * 4 * t), 0, None))
+    pauses = np.sin(2 * np.pi * 0.15 * t + seed) > -0.6
+    audio = 0.2 * voice * syllables * pauses + 0.003 * rng.standard_normal(n)
+    return audio.astype(np.float32)
+
+
+def synthetic_corpus(output_dir: str, count: int = 3, seconds: float = 60.0) -> List[CorpusItem]:
+    """
+    합성 코퍼스를 WAV로 저장 (같은 설정이면 기존 파일 재사용)
+
+    Args:
+        output_dir (str): 저장 디렉토리
+        count (int): 파일 수
+        seconds (float): 파일당 길이 (초)
+
+    Returns:
+        List[CorpusItem]: 코퍼스 (참조 텍스트 없음)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    items = []
+    for index in range(count):
+        path = os.path.join(output_dir, f"synthetic_{index:02d}_{int(seconds)}s.wav")
+        if not os.path.exists(path):
+            sf.write(path, synthesize_speech_like(seconds, seed=index), SAMPLE_RATE, subtype="PCM_16")
+        items.append(CorpusItem(path, seconds))
+    return items
+
+
+def _read_reference(audio_path: Path) -> Optional[str]:
+    reference_path = audio_path.with_suffix(".txt")
+    if reference_path.exists():
+        return reference_path.read_text(encoding="utf-8").strip()
+    return None
+
+
+def load_corpus(path: str) -> List[CorpusItem]:
+    """
+    로컬 코퍼스 로드
+
+    Args:
+        path (str): 오디오 디렉토리 또는 JSON 매니페스트 경로
+
+    Returns:
+        List[CorpusItem]: 이름 순으로 정렬된 코퍼스
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        base = Path(path).parent
+        audio_refs = [(base / entry["audio"], entry.get("reference")) for entry in entries]
+    else:
+        audio_refs = [
+            (audio_path, _read_reference(audio_path))
+            for audio_path in sorted(Path(path).rglob("*"))
+            if audio_path.suffix.lower() in AUDIO_EXTENSIONS
+        ]
+
+    items = []
+    for audio_path, reference in audio_refs:
+        try:
+            duration = sf.info(str(audio_path)).duration
+        except RuntimeError:
+            # libsndfile이 읽지 못하는 형식은 디코딩하여 길이 계산
+            from faster_whisper import decode_audio
+            duration = len(decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)) / SAMPLE_RATE
+        items.append(CorpusItem(str(audio_path), duration, reference))
+    return items
@@ -0,0 +1,64 @@
+"""
+벤치마크 지표: 단어/문자 오류율, 최대 메모리 사용량
+"""
+
+import re
+import sys
+from typing import List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화 (소문자, 문장부호 제거, 공백 정리)"""
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+def edit_distance(reference: Sequence, hypothesis: Sequence) -> int:
+    """두 시퀀스의 레벤슈타인 거리 (치환/삽입/삭제 비용 1)"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref in enumerate(reference, 1):
+        current = [i]
+        for j, hyp in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref != hyp)))
+        previous = current
+    return previous[-1]
+
+
+def word_error_rate(reference: str, hypothesis: str) -> Optional[float]:
+    """
+    단어 오류율 (WER)
+
+    Returns:
+        Optional[float]: 참조 텍스트가 비어 있으면 None
+    """
+    ref_words: List[str] = normalize_text(reference).split()
+    if not ref_words:
+        return None
+    return edit_distance(ref_words, normalize_text(hypothesis).split()) / len(ref_words)
+
+
+def char_error_rate(reference: str, hypothesis: str) -> Optional[float]:
+    """
+    문자 오류율 (CER, 공백 제외) - 띄어쓰기 차이가 큰 한국어에서 WER과 함께 참고
+
+    Returns:
+        Optional[float]: 참조 텍스트가 비어 있으면 None
+    """
+    ref_chars = normalize_text(reference).replace(" ", "")
+    if not ref_chars:
+        return None
+    return edit_distance(ref_chars, normalize_text(hypothesis).replace(" ", "")) / len(ref_chars)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 상주 메모리 (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+전사 설정별 실시간 배율(RTF) 벤치마크
+
+model_size × compute_type × cpu_threads × num_workers × beam_size 조합마다
+load_whisper_model로 모델을 올리고 transcribe_audio_with_model로 코퍼스 전체를 전사하여
+RTF(처리 시간 / 오디오 길이), 최대 RSS, 첫 세그먼트 지연, WER/CER을 측정합니다.
+결과는 JSON 파일로 저장하며 --compare로 이전 결과와 비교해 성능 저하를 확인할 수 있습니다.
+
+설정마다 별도 프로세스에서 실행하므로 최대 RSS와 모델 로드 시간이 설정별로 분리됩니다.
+num_workers > 1이면 코퍼스 파일을 num_workers개씩 동시에 전사합니다.
+
+사용법:
+    # 합성 코퍼스 (WER 없음)
+    python -m benchmarks.transcription --models small medium --beam-sizes 1 5
+
+    # 참조 텍스트(오디오와 같은 이름의 .txt)가 있는 로컬 코퍼스, 이전 결과와 비교
+    python -m benchmarks.transcription --corpus data/benchmark --compute-types int8 float32 \\
+        --compare output/benchmarks/transcription_20250101_120000.json
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT))
+from benchmarks.transcription.corpus import CorpusItem, load_corpus, synthetic_corpus
+from benchmarks.transcription.metrics import char_error_rate, normalize_text, peak_rss_mb, word_error_rate
+from src.decoding import DECODING_OPTIONS, DECODING_PRESETS, DEFAULT_PRESET, get_decoding_config
+from src.transcript_cache import configure_transcript_cache
+from src.transcription import load_whisper_model, transcribe_audio_with_model
+
+# 결과 파일 구조가 바뀌면 올림
+RESULTS_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkConfig:
+    """측정할 전사 설정 조합 하나"""
+    model_size: str
+    compute_type: str = "int8"
+    cpu_threads: int = 0
+    num_workers: int = 1
+    beam_size: int = DECODING_OPTIONS["beam_size"]
+
+    @property
+    def label(self) -> str:
+        return (f"{self.model_size}/{self.compute_type}/threads={self.cpu_threads}"
+                f"/workers={self.num_workers}/beam={self.beam_size}")
+
+
+class FirstSegmentTimer:
+    """model.transcribe의 세그먼트 제너레이터에서 첫 세그먼트가 나온 시각을 기록하는 모델 래퍼"""
+
+    def __init__(self, model: Any):
+        self.model = model
+        self.first_segment_at: Optional[float] = None
+
+    def transcribe(self, audio, **kwargs):
+        segments, info = self.model.transcribe(audio, **kwargs)
+        return self._timed(segments), info
+
+    def _timed(self, segments):
+        for segment in segments:
+            if self.first_segment_at is None:
+                self.first_segment_at = time.perf_counter()
+            yield segment
+
+
+def transcribe_item(item: CorpusItem, model: Any, config: BenchmarkConfig, decoding: Any,
+                    language: Optional[str], output_dir: str) -> Dict[str, Any]:
+    """코퍼스 파일 하나를 전사하고 파일별 지표 반환"""
+    timer = FirstSegmentTimer(model)
+    start = time.perf_counter()
+    output_path = transcribe_audio_with_model(
+        item.audio_path, timer, output_dir, config.model_size, language, resume=False, decoding=decoding
+    )
+    elapsed = time.perf_counter() - start
+    with open(output_path, "r", encoding="utf-8") as f:
+        hypothesis = json.load(f)["transcript"]
+
+    result = {
+        "audio": item.audio_path,
+        "duration": item.duration,
+        "seconds": elapsed,
+        "rtf": elapsed / item.duration if item.duration else None,
+        "first_segment_latency": timer.first_segment_at - start if timer.first_segment_at else None,
+        "wer": None,
+        "cer": None,
+    }
+    if item.reference:
+        result.update(
+            wer=word_error_rate(item.reference, hypothesis),
+            cer=char_error_rate(item.reference, hypothesis),
+            reference_words=len(normalize_text(item.reference).split()),
+            reference_chars=len(normalize_text(item.reference).replace(" ", "")),
+        )
+    return result
+
+
+def _weighted(files: List[Dict[str, Any]], metric: str, weight: str) -> Optional[float]:
+    """참조 길이로 가중 평균한 코퍼스 전체 오류율"""
+    scored = [f for f in files if f[metric] is not None]
+    total = sum(f[weight] for f in scored)
+    return sum(f[metric] * f[weight] for f in scored) / total if total else None
+
+
+def run_configuration(config: BenchmarkConfig, corpus: List[CorpusItem], language: Optional[str] = "ko",
+                      decoding: str = DEFAULT_PRESET, device: Optional[str] = "cpu") -> Dict[str, Any]:
+    """
+    설정 하나로 모델을 로드하고 코퍼스 전체를 전사하여 지표 계산
+
+    Args:
+        config (BenchmarkConfig): 측정할 설정
+        corpus (List[CorpusItem]): 코퍼스
+        language (str, optional): 언어 설정
+        decoding (str): 기준 디코딩 프리셋 (beam_size는 config 값으로 대체)
+        device (str, optional): 장치 설정
+
+    Returns:
+        Dict[str, Any]: 설정별 결과 (결과 파일의 results 항목)
+    """
+    # 캐시된 결과를 재사용하면 디코딩 시간이 측정되지 않음
+    configure_transcript_cache(None)
+    decoding_config = dataclasses.replace(get_decoding_config(decoding), beam_size=config.beam_size)
+
+    start = time.perf_counter()
+    model = load_whisper_model(config.model_size, device, config.compute_type,
+                               config.cpu_threads, config.num_workers)
+    load_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=config.num_workers) as executor:
+            files = list(executor.map(
+                lambda indexed: transcribe_item(indexed[1], model, config, decoding_config, language,
+                                                os.path.join(output_dir, str(indexed[0]))),
+                enumerate(corpus),
+            ))
+        wall_seconds = time.perf_counter() - start
+
+    audio_seconds = sum(item.duration for item in corpus)
+    latencies = [f["first_segment_latency"] for f in files if f["first_segment_latency"] is not None]
+    return {
+        "config": dataclasses.asdict(config),
+        "label": config.label,
+        "decoding": decoding_config.params(),
+        "load_seconds": load_seconds,
+        "wall_seconds": wall_seconds,
+        "audio_seconds": audio_seconds,
+        "rtf": wall_seconds / audio_seconds if audio_seconds else None,
+        "first_segment_latency": {
+            "mean": sum(latencies) / len(latencies) if latencies else None,
+            "max": max(latencies) if latencies else None,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "wer": _weighted(files, "wer", "reference_words"),
+        "cer": _weighted(files, "cer", "reference_chars"),
+        "files": files,
+    }
+
+
+def run_isolated(config: BenchmarkConfig, corpus: List[CorpusItem], **kwargs) -> Dict[str, Any]:
+    """새 프로세스에서 run_configuration 실행 (최대 RSS와 모델 로드를 설정별로 분리)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_configuration, config, corpus, **kwargs).result()
+
+
+def environment_info() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    versions = {}
+    for package in ("faster-whisper", "ctranslate2", "onnxruntime"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    rtf_tolerance: float = 0.1, wer_tolerance: float = 0.01) -> List[str]:
+    """
+    같은 설정끼리 이전 결과와 비교하여 성능 저하 목록 반환
+
+    Args:
+        baseline (Dict): 이전 결과 파일 내용
+        current (Dict): 현재 결과 파일 내용
+        rtf_tolerance (float): 허용할 RTF 증가 비율 (0.1 = 10% 느려짐까지 허용)
+        wer_tolerance (float): 허용할 WER 증가량 (절대값)
+
+    Returns:
+        List[str]: 성능 저하 설명 (없으면 빈 리스트)
+    """
+    previous = {result["label"]: result for result in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get(result["label"])
+        if before is None:
+            continue
+        if before["rtf"] and result["rtf"] and result["rtf"] > before["rtf"] * (1 + rtf_tolerance):
+            regressions.append(f"{result['label']}: RTF {before['rtf']:.3f} -> {result['rtf']:.3f}")
+        if before["wer"] is not None and result["wer"] is not None \
+                and result["wer"] > before["wer"] + wer_tolerance:
+            regressions.append(f"{result['label']}: WER {before['wer']:.3f} -> {result['wer']:.3f}")
+    return regressions
+
+
+def _format(value: Optional[float], spec: str) -> str:
+    return format(value, spec) if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전사 설정별 실시간 배율(RTF) 벤치마크')
+    parser.add_argument('--corpus', help='오디오 디렉토리(같은 이름의 .txt가 참조 텍스트) 또는 JSON 매니페스트 '
+                                         '(지정하지 않으면 합성 코퍼스)')
+    parser.add_argument('--synthetic-count', type=int, default=3, help='합성 코퍼스 파일 수 (기본값: 3)')
+    parser.add_argument('--synthetic-seconds', type=float, default=60.0, help='합성 코퍼스 파일 길이 (초, 기본값: 60)')
+    parser.add_argument('--models', nargs='+', default=['small'], help='모델 크기 (기본값: small)')
+    parser.add_argument('--compute-types', nargs='+', default=['int8'], help='연산 타입 (기본값: int8)')
+    parser.add_argument('--cpu-threads', type=int, nargs='+', default=[0], help='CPU 스레드 수 (0=기본값)')
+    parser.add_argument('--num-workers', type=int, nargs='+', default=[1], help='모델 복제본/동시 전사 수')
+    parser.add_argument('--beam-sizes', type=int, nargs='+', default=[DECODING_OPTIONS["beam_size"]],
+                        help=f'빔 크기 (기본값: {DECODING_OPTIONS["beam_size"]})')
+    parser.add_argument('--decoding', choices=list(DECODING_PRESETS), default=DEFAULT_PRESET,
+                        help='기준 디코딩 프리셋 (beam_size는 --beam-sizes 값 사용)')
+    parser.add_argument('--language', '-l', default='ko', help='언어 설정 (기본값: ko)')
+    parser.add_argument('--device', default='cpu', help='장치 설정 (기본값: cpu)')
+    parser.add_argument('--output', '-o', help='결과 JSON 경로 (기본값: output/benchmarks/transcription_<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON (성능 저하가 있으면 종료 코드 1)')
+    parser.add_argument('--rtf-tolerance', type=float, default=0.1, help='허용할 RTF 증가 비율 (기본값: 0.1)')
+    parser.add_argument('--wer-tolerance', type=float, default=0.01, help='허용할 WER 증가량 (기본값: 0.01)')
+    parser.add_argument('--in-process', action='store_true',
+                        help='설정마다 새 프로세스를 만들지 않음 (최대 RSS가 누적값이 됨)')
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+        corpus_name = args.corpus
+    else:
+        corpus = synthetic_corpus(str(ROOT / "output" / "benchmarks" / "corpus"),
+                                  args.synthetic_count, args.synthetic_seconds)
+        corpus_name = f"synthetic:{args.synthetic_count}x{args.synthetic_seconds:g}s"
+    if not corpus:
+        print(f"❌ 코퍼스가 비어 있습니다: {args.corpus}")
+        sys.exit(1)
+
+    language = None if args.language.lower() == "none" else args.language
+    configs = [BenchmarkConfig(*combo) for combo in itertools.product(
+        args.models, args.compute_types, args.cpu_threads, args.num_workers, args.beam_sizes
+    )]
+    audio_seconds = sum(item.duration for item in corpus)
+    print(f"코퍼스: {corpus_name} ({len(corpus)}개 파일, {audio_seconds / 60:.1f}분), 설정 {len(configs)}개\n")
+    print(f"{'설정':<48} {'로드(초)':>8} {'RTF':>7} {'첫 세그먼트(초)':>14} {'RSS(MB)':>9} {'WER':>6} {'CER':>6}")
+
+    run = run_configuration if args.in_process else run_isolated
+    results = []
+    for config in configs:
+        result = run(config, corpus, language=language, decoding=args.decoding, device=args.device)
+        results.append(result)
+        print(f"{config.label:<48} {result['load_seconds']:8.1f} {_format(result['rtf'], '7.3f')} "
+              f"{_format(result['first_segment_latency']['mean'], '14.2f')} "
+              f"{_format(result['peak_rss_mb'], '9.0f')} "
+              f"{_format(result['wer'], '6.3f')} {_format(result['cer'], '6.3f')}")
+
+    report = {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "environment": environment_info(),
+        "corpus": {"name": corpus_name, "files": len(corpus), "audio_seconds": audio_seconds},
+        "language": language,
+        "device": args.device,
+        "results": results,
+    }
+    output_path = args.output or str(
+        ROOT / "output" / "benchmarks" / f"transcription_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, report, args.rtf_tolerance, args.wer_tolerance)
+        if regressions:
+            print("\n⚠️ 성능 저하:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\n✅ 이전 결과 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
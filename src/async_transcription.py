@@ -0,0 +1,194 @@
+"""
+asyncio용 전사 API
+
+전사 진입점은 모두 결과 JSON 경로를 반환하는 블로킹 함수이므로 asyncio 서비스에서는
+직접 스레드로 감싸야 했습니다. AsyncTranscriber는 디코딩을 전용 스레드 풀에서 실행하고
+세그먼트를 디코딩되는 대로 AudioSegment 비동기 이터레이터로 전달합니다.
+
+- 스레드 풀 크기 = 모델 복제본 수(num_workers)이므로 동시 요청이 많아도 디코딩은
+  복제본 수만큼만 실행되고 나머지는 이벤트 루프를 막지 않은 채 대기합니다.
+- 소비하는 쪽이 취소되거나 순회를 중단하면 다음 세그먼트 경계에서 디코딩을 멈추며,
+  아직 시작되지 않은 요청은 실행되지 않습니다.
+
+사용 예시:
+    async with AsyncTranscriber("medium", replicas=2) as transcriber:
+        async for segment in transcriber.transcribe("call.wav"):
+            print(segment.start, segment.text)
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional, Union
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.audio_transcript_info import AudioSegment
+from src.decoding import DecodingConfig, get_decoding_config, redecode_segments
+from src.model_registry import get_model
+from src.transcription import load_audio, sharded_model_options, transcribe_audio_with_model
+
+# 디코딩 종료 표시 (세그먼트 대기열의 마지막 항목)
+_DONE = object()
+
+
+def to_audio_segment(segment: Any, segment_id: int) -> AudioSegment:
+    """faster-whisper 세그먼트를 AudioSegment로 변환 (id는 1부터 시작하는 문자열, AudioTranscriptInfo와 동일)"""
+    audio_segment = AudioSegment(id=str(segment_id), text=segment.text, start=segment.start, end=segment.end,
+                                 channel=getattr(segment, "channel", None))
+    for word in getattr(segment, "words", None) or []:
+        audio_segment.add_word(word.word, word.start, word.end)
+    return audio_segment
+
+
+class AsyncTranscriber:
+    """고정된 수의 모델 복제본을 여러 asyncio 요청이 나누어 쓰는 전사기"""
+
+    def __init__(self,
+                 model_size: str = "medium",
+                 language: Optional[str] = "ko",
+                 device: Optional[str] = None,
+                 replicas: int = 1,
+                 decoding: Union[str, DecodingConfig, None] = None,
+                 word_timestamps: bool = True):
+        """
+        Args:
+            model_size (str): Whisper 모델 크기
+            language (str, optional): 기본 언어 설정 (None이면 자동 감지)
+            device (str, optional): 장치 설정
+            replicas (int): 모델 복제본 수 (= 동시에 디코딩하는 요청 수)
+            decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+            word_timestamps (bool): 단어 타임스탬프 포함 여부
+        """
+        if replicas < 1:
+            raise ValueError("replicas는 1 이상이어야 합니다.")
+        self.model_size = model_size
+        self.language = language
+        self.device = device
+        self.replicas = replicas
+        self.decoding = get_decoding_config(decoding)
+        self.word_timestamps = word_timestamps
+        self._executor = ThreadPoolExecutor(max_workers=replicas, thread_name_prefix="async-transcription")
+
+    def model(self) -> Any:
+        """모델 레지스트리에서 복제본 수만큼 워커를 가진 모델을 가져옴 (필요하면 로드)"""
+        return get_model(self.model_size, self.device, **sharded_model_options(self.replicas))
+
+    async def __aenter__(self) -> "AsyncTranscriber":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """대기 중인 요청을 취소하고 스레드 풀 종료 (진행 중인 디코딩은 다음 세그먼트에서 중단)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _decode(self,
+                source: Union[str, np.ndarray],
+                language: Optional[str],
+                emit: Callable[[AudioSegment], None],
+                cancelled: threading.Event):
+        """워커 스레드에서 디코딩하며 세그먼트마다 emit 호출"""
+        if cancelled.is_set():
+            return
+        audio = source if isinstance(source, np.ndarray) else None
+        if audio is None and not os.path.exists(source):
+            raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {source}")
+
+        model = self.model()
+        config = self.decoding
+        if config.adaptive and audio is None:
+            audio = load_audio(source)
+        segments, info = model.transcribe(
+            source if audio is None else audio,
+            language=language,
+            word_timestamps=self.word_timestamps,
+            vad_filter=True,
+            vad_parameters=config.vad_parameters(),
+            **config.decoding_options()
+        )
+        if config.adaptive:
+            segments = redecode_segments(model, audio, segments, config, language or info.language,
+                                         word_timestamps=self.word_timestamps)
+        try:
+            # faster-whisper는 세그먼트를 순회할 때 디코딩하므로 순회를 멈추면 남은 구간은 디코딩하지 않음
+            for segment_id, segment in enumerate(segments, 1):
+                if cancelled.is_set():
+                    logging.info("전사 요청 취소: 디코딩 중단")
+                    return
+                emit(to_audio_segment(segment, segment_id))
+        finally:
+            close = getattr(segments, "close", None)
+            if close is not None:
+                close()
+
+    async def transcribe(self,
+                         source: Union[str, np.ndarray],
+                         language: Optional[str] = "") -> AsyncIterator[AudioSegment]:
+        """
+        오디오를 전사하며 세그먼트를 디코딩되는 대로 반환하는 비동기 이터레이터
+
+        Args:
+            source (str | np.ndarray): 오디오 파일 경로 또는 16kHz float32 모노 배열
+            language (str, optional): 언어 ("" 이면 전사기 설정, None이면 자동 감지)
+
+        Yields:
+            AudioSegment: 시간순 세그먼트 (id는 1부터)
+
+        Raises:
+            FileNotFoundError: 오디오 파일이 없는 경우 (첫 세그먼트를 기다릴 때 발생)
+        """
+        loop = asyncio.get_running_loop()
+        segments: "asyncio.Queue[Any]" = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def emit(segment: AudioSegment):
+            loop.call_soon_threadsafe(segments.put_nowait, segment)
+
+        future = loop.run_in_executor(
+            self._executor, self._decode, source, self.language if language == "" else language, emit, cancelled
+        )
+        # emit과 같은 순서로 이벤트 루프에 전달되므로 모든 세그먼트 뒤에 들어감
+        future.add_done_callback(lambda _: segments.put_nowait(_DONE))
+        try:
+            while True:
+                segment = await segments.get()
+                if segment is _DONE:
+                    break
+                yield segment
+            future.result()
+        finally:
+            # 소비 중단/취소 시 시작 전이면 실행하지 않고, 디코딩 중이면 다음 세그먼트에서 멈춤
+            cancelled.set()
+            future.cancel()
+
+    async def transcribe_file(self,
+                              audio_file_path: str,
+                              output_dir: str = "output/transcript",
+                              language: Optional[str] = "") -> str:
+        """
+        transcribe_audio_with_model을 스레드 풀에서 실행하여 결과 JSON 경로를 반환
+        (JSONL 스트림, 전사 캐시, 체크포인트 재개 동작은 동기 API와 동일)
+
+        Args:
+            audio_file_path (str): 오디오 파일 경로
+            output_dir (str): 결과 JSON 파일이 저장될 디렉토리
+            language (str, optional): 언어 ("" 이면 전사기 설정, None이면 자동 감지)
+
+        Returns:
+            str: 저장된 JSON 파일 경로
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: transcribe_audio_with_model(
+                audio_file_path, self.model(), output_dir, self.model_size,
+                self.language if language == "" else language,
+                decoding=self.decoding, word_timestamps=self.word_timestamps
+            )
+        )
@@ -0,0 +1,243 @@
+"""
+디코딩된 오디오 공유 버퍼 캐시
+
+같은 녹음을 전사 단계(faster-whisper)와 내보내기 단계(export.mute_audio_segments)에서
+각각 디코딩하지 않도록, 한 번 디코딩한 float32 모노 배열을 .npy 파일로 저장해 두고
+각 단계는 np.load(mmap_mode="r")로 복사 없이 읽습니다.
+기본 위치는 /dev/shm(메모리 기반 파일 시스템)이므로 디스크 I/O 없이 프로세스 간에 공유됩니다.
+
+- 키는 파일 내용의 SHA-256 (전사 캐시와 같은 audio_sha256)
+- 원본 샘플레이트 배열({해시}.native.{sr}.npy)을 한 번 디코딩하고,
+  Whisper 입력(16kHz)처럼 다른 샘플레이트는 여기서 soxr로 리샘플링하여 ({해시}.{sr}.npy) 함께 보관
+- 전체 크기 상한을 넘으면 가장 오래 사용하지 않은 배열부터 삭제
+  (다른 프로세스가 이미 매핑한 배열은 삭제되어도 계속 읽을 수 있음)
+- 녹음 내용이 담기므로 디렉토리는 0o700, 배열 파일은 0o600으로 만들어 다른 사용자가 읽지 못하게 함
+- faster-whisper 내부 디코더(PyAV) 대신 soundfile+soxr로 디코딩하므로 Whisper 입력이 조금 달라질 수 있음
+  (전사 매니페스트/캐시/스트림 파라미터에 AUDIO_BUFFER_DECODER로 구분)
+"""
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.lazy_import import lazy_import
+from src.transcript_cache import audio_sha256
+
+sf = lazy_import("soundfile")
+soxr = lazy_import("soxr")
+
+# 기본 캐시 크기 상한 (MB)
+DEFAULT_BUFFER_SIZE_MB = 2048.0
+
+# 버퍼를 거친 Whisper 입력의 디코딩 방식 (전사 설정 파라미터 "audio_decoder" 값)
+AUDIO_BUFFER_DECODER = "soundfile+soxr"
+
+# 공유 메모리가 있으면 /dev/shm, 없으면 임시 디렉토리 사용
+DEFAULT_BUFFER_DIR = os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+                                  "deid-audio-buffers")
+
+
+def read_audio(audio_path: str) -> Tuple[np.ndarray, int]:
+    """
+    오디오 파일을 원본 샘플레이트의 float32 모노 배열로 디코딩
+    (WAV 등은 soundfile로 바로 읽고, libsndfile이 읽지 못하는 형식만 librosa 사용)
+
+    Args:
+        audio_path (str): 오디오 파일 경로
+
+    Returns:
+        Tuple[np.ndarray, int]: (float32 모노 오디오 배열, 샘플레이트)
+    """
+    try:
+        audio, sr = sf.read(audio_path, dtype='float32')
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+    except sf.LibsndfileError:
+        import librosa
+        audio, sr = librosa.load(audio_path, sr=None)
+    return audio, sr
+
+
+class AudioBufferCache:
+    """크기 상한이 있는 LRU 디코딩 오디오 캐시 (.npy 메모리 매핑)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_BUFFER_DIR, max_size_mb: float = DEFAULT_BUFFER_SIZE_MB):
+        # 이미 있던 디렉토리도 소유자만 접근하도록 제한 (다른 사용자의 디렉토리면 PermissionError)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        os.chmod(cache_dir, 0o700)
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = int(max_size_mb * 2 ** 20)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+
+        # 기존 배열을 마지막 사용 시각(mtime) 순으로 색인 (다른 프로세스가 만든 배열 포함)
+        entries = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".npy"):
+                stat = os.stat(os.path.join(cache_dir, name))
+                entries.append((stat.st_mtime_ns, name, stat.st_size))
+        self.entries: "OrderedDict[str, int]" = OrderedDict(
+            (name, size) for _, name, size in sorted(entries)
+        )
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def _find_native(self, audio_hash: str) -> Optional[str]:
+        """원본 샘플레이트 배열 이름 (디렉토리를 다시 확인하여 다른 프로세스가 만든 배열도 찾음)"""
+        prefix = f"{audio_hash}.native."
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name.endswith(".npy"):
+                return name
+        return None
+
+    def _open(self, name: str) -> Optional[np.ndarray]:
+        """배열을 읽기 전용 메모리 매핑으로 열기 (없거나 손상되었으면 None)"""
+        path = self._path(name)
+        try:
+            audio = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (OSError, ValueError):
+            self._remove(name)
+            return None
+        self.entries[name] = audio.nbytes
+        self.entries.move_to_end(name)
+        return audio
+
+    def _store(self, name: str, audio: np.ndarray) -> np.ndarray:
+        """배열 저장 후 메모리 매핑으로 다시 열기 (크기 상한을 넘으면 오래 사용하지 않은 배열부터 삭제)"""
+        path = self._path(name)
+        tmp_path = self._path(f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as f:
+            np.save(f, np.ascontiguousarray(audio, dtype=np.float32))
+        os.replace(tmp_path, path)
+        self.entries[name] = os.path.getsize(path)
+        self.entries.move_to_end(name)
+        while self.size_bytes() > self.max_bytes and len(self.entries) > 1:
+            self._remove(next(iter(self.entries)))
+            self.stats["evictions"] += 1
+        return np.load(path, mmap_mode="r")
+
+    def load(self, audio_path: str, sample_rate: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """
+        디코딩된 오디오를 읽기 전용 배열로 가져옴 (없으면 디코딩하여 저장)
+
+        Args:
+            audio_path (str): 오디오 파일 경로
+            sample_rate (int, optional): 원하는 샘플레이트 (None이면 원본 샘플레이트)
+
+        Returns:
+            Tuple[np.ndarray, int]: (읽기 전용 float32 모노 배열, 샘플레이트)
+        """
+        audio_hash = audio_sha256(audio_path)
+        with self._lock:
+            if sample_rate is not None:
+                audio = self._open(f"{audio_hash}.{sample_rate}.npy")
+                if audio is not None:
+                    self.stats["hits"] += 1
+                    return audio, sample_rate
+
+            native_name = self._find_native(audio_hash)
+            native = self._open(native_name) if native_name else None
+            if native is not None:
+                self.stats["hits"] += 1
+                native_rate = int(native_name.split(".")[2])
+            else:
+                self.stats["misses"] += 1
+                logging.info(f"오디오 디코딩 후 공유 버퍼에 저장: {os.path.basename(audio_path)}")
+                decoded, native_rate = read_audio(audio_path)
+                native = self._store(f"{audio_hash}.native.{native_rate}.npy", decoded)
+
+            if sample_rate is None or sample_rate == native_rate:
+                return native, native_rate
+
+            # 디코딩 없이 공유된 원본 배열에서 리샘플링
+            resampled = soxr.resample(native, native_rate, sample_rate)
+            return self._store(f"{audio_hash}.{sample_rate}.npy", resampled), sample_rate
+
+    def _remove(self, name: str):
+        """배열 삭제"""
+        self.entries.pop(name, None)
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def size_bytes(self) -> int:
+        """캐시 배열 전체 크기 (바이트)"""
+        return sum(self.entries.values())
+
+    def clear(self):
+        """모든 배열 삭제"""
+        with self._lock:
+            for name in list(self.entries):
+                self._remove(name)
+
+
+def _cache_from_env() -> Optional[AudioBufferCache]:
+    """환경변수 설정으로 캐시 생성 (AUDIO_BUFFER_CACHE_DIR이 없으면 사용 안 함)"""
+    cache_dir = os.getenv("AUDIO_BUFFER_CACHE_DIR")
+    if not cache_dir:
+        return None
+    max_size_mb = float(os.getenv("AUDIO_BUFFER_CACHE_MB") or DEFAULT_BUFFER_SIZE_MB)
+    return AudioBufferCache(cache_dir, max_size_mb)
+
+
+# 프로세스 전역 캐시 (처음 요청될 때 환경변수로 생성)
+_audio_buffer_cache: Optional[AudioBufferCache] = None
+_configured = False
+
+
+def get_audio_buffer_cache() -> Optional[AudioBufferCache]:
+    """프로세스 전역 오디오 버퍼 캐시를 가져옵니다 (설정되지 않았으면 None)."""
+    global _audio_buffer_cache, _configured
+    if not _configured:
+        _audio_buffer_cache = _cache_from_env()
+        _configured = True
+    return _audio_buffer_cache
+
+
+def configure_audio_buffer_cache(cache_dir: Optional[str],
+                                 max_size_mb: float = DEFAULT_BUFFER_SIZE_MB) -> Optional[AudioBufferCache]:
+    """
+    프로세스 전역 오디오 버퍼 캐시 설정
+
+    Args:
+        cache_dir (str, optional): 캐시 디렉토리 (None이면 캐시 사용 안 함, 기본 위치는 DEFAULT_BUFFER_DIR)
+        max_size_mb (float): 캐시 크기 상한 (MB)
+
+    Returns:
+        Optional[AudioBufferCache]: 설정된 캐시
+    """
+    global _audio_buffer_cache, _configured
+    _audio_buffer_cache = AudioBufferCache(cache_dir, max_size_mb) if cache_dir else None
+    _configured = True
+    logging.info(f"오디오 버퍼 캐시: {cache_dir or '사용 안 함'}")
+    return _audio_buffer_cache
+
+
+def load_audio_buffer(audio_path: str, sample_rate: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    캐시가 설정되어 있으면 공유 버퍼에서, 아니면 직접 디코딩하여 오디오를 가져옴
+
+    Args:
+        audio_path (str): 오디오 파일 경로
+        sample_rate (int, optional): 원하는 샘플레이트 (None이면 원본 샘플레이트)
+
+    Returns:
+        Tuple[np.ndarray, int]: (float32 모노 배열, 샘플레이트), 캐시를 사용하면 읽기 전용 배열
+    """
+    cache = get_audio_buffer_cache()
+    if cache is not None:
+        return cache.load(audio_path, sample_rate)
+    audio, sr = read_audio(audio_path)
+    if sample_rate is not None and sample_rate != sr:
+        audio, sr = soxr.resample(audio, sr, sample_rate), sample_rate
+    return audio, sr
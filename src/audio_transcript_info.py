@@ -1,35 +1,433 @@
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import json
 import os
-from pydantic import BaseModel
+import threading
+
+import numpy as np
+
+# orjson이 설치되어 있으면 JSON 인코딩/디코딩에 사용 (선택 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 @dataclass
 class WordTimestamp:
-    """단어별 타임스탬프 정보를 저장하는 클래스"""
+    """단어별 타임스탬프 정보를 저장하는 클래스 (AudioSegment.words에 추가할 때 사용하는 독립 레코드)"""
     word: str
     start: float
     end: float
     is_pii: bool = False  # 개인정보 여부
 
-@dataclass
-class AudioSegment:
-    """음성 파일의 세그먼트 정보를 저장하는 클래스"""
-    id: int
-    text: str
-    start: float
-    end: float
-    words: List[WordTimestamp] = None
+class WordStore:
+    """
+    전사 전체 단어의 열 기반 저장소
+    
+    단어마다 객체를 만들지 않고 start/end/is_pii를 NumPy 배열로, 단어 텍스트를 하나의 문자열 버퍼와
+    오프셋으로 보관합니다. 세그먼트 i의 단어는 segment_offsets[i]:segment_offsets[i + 1] 범위이며,
+    AudioSegment.words는 이 범위를 가리키는 WordList 뷰입니다.
+    
+    단어는 대부분 마지막 세그먼트 뒤에 추가되므로(전사, JSON 로드) 배열 용량을 두 배씩 늘려 추가하고,
+    앞쪽 세그먼트에 단어를 채우는 경우(단어 정렬)에만 뒤쪽 단어를 한 칸씩 밀어 넣습니다.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.segment_count = 0
+        self._starts = np.zeros(capacity, dtype=np.float64)
+        self._ends = np.zeros(capacity, dtype=np.float64)
+        self._is_pii = np.zeros(capacity, dtype=bool)
+        self._text_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._segment_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._text = ""
+        self._pending_text: List[str] = []  # 아직 버퍼에 합치지 않은 뒤쪽 단어 텍스트
+    
+    @property
+    def starts(self) -> np.ndarray:
+        """단어 시작 시간 (초)"""
+        return self._starts[:self.size]
+    
+    @property
+    def ends(self) -> np.ndarray:
+        """단어 끝 시간 (초)"""
+        return self._ends[:self.size]
+    
+    @property
+    def is_pii(self) -> np.ndarray:
+        """단어 개인정보 여부 (쓰기 가능한 뷰)"""
+        return self._is_pii[:self.size]
+    
+    @property
+    def text_offsets(self) -> np.ndarray:
+        """단어 i의 텍스트는 text[text_offsets[i]:text_offsets[i + 1]]"""
+        return self._text_offsets[:self.size + 1]
+    
+    @property
+    def segment_offsets(self) -> np.ndarray:
+        """세그먼트 i의 단어는 segment_offsets[i]:segment_offsets[i + 1] 범위"""
+        return self._segment_offsets[:self.segment_count + 1]
+    
+    @property
+    def text(self) -> str:
+        """모든 단어 텍스트를 이어 붙인 버퍼"""
+        if self._pending_text:
+            self._text += "".join(self._pending_text)
+            self._pending_text = []
+        return self._text
+    
+    @property
+    def nbytes(self) -> int:
+        """사용 중인 배열과 텍스트 버퍼의 크기 (바이트, 예상치)"""
+        return self.size * (8 + 8 + 1 + 8) + self.segment_count * 8 + len(self.text.encode("utf-8"))
+    
+    def _reserve(self, words: int = 0, segments: int = 0):
+        """단어/세그먼트 배열 용량 확보 (두 배씩 증가)"""
+        if self.size + words > len(self._starts):
+            capacity = max(self.size + words, 2 * len(self._starts))
+            for name in ("_starts", "_ends", "_is_pii"):
+                array = getattr(self, name)
+                grown = np.zeros(capacity, dtype=array.dtype)
+                grown[:self.size] = array[:self.size]
+                setattr(self, name, grown)
+            offsets = np.zeros(capacity + 1, dtype=np.int64)
+            offsets[:self.size + 1] = self._text_offsets[:self.size + 1]
+            self._text_offsets = offsets
+        if self.segment_count + segments + 1 > len(self._segment_offsets):
+            offsets = np.zeros(max(self.segment_count + segments + 1, 2 * len(self._segment_offsets)),
+                               dtype=np.int64)
+            offsets[:self.segment_count + 1] = self._segment_offsets[:self.segment_count + 1]
+            self._segment_offsets = offsets
+    
+    def add_segment(self) -> int:
+        """빈 세그먼트를 끝에 추가하고 세그먼트 번호(0부터) 반환"""
+        self._reserve(segments=1)
+        self.segment_count += 1
+        self._segment_offsets[self.segment_count] = self.size
+        return self.segment_count - 1
+    
+    def segment_range(self, segment: int) -> Tuple[int, int]:
+        """세그먼트의 단어 범위 [시작, 끝)"""
+        return int(self._segment_offsets[segment]), int(self._segment_offsets[segment + 1])
+    
+    def word(self, row: int) -> str:
+        """단어 텍스트"""
+        return self.text[self._text_offsets[row]:self._text_offsets[row + 1]]
+    
+    def words(self, start: int, end: int) -> List[str]:
+        """범위 [start, end)의 단어 텍스트 목록"""
+        text = self.text
+        offsets = self._text_offsets[start:end + 1].tolist()
+        return [text[a:b] for a, b in zip(offsets, offsets[1:])]
+    
+    def append(self, segment: int, word: str, start: float, end: float, is_pii: bool = False):
+        """세그먼트의 마지막 단어로 추가"""
+        self._reserve(words=1)
+        row = int(self._segment_offsets[segment + 1])
+        size = self.size
+        text_pos = int(self._text_offsets[row])
+        if row == size:
+            # 마지막 위치에 추가 (뒤쪽 세그먼트가 모두 비어 있음)
+            self._pending_text.append(word)
+            self._text_offsets[row + 1] = text_pos + len(word)
+        else:
+            # 뒤쪽 단어를 한 칸씩 밀고 삽입
+            text = self.text
+            self._text = text[:text_pos] + word + text[text_pos:]
+            for array in (self._starts, self._ends, self._is_pii):
+                array[row + 1:size + 1] = array[row:size]
+            self._text_offsets[row + 1:size + 2] = self._text_offsets[row:size + 1] + len(word)
+        self._starts[row] = start
+        self._ends[row] = end
+        self._is_pii[row] = bool(is_pii)
+        self.size += 1
+        self._segment_offsets[segment + 1:self.segment_count + 1] += 1
+    
+    def load_columns(self, words: List[str], starts: List[float], ends: List[float], is_pii: List[bool],
+                     segment_sizes: List[int]):
+        """
+        단어가 없는 저장소에 세그먼트별 단어 열을 한 번에 채움 (JSON 로드용)
+        
+        Args:
+            words, starts, ends, is_pii: 모든 세그먼트의 단어 열 (세그먼트 순서)
+            segment_sizes: 세그먼트별 단어 수 (길이 = segment_count)
+        """
+        if self.size or len(segment_sizes) != self.segment_count:
+            raise ValueError("load_columns는 단어가 없는 저장소의 세그먼트 수와 같은 segment_sizes가 필요합니다.")
+        count = len(words)
+        self._reserve(words=count)
+        self._starts[:count] = starts
+        self._ends[:count] = ends
+        self._is_pii[:count] = is_pii
+        self._text_offsets[1:count + 1] = np.cumsum([len(word) for word in words])
+        self._segment_offsets[1:self.segment_count + 1] = np.cumsum(segment_sizes)
+        self._text = "".join(words)
+        self._pending_text = []
+        self.size = count
+    
+    def clear_segment(self, segment: int):
+        """세그먼트의 단어 모두 삭제"""
+        first, last = self.segment_range(segment)
+        count = last - first
+        if count == 0:
+            return
+        text = self.text
+        text_first, text_last = int(self._text_offsets[first]), int(self._text_offsets[last])
+        self._text = text[:text_first] + text[text_last:]
+        size = self.size
+        for array in (self._starts, self._ends, self._is_pii):
+            array[first:size - count] = array[last:size]
+        self._text_offsets[first:size - count + 1] = self._text_offsets[last:size + 1] - (text_last - text_first)
+        self.size -= count
+        self._segment_offsets[segment + 1:self.segment_count + 1] -= count
+
+class WordView:
+    """WordStore의 단어 하나를 가리키는 뷰 (segments[i].words[j], 속성 변경은 저장소에 반영)"""
+    __slots__ = ("_store", "_segment", "_index")
+    
+    def __init__(self, store: WordStore, segment: int, index: int):
+        self._store = store
+        self._segment = segment
+        self._index = index  # 세그먼트 안에서의 순서 (앞쪽 세그먼트에 단어가 추가되어도 유지)
+    
+    @property
+    def _row(self) -> int:
+        return int(self._store._segment_offsets[self._segment]) + self._index
+    
+    @property
+    def word(self) -> str:
+        return self._store.word(self._row)
+    
+    @property
+    def start(self) -> float:
+        return float(self._store._starts[self._row])
+    
+    @start.setter
+    def start(self, value: float):
+        self._store._starts[self._row] = value
+    
+    @property
+    def end(self) -> float:
+        return float(self._store._ends[self._row])
+    
+    @end.setter
+    def end(self, value: float):
+        self._store._ends[self._row] = value
+    
+    @property
+    def is_pii(self) -> bool:
+        return bool(self._store._is_pii[self._row])
+    
+    @is_pii.setter
+    def is_pii(self, value: bool):
+        self._store._is_pii[self._row] = bool(value)
+    
+    def _fields(self) -> tuple:
+        return self.word, self.start, self.end, self.is_pii
+    
+    def __eq__(self, other) -> bool:
+        if not all(hasattr(other, name) for name in ("word", "start", "end", "is_pii")):
+            return NotImplemented
+        return self._fields() == (other.word, other.start, other.end, other.is_pii)
+    
+    def __repr__(self) -> str:
+        return f"WordTimestamp(word={self.word!r}, start={self.start}, end={self.end}, is_pii={self.is_pii})"
 
-    def __post_init__(self):
-        if self.words is None:
-            self.words = []
+class WordList:
+    """
+    세그먼트 하나의 단어 목록 뷰 (기존 List[WordTimestamp]와 같이 사용)
+    
+    starts/ends/is_pii는 저장소 배열의 해당 범위 뷰이므로 배열 단위로 읽고 쓸 수 있습니다.
+    """
+    __slots__ = ("_store", "_segment")
+    
+    def __init__(self, store: WordStore, segment: int):
+        self._store = store
+        self._segment = segment
+    
+    def _slice(self) -> slice:
+        return slice(*self._store.segment_range(self._segment))
+    
+    @property
+    def starts(self) -> np.ndarray:
+        return self._store._starts[self._slice()]
+    
+    @property
+    def ends(self) -> np.ndarray:
+        return self._store._ends[self._slice()]
+    
+    @property
+    def is_pii(self) -> np.ndarray:
+        return self._store._is_pii[self._slice()]
+    
+    @property
+    def texts(self) -> List[str]:
+        """단어 텍스트 목록"""
+        return self._store.words(*self._store.segment_range(self._segment))
+    
+    def __len__(self) -> int:
+        first, last = self._store.segment_range(self._segment)
+        return last - first
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [WordView(self._store, self._segment, i) for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("word index out of range")
+        return WordView(self._store, self._segment, index)
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield WordView(self._store, self._segment, index)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, WordList)):
+            return NotImplemented
+        return list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def append(self, word):
+        """단어 추가 (word, start, end, is_pii 속성을 가진 객체)"""
+        self._store.append(self._segment, word.word, word.start, word.end, getattr(word, "is_pii", False))
+    
+    def extend(self, words):
+        for word in words:
+            self.append(word)
+    
+    def clear(self):
+        self._store.clear_segment(self._segment)
 
+class AudioSegment:
+    """음성 파일의 세그먼트 정보를 저장하는 클래스 (단어는 WordStore에 열 단위로 저장)"""
+    __slots__ = ("id", "text", "start", "end", "channel", "_store", "_index")
+    
+    def __init__(self, id: str, text: str, start: float, end: float,
+                 words: Optional[List[WordTimestamp]] = None, channel: Optional[int] = None,
+                 store: Optional[WordStore] = None):
+        self.id = id
+        self.text = text
+        self.start = start
+        self.end = end
+        self.channel = channel  # 채널 분리 전사의 채널 번호 (0=왼쪽, 1=오른쪽, 모노 전사이면 None)
+        # 전사에 속한 세그먼트는 전사 전체의 저장소를, 단독 세그먼트는 자체 저장소를 사용
+        self._store = store if store is not None else WordStore(capacity=max(4, len(words or [])))
+        self._index = self._store.add_segment()
+        if words:
+            self.words.extend(words)
+    
+    @property
+    def words(self) -> WordList:
+        return WordList(self._store, self._index)
+    
+    @words.setter
+    def words(self, words):
+        word_list = self.words
+        word_list.clear()
+        word_list.extend(words or [])
+    
     def add_word(self, word: str, start: float, end: float):
         """단어 타임스탬프 정보 추가"""
-        word_timestamp = WordTimestamp(word, start, end)
-        self.words.append(word_timestamp)
+        self._store.append(self._index, word, start, end)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AudioSegment):
+            return NotImplemented
+        return ((self.id, self.text, self.start, self.end, self.channel, list(self.words)) ==
+                (other.id, other.text, other.start, other.end, other.channel, list(other.words)))
+    
+    def __repr__(self) -> str:
+        return (f"AudioSegment(id={self.id!r}, text={self.text!r}, start={self.start}, end={self.end}, "
+                f"words={self.words!r}, channel={self.channel!r})")
+
+class JsonSerializer:
+    """
+    전사 JSON 직렬화 방식
+    
+    backend="auto"이면 orjson이 설치되어 있을 때 orjson을, 아니면 표준 json을 사용합니다.
+    compact=True이면 들여쓰기 없이 저장하며(파일 크기 약 40% 감소), 읽을 때는 형식과 관계없이 모두 읽습니다.
+    """
+    
+    BACKENDS = ("auto", "orjson", "json")
+    
+    def __init__(self, backend: str = "auto", compact: bool = False):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"알 수 없는 JSON 백엔드: {backend} (사용 가능: {', '.join(self.BACKENDS)})")
+        if backend == "orjson" and orjson is None:
+            raise ImportError("orjson이 설치되어 있지 않습니다: pip install orjson")
+        if backend == "auto":
+            backend = "orjson" if orjson is not None else "json"
+        self.backend = backend
+        self.compact = compact
+    
+    def dumps(self, data: Any) -> bytes:
+        """UTF-8 JSON 바이트로 인코딩"""
+        if self.backend == "orjson":
+            option = orjson.OPT_SERIALIZE_NUMPY | (0 if self.compact else orjson.OPT_INDENT_2)
+            return orjson.dumps(data, option=option)
+        if self.compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    
+    def loads(self, payload: bytes) -> Any:
+        """JSON 바이트/문자열 디코딩"""
+        if self.backend == "orjson":
+            return orjson.loads(payload)
+        return json.loads(payload)
+    
+    def dump_file(self, data: Any, path: str):
+        """JSON 파일로 저장 (임시 파일에 쓴 뒤 이름을 바꾸므로 읽는 쪽은 완성된 파일만 봄)"""
+        directory, name = os.path.split(path)
+        tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(self.dumps(data))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def load_file(self, path: str) -> Any:
+        """JSON 파일 읽기"""
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+
+def _serializer_from_env() -> JsonSerializer:
+    """환경변수 설정으로 직렬화 방식 생성 (TRANSCRIPT_JSON_BACKEND, TRANSCRIPT_JSON_COMPACT)"""
+    return JsonSerializer(os.getenv("TRANSCRIPT_JSON_BACKEND") or "auto",
+                          os.getenv("TRANSCRIPT_JSON_COMPACT", "").lower() in ("1", "true", "yes"))
+
+# 프로세스 전역 직렬화 방식 (처음 요청될 때 환경변수로 생성)
+_json_serializer: Optional[JsonSerializer] = None
+
+def get_json_serializer() -> JsonSerializer:
+    """프로세스 전역 JSON 직렬화 방식을 가져옵니다."""
+    global _json_serializer
+    if _json_serializer is None:
+        _json_serializer = _serializer_from_env()
+    return _json_serializer
+
+def configure_json_serializer(backend: str = "auto", compact: bool = False) -> JsonSerializer:
+    """
+    프로세스 전역 JSON 직렬화 방식 설정
+    
+    Args:
+        backend (str): "auto"(orjson 우선), "orjson", "json"
+        compact (bool): 들여쓰기 없이 저장
+    
+    Returns:
+        JsonSerializer: 설정된 직렬화 방식
+    """
+    global _json_serializer
+    _json_serializer = JsonSerializer(backend, compact)
+    return _json_serializer
 
 class AudioTranscriptInfo:
     """음성 파일의 전사 정보를 저장하고 관리하는 클래스"""
@@ -39,9 +437,14 @@ class AudioTranscriptInfo:
         self.file_name: str = os.path.basename(audio_path)
         self.transcript: str = ""
         self.segments: List[AudioSegment] = []
+        self.word_store: WordStore = WordStore()  # 모든 세그먼트의 단어 (열 단위)
         self.processing_time: float = 0.0
         self.processed_date: datetime = datetime.now()
         self.model_info: Optional[str] = None
+        # 세그먼트 id/텍스트 색인 (segments 목록이 바뀌면 처음 조회할 때 다시 생성)
+        self._indexed_segments: Tuple[int, int] = (0, -1)
+        self._id_index: Dict[str, AudioSegment] = {}
+        self._text_index: Tuple[str, List[int]] = ("", [])
         
     def add_transcript(self, text: str, processing_time: float = 0.0, model_info: Optional[str] = None):
         """전체 전사 텍스트 추가"""
@@ -50,23 +453,84 @@ class AudioTranscriptInfo:
         self.processed_date = datetime.now()
         self.model_info = model_info
         
-    def add_segment(self, start: float, end: float, text: str) -> AudioSegment:
-        """세그먼트 정보 추가"""
-        segment_id = str(len(self.segments) + 1)  # 1부터 시작하는 단순 숫자
-        segment = AudioSegment(id=segment_id, text=text, start=start, end=end)
+    def add_segment(self, start: float, end: float, text: str, channel: Optional[int] = None,
+                    segment_id: Optional[Any] = None) -> AudioSegment:
+        """세그먼트 정보 추가 (segment_id가 없으면 1부터 시작하는 순번, id는 항상 문자열)"""
+        if segment_id is None:
+            segment_id = len(self.segments) + 1
+        segment = AudioSegment(id=str(segment_id), text=text, start=start, end=end, channel=channel,
+                               store=self.word_store)
         self.segments.append(segment)
         return segment
+    
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """텍스트 검색용 정규화 (소문자, 연속 공백을 공백 하나로)"""
+        return " ".join(text.lower().split())
+    
+    def _segment_indexes(self):
+        """segments 목록이 교체되었거나 길이가 바뀌었으면 id/텍스트 색인을 다시 생성"""
+        key = (id(self.segments), len(self.segments))
+        if self._indexed_segments != key:
+            self._id_index = {str(segment.id): segment for segment in reversed(self.segments)}
+            # 정규화한 세그먼트 텍스트를 구분 문자(\x00)로 이어 붙이고 각 세그먼트의 시작 위치를 기록
+            texts = [self.normalize_text(segment.text).replace("\x00", "") for segment in self.segments]
+            offsets = np.zeros(len(texts), dtype=np.int64)
+            if texts:
+                offsets[1:] = np.cumsum([len(text) + 1 for text in texts[:-1]])
+            self._text_index = ("\x00".join(texts), offsets.tolist())
+            self._indexed_segments = key
+    
+    def segment_by_id(self, segment_id: Any) -> Optional[AudioSegment]:
+        """
+        id로 세그먼트 찾기 (문자열/정수 id 모두 가능, 같은 id가 여러 개이면 첫 세그먼트)
         
-    def save_to_json(self, output_dir: str):
-        """전사 정보를 JSON 파일로 저장"""
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        base_name = os.path.splitext(self.file_name)[0]
-        timestamp = self.processed_date.strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(output_dir, f"{base_name}_{timestamp}.json")
+        Args:
+            segment_id: 세그먼트 id (예: "3" 또는 3)
+        
+        Returns:
+            Optional[AudioSegment]: 찾은 세그먼트 (없으면 None)
+        """
+        self._segment_indexes()
+        key = str(segment_id)
+        segment = self._id_index.get(key)
+        if segment is not None and str(segment.id) != key:
+            # 색인 생성 후 id를 직접 바꾼 경우
+            self._indexed_segments = (0, -1)
+            self._segment_indexes()
+            segment = self._id_index.get(key)
+        return segment
+    
+    def find_segment_by_text(self, text: str) -> Optional[AudioSegment]:
+        """
+        텍스트를 포함하는 첫 세그먼트 찾기 (대소문자와 공백 차이는 무시)
+        
+        Args:
+            text (str): 찾을 텍스트
         
-        data = {
+        Returns:
+            Optional[AudioSegment]: 찾은 세그먼트 (없으면 None)
+        """
+        query = self.normalize_text(text).replace("\x00", "")
+        if not query:
+            return None
+        self._segment_indexes()
+        joined, offsets = self._text_index
+        position = joined.find(query)
+        if position < 0:
+            return None
+        return self.segments[bisect_right(offsets, position) - 1]
+        
+    def to_dict(self) -> dict:
+        """전사 정보를 JSON 파일과 같은 구조의 dict로 변환"""
+        # 단어 열을 한 번에 Python 값으로 변환한 뒤 세그먼트 범위별로 나눔
+        store = self.word_store
+        words = [
+            {"word": word, "start": start, "end": end, "is_pii": is_pii}
+            for word, start, end, is_pii in zip(store.words(0, store.size), store.starts.tolist(),
+                                                store.ends.tolist(), store.is_pii.tolist())
+        ]
+        return {
             "audio_file": self.audio_path,  # 전체 경로로 변경
             "transcript": self.transcript,
             "processing_time": self.processing_time,
@@ -78,62 +542,195 @@ class AudioTranscriptInfo:
                     "start": seg.start,
                     "end": seg.end,
                     "text": seg.text,
-                    "words": [
-                        {
-                            "word": word.word,
-                            "start": word.start,
-                            "end": word.end,
-                            "is_pii": word.is_pii
-                        }
-                        for word in seg.words
-                    ] if seg.words else []
+                    "words": (words[slice(*store.segment_range(seg._index))] if seg._store is store else
+                              [{"word": w.word, "start": w.start, "end": w.end, "is_pii": w.is_pii}
+                               for w in seg.words]),
+                    # 채널 분리 전사에서만 기록 (기존 모노 전사 결과와 같은 구조 유지)
+                    **({"channel": seg.channel} if seg.channel is not None else {})
                 }
                 for seg in self.segments
             ]
         }
+
+    def save_to_json(self, output_dir: str):
+        """전사 정보를 JSON 파일로 저장"""
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+            
+        base_name = os.path.splitext(self.file_name)[0]
+        timestamp = self.processed_date.strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(output_dir, f"{base_name}_{timestamp}.json")
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        get_json_serializer().dump_file(self.to_dict(), output_path)
             
         return output_path
     
     def load_from_json(self, json_path: str) -> bool:
         """JSON 파일에서 전사 정보 로드"""
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                
-            self.audio_path = data["audio_file"]  # 전체 경로 로드
-            self.file_name = os.path.basename(self.audio_path)
-            self.transcript = data["transcript"]
-            self.processing_time = data["processing_time"]
-            self.processed_date = datetime.fromisoformat(data["processed_date"])
-            self.model_info = data.get("model_info")  # 이전 버전 호환성을 위해 get 사용
-            
-            self.segments = []
-            for seg_data in data["segments"]:
-                segment = self.add_segment(
-                    seg_data["start"],
-                    seg_data["end"],
-                    seg_data["text"]
-                )
-                
-                # id 필드 수정 (이전 버전과의 호환성을 위해)
-                if "id" in seg_data:
-                    segment.id = seg_data["id"]
-                
-                # 단어 타임스탬프 정보 로드
-                if "words" in seg_data:
-                    for word_data in seg_data["words"]:
-                        word_timestamp = WordTimestamp(
-                            word_data["word"],
-                            word_data["start"],
-                            word_data["end"],
-                            word_data.get("is_pii")
-                        )
-                        segment.words.append(word_timestamp)
-                
+            data = get_json_serializer().load_file(json_path)
+            self.load_from_dict(data)
             return True
         except Exception as e:
             print(f"JSON 파일 로드 실패: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+    def load_from_dict(self, data: dict):
+        """JSON 파일과 같은 구조의 dict에서 전사 정보 로드"""
+        self.audio_path = data["audio_file"]  # 전체 경로 로드
+        self.file_name = os.path.basename(self.audio_path)
+        self.transcript = data["transcript"]
+        self.processing_time = data["processing_time"]
+        self.processed_date = datetime.fromisoformat(data["processed_date"])
+        self.model_info = data.get("model_info")  # 이전 버전 호환성을 위해 get 사용
+        
+        self.segments = []
+        self.word_store = WordStore()
+        words, starts, ends, is_pii, segment_sizes = [], [], [], [], []
+        for seg_data in data["segments"]:
+            # id가 없거나 정수인 이전 버전 파일도 문자열 id로 통일
+            self.add_segment(
+                seg_data["start"],
+                seg_data["end"],
+                seg_data["text"],
+                seg_data.get("channel"),
+                seg_data.get("id")
+            )
+            
+            # 단어 타임스탬프 정보는 열로 모아 마지막에 한 번에 저장
+            word_data_list = seg_data.get("words") or []
+            segment_sizes.append(len(word_data_list))
+            for word_data in word_data_list:
+                words.append(word_data["word"])
+                starts.append(word_data["start"])
+                ends.append(word_data["end"])
+                is_pii.append(bool(word_data.get("is_pii")))
+        self.word_store.load_columns(words, starts, ends, is_pii, segment_sizes)
+ 
+
+class TranscriptJsonReader:
+    """
+    전사 JSON을 문서 전체를 메모리에 올리지 않고 세그먼트 단위로 읽는 클래스
+    
+    최상위 객체의 키를 앞에서부터 하나씩 디코딩하고, "segments" 배열은 원소를 하나씩 반환합니다.
+    들여쓰기 여부와 관계없이 기존 save_to_json 결과를 그대로 읽습니다.
+    
+    사용 예시:
+        reader = TranscriptJsonReader("call_20250101_120000.json")
+        print(reader.header["audio_file"])
+        for segment in reader.iter_segments():
+            print(segment.id, segment.text)
+    """
+    
+    CHUNK_SIZE = 1 << 16
+    
+    def __init__(self, json_path: str, chunk_size: int = CHUNK_SIZE):
+        self.json_path = json_path
+        self.chunk_size = chunk_size
+        self._header: Optional[Dict[str, Any]] = None
+    
+    @property
+    def header(self) -> Dict[str, Any]:
+        """segments 앞에 있는 최상위 필드 (audio_file, transcript, processing_time 등)"""
+        if self._header is None:
+            self._header = {}
+            for key, value in self._iter_document(stop_at_segments=True):
+                self._header[key] = value
+        return self._header
+    
+    def iter_segment_dicts(self) -> Iterator[Dict[str, Any]]:
+        """세그먼트를 JSON과 같은 구조의 dict로 하나씩 반환"""
+        for key, value in self._iter_document():
+            if key == "segments":
+                yield value
+    
+    def iter_segments(self) -> Iterator[AudioSegment]:
+        """세그먼트를 AudioSegment(단독 저장소)로 하나씩 반환"""
+        for seg_data in self.iter_segment_dicts():
+            yield AudioSegment(
+                id=seg_data.get("id"),
+                text=seg_data["text"],
+                start=seg_data["start"],
+                end=seg_data["end"],
+                words=[WordTimestamp(word["word"], word["start"], word["end"], bool(word.get("is_pii")))
+                       for word in seg_data.get("words", [])],
+                channel=seg_data.get("channel"),
+            )
+    
+    def _iter_document(self, stop_at_segments: bool = False) -> Iterator[Tuple[str, Any]]:
+        """(키, 값) 반환, segments는 원소마다 ("segments", 원소)"""
+        decoder = json.JSONDecoder()
+        with open(self.json_path, "r", encoding="utf-8") as f:
+            buffer = ""
+            pos = 0
+            eof = False
+            
+            def fill() -> bool:
+                """버퍼에 다음 청크를 이어 붙임 (파일 끝이면 False)"""
+                nonlocal buffer, pos, eof
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                return True
+            
+            def skip_whitespace():
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                        pos += 1
+                    if pos < len(buffer) or not fill():
+                        return
+            
+            def expect(chars: str) -> str:
+                nonlocal pos
+                skip_whitespace()
+                if pos >= len(buffer) or buffer[pos] not in chars:
+                    found = buffer[pos:pos + 20] if pos < len(buffer) else "EOF"
+                    raise ValueError(f"전사 JSON 형식 오류: {chars!r} 예상, {found!r} 발견 ({self.json_path})")
+                pos += 1
+                return buffer[pos - 1]
+            
+            def decode_value() -> Any:
+                """다음 JSON 값 디코딩 (값이 청크 경계에 걸리면 더 읽어서 다시 시도)"""
+                nonlocal pos
+                skip_whitespace()
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                        # 숫자는 청크 경계에서 잘린 채로 디코딩될 수 있으므로 ("1."은 1로 디코딩)
+                        # 값 뒤에 구분 문자(공백, 쉼표, 닫는 괄호)가 있어야 완료
+                        if eof or (end < len(buffer) and buffer[end] in " \t\r\n,}]"):
+                            pos = end
+                            return value
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    fill()
+            
+            expect("{")
+            skip_whitespace()
+            if buffer[pos:pos + 1] == "}":
+                return
+            while True:
+                key = decode_value()
+                expect(":")
+                if key == "segments":
+                    if stop_at_segments:
+                        return
+                    expect("[")
+                    skip_whitespace()
+                    if buffer[pos:pos + 1] == "]":
+                        pos += 1
+                    else:
+                        while True:
+                            yield key, decode_value()
+                            if expect(",]") == "]":
+                                break
+                else:
+                    yield key, decode_value()
+                if expect(",}") == "}":
+                    return
+
@@ -0,0 +1,255 @@
+"""
+여러 파일의 VAD 청크를 묶어 배치로 전사하는 엔진
+
+faster-whisper의 BatchedInferencePipeline은 파일 하나의 청크만 배치로 묶습니다.
+이 모듈은 여러 파일에서 나온 VAD 청크(최대 30초)를 하나의 대기열에 넣고
+batch_size개씩 모델에 전달한 뒤, 결과 세그먼트와 단어 타임스탬프를 원래 파일의
+시간축으로 되돌려 파일별로 반환합니다. 파일 하나만 넣으면
+BatchedInferencePipeline.transcribe와 같은 결과를 얻습니다.
+
+주의: faster-whisper 1.1 이상의 공개되지 않은 내부 API에 의존합니다
+(BatchedInferencePipeline.forward(features, tokenizer, chunks_metadata, options),
+직접 생성하는 TranscriptionOptions, vad.collect_chunks, restore_speech_timestamps).
+faster-whisper 1.2.1 기준으로 작성되었으므로 버전을 올릴 때는 이 모듈의 테스트를 먼저 확인하세요.
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio, pad_or_trim
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.transcribe import (Segment, TranscriptionInfo, TranscriptionOptions, Word,
+                                       get_suppressed_tokens, restore_speech_timestamps)
+from faster_whisper.vad import VadOptions, collect_chunks, get_speech_timestamps
+
+# 배치 전사 입력: 파일 경로, 16kHz float32 배열, 또는 배열을 반환하는 함수
+AudioSource = Union[str, np.ndarray, Callable[[], np.ndarray]]
+
+
+@dataclass
+class FileResult:
+    """파일 하나의 배치 전사 결과"""
+    key: str
+    segments: List[Segment] = field(default_factory=list)
+    info: Optional[TranscriptionInfo] = None
+    processing_time: float = 0.0
+    error: Optional[Exception] = None
+
+
+@dataclass
+class _FileState:
+    """배치 대기열에 청크가 남아 있는 파일의 진행 상태"""
+    key: str
+    clip_timestamps: List[dict]
+    chunks: List[np.ndarray]
+    chunks_metadata: List[Dict[str, Any]]
+    language: str
+    language_probability: float
+    duration: float
+    duration_after_vad: float
+    started_at: float
+    outputs: Dict[int, List[dict]] = field(default_factory=dict)
+    error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        return self.error is not None or len(self.outputs) == len(self.chunks)
+
+
+class BatchedTranscriber:
+    """여러 파일의 VAD 청크를 batch_size개씩 묶어 전사하는 클래스"""
+
+    def __init__(self,
+                 model: WhisperModel,
+                 batch_size: int = 8,
+                 language: Optional[str] = "ko",
+                 decoding_options: Optional[Dict[str, Any]] = None,
+                 vad_options: Optional[Dict[str, Any]] = None,
+                 word_timestamps: bool = True):
+        self.model = model
+        self.pipeline = BatchedInferencePipeline(model)
+        self.batch_size = batch_size
+        self.language = language
+        self.decoding_options = dict(decoding_options or {})
+        self.word_timestamps = word_timestamps
+        self.sampling_rate = model.feature_extractor.sampling_rate
+        self.chunk_length = model.feature_extractor.chunk_length
+
+        # BatchedInferencePipeline과 같이 VAD 구간은 청크 길이를 넘지 않도록 제한
+        vad_options = dict(vad_options or {})
+        vad_options["max_speech_duration_s"] = min(
+            vad_options.get("max_speech_duration_s", self.chunk_length), self.chunk_length
+        )
+        self.vad_options = VadOptions(**vad_options)
+        self._contexts: Dict[str, Tuple[Tokenizer, TranscriptionOptions]] = {}
+
+    def _decoding_context(self, language: str) -> Tuple[Tokenizer, TranscriptionOptions]:
+        """언어별 토크나이저와 디코딩 옵션 (BatchedInferencePipeline.transcribe와 같은 설정)"""
+        if language not in self._contexts:
+            tokenizer = Tokenizer(self.model.hf_tokenizer, self.model.model.is_multilingual,
+                                  task="transcribe", language=language)
+            temperature = self.decoding_options.get("temperature", 0.0)
+            options = TranscriptionOptions(
+                beam_size=self.decoding_options.get("beam_size", 5),
+                best_of=self.decoding_options.get("best_of", 5),
+                patience=self.decoding_options.get("patience", 1),
+                length_penalty=self.decoding_options.get("length_penalty", 1),
+                repetition_penalty=self.decoding_options.get("repetition_penalty", 1),
+                no_repeat_ngram_size=self.decoding_options.get("no_repeat_ngram_size", 0),
+                log_prob_threshold=-1.0,
+                no_speech_threshold=0.6,
+                compression_ratio_threshold=2.4,
+                condition_on_previous_text=False,
+                prompt_reset_on_temperature=0.5,
+                temperatures=list(temperature[:1]) if isinstance(temperature, (list, tuple)) else [temperature],
+                initial_prompt=None,
+                prefix=None,
+                suppress_blank=True,
+                suppress_tokens=get_suppressed_tokens(tokenizer, [-1]),
+                without_timestamps=True,
+                max_initial_timestamp=0.0,
+                word_timestamps=self.word_timestamps,
+                prepend_punctuations="\"'“¿([{-",
+                append_punctuations="\"'.。,，!！?？:：”)]}、",
+                multilingual=False,
+                max_new_tokens=None,
+                clip_timestamps=[],
+                hallucination_silence_threshold=None,
+                hotwords=None,
+            )
+            self._contexts[language] = (tokenizer, options)
+        return self._contexts[language]
+
+    def _features(self, chunk: np.ndarray) -> np.ndarray:
+        """청크의 log-mel 특징 (30초 길이로 맞춤)"""
+        return pad_or_trim(self.model.feature_extractor(chunk)[..., :-1])
+
+    def _prepare(self, key: str, audio: AudioSource) -> _FileState:
+        """파일을 디코딩하고 VAD로 청크를 나누어 대기열에 넣을 상태 생성"""
+        started_at = time.time()
+        if callable(audio):
+            audio = audio()
+        if not isinstance(audio, np.ndarray):
+            audio = decode_audio(audio, sampling_rate=self.sampling_rate)
+        duration = audio.shape[0] / self.sampling_rate
+
+        clip_timestamps = get_speech_timestamps(audio, self.vad_options)
+        if clip_timestamps:
+            chunks, chunks_metadata = collect_chunks(audio, clip_timestamps, max_duration=self.chunk_length)
+        else:
+            chunks, chunks_metadata = [], []
+        duration_after_vad = sum(c["end"] - c["start"] for c in clip_timestamps) / self.sampling_rate
+
+        if self.language is not None:
+            language, language_probability = self.language, 1.0
+        elif chunks:
+            features = np.concatenate([self.model.feature_extractor(chunk)[..., :-1] for chunk in chunks], axis=1)
+            language, language_probability, _ = self.model.detect_language(features=features)
+        else:
+            language, language_probability = "en", 0.0
+
+        return _FileState(key, clip_timestamps, chunks, chunks_metadata, language,
+                          language_probability, duration, duration_after_vad, started_at)
+
+    def _run_batch(self, batch: List[Tuple[_FileState, int]], language: str):
+        """대기열의 청크 batch_size개를 한 번에 전사하고 파일별 결과에 저장"""
+        tokenizer, options = self._decoding_context(language)
+        features = np.stack([self._features(state.chunks[index]) for state, index in batch])
+        metadata = [state.chunks_metadata[index] for state, index in batch]
+        try:
+            outputs = self.pipeline.forward(features, tokenizer, metadata, options)
+        except Exception as e:
+            # 배치가 실패하면 해당 배치에 청크가 있던 파일은 모두 실패 처리
+            for state, _ in batch:
+                state.error = e
+            return
+        for (state, index), output in zip(batch, outputs):
+            state.outputs[index] = output
+
+    def _finish(self, state: _FileState) -> FileResult:
+        """파일의 모든 청크 결과를 원래 시간축의 세그먼트로 변환"""
+        processing_time = time.time() - state.started_at
+        if state.error is not None:
+            return FileResult(state.key, error=state.error, processing_time=processing_time)
+
+        _, options = self._decoding_context(state.language)
+        info = TranscriptionInfo(
+            language=state.language,
+            language_probability=state.language_probability,
+            duration=state.duration,
+            duration_after_vad=state.duration_after_vad,
+            all_language_probs=None,
+            transcription_options=options,
+            vad_options=self.vad_options,
+        )
+        segments = []
+        for index in range(len(state.chunks)):
+            for output in state.outputs[index]:
+                segments.append(Segment(
+                    id=len(segments) + 1,
+                    seek=output["seek"],
+                    start=round(output["start"], 3),
+                    end=round(output["end"], 3),
+                    text=output["text"],
+                    tokens=output["tokens"],
+                    avg_logprob=output["avg_logprob"],
+                    compression_ratio=output["compression_ratio"],
+                    no_speech_prob=output["no_speech_prob"],
+                    words=[Word(**word) for word in output["words"]] if options.word_timestamps else None,
+                    temperature=options.temperatures[0],
+                ))
+        # VAD로 제거된 무음 구간을 되돌려 원본 파일 기준 시간으로 변환
+        segments = list(restore_speech_timestamps(segments, state.clip_timestamps, self.sampling_rate))
+        return FileResult(state.key, segments, info, processing_time)
+
+    def transcribe(self, items: Iterable[Tuple[str, AudioSource]]) -> Iterator[FileResult]:
+        """
+        여러 파일을 배치로 전사
+
+        파일은 입력 순서대로 대기열에 들어가며, 청크가 모두 전사된 파일부터 결과를 반환합니다.
+        대기열에는 배치 하나를 채우는 데 필요한 파일만 올라가므로 메모리 사용량이 파일 수와 무관합니다.
+
+        Args:
+            items (Iterable[Tuple[str, AudioSource]]): (파일 식별자, 오디오)
+                오디오는 파일 경로, 16kHz float32 배열, 또는 배열을 반환하는 함수
+                (함수는 해당 파일이 대기열에 들어갈 때 호출되며 예외는 파일 실패로 처리)
+
+        Yields:
+            FileResult: 파일별 전사 결과 (실패한 파일은 error 설정)
+        """
+        queues: Dict[str, Deque[Tuple[_FileState, int]]] = {}
+        # 입력 순서를 유지하기 위한 진행 중 목록 (디코딩에 실패한 파일은 FileResult로 보관)
+        in_flight: Deque[Union[_FileState, FileResult]] = deque()
+
+        def drain(flush: bool) -> Iterator[FileResult]:
+            for language, queue in queues.items():
+                while len(queue) >= self.batch_size or (flush and queue):
+                    batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+                    # 앞선 배치에서 실패한 파일의 청크는 건너뜀
+                    batch = [(state, index) for state, index in batch if state.error is None]
+                    if batch:
+                        self._run_batch(batch, language)
+            # 완료된 파일은 입력 순서대로 반환
+            while in_flight and (isinstance(in_flight[0], FileResult) or in_flight[0].done):
+                item = in_flight.popleft()
+                yield item if isinstance(item, FileResult) else self._finish(item)
+
+        for key, audio in items:
+            try:
+                state = self._prepare(key, audio)
+            except Exception as e:
+                logging.error(f"❌ 디코딩 실패: {key} - {e}")
+                in_flight.append(FileResult(key, error=e))
+                continue
+
+            in_flight.append(state)
+            queues.setdefault(state.language, deque()).extend(
+                (state, index) for index in range(len(state.chunks))
+            )
+            yield from drain(flush=False)
+
+        yield from drain(flush=True)
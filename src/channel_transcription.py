@@ -0,0 +1,105 @@
+"""
+스테레오 통화 녹음을 채널별로 나누어 병렬 전사하는 모듈
+
+의사/환자 회선 녹음처럼 화자마다 채널이 분리된 녹음을 모노로 합치면
+겹쳐 말하는 구간(crosstalk)이 인식을 떨어뜨립니다. 이 모듈은 각 채널을 독립된 작업으로
+num_workers개의 모델 복제본(CTranslate2 워커)에 스레드로 나누어 전사하고,
+세그먼트에 채널 번호를 붙여 시간순으로 합칩니다.
+"""
+import dataclasses
+import heapq
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 채널 분리 전사의 기본 채널 수 (스테레오)
+STEREO_CHANNELS = 2
+
+
+def channel_count(audio_file_path: str) -> int:
+    """오디오 파일의 채널 수 (faster-whisper와 같은 PyAV로 읽음)"""
+    import av
+    with av.open(audio_file_path) as container:
+        return container.streams.audio[0].codec_context.channels
+
+
+def channel_audit_paths(audit_path: Optional[str], count: int) -> List[str]:
+    """채널별 전처리 결과 WAV 경로 (call.wav -> call_ch0.wav, call_ch1.wav, 채널이 하나면 그대로)"""
+    if not audit_path:
+        return []
+    if count <= 1:
+        return [audit_path]
+    root, ext = os.path.splitext(audit_path)
+    return [f"{root}_ch{channel}{ext}" for channel in range(count)]
+
+
+def tag_channel(segment: Any, channel: int) -> Any:
+    """세그먼트에 channel 속성을 붙인 사본 (faster-whisper Segment에는 channel 필드가 없음)"""
+    if dataclasses.is_dataclass(segment):
+        fields = {field.name: getattr(segment, field.name) for field in dataclasses.fields(segment)}
+        return SimpleNamespace(**fields, channel=channel)
+    return type(segment)(**{**vars(segment), "channel": channel})
+
+
+def interleave_channels(channel_segments: Sequence[Iterable[Any]]) -> List[Any]:
+    """
+    채널별 세그먼트 목록을 시작 시간순으로 합치는 함수
+
+    각 채널의 세그먼트는 이미 시간순이므로 병합 정렬로 합치고,
+    시작 시간이 같으면 채널 번호가 작은 쪽을 먼저 둡니다.
+
+    Args:
+        channel_segments (Sequence[Iterable]): 채널 번호 순서의 세그먼트 목록
+
+    Returns:
+        List[Any]: channel 속성이 붙은 시간순 세그먼트 목록
+    """
+    tagged = [[tag_channel(segment, channel) for segment in segments]
+              for channel, segments in enumerate(channel_segments)]
+    return list(heapq.merge(*tagged, key=lambda segment: (segment.start, segment.channel)))
+
+
+def transcribe_channels(model: Any,
+                        channels: Sequence[np.ndarray],
+                        language: Optional[str] = "ko",
+                        redecode: Optional[Callable[[np.ndarray, Iterable[Any], Any], Iterable[Any]]] = None,
+                        **transcribe_options) -> Tuple[List[Any], Any]:
+    """
+    채널마다 독립적으로 병렬 전사한 뒤 시간순으로 합치는 함수
+
+    모델은 num_workers >= 채널 수로 로드되어야 채널별 transcribe 호출이 실제로 병렬 실행됩니다.
+
+    Args:
+        model (WhisperModel): 로드된 모델
+        channels (Sequence[np.ndarray]): 채널별 16kHz float32 오디오
+        language (str, optional): 언어 설정 (None이면 채널마다 감지)
+        redecode (Callable, optional): 채널별 (오디오, 세그먼트, 전사 정보)를 받아 세그먼트를 다시 반환하는
+            후처리 (적응형 디코딩의 재디코딩 단계, 워커 스레드에서 실행)
+        **transcribe_options: model.transcribe에 전달할 옵션
+
+    Returns:
+        Tuple[List[Segment], TranscriptionInfo]: channel 속성이 붙은 시간순 세그먼트와 첫 채널의 전사 정보
+            (duration은 가장 긴 채널 기준)
+    """
+    logging.info(f"채널 분리 전사: {len(channels)}개 채널 병렬 처리")
+
+    def run_channel(audio: np.ndarray):
+        segments, info = model.transcribe(audio, language=language, **transcribe_options)
+        if redecode is not None:
+            segments = redecode(audio, segments, info)
+        # 디코딩은 세그먼트를 순회할 때 수행되므로 워커 스레드에서 끝까지 소비
+        return list(segments), info
+
+    with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+        results = list(executor.map(run_channel, channels))
+
+    for channel, (segments, info) in enumerate(results):
+        logging.info(f"채널 {channel}: 세그먼트 {len(segments)}개 (언어: {info.language})")
+    info = results[0][1]
+    if dataclasses.is_dataclass(info):
+        info = dataclasses.replace(info, duration=max(channel_info.duration for _, channel_info in results))
+    return interleave_channels([segments for segments, _ in results]), info
@@ -0,0 +1,176 @@
+"""
+전사 디코딩 설정과 프리셋
+
+모든 전사 경로(순차, 통합, 배치, 샤드)가 같은 디코딩/VAD 설정을 사용하도록 한 곳에서 정의합니다.
+
+프리셋:
+    fast      greedy 디코딩 (beam_size=1)
+    balanced  기존 기본값 (beam_size=5, patience=1.2)
+    accurate  넓은 빔 (beam_size=8, patience=1.5)
+    adaptive  greedy로 먼저 디코딩하고, 평균 로그 확률이 낮거나 압축률이 높은
+              (반복/환각 의심) 세그먼트만 빔 서치로 다시 디코딩
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from src.sharded_transcription import shift_segment
+
+if TYPE_CHECKING:
+    from faster_whisper.vad import VadOptions
+
+# 디코딩 설정 (balanced 프리셋, 전사 함수 공통)
+DECODING_OPTIONS = {
+    "beam_size": 5,        # 빔 서치 크기
+    "temperature": 0.0,
+    "patience": 1.2,
+}
+
+# VAD 설정 (모든 프리셋 공통)
+VAD_OPTIONS = {
+    "threshold": 0.3,
+    "neg_threshold": 0.15,
+    "min_speech_duration_ms": 1200,
+    "max_speech_duration_s": 30,
+    "min_silence_duration_ms": 2000,
+    "speech_pad_ms": 1000,
+}
+
+
+@dataclass(frozen=True)
+class DecodingConfig:
+    """전사 디코딩 설정"""
+    beam_size: int = DECODING_OPTIONS["beam_size"]
+    patience: float = DECODING_OPTIONS["patience"]
+    temperature: float = DECODING_OPTIONS["temperature"]
+    vad: Dict[str, Any] = field(default_factory=lambda: VAD_OPTIONS)
+    # 적응형 모드: 첫 디코딩 결과가 아래 기준을 넘는 세그먼트만 fallback 설정으로 다시 디코딩
+    adaptive: bool = False
+    fallback_beam_size: int = DECODING_OPTIONS["beam_size"]
+    fallback_patience: float = DECODING_OPTIONS["patience"]
+    logprob_threshold: float = -1.0
+    compression_ratio_threshold: float = 2.4
+
+    def decoding_options(self) -> Dict[str, Any]:
+        """model.transcribe에 전달할 디코딩 옵션 (첫 디코딩)"""
+        return {"beam_size": self.beam_size, "temperature": self.temperature, "patience": self.patience}
+
+    def fallback_options(self) -> Dict[str, Any]:
+        """적응형 모드에서 다시 디코딩할 때의 옵션"""
+        return {"beam_size": self.fallback_beam_size, "temperature": self.temperature,
+                "patience": self.fallback_patience}
+
+    def vad_parameters(self) -> "VadOptions":
+        """model.transcribe에 전달할 VAD 옵션"""
+        from faster_whisper.vad import VadOptions
+        return VadOptions(**self.vad)
+
+    def params(self) -> Dict[str, Any]:
+        """
+        결과에 영향을 주는 설정 (매니페스트/캐시 키용)
+
+        적응형이 아니면 기존 매니페스트와 같은 형태이므로 balanced 설정의 기존 결과는 그대로 유효합니다.
+        """
+        params = {"decoding": self.decoding_options(), "vad": self.vad}
+        if self.adaptive:
+            params["adaptive"] = {
+                **self.fallback_options(),
+                "logprob_threshold": self.logprob_threshold,
+                "compression_ratio_threshold": self.compression_ratio_threshold,
+            }
+        return params
+
+    def needs_redecode(self, segment: Any) -> bool:
+        """첫 디코딩 결과가 다시 디코딩할 대상인지 여부"""
+        return (getattr(segment, "avg_logprob", 0.0) < self.logprob_threshold
+                or getattr(segment, "compression_ratio", 0.0) > self.compression_ratio_threshold)
+
+
+# 이름으로 선택 가능한 프리셋
+DECODING_PRESETS: Dict[str, DecodingConfig] = {
+    "fast": DecodingConfig(beam_size=1, patience=1.0),
+    "balanced": DecodingConfig(),
+    "accurate": DecodingConfig(beam_size=8, patience=1.5),
+    "adaptive": DecodingConfig(beam_size=1, patience=1.0, adaptive=True),
+}
+
+DEFAULT_PRESET = "balanced"
+
+
+def get_decoding_config(decoding: Union[str, DecodingConfig, None] = None) -> DecodingConfig:
+    """
+    프리셋 이름 또는 설정 객체를 DecodingConfig로 변환
+
+    Args:
+        decoding: 프리셋 이름, DecodingConfig, 또는 None(기본 프리셋)
+
+    Returns:
+        DecodingConfig: 디코딩 설정
+
+    Raises:
+        ValueError: 알 수 없는 프리셋 이름인 경우
+    """
+    if decoding is None:
+        decoding = DEFAULT_PRESET
+    if isinstance(decoding, DecodingConfig):
+        return decoding
+    if decoding not in DECODING_PRESETS:
+        raise ValueError(f"알 수 없는 디코딩 프리셋입니다: {decoding} "
+                         f"(사용 가능: {', '.join(DECODING_PRESETS)})")
+    return DECODING_PRESETS[decoding]
+
+
+def redecode_segments(model: Any,
+                      audio: np.ndarray,
+                      segments: Iterable[Any],
+                      config: DecodingConfig,
+                      language: Optional[str] = "ko",
+                      sample_rate: int = 16000,
+                      word_timestamps: bool = True) -> Iterator[Any]:
+    """
+    적응형 모드의 두 번째 단계: 기준을 넘는 세그먼트만 빔 서치로 다시 디코딩하는 제너레이터
+
+    세그먼트 구간의 오디오만 잘라 VAD 없이 다시 전사하고 타임스탬프를 원래 위치로 옮깁니다.
+    앞 세그먼트의 텍스트를 프롬프트로 넘겨 순차 디코딩과 비슷한 문맥을 유지합니다.
+    다시 디코딩한 결과가 비어 있으면 첫 디코딩 결과를 그대로 사용합니다.
+
+    Args:
+        model (WhisperModel): 로드된 모델
+        audio (np.ndarray): 16kHz float32 모노 오디오 (세그먼트 시간 기준)
+        segments (Iterable): 첫 디코딩 세그먼트
+        config (DecodingConfig): 적응형 디코딩 설정
+        language (str, optional): 언어 설정
+        sample_rate (int): 샘플레이트
+        word_timestamps (bool): 다시 디코딩할 때 단어 타임스탬프 포함 여부
+
+    Yields:
+        Segment: 최종 세그먼트
+    """
+    total = redecoded = 0
+    previous_text = None
+    for segment in segments:
+        total += 1
+        if config.needs_redecode(segment):
+            start = max(0, int(segment.start * sample_rate))
+            end = min(audio.size, int(np.ceil(segment.end * sample_rate)))
+            new_segments, _ = model.transcribe(
+                audio[start:end],
+                language=language,
+                word_timestamps=word_timestamps,
+                vad_filter=False,
+                initial_prompt=previous_text,
+                **config.fallback_options()
+            )
+            new_segments = [shift_segment(new, start / sample_rate) for new in new_segments]
+            if new_segments:
+                redecoded += 1
+                for new in new_segments:
+                    yield new
+                previous_text = new_segments[-1].text
+                continue
+        previous_text = segment.text
+        yield segment
+    logging.info(f"적응형 디코딩: {total}개 세그먼트 중 {redecoded}개 빔 서치로 다시 디코딩")
+
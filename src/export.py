@@ -1,11 +1,45 @@
-import json
 import numpy as np
-import librosa
 import soundfile as sf
 import os
+import sys
 from typing import List, Tuple, Dict, Any
 from pathlib import Path
 
+# 매니페스트 모듈 import를 위한 경로 설정
+sys.path.append(str(Path(__file__).parent.parent))
+from src.audio_transcript_info import configure_json_serializer, get_json_serializer
+from src.audio_buffer_cache import DEFAULT_BUFFER_DIR, DEFAULT_BUFFER_SIZE_MB, configure_audio_buffer_cache, \
+    load_audio_buffer
+from src.manifest import StageManifest
+
+# PII 구간 병합 여백 (초)
+MERGE_MARGIN = 0.1
+
+
+def export_params() -> Dict[str, Any]:
+    """비식별화 출력 결과에 영향을 주는 설정 (매니페스트 파라미터)"""
+    return {
+        "merge_margin": MERGE_MARGIN,
+        "mask_token": "***",
+    }
+
+
+def export_output_paths(json_path: str, output_dir: str) -> Tuple[str, str]:
+    """
+    입력 JSON에 대한 비식별화 오디오/JSON 출력 경로를 반환합니다.
+    
+    Args:
+        json_path (str): 입력 JSON 파일 경로
+        output_dir (str): 출력 디렉토리
+        
+    Returns:
+        Tuple[str, str]: (묵음 처리된 오디오 경로, 마스킹된 JSON 경로)
+    """
+    input_filename = Path(json_path).stem
+    output_audio_path = os.path.join(output_dir, "audio", f"{input_filename}_deid.wav")
+    output_json_path = os.path.join(output_dir, "json", f"{input_filename}_deid.json")
+    return output_audio_path, output_json_path
+
 
 def load_processed_json(json_path: str) -> Dict[str, Any]:
     """
@@ -17,8 +51,7 @@ def load_processed_json(json_path: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: JSON 데이터
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json_serializer().load_file(json_path)
 
 
 def extract_pii_segments(json_data: Dict[str, Any]) -> List[Tuple[float, float]]:
@@ -34,57 +67,64 @@ def extract_pii_segments(json_data: Dict[str, Any]) -> List[Tuple[float, float]]
     """
     pii_segments = []
     
-    # 모든 세그먼트의 모든 단어를 하나의 리스트로 수집
-    all_words = []
+    # 모든 세그먼트의 단어를 시간순 리스트로 수집
+    # 단어 타임스탬프 없이 전사된 세그먼트(PII 없음)는 세그먼트 전체를 non-PII 단어로 두어
+    # 앞뒤 PII 블록의 경계 확장이 이 세그먼트를 넘어가지 않도록 함
+    # 채널 분리 전사 결과는 채널마다 따로 수집하여 경계 단어를 같은 채널(화자)에서 찾음
+    words_by_channel: Dict[Any, List[Dict[str, Any]]] = {}
     for segment in json_data.get('segments', []):
-        all_words.extend(segment.get('words', []))
+        words = segment.get('words', [])
+        if not words and segment.get('text', '').strip():
+            words = [{'word': segment['text'], 'start': segment.get('start', 0.0),
+                      'end': segment.get('end', 0.0), 'is_pii': False}]
+        words_by_channel.setdefault(segment.get('channel'), []).extend(words)
     
+    for all_words in words_by_channel.values():
+        pii_segments.extend(_extract_pii_blocks(all_words))
+    return sorted(pii_segments)
+
+
+def pii_block_bounds(is_pii: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    연속된 PII 단어 블록의 첫 단어/마지막 단어 인덱스를 배열 연산으로 찾습니다.
+    
+    Args:
+        is_pii (np.ndarray): 시간순 단어의 PII 여부 (bool)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (블록 첫 단어 인덱스, 블록 마지막 단어 인덱스)
+    """
+    edges = np.diff(np.concatenate(([0], is_pii.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def _extract_pii_blocks(all_words: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+    """시간순 단어 목록에서 연속된 PII 블록의 확장 구간 추출 (extract_pii_segments 참고)"""
     if not all_words:
-        return pii_segments
+        return []
     
-    # 연속된 PII 블록 찾기
-    i = 0
-    while i < len(all_words):
-        word = all_words[i]
+    # 단어 열을 배열로 모아 블록 경계와 확장 구간을 한 번에 계산
+    starts = np.array([word.get('start', 0.0) for word in all_words], dtype=np.float64)
+    ends = np.array([word.get('end', 0.0) for word in all_words], dtype=np.float64)
+    is_pii = np.array([bool(word.get('is_pii', False)) for word in all_words])
+    first, last = pii_block_bounds(is_pii)
+    
+    # 시작점: 이전 단어의 끝 시간 (이전 단어가 없으면 PII 블록의 시작 시간)
+    extended_starts = np.where(first > 0, ends[np.maximum(first - 1, 0)], starts[first])
+    # 끝점: 다음 단어의 시작 시간 (다음 단어가 없으면 PII 블록의 끝 시간)
+    has_next = last + 1 < len(all_words)
+    extended_ends = np.where(has_next, starts[np.minimum(last + 1, len(all_words) - 1)], ends[last])
+    
+    pii_segments = []
+    for block_first, block_last, extended_start_time, extended_end_time in zip(
+            first.tolist(), last.tolist(), extended_starts.tolist(), extended_ends.tolist()):
+        # PII 블록 정보 출력
+        pii_words = [all_words[j].get('word', '') for j in range(block_first, block_last + 1)]
+        print(f"PII 블록 발견: {starts[block_first]:.2f}s - {ends[block_last]:.2f}s")
+        print(f"  PII 단어들: {pii_words}")
+        print(f"  확장된 묵음 구간: {extended_start_time:.2f}s - {extended_end_time:.2f}s")
         
-        # PII 단어를 발견하면 블록 시작
-        if word.get('is_pii', False):
-            pii_block_start_idx = i
-            pii_block_end_idx = i
-            
-            # 연속된 PII 단어들 찾기
-            while pii_block_end_idx + 1 < len(all_words) and all_words[pii_block_end_idx + 1].get('is_pii', False):
-                pii_block_end_idx += 1
-            
-            # PII 블록의 실제 시작/끝 시간
-            pii_start_time = all_words[pii_block_start_idx].get('start', 0.0)
-            pii_end_time = all_words[pii_block_end_idx].get('end', 0.0)
-            
-            # 확장된 구간 계산
-            # 시작점: 이전 단어의 끝 시간 (이전 단어가 없으면 PII 블록의 시작 시간)
-            if pii_block_start_idx > 0:
-                extended_start_time = all_words[pii_block_start_idx - 1].get('end', pii_start_time)
-            else:
-                extended_start_time = pii_start_time
-            
-            # 끝점: 다음 단어의 시작 시간 (다음 단어가 없으면 PII 블록의 끝 시간)
-            if pii_block_end_idx + 1 < len(all_words):
-                extended_end_time = all_words[pii_block_end_idx + 1].get('start', pii_end_time)
-            else:
-                extended_end_time = pii_end_time
-            
-            # PII 블록 정보 출력
-            pii_words = [all_words[j].get('word', '') for j in range(pii_block_start_idx, pii_block_end_idx + 1)]
-            print(f"PII 블록 발견: {pii_start_time:.2f}s - {pii_end_time:.2f}s")
-            print(f"  PII 단어들: {pii_words}")
-            print(f"  확장된 묵음 구간: {extended_start_time:.2f}s - {extended_end_time:.2f}s")
-            
-            pii_segments.append((extended_start_time, extended_end_time))
-            
-            # 다음 반복을 위해 블록 끝 이후로 이동
-            i = pii_block_end_idx + 1
-        else:
-            i += 1
+        pii_segments.append((extended_start_time, extended_end_time))
     
     return pii_segments
 
@@ -134,8 +174,8 @@ def mute_audio_segments(audio_path: str, pii_segments: List[Tuple[float, float]]
         bool: 성공 여부
     """
     try:
-        # 오디오 파일 로드
-        audio, sr = librosa.load(audio_path, sr=None)
+        # 오디오 파일 로드 (오디오 버퍼 캐시가 설정되어 있으면 전사 단계에서 디코딩한 배열 재사용)
+        audio, sr = load_audio_buffer(audio_path)
         print(f"오디오 로드 완료: {audio_path}")
         print(f"  - 샘플링 레이트: {sr} Hz")
         print(f"  - 길이: {len(audio)} 샘플 ({len(audio)/sr:.2f}초)")
@@ -209,6 +249,9 @@ def mask_text_in_json(json_data: Dict[str, Any]) -> Dict[str, Any]:
         if segment_text_parts:
             segment['text'] = ''.join(segment_text_parts)
             updated_segments_text.append(segment['text'])
+        elif segment.get('text'):
+            # 단어 타임스탬프 없이 전사된 세그먼트 (PII 없음)
+            updated_segments_text.append(segment['text'])
     
     # 전체 transcript 업데이트
     if updated_segments_text:
@@ -251,13 +294,11 @@ def process_pii_file(json_path: str, output_dir: str = "output/deid") -> bool:
         print(f"총 {len(pii_segments)}개의 PII 구간 발견")
         
         # 겹치는 구간 병합
-        merged_segments = merge_overlapping_segments(pii_segments)
+        merged_segments = merge_overlapping_segments(pii_segments, MERGE_MARGIN)
         print(f"병합 후 {len(merged_segments)}개의 구간")
         
         # 출력 파일 경로 설정
-        input_filename = Path(json_path).stem
-        output_audio_path = os.path.join(output_dir, "audio", f"{input_filename}_deid.wav")
-        output_json_path = os.path.join(output_dir, "json", f"{input_filename}_deid.json")
+        output_audio_path, output_json_path = export_output_paths(json_path, output_dir)
         
         # 오디오 묵음 처리
         print("\n--- 오디오 묵음 처리 ---")
@@ -272,8 +313,7 @@ def process_pii_file(json_path: str, output_dir: str = "output/deid") -> bool:
         
         # 마스킹된 JSON 저장
         os.makedirs(os.path.dirname(output_json_path), exist_ok=True)
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(masked_json_data, f, ensure_ascii=False, indent=2)
+        get_json_serializer().dump_file(masked_json_data, output_json_path)
         
         print(f"마스킹된 JSON 저장 완료: {output_json_path}")
         
@@ -291,13 +331,15 @@ def process_pii_file(json_path: str, output_dir: str = "output/deid") -> bool:
         return False
 
 
-def process_directory(input_dir: str, output_dir: str = "output/deid") -> None:
+def process_directory(input_dir: str, output_dir: str = "output/deid", force: bool = False) -> None:
     """
     디렉토리 내의 모든 처리된 JSON 파일에 대해 PII 처리를 수행합니다.
+    출력 디렉토리의 매니페스트를 확인하여 변경되지 않은 JSON 파일은 건너뜁니다.
     
     Args:
         input_dir (str): 입력 디렉토리 (processed JSON 파일들이 있는 곳)
         output_dir (str): 출력 디렉토리
+        force (bool): 매니페스트와 관계없이 모든 파일을 다시 처리할지 여부
     """
     print(f"\n=== 디렉토리 PII 처리 시작: {input_dir} ===")
     
@@ -314,17 +356,30 @@ def process_directory(input_dir: str, output_dir: str = "output/deid") -> None:
     
     print(f"처리할 JSON 파일 {len(json_files)}개 발견")
     
+    manifest = StageManifest(output_dir, "export")
+    params = export_params()
+    
     success_count = 0
+    skipped_count = 0
     for json_file in json_files:
         json_path = os.path.join(input_dir, json_file)
         
+        if not force and manifest.is_up_to_date(json_path, params):
+            skipped_count += 1
+            success_count += 1
+            print(f"⏭️ 변경 없음, 건너뜀: {json_path}")
+            continue
+        
         try:
             if process_pii_file(json_path, output_dir):
                 success_count += 1
+                # PII가 없으면 출력 파일이 생성되지 않으므로 실제로 존재하는 파일만 기록
+                outputs = [path for path in export_output_paths(json_path, output_dir) if os.path.exists(path)]
+                manifest.record(json_path, params, outputs)
         except Exception as e:
             print(f"파일 처리 실패 ({json_file}): {e}")
     
-    print(f"\n=== 처리 완료: {success_count}/{len(json_files)}개 성공 ===")
+    print(f"\n=== 처리 완료: {success_count}/{len(json_files)}개 성공 (건너뜀 {skipped_count}개) ===")
 
 
 if __name__ == "__main__":
@@ -335,14 +390,29 @@ if __name__ == "__main__":
                        help='입력 JSON 파일 또는 디렉토리 경로')
     parser.add_argument('--output', '-o', default='output/deid',
                        help='출력 디렉토리 (기본값: output/deid)')
+    parser.add_argument('--force', action='store_true',
+                       help='매니페스트와 관계없이 모든 파일 다시 처리')
+    parser.add_argument('--audio-buffer-dir', nargs='?', const=DEFAULT_BUFFER_DIR,
+                       help=f'전사 단계와 공유하는 디코딩 오디오 버퍼 디렉토리 (값 없이 지정하면 {DEFAULT_BUFFER_DIR}, '
+                            '기본값: 환경변수 AUDIO_BUFFER_CACHE_DIR)')
+    parser.add_argument('--audio-buffer-mb', type=float, default=DEFAULT_BUFFER_SIZE_MB,
+                       help=f'오디오 버퍼 크기 상한 (MB, 기본값: {DEFAULT_BUFFER_SIZE_MB:.0f})')
+    parser.add_argument('--compact-json', action='store_true',
+                       help='마스킹된 JSON을 들여쓰기 없이 저장 (기본값: 환경변수 TRANSCRIPT_JSON_COMPACT)')
     
     args = parser.parse_args()
     
+    if args.compact_json:
+        configure_json_serializer(compact=True)
+    
+    if args.audio_buffer_dir:
+        configure_audio_buffer_cache(args.audio_buffer_dir, args.audio_buffer_mb)
+    
     if os.path.isfile(args.input):
         # 단일 파일 처리
         process_pii_file(args.input, args.output)
     elif os.path.isdir(args.input):
         # 디렉토리 처리
-        process_directory(args.input, args.output)
+        process_directory(args.input, args.output, args.force)
     else:
         print(f"오류: 유효하지 않은 입력 경로 - {args.input}")
@@ -1,13 +1,28 @@
 import json
-import requests
 import re
 import os
 import argparse
+import numpy as np
 from pydantic import BaseModel, Field, ValidationError
-from typing import List, Optional, Dict, Set
-from audio_transcript_info import AudioTranscriptInfo
+from typing import Callable, Iterable, List, Optional, Dict, Set
+from audio_transcript_info import AudioTranscriptInfo, WordTimestamp, configure_json_serializer
+from lazy_import import lazy_import
+from manifest import StageManifest
 from enum import Enum
 
+# HTTP 클라이언트는 LLM을 호출할 때 import
+requests = lazy_import("requests")
+
+# PII 추출에 사용하는 LLM 모델
+LLM_MODEL_NAME = "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B"
+
+# 프롬프트 버전 (프롬프트나 PII 필터링 규칙을 변경하면 올려야 매니페스트가 재처리를 판단할 수 있음)
+PROMPT_VERSION = "2025-06-v1"
+
+# 슬라이딩 윈도우 설정
+WINDOW_SIZE = 50
+SLIDE_SIZE = 47
+
 class PIISentence(BaseModel):
     sentence_id: int = Field(description="개인정보가 포함된 문장의 번호")
     pii_text: str = Field(description="문장 전체가 아니라 개인정보 구간 정확히 추출")
@@ -40,33 +55,25 @@ def de_identification(audio_transcript_info: AudioTranscriptInfo, pii_sentences:
     for pii_sentence in pii_sentences.pii_sentences:
         print(f"    📍 PII 문장 {pii_sentence.sentence_id}: {pii_sentence.pii_text}")
         
-        segment_found = False
-        for segment in audio_transcript_info.segments:
-            if pii_sentence.sentence_id == int(segment.id):
-                print(f"      🎯 세그먼트 {segment.id} 발견: '{segment.text}'")
-                segment_found = True
-                
-                # PII 텍스트 처리
-                if pii_sentence.pii_text and pii_sentence.pii_text.strip():
-                    print(f"        🔎 PII 텍스트 '{pii_sentence.pii_text}' 처리 중...")
-                    # 단어 단위에서 PII 플래그 설정
-                    mark_pii_in_words(segment.words, pii_sentence.pii_text)
-                
-                break
-        
-        if not segment_found:
+        segment = audio_transcript_info.segment_by_id(pii_sentence.sentence_id)
+        if segment is not None:
+            print(f"      🎯 세그먼트 {segment.id} 발견: '{segment.text}'")
+            
+            # PII 텍스트 처리
+            if pii_sentence.pii_text and pii_sentence.pii_text.strip():
+                print(f"        🔎 PII 텍스트 '{pii_sentence.pii_text}' 처리 중...")
+                # 단어 단위에서 PII 플래그 설정
+                mark_pii_in_words(segment.words, pii_sentence.pii_text)
+        else:
             print(f"      ❌ sentence_id {pii_sentence.sentence_id}에 해당하는 세그먼트를 찾을 수 없음!")
             available_ids = [seg.id for seg in audio_transcript_info.segments[:10]]  # 처음 10개만 출력
             print(f"      📋 사용 가능한 segment ID (처음 10개): {available_ids}")
             
             # PII 텍스트와 유사한 내용을 다른 segment에서 찾기
             print(f"      🔍 '{pii_sentence.pii_text}' 와 유사한 내용을 다른 segment에서 찾는 중...")
-            found_segment = None
-            for seg in audio_transcript_info.segments:
-                if pii_sentence.pii_text.lower() in seg.text.lower():
-                    print(f"      🎯 유사한 내용 발견! segment {seg.id}: '{seg.text}'")
-                    found_segment = seg
-                    break
+            found_segment = audio_transcript_info.find_segment_by_text(pii_sentence.pii_text)
+            if found_segment is not None:
+                print(f"      🎯 유사한 내용 발견! segment {found_segment.id}: '{found_segment.text}'")
             
             # 자동으로 올바른 segment에서 PII 처리
             if found_segment and pii_sentence.pii_text and pii_sentence.pii_text.strip():
@@ -75,6 +82,50 @@ def de_identification(audio_transcript_info: AudioTranscriptInfo, pii_sentences:
     return audio_transcript_info
 
 
+def pii_segment_ids(audio_transcript_info: AudioTranscriptInfo, pii_sentences: PIISentences) -> List[str]:
+    """
+    PII 문장이 가리키는 세그먼트 ID 목록 (de_identification과 같은 방식으로 세그먼트를 찾음)
+    
+    sentence_id에 해당하는 세그먼트가 없으면 pii_text를 포함하는 첫 세그먼트를 사용합니다.
+    """
+    segment_ids = []
+    for pii_sentence in pii_sentences.pii_sentences:
+        segment = audio_transcript_info.segment_by_id(pii_sentence.sentence_id)
+        if segment is None and pii_sentence.pii_text:
+            segment = audio_transcript_info.find_segment_by_text(pii_sentence.pii_text)
+        if segment is not None and segment.id not in segment_ids:
+            segment_ids.append(segment.id)
+    return segment_ids
+
+
+def ensure_segment_words(audio_transcript_info: AudioTranscriptInfo,
+                         segment_ids: Iterable[str],
+                         word_aligner: Optional[Callable[[AudioTranscriptInfo, List[str]], int]] = None) -> int:
+    """
+    단어 타임스탬프 없이 전사된 세그먼트(--word-timestamps deferred)에 단어 경계를 채웁니다.
+    
+    word_aligner(transcription.WordAligner)가 있으면 해당 세그먼트만 다시 디코딩하여 단어를 정렬하고,
+    없거나 정렬되지 않은 세그먼트는 세그먼트 전체를 하나의 단어로 두어 구간 전체가 마스킹되도록 합니다.
+    
+    Returns:
+        int: 단어를 채운 세그먼트 수
+    """
+    targets = [segment for segment in audio_transcript_info.segments
+               if segment.id in segment_ids and not segment.words]
+    if not targets:
+        return 0
+    
+    if word_aligner is not None:
+        print(f"  🎯 단어 정렬: PII 세그먼트 {len(targets)}개")
+        word_aligner(audio_transcript_info, [segment.id for segment in targets])
+    
+    for segment in targets:
+        if not segment.words:
+            print(f"    ⚠️ 세그먼트 {segment.id}: 단어 타임스탬프 없음 → 세그먼트 전체 사용")
+            segment.words.append(WordTimestamp(segment.text, segment.start, segment.end))
+    return len(targets)
+
+
 def mark_pii_in_words(words: List, pii_text: str):
     """
     단어 레벨에서 PII를 식별하여 is_pii 플래그 설정
@@ -85,7 +136,9 @@ def mark_pii_in_words(words: List, pii_text: str):
         return
     
     pii_text = pii_text.strip()
-    print(f"          📋 단어들: {[w.word for w in words]}")
+    # 열 기반 단어 목록(WordList)은 텍스트 버퍼에서 한 번에 가져옴
+    texts = words.texts if hasattr(words, 'texts') else [w.word for w in words]
+    print(f"          📋 단어들: {texts}")
     print(f"          🎯 찾을 PII: '{pii_text}'")
     
     marked_words = []
@@ -94,7 +147,7 @@ def mark_pii_in_words(words: List, pii_text: str):
     pii_normalized = re.sub(r'[^\w가-힣-]', '', pii_text.lower())
     
     # 전체 세그먼트 텍스트를 하나로 합치기 (단어 경계 무시)
-    full_text = ''.join([w.word.strip() for w in words])
+    full_text = ''.join([text.strip() for text in texts])
     full_text_normalized = re.sub(r'[^\w가-힣-]', '', full_text.lower())
     
     print(f"          🔍 정규화된 PII: '{pii_normalized}'")
@@ -111,24 +164,25 @@ def mark_pii_in_words(words: List, pii_text: str):
     
     print(f"          📍 PII 위치: {pii_start_pos} ~ {pii_end_pos}")
     
-    # 각 단어의 위치를 계산하여 PII 범위와 겹치는지 확인
-    current_pos = 0
-    for word in words:
-        word_clean = word.word.strip()
-        if not word_clean:
-            continue
-            
-        word_normalized = re.sub(r'[^\w가-힣-]', '', word_clean.lower())
-        word_start_pos = current_pos
-        word_end_pos = current_pos + len(word_normalized)
-        
-        # 단어가 PII 범위와 겹치는지 확인
-        if (word_start_pos < pii_end_pos and word_end_pos > pii_start_pos):
-            word.is_pii = True
-            marked_words.append(f"위치매칭: {word.word}")
-            print(f"            ✅ '{word.word}' (위치: {word_start_pos}~{word_end_pos}) -> PII 범위와 겹침")
-        
-        current_pos = word_end_pos
+    # 각 단어의 정규화된 텍스트 위치를 한 번에 계산하여 PII 범위와 겹치는 단어 선택
+    # (공백뿐인 단어는 위치를 차지하지 않고 PII로 표시하지도 않음)
+    stripped = [text.strip() for text in texts]
+    lengths = np.array([len(re.sub(r'[^\w가-힣-]', '', text.lower())) for text in stripped], dtype=np.int64)
+    word_end_pos = np.cumsum(lengths)
+    word_start_pos = word_end_pos - lengths
+    overlaps = ((word_start_pos < pii_end_pos) & (word_end_pos > pii_start_pos)
+                & np.array([bool(text) for text in stripped]))
+    
+    matched = np.flatnonzero(overlaps)
+    if isinstance(getattr(words, 'is_pii', None), np.ndarray):
+        # 열 기반 단어 목록(WordList)은 배열에 한 번에 표시
+        words.is_pii[overlaps] = True
+    else:
+        for index in matched:
+            words[index].is_pii = True
+    for index in matched:
+        marked_words.append(f"위치매칭: {texts[index]}")
+        print(f"            ✅ '{texts[index]}' (위치: {word_start_pos[index]}~{word_end_pos[index]}) -> PII 범위와 겹침")
     
     if marked_words:
         print(f"          ✅ PII 플래그 설정됨: {marked_words}")
@@ -273,7 +327,7 @@ JSON 스키마:
     data = {
         # "model": "deepseek-ai/DeepSeek-R1-Distill-Llama-8B",
         # "model": "LGAI-EXAONE/EXAONE-4.0-1.2B",
-        "model": "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B",
+        "model": LLM_MODEL_NAME,
         "messages": [
             {"role": "system", "content": system_message},
             {"role": "assistant", "content": assistant_message},
@@ -309,8 +363,8 @@ def extract_pii_from_json(json_file_path: str) -> PIISentences:
     all_pii_sentences: Dict[int, PIISentence] = {}  # 중복 제거를 위한 딕셔너리
     
     # 슬라이딩 윈도우로 처리
-    window_size = 50
-    slide_size = 47
+    window_size = WINDOW_SIZE
+    slide_size = SLIDE_SIZE
     
     for start_idx in range(0, len(segments), slide_size):
         # 현재 윈도우의 세그먼트들 추출
@@ -455,8 +509,23 @@ def is_valid_pii(text: str) -> bool:
     return True
 
 
-def process_file(input_file_path: str, output_dir: str) -> bool:
-    """단일 JSON 파일을 처리합니다."""
+def extraction_params() -> Dict[str, object]:
+    """PII 추출 결과에 영향을 주는 설정 (매니페스트 파라미터)"""
+    return {
+        "model": LLM_MODEL_NAME,
+        "prompt_version": PROMPT_VERSION,
+        "window_size": WINDOW_SIZE,
+        "slide_size": SLIDE_SIZE,
+    }
+
+
+def process_file(input_file_path: str, output_dir: str,
+                 word_aligner: Optional[Callable[[AudioTranscriptInfo, List[str]], int]] = None) -> Optional[str]:
+    """
+    단일 JSON 파일을 처리하고 저장된 결과 파일 경로를 반환합니다 (실패 시 None).
+    
+    단어 타임스탬프 없이 전사된 파일이면 PII 세그먼트만 word_aligner로 단어를 정렬합니다.
+    """
     print(f"▶ 처리 대상: {input_file_path}")
     
     try:
@@ -471,20 +540,19 @@ def process_file(input_file_path: str, output_dir: str) -> bool:
         
         if not audio_info.load_from_json(input_file_path):
             print("     ❌ JSON 파일 로드 실패")
-            return False
+            return None
         
         print(f"     - 세그먼트 수: {len(audio_info.segments)}")
         
+        # 단어 타임스탬프가 없는 PII 세그먼트만 단어 정렬
+        ensure_segment_words(audio_info, pii_segment_ids(audio_info, pii_sentences), word_aligner)
+        
         # 3. PII 식별 및 is_pii 플래그 설정
         print("  3. PII 플래그 설정 중...")
         processed_audio_info = de_identification(audio_info, pii_sentences)
         
         # PII가 설정된 단어 개수 확인
-        pii_word_count = 0
-        for segment in processed_audio_info.segments:
-            for word in segment.words:
-                if word.is_pii:
-                    pii_word_count += 1
+        pii_word_count = int(processed_audio_info.word_store.is_pii.sum())
         
         print(f"     - PII 플래그가 설정된 단어 수: {pii_word_count}")
         
@@ -492,24 +560,64 @@ def process_file(input_file_path: str, output_dir: str) -> bool:
         print("  4. 결과 저장 중...")
         result_path = processed_audio_info.save_to_json(output_dir)
         print(f"     ✅ 저장 완료: {result_path}")
-        return True
+        return result_path
         
     except Exception as e:
         print(f"     ❌ 파일 처리 중 오류 발생: {e}")
-        return False
+        return None
 
 
-def process_input(input_path: str, output_dir: str):
+def process_file_with_manifest(input_file_path: str, output_dir: str,
+                               manifest: StageManifest, force: bool = False,
+                               word_aligner=None, content_addressed: bool = False) -> Optional[str]:
+    """
+    매니페스트를 확인하여 변경된 JSON 파일만 처리합니다.
+    이미 같은 설정으로 처리된 파일이면 기록된 결과 파일 경로를 반환합니다.
+    
+    content_addressed=True이면 결과 이름을 입력 해시와 설정 지문으로 정하고({파일명}_{입력 해시}_{설정 지문}.json),
+    같은 이름의 결과가 있으면 매니페스트를 확인하지 않고 건너뜁니다.
+    """
+    params = extraction_params()
+    if word_aligner is not None:
+        params["word_alignment"] = word_aligner.params
+    
+    sha256 = target_path = None
+    if content_addressed:
+        sha256 = manifest.content_hash(input_file_path)
+        target_path = manifest.content_addressed_path(input_file_path, params, sha256)
+        if not force and os.path.exists(target_path):
+            print(f"⏭️ 결과 있음, 건너뜀: {input_file_path}")
+            return target_path
+    elif not force and manifest.is_up_to_date(input_file_path, params):
+        print(f"⏭️ 변경 없음, 건너뜀: {input_file_path}")
+        outputs = manifest.outputs(input_file_path)
+        return outputs[0] if outputs else None
+    
+    result_path = process_file(input_file_path, output_dir, word_aligner)
+    if result_path:
+        if target_path:
+            # 완성된 결과 JSON을 정해진 이름으로 원자적으로 이동
+            os.replace(result_path, target_path)
+            result_path = target_path
+        # 완료 즉시 기록하여 중단 후 재실행 시에도 이어서 처리
+        manifest.record(input_file_path, params, [result_path], sha256=sha256)
+    return result_path
+
+
+def process_input(input_path: str, output_dir: str, force: bool = False, word_aligner=None,
+                  content_addressed: bool = False):
     """입력 경로가 파일인지 폴더인지 판단하여 처리합니다."""
     # 출력 디렉토리 생성
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"📁 출력 디렉토리 생성: {output_dir}")
     
+    manifest = StageManifest(output_dir, "extraction")
+    
     if os.path.isfile(input_path):
         # 단일 파일 처리
         if input_path.endswith(".json"):
-            process_file(input_path, output_dir)
+            process_file_with_manifest(input_path, output_dir, manifest, force, word_aligner, content_addressed)
         else:
             print(f"❌ JSON 파일이 아닙니다: {input_path}")
     
@@ -523,7 +631,8 @@ def process_input(input_path: str, output_dir: str):
             for file in files:
                 if file.endswith(".json"):
                     full_path = os.path.join(root, file)
-                    success = process_file(full_path, output_dir)
+                    success = process_file_with_manifest(full_path, output_dir, manifest, force, word_aligner,
+                                                         content_addressed)
                     if success:
                         processed_count += 1
                     else:
@@ -547,6 +656,9 @@ def main():
   
   # 단일 파일 처리  
   python src/extraction.py --input output/transcript/sample.json --output output/processed_local
+  
+  # 단어 타임스탬프 없이 전사한 파일 (transcription.py --word-timestamps deferred)
+  python src/extraction.py --input output/transcript --output output/processed_local --align-words
         """
     )
     
@@ -562,14 +674,62 @@ def main():
         help="출력 폴더 경로"
     )
     
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="매니페스트와 관계없이 모든 파일 다시 처리"
+    )
+    
+    # 단어 정렬 설정 (--word-timestamps deferred로 전사한 파일용)
+    parser.add_argument(
+        "--align-words",
+        action="store_true",
+        help="단어 타임스탬프가 없는 PII 세그먼트만 Whisper로 다시 디코딩하여 단어 정렬 "
+             "(지정하지 않으면 세그먼트 전체를 마스킹)"
+    )
+    parser.add_argument(
+        "--align-model",
+        default="medium",
+        help="단어 정렬에 사용할 Whisper 모델 크기 (전사와 같은 모델 권장, 기본값: medium)"
+    )
+    parser.add_argument(
+        "--align-language",
+        default="ko",
+        help="단어 정렬 언어 설정 (기본값: ko)"
+    )
+    parser.add_argument(
+        "--align-device",
+        default=None,
+        help="단어 정렬 장치 설정 (cuda, cpu, 기본값: 자동선택)"
+    )
+    parser.add_argument(
+        "--content-addressed-names",
+        action="store_true",
+        help="결과 JSON 이름을 타임스탬프 대신 입력 해시와 설정 지문으로 정함 (재실행해도 같은 이름, 결과가 있으면 건너뜀)"
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="결과 JSON을 들여쓰기 없이 저장 (기본값: 환경변수 TRANSCRIPT_JSON_COMPACT)"
+    )
+    
     args = parser.parse_args()
     
+    if args.compact_json:
+        configure_json_serializer(compact=True)
+    
     print("🚀 PII 추출 및 비식별화 시작")
     print(f"📥 입력: {args.input}")
     print(f"📤 출력: {args.output}")
     print()
     
-    process_input(args.input, args.output)
+    word_aligner = None
+    if args.align_words:
+        # Whisper 의존성은 단어 정렬을 사용할 때만 로드
+        from transcription import WordAligner
+        word_aligner = WordAligner(args.align_model, args.align_language, args.align_device)
+    
+    process_input(args.input, args.output, args.force, word_aligner, args.content_addressed_names)
     
     print("🎉 모든 처리가 완료되었습니다!")
 
@@ -0,0 +1,48 @@
+"""
+무거운 의존성의 지연 import
+
+librosa, noisereduce, soundfile 등은 import만으로 수백 ms~수 초가 걸려
+`--help`나 인자 오류처럼 오디오를 다루지 않는 실행도 느려집니다.
+lazy_import로 만든 모듈 객체는 속성에 처음 접근할 때 실제 모듈을 import합니다.
+
+사용법:
+    nr = lazy_import("noisereduce")   # 이 시점에는 import하지 않음
+    nr.reduce_noise(...)              # 처음 사용할 때 import
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """처음 속성에 접근할 때 실제 모듈을 import하는 대리 모듈"""
+
+    def _load(self) -> types.ModuleType:
+        # import 시스템의 모듈별 잠금을 사용하므로 여러 스레드에서 동시에 접근해도 한 번만 import
+        return importlib.import_module(self.__name__)
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value):
+        # monkeypatch 등으로 설정한 속성은 실제 모듈에 반영
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    처음 사용할 때 import되는 모듈 반환
+
+    Args:
+        name (str): 모듈 이름 (예: "noisereduce", "scipy.signal")
+
+    Returns:
+        ModuleType: 이미 import된 모듈이면 실제 모듈, 아니면 LazyModule
+    """
+    return sys.modules.get(name) or LazyModule(name)
@@ -0,0 +1,291 @@
+"""
+numpy 기반 라우드니스 측정 및 정규화
+
+float 오디오 배열을 제자리(in-place)에서 정규화합니다.
+- RMS: pydub의 dBFS와 같은 기준 (풀스케일 1.0 = 0 dBFS)
+- EBU R128: ITU-R BS.1770 K-weighting + 게이팅 기반 통합 라우드니스 (LUFS)
+- True-peak 리미터: 4배 오버샘플링 피크 기준 lookahead 리미터
+"""
+import logging
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 지원하는 라우드니스 측정 방식
+LOUDNESS_METHODS = ("rms", "ebu_r128")
+
+# 긴 오디오를 처리할 때 한 번에 다룰 샘플 수 (임시 배열 크기 제한)
+CHUNK_SAMPLES = 1 << 20
+
+# BS.1770 게이팅 설정
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+BLOCK_SECONDS = 0.4
+STEP_SECONDS = 0.1
+
+
+def _k_weighting_sos(sample_rate: int) -> np.ndarray:
+    """
+    BS.1770 K-weighting 필터(고역 쉘빙 + 고역 통과)의 second-order section 계수
+
+    48kHz 기준 계수를 만드는 아날로그 원형 파라미터로부터
+    임의의 샘플레이트에 맞는 계수를 다시 계산합니다.
+    """
+    # 1단계: 고역 쉘빙 필터 (약 +4dB, 머리 효과 보정)
+    fc, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = math.tan(math.pi * fc / sample_rate)
+    vh = 10 ** (gain_db / 20)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0,
+        2 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+        1.0,
+        2 * (k * k - 1) / a0,
+        (1 - k / q + k * k) / a0,
+    ]
+
+    # 2단계: 고역 통과 필터 (RLB weighting)
+    fc, q = 38.13547087602444, 0.5003270373238773
+    k = math.tan(math.pi * fc / sample_rate)
+    a0 = 1 + k / q + k * k
+    high_pass = [
+        1.0,
+        -2.0,
+        1.0,
+        1.0,
+        2 * (k * k - 1) / a0,
+        (1 - k / q + k * k) / a0,
+    ]
+
+    return np.array([shelf, high_pass], dtype=np.float64)
+
+
+def rms_dbfs(audio: np.ndarray) -> float:
+    """
+    float 오디오의 RMS 레벨(dBFS) 계산
+
+    Args:
+        audio (np.ndarray): float 모노 오디오 (풀스케일 1.0)
+
+    Returns:
+        float: RMS 레벨 (무음이면 -inf)
+    """
+    if audio.size == 0:
+        return -math.inf
+
+    sum_squares = 0.0
+    for start in range(0, audio.size, CHUNK_SAMPLES):
+        chunk = audio[start:start + CHUNK_SAMPLES].astype(np.float64)
+        sum_squares += float(np.dot(chunk, chunk))
+    if sum_squares == 0.0:
+        return -math.inf
+    return 10 * math.log10(sum_squares / audio.size)
+
+
+def integrated_loudness(audio: np.ndarray, sample_rate: int) -> float:
+    """
+    EBU R128 (ITU-R BS.1770) 통합 라우드니스 계산
+
+    Args:
+        audio (np.ndarray): float 모노 오디오 (풀스케일 1.0)
+        sample_rate (int): 샘플레이트
+
+    Returns:
+        float: 통합 라우드니스 (LUFS, 게이트를 통과한 블록이 없으면 -inf)
+    """
+    from scipy.signal import sosfilt  # scipy.signal은 import가 느려 사용할 때 로드
+
+    step = int(round(STEP_SECONDS * sample_rate))
+    steps_per_block = int(round(BLOCK_SECONDS / STEP_SECONDS))
+    sos = _k_weighting_sos(sample_rate)
+    zi = np.zeros((sos.shape[0], 2))
+
+    # K-weighting 필터 출력의 100ms 단위 제곱합 (청크 단위로 필터 상태를 이어가며 계산)
+    chunk_samples = max(step, CHUNK_SAMPLES // step * step)
+    step_energies = []
+    for start in range(0, audio.size, chunk_samples):
+        filtered, zi = sosfilt(sos, audio[start:start + chunk_samples], zi=zi)
+        usable = filtered.size // step * step
+        if usable:
+            frames = filtered[:usable].reshape(-1, step)
+            step_energies.append(np.einsum("ij,ij->i", frames, frames))
+
+    if not step_energies:
+        return -math.inf
+    step_energies = np.concatenate(step_energies)
+    if step_energies.size < steps_per_block:
+        return -math.inf
+
+    # 400ms 블록 (75% 겹침) 평균 제곱
+    cumulative = np.concatenate(([0.0], np.cumsum(step_energies)))
+    block_power = (cumulative[steps_per_block:] - cumulative[:-steps_per_block]) / (steps_per_block * step)
+
+    with np.errstate(divide="ignore"):
+        block_loudness = -0.691 + 10 * np.log10(block_power)
+
+    # 절대 게이트 (-70 LUFS)
+    gated = block_power[block_loudness > ABSOLUTE_GATE_LUFS]
+    if gated.size == 0:
+        return -math.inf
+
+    # 상대 게이트 (절대 게이트 통과 블록 평균보다 10 LU 낮은 기준)
+    relative_gate = -0.691 + 10 * math.log10(gated.mean()) + RELATIVE_GATE_LU
+    gated = block_power[(block_loudness > ABSOLUTE_GATE_LUFS) & (block_loudness > relative_gate)]
+    if gated.size == 0:
+        return -math.inf
+    return -0.691 + 10 * math.log10(gated.mean())
+
+
+@lru_cache(maxsize=None)
+def _oversampling_filter(oversample: int) -> Tuple[np.ndarray, float]:
+    """
+    true-peak 오버샘플링용 FIR 필터와 출력 피크 상한 배수
+
+    상한 배수는 위상별 계수 절대값 합의 최대값으로, 입력 샘플 피크에 곱하면
+    오버샘플링 결과 피크의 상한이 됩니다 (리미터가 필요 없는 구간을 빠르게 건너뛰는 데 사용).
+    """
+    from scipy.signal import firwin
+
+    # resample_poly와 같은 설계 (resample_poly가 보간 이득 oversample을 곱해 사용)
+    taps = firwin(20 * oversample + 1, 1.0 / oversample, window=("kaiser", 5.0))
+    bound = max(float(np.abs(taps[phase::oversample]).sum()) for phase in range(oversample)) * oversample
+    return taps, bound
+
+
+def _true_peak_envelope(segment: np.ndarray, oversample: int) -> np.ndarray:
+    """오버샘플링한 신호에서 원래 샘플마다의 최대 절대값(true-peak 포락선) 계산"""
+    from scipy.signal import resample_poly
+
+    upsampled = resample_poly(segment, oversample, 1, window=_oversampling_filter(oversample)[0])
+    envelope = np.abs(upsampled[:segment.size * oversample]).reshape(-1, oversample).max(axis=1)
+    return np.maximum(envelope, np.abs(segment))
+
+
+def true_peak_dbfs(audio: np.ndarray, sample_rate: int, oversample: int = 4) -> float:
+    """
+    4배 오버샘플링 기준 true-peak 레벨(dBTP) 계산
+
+    Args:
+        audio (np.ndarray): float 모노 오디오 (풀스케일 1.0)
+        sample_rate (int): 샘플레이트 (포락선 계산 시 청크 경계 여유에만 사용)
+        oversample (int): 오버샘플링 배수
+
+    Returns:
+        float: true-peak 레벨 (무음이면 -inf)
+    """
+    margin = 64
+    peak = 0.0
+    for start in range(0, audio.size, CHUNK_SAMPLES):
+        lo = max(0, start - margin)
+        hi = min(audio.size, start + CHUNK_SAMPLES + margin)
+        envelope = _true_peak_envelope(audio[lo:hi], oversample)
+        peak = max(peak, float(envelope[start - lo:min(start + CHUNK_SAMPLES, audio.size) - lo].max()))
+    return 20 * math.log10(peak) if peak > 0 else -math.inf
+
+
+def limit_true_peak(audio: np.ndarray, sample_rate: int,
+                    ceiling_dBTP: float = -1.0,
+                    lookahead_ms: float = 5.0,
+                    oversample: int = 4) -> int:
+    """
+    True-peak lookahead 리미터 (제자리 처리)
+
+    샘플마다 필요한 감쇠량을 구한 뒤 lookahead 구간의 최소값을 취하고 부드럽게 만들어
+    피크 직전부터 게인을 줄이고, 피크 이후 같은 시간에 걸쳐 원래 게인으로 복귀합니다.
+
+    Args:
+        audio (np.ndarray): float 모노 오디오 (제자리에서 수정됨)
+        sample_rate (int): 샘플레이트
+        ceiling_dBTP (float): 허용할 최대 true-peak 레벨 (dBTP)
+        lookahead_ms (float): lookahead/어택 시간 (ms)
+        oversample (int): true-peak 계산용 오버샘플링 배수
+
+    Returns:
+        int: 감쇠가 적용된 샘플 수
+    """
+    from scipy.ndimage import minimum_filter1d, uniform_filter1d
+
+    ceiling = 10 ** (ceiling_dBTP / 20)
+    attack = max(1, int(sample_rate * lookahead_ms / 1000))
+    margin = 2 * attack + 64
+    bound = _oversampling_filter(oversample)[1]
+    limited_count = 0
+    original_tail = None
+
+    for start in range(0, audio.size, CHUNK_SAMPLES):
+        end = min(start + CHUNK_SAMPLES, audio.size)
+        lo = max(0, start - margin)
+        hi = min(audio.size, end + margin)
+
+        # 앞 청크가 수정되었으면 경계 여유 구간은 보관해 둔 원본 사용
+        head = original_tail if original_tail is not None else audio[lo:start]
+        peak = max(float(np.abs(head).max(initial=0.0)), float(np.abs(audio[start:hi]).max()))
+
+        # 샘플 피크로 구한 상한이 한계 이하이면 오버샘플링 없이 건너뜀
+        if peak * bound <= ceiling:
+            original_tail = None
+            continue
+
+        segment = np.concatenate((head, audio[start:hi])).astype(np.float64)
+        original_tail = segment[max(lo, end - margin) - lo:end - lo].copy()
+
+        envelope = _true_peak_envelope(segment, oversample)
+        if envelope.max() <= ceiling:
+            continue
+
+        gain = np.minimum(1.0, ceiling / np.maximum(envelope, 1e-12))
+        gain = minimum_filter1d(gain, size=2 * attack + 1, mode="nearest")
+        gain = uniform_filter1d(gain, size=attack + 1, mode="nearest")
+
+        chunk_gain = gain[start - lo:end - lo]
+        audio[start:end] *= chunk_gain.astype(audio.dtype)
+        limited_count += int(np.count_nonzero(chunk_gain < 1.0))
+
+    return limited_count
+
+
+def normalize_loudness(audio: np.ndarray, sample_rate: int,
+                       target: float = -20.0,
+                       method: str = "rms",
+                       true_peak_limit: Optional[float] = None) -> float:
+    """
+    float 오디오의 라우드니스를 제자리에서 정규화하는 함수
+
+    Args:
+        audio (np.ndarray): float 모노 오디오 (제자리에서 수정됨)
+        sample_rate (int): 샘플레이트
+        target (float): 목표 레벨 (rms: dBFS, ebu_r128: LUFS)
+        method (str): 측정 방식 ("rms", "ebu_r128")
+        true_peak_limit (float, optional): true-peak 리미터 한계 (dBTP, None이면 리미터 미사용)
+
+    Returns:
+        float: 적용된 게인 (dB)
+    """
+    if not np.issubdtype(audio.dtype, np.floating):
+        raise ValueError(f"float 오디오 배열이 필요합니다 (입력 dtype: {audio.dtype})")
+
+    if method == "rms":
+        current, unit = rms_dbfs(audio), "dBFS"
+    elif method == "ebu_r128":
+        current, unit = integrated_loudness(audio, sample_rate), "LUFS"
+    else:
+        raise ValueError(f"지원하지 않는 라우드니스 측정 방식입니다: {method} (지원: {', '.join(LOUDNESS_METHODS)})")
+
+    if not math.isfinite(current):
+        logging.warning("무음 오디오이므로 볼륨 정규화를 건너뜁니다.")
+        return 0.0
+
+    gain_db = target - current
+    audio *= audio.dtype.type(10 ** (gain_db / 20))
+    logging.info(f"볼륨 정규화 ({method}): {current:.2f} {unit} -> {target:.2f} {unit}")
+
+    if true_peak_limit is not None:
+        limited_count = limit_true_peak(audio, sample_rate, true_peak_limit)
+        if limited_count:
+            logging.info(f"True-peak 리미터: {limited_count}개 샘플 감쇠 (한계 {true_peak_limit:.1f} dBTP)")
+
+    return gain_db
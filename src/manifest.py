@@ -0,0 +1,186 @@
+"""
+처리 단계별 매니페스트 관리
+
+각 처리 단계(전처리, 전사, 개인정보 추출, 비식별화 출력)는 출력 디렉토리의
+매니페스트에 입력 파일의 내용 해시(SHA-256)와 단계 파라미터를 기록합니다.
+다음 실행에서 입력 해시와 파라미터가 같고 출력 파일이 남아 있으면 해당 입력은 건너뜁니다.
+
+매니페스트는 한 줄에 한 항목씩 추가 기록하는 JSONL 형식이므로
+처리 도중 중단되어도 그때까지 완료된 항목은 보존됩니다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 출력 디렉토리에 생성되는 매니페스트 파일 이름
+MANIFEST_FILENAME = ".manifest.jsonl"
+
+# 해시 계산 시 한 번에 읽을 바이트 수
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산하는 함수
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def params_fingerprint(params: Dict[str, Any]) -> str:
+    """
+    단계 파라미터의 지문(해시)을 계산하는 함수
+
+    Args:
+        params (Dict[str, Any]): JSON 직렬화 가능한 파라미터 딕셔너리
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    encoded = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def content_addressed_name(input_path: str, sha256: str, params: Dict[str, Any], suffix: str = ".json") -> str:
+    """
+    입력 해시와 파라미터 지문으로 정한 출력 파일명
+
+    같은 입력 내용을 같은 파라미터로 처리하면 항상 같은 이름이 되므로,
+    다음 단계나 재실행은 os.path.exists 한 번으로 결과가 있는지 확인할 수 있습니다.
+
+    Args:
+        input_path (str): 입력 파일 경로 (파일명은 사람이 알아보기 위해 앞에 붙임)
+        sha256 (str): 입력 파일 내용 해시
+        params (Dict[str, Any]): 단계 파라미터
+        suffix (str): 확장자
+
+    Returns:
+        str: "{입력 파일명}_{입력 해시 16자}_{파라미터 지문 12자}{확장자}"
+    """
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return f"{stem}_{sha256[:16]}_{params_fingerprint(params)[:12]}{suffix}"
+
+
+class StageManifest:
+    """한 처리 단계의 입력 해시, 파라미터, 출력 파일 목록을 기록하고 조회하는 클래스"""
+
+    def __init__(self, output_dir: str, stage: str):
+        self.stage: str = stage
+        self.output_dir: str = output_dir
+        self.path: str = os.path.join(output_dir, MANIFEST_FILENAME)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        """매니페스트 파일에서 이 단계의 항목 로드 (같은 입력은 마지막 기록이 우선)"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄은 무시
+                    continue
+                if entry.get("stage") == self.stage:
+                    self.entries[entry["input"]] = entry
+
+    def content_hash(self, input_path: str) -> str:
+        """
+        입력 파일의 내용 해시 반환
+
+        파일 크기와 수정 시각이 기록과 같으면 기록된 해시를 재사용하여
+        변경되지 않은 대용량 오디오를 매번 다시 읽지 않습니다.
+        """
+        key = os.path.abspath(input_path)
+        stat = os.stat(key)
+        entry = self.entries.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+        return file_sha256(key)
+
+    def is_up_to_date(self, input_path: str, params: Dict[str, Any]) -> bool:
+        """
+        입력 파일이 같은 파라미터로 이미 처리되었고 출력 파일이 모두 남아 있는지 확인
+
+        Args:
+            input_path (str): 입력 파일 경로
+            params (Dict[str, Any]): 단계 파라미터
+
+        Returns:
+            bool: 다시 처리할 필요가 없으면 True
+        """
+        entry = self.entries.get(os.path.abspath(input_path))
+        if entry is None:
+            return False
+        if entry.get("fingerprint") != params_fingerprint(params):
+            return False
+        if not all(os.path.exists(path) for path in entry.get("outputs", [])):
+            return False
+        return entry.get("sha256") == self.content_hash(input_path)
+
+    def content_addressed_path(self, input_path: str, params: Dict[str, Any], sha256: Optional[str] = None,
+                               suffix: str = ".json") -> str:
+        """
+        출력 디렉토리 안의 내용 주소 기반 출력 파일 경로 (content_addressed_name 참고)
+
+        Args:
+            input_path (str): 입력 파일 경로
+            params (Dict[str, Any]): 단계 파라미터
+            sha256 (str, optional): 이미 계산된 입력 해시 (없으면 계산, 기록된 크기/수정 시각이 같으면 재사용)
+            suffix (str): 확장자
+
+        Returns:
+            str: 출력 파일 경로
+        """
+        sha256 = sha256 or self.content_hash(input_path)
+        return os.path.join(self.output_dir, content_addressed_name(input_path, sha256, params, suffix))
+
+    def outputs(self, input_path: str) -> List[str]:
+        """입력 파일에 대해 기록된 출력 파일 목록 반환"""
+        entry = self.entries.get(os.path.abspath(input_path))
+        return list(entry.get("outputs", [])) if entry else []
+
+    def record(self, input_path: str, params: Dict[str, Any],
+               outputs: Optional[List[str]] = None, sha256: Optional[str] = None):
+        """
+        처리 완료된 입력 파일을 매니페스트에 기록
+
+        Args:
+            input_path (str): 입력 파일 경로
+            params (Dict[str, Any]): 단계 파라미터
+            outputs (List[str], optional): 생성된 출력 파일 경로 목록
+            sha256 (str, optional): 이미 계산된 입력 해시 (없으면 계산)
+        """
+        key = os.path.abspath(input_path)
+        stat = os.stat(key)
+        entry = {
+            "stage": self.stage,
+            "input": key,
+            "sha256": sha256 or self.content_hash(key),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "fingerprint": params_fingerprint(params),
+            "params": params,
+            "outputs": [os.path.abspath(path) for path in (outputs or [])],
+            "recorded_at": datetime.now().isoformat(),
+        }
+        self.entries[key] = entry
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,253 @@
+"""
+Whisper 모델 레지스트리
+
+(model_size, device, compute_type, cpu_threads, num_workers) 조합마다 모델을 처음 요청될 때 한 번만 로드하고
+프로세스 안의 모든 전사 진입점이 같은 인스턴스를 재사용하도록 관리합니다.
+여러 크기의 모델이 함께 올라가는 경우를 위해 모델 수/예상 메모리 상한과 명시적 해제를 지원합니다.
+"""
+import gc
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+logger = logging.getLogger(__name__)
+
+# 모델 크기별 파라미터 수 (백만 단위, 예상 메모리 계산용)
+MODEL_PARAMS_M = {
+    "tiny": 39,
+    "base": 74,
+    "small": 244,
+    "medium": 769,
+    "large-v1": 1550,
+    "large-v2": 1550,
+    "large-v3": 1550,
+}
+
+# compute_type별 파라미터당 바이트 수
+BYTES_PER_PARAM = {
+    "int8": 1,
+    "int8_float16": 1,
+    "int8_bfloat16": 1,
+    "int8_float32": 1,
+    "int16": 2,
+    "float16": 2,
+    "bfloat16": 2,
+    "float32": 4,
+}
+
+
+class ModelKey(NamedTuple):
+    """레지스트리 키 (device가 None이면 GPU 우선 자동 선택)"""
+    model_size: str
+    device: Optional[str]
+    compute_type: str
+    cpu_threads: int
+    num_workers: int = 1
+
+
+def estimate_model_memory_mb(model_size: str, compute_type: str = "int8") -> float:
+    """
+    모델의 예상 메모리 사용량(MB) 계산
+
+    Args:
+        model_size (str): 모델 크기 (알 수 없는 크기나 로컬 경로이면 디렉토리 크기 사용)
+        compute_type (str): 연산 타입
+
+    Returns:
+        float: 예상 메모리 사용량 (MB)
+    """
+    if model_size in MODEL_PARAMS_M:
+        return MODEL_PARAMS_M[model_size] * BYTES_PER_PARAM.get(compute_type, 4)
+    if os.path.isdir(model_size):
+        total = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(model_size)
+            for name in files
+        )
+        return total / 2 ** 20
+    return 0.0
+
+
+def _load_model(key: ModelKey) -> "WhisperModel":
+    """키에 해당하는 모델 로드 (device가 None이면 GPU를 먼저 시도하고 실패하면 CPU 사용)"""
+    # faster-whisper(CTranslate2)는 import가 느려 실제로 모델을 로드할 때 가져옴
+    from faster_whisper import WhisperModel
+
+    if key.device is None:
+        try:
+            logger.info("GPU 모드로 시도 중...")
+            model = WhisperModel(key.model_size, device="cuda", compute_type=key.compute_type,
+                                 cpu_threads=key.cpu_threads, num_workers=key.num_workers)
+            logger.info("✅ GPU 모드 로딩 완료!")
+            return model
+        except Exception as e:
+            logger.warning(f"GPU 모드 실패: {e}")
+            logger.info("CPU 모드로 대체 중...")
+            model = WhisperModel(key.model_size, device="cpu", compute_type=key.compute_type,
+                                 cpu_threads=key.cpu_threads, num_workers=key.num_workers)
+            logger.info("✅ CPU 모드 로딩 완료!")
+            return model
+
+    model = WhisperModel(key.model_size, device=key.device, compute_type=key.compute_type,
+                         cpu_threads=key.cpu_threads, num_workers=key.num_workers)
+    logger.info(f"✅ {key.device.upper()} 모드 로딩 완료!")
+    return model
+
+
+class ModelRegistry:
+    """키별로 Whisper 모델을 지연 로드하고 LRU 순서로 상한을 관리하는 클래스"""
+
+    def __init__(self,
+                 max_models: Optional[int] = None,
+                 max_memory_mb: Optional[float] = None,
+                 loader: Callable[[ModelKey], Any] = _load_model):
+        self.max_models: Optional[int] = max_models
+        self.max_memory_mb: Optional[float] = max_memory_mb
+        self.loader = loader
+        self.models: "OrderedDict[ModelKey, Any]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "loads": 0, "evictions": 0}
+        self._lock = threading.RLock()
+        # 로드 중인 키 (같은 키를 동시에 요청하면 먼저 요청한 스레드의 로드 결과를 기다림)
+        self._loading: Dict[ModelKey, Future] = {}
+
+    def get(self,
+            model_size: str,
+            device: Optional[str] = None,
+            compute_type: str = "int8",
+            cpu_threads: int = 0,
+            num_workers: int = 1) -> Any:
+        """
+        모델을 반환 (처음 요청된 키이면 로드)
+
+        Args:
+            model_size (str): 모델 크기
+            device (str, optional): 장치 설정 (None=자동선택)
+            compute_type (str): 연산 타입
+            cpu_threads (int): CPU 스레드 수 (0=CTranslate2 기본값)
+            num_workers (int): 여러 스레드에서 동시에 transcribe를 호출할 때 사용할 모델 복제본 수
+
+        Returns:
+            WhisperModel: 로드된 모델
+        """
+        key = ModelKey(model_size, device, compute_type, cpu_threads, num_workers)
+        with self._lock:
+            if key in self.models:
+                self.models.move_to_end(key)
+                self.stats["hits"] += 1
+                return self.models[key]
+
+            loading = self._loading.get(key)
+            owner = loading is None
+            if owner:
+                loading = self._loading[key] = Future()
+                logger.info(f"Whisper 모델 ({model_size}) 로딩 중...")
+                # 새 모델을 올리기 전에 상한을 넘지 않도록 오래 사용하지 않은 모델부터 해제
+                self._enforce_limits(reserve_mb=estimate_model_memory_mb(model_size, compute_type),
+                                     reserve_models=1)
+            else:
+                self.stats["hits"] += 1
+
+        if not owner:
+            # 다른 스레드가 같은 키를 로드 중 (실패하면 같은 예외 발생)
+            return loading.result()
+
+        # 모델 로드(허브 다운로드 포함)는 잠금 밖에서 수행하여 다른 키의 요청을 막지 않음
+        try:
+            model = self.loader(key)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            loading.set_exception(e)
+            raise
+        with self._lock:
+            self.models[key] = model
+            self.stats["loads"] += 1
+            del self._loading[key]
+        loading.set_result(model)
+        return model
+
+    def _enforce_limits(self, reserve_mb: float = 0.0, reserve_models: int = 0):
+        """모델 수와 예상 메모리가 상한 이하가 되도록 LRU 모델 해제"""
+        while self.models:
+            over_count = (self.max_models is not None
+                          and len(self.models) + reserve_models > self.max_models)
+            over_memory = (self.max_memory_mb is not None
+                           and self.memory_mb() + reserve_mb > self.max_memory_mb)
+            if not (over_count or over_memory):
+                break
+            self._evict_key(next(iter(self.models)))
+
+    def _evict_key(self, key: ModelKey):
+        """키에 해당하는 모델 해제"""
+        del self.models[key]
+        self.stats["evictions"] += 1
+        gc.collect()
+        logger.info(f"🗑️ Whisper 모델 해제: {key.model_size} ({key.device or '자동'}, {key.compute_type})")
+
+    def evict(self, model_size: Optional[str] = None, device: Optional[str] = None) -> int:
+        """
+        레지스트리에서 모델 해제
+
+        Args:
+            model_size (str, optional): 해제할 모델 크기 (None이면 모든 크기)
+            device (str, optional): 해제할 장치 (None이면 모든 장치)
+
+        Returns:
+            int: 해제된 모델 수
+        """
+        with self._lock:
+            keys = [
+                key for key in self.models
+                if (model_size is None or key.model_size == model_size)
+                and (device is None or key.device == device)
+            ]
+            for key in keys:
+                self._evict_key(key)
+            return len(keys)
+
+    def memory_mb(self) -> float:
+        """현재 올라가 있는 모델들의 예상 메모리 합계 (MB)"""
+        return sum(estimate_model_memory_mb(key.model_size, key.compute_type) for key in self.models)
+
+    def resident(self) -> List[ModelKey]:
+        """현재 올라가 있는 모델 키 목록 (오래 사용하지 않은 순)"""
+        with self._lock:
+            return list(self.models)
+
+
+def _env_number(name: str, cast):
+    """환경변수 값을 숫자로 읽기 (없으면 None)"""
+    value = os.getenv(name)
+    return cast(value) if value else None
+
+
+# 프로세스 전역 레지스트리
+_registry = ModelRegistry(
+    max_models=_env_number("WHISPER_MAX_MODELS", int),
+    max_memory_mb=_env_number("WHISPER_MAX_MODEL_MEMORY_MB", float),
+)
+
+
+def get_registry() -> ModelRegistry:
+    """프로세스 전역 모델 레지스트리를 가져옵니다."""
+    return _registry
+
+
+def get_model(model_size: str,
+              device: Optional[str] = None,
+              compute_type: str = "int8",
+              cpu_threads: int = 0,
+              num_workers: int = 1) -> Any:
+    """전역 레지스트리에서 모델을 가져옵니다 (필요하면 로드)."""
+    return _registry.get(model_size, device, compute_type, cpu_threads, num_workers)
+
+
+def evict_model(model_size: Optional[str] = None, device: Optional[str] = None) -> int:
+    """전역 레지스트리에서 모델을 해제합니다."""
+    return _registry.evict(model_size, device)
@@ -1,14 +1,30 @@
-import librosa
-import soundfile as sf
-import noisereduce as nr
 import numpy as np
 import os
+import math
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import re
-from pydub import AudioSegment
-from pydub.utils import make_chunks
 import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# 매니페스트 모듈 import를 위한 경로 설정
+sys.path.append(str(Path(__file__).parent.parent))
+from src.lazy_import import lazy_import
+from src.manifest import StageManifest
+from src.loudness import normalize_loudness
+
+# 오디오 라이브러리는 실제로 사용할 때 import (--help, 인자 오류 시 빠르게 종료)
+librosa = lazy_import("librosa")
+sf = lazy_import("soundfile")
+nr = lazy_import("noisereduce")
+soxr = lazy_import("soxr")
+pydub = lazy_import("pydub")
+pydub_utils = lazy_import("pydub.utils")
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -42,7 +58,7 @@ def should_add_dummy_data(text: str, is_first_chunk: bool) -> bool:
     # 첫 번째 청크이면서 문장이 5개 이하일 때만 True 반환
     return is_first_chunk and count_sentences(text) <= 5
 
-def normalize_volume(audio_segment: AudioSegment, target_dBFS: float = -20.0) -> AudioSegment:
+def normalize_volume(audio_segment: "AudioSegment", target_dBFS: float = -20.0) -> "AudioSegment":
     """
     오디오의 볼륨을 정규화하는 함수
     
@@ -75,7 +91,7 @@ def preprocess_audio_pydub(input_path: str, output_path: str, target_dBFS: float
         logging.info(f"pydub으로 오디오 전처리 시작: {input_path}")
         
         # 1. 원본 오디오 로드
-        audio = AudioSegment.from_file(input_path)
+        audio = pydub.AudioSegment.from_file(input_path)
         
         # 오디오 정보 로깅
         logging.info(f"원본 오디오 정보: {audio.frame_rate}Hz, {audio.channels}ch, {len(audio)}ms, {audio.dBFS:.2f}dBFS")
@@ -103,19 +119,223 @@ def preprocess_audio_pydub(input_path: str, output_path: str, target_dBFS: float
         logging.error(f"pydub 전처리 오류: {str(e)}")
         return False
 
+# 정수 PCM 샘플 폭(byte)별 numpy dtype
+PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+def pcm_dbfs(samples: np.ndarray, sample_width: int) -> float:
+    """
+    정수 PCM 샘플 배열의 dBFS를 계산하는 함수 (pydub AudioSegment.dBFS와 동일한 결과)
+    
+    Parameters:
+        samples (np.ndarray): 정수 PCM 샘플 배열
+        sample_width (int): 샘플 폭 (byte)
+    
+    Returns:
+        float: dBFS 값 (무음이면 -inf)
+    """
+    if samples.size == 0:
+        return -float("inf")
+    
+    # audioop.rms와 같이 제곱합의 평균에 대한 제곱근을 정수로 버림
+    if sample_width <= 2:
+        wide = samples.astype(np.int64)
+        sum_squares = int(np.dot(wide, wide))
+    else:
+        wide = samples.astype(np.float64)
+        sum_squares = float(np.dot(wide, wide))
+    rms = int(math.sqrt(sum_squares / samples.size))
+    if not rms:
+        return -float("inf")
+    return pydub_utils.ratio_to_db(rms / float(2 ** (8 * sample_width - 1)))
+
+def pcm_apply_gain(samples: np.ndarray, sample_width: int, gain_dB: float) -> np.ndarray:
+    """
+    정수 PCM 샘플 배열에 게인을 적용하는 함수 (pydub AudioSegment.apply_gain과 동일한 결과)
+    
+    Parameters:
+        samples (np.ndarray): 정수 PCM 샘플 배열
+        sample_width (int): 샘플 폭 (byte)
+        gain_dB (float): 적용할 게인 (dB)
+    
+    Returns:
+        np.ndarray: 게인이 적용된 같은 dtype의 샘플 배열
+    """
+    max_value = float(2 ** (8 * sample_width - 1) - 1)
+    min_value = -float(2 ** (8 * sample_width - 1))
+    
+    # audioop.mul과 같이 범위를 벗어나면 클리핑, 그 외에는 -inf 방향으로 버림
+    scaled = samples * pydub_utils.db_to_float(float(gain_dB))
+    result = np.floor(scaled)
+    result[scaled > max_value] = max_value
+    result[scaled < min_value + 1.0] = min_value
+    return result.astype(samples.dtype)
+
+def normalize_pcm(samples: np.ndarray, sample_width: int, target_dBFS: float = -20.0) -> np.ndarray:
+    """
+    정수 PCM 샘플 배열의 볼륨을 정규화하는 함수 (normalize_volume의 numpy 버전)
+    
+    Parameters:
+        samples (np.ndarray): 정수 PCM 샘플 배열
+        sample_width (int): 샘플 폭 (byte)
+        target_dBFS (float): 목표 dBFS 값
+    
+    Returns:
+        np.ndarray: 볼륨이 정규화된 샘플 배열
+    """
+    current_dBFS = pcm_dbfs(samples, sample_width)
+    normalized = pcm_apply_gain(samples, sample_width, target_dBFS - current_dBFS)
+    
+    logging.info(f"볼륨 정규화: {current_dBFS:.2f} dBFS -> {pcm_dbfs(normalized, sample_width):.2f} dBFS")
+    return normalized
+
+def load_for_denoise(input_path: str,
+                     target_dBFS: float = -20.0,
+                     use_pydub_preprocessing: bool = True,
+                     loudness_method: str = "rms",
+                     channel: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    노이즈 제거 입력용 오디오를 메모리에서 디코딩하는 함수
+    
+    pydub 전처리를 사용하면 모노/16kHz 변환과 1차 볼륨 정규화까지 수행합니다.
+    디코딩과 채널/샘플레이트 변환은 pydub(audioop)이 메모리 상에서 처리하고,
+    이후 단계는 numpy 배열로 진행하므로 임시 파일을 만들지 않습니다.
+    
+    Parameters:
+        input_path (str): 입력 오디오 파일 경로
+        target_dBFS (float): 1차 볼륨 정규화 목표 레벨 (ebu_r128이면 LUFS)
+        use_pydub_preprocessing (bool): pydub을 사용한 전처리 여부
+        loudness_method (str): 볼륨 정규화 방식 ("pcm", "rms", "ebu_r128")
+        channel (int, optional): 지정하면 모노로 합치지 않고 해당 채널만 사용 (채널 분리 전사)
+    
+    Returns:
+        Tuple[np.ndarray, int]: (float32 모노 오디오 배열, 샘플레이트)
+    """
+    if not use_pydub_preprocessing:
+        if channel is None:
+            return librosa.load(input_path, sr=None)
+        audio_data, sample_rate = librosa.load(input_path, sr=None, mono=False)
+        return np.atleast_2d(audio_data)[channel], sample_rate
+    
+    logging.info(f"pydub으로 오디오 디코딩 시작: {input_path}")
+    audio = pydub.AudioSegment.from_file(input_path)
+    
+    # 오디오 정보 로깅
+    logging.info(f"원본 오디오 정보: {audio.frame_rate}Hz, {audio.channels}ch, {len(audio)}ms, {audio.dBFS:.2f}dBFS")
+    
+    # 모노로 변환 (필요한 경우, 채널 분리 모드이면 해당 채널만 사용)
+    if channel is not None:
+        audio = audio.split_to_mono()[channel]
+        logging.info(f"채널 {channel}만 사용")
+    elif audio.channels > 1:
+        audio = audio.set_channels(1)
+        logging.info("스테레오를 모노로 변환")
+    
+    # 샘플레이트 정규화 (16kHz가 일반적)
+    if audio.frame_rate != 16000:
+        audio = audio.set_frame_rate(16000)
+        logging.info(f"샘플레이트를 16kHz로 변환")
+    
+    sample_width = audio.sample_width
+    samples = np.frombuffer(audio.raw_data, dtype=PCM_DTYPES[sample_width])
+    scale = float(2 ** (8 * sample_width - 1))
+    
+    if loudness_method == "pcm":
+        # 1차 볼륨 정규화 (정수 PCM 상태에서 수행하여 기존 WAV 경유 결과와 동일하게 유지)
+        samples = normalize_pcm(samples, sample_width, target_dBFS)
+        return (samples / scale).astype(np.float32), audio.frame_rate
+    
+    # 1차 볼륨 정규화 (float32 배열에서 제자리 처리)
+    audio_data = samples.astype(np.float32)
+    audio_data *= np.float32(1.0 / scale)
+    normalize_loudness(audio_data, audio.frame_rate, target_dBFS, loudness_method)
+    return audio_data, audio.frame_rate
+
+def preprocess_to_array(input_path: str,
+                        noise_clip_duration: float = 2.0,
+                        target_dBFS: float = -20.0,
+                        use_pydub_preprocessing: bool = True,
+                        loudness_method: str = "rms",
+                        true_peak_limit: Optional[float] = None,
+                        channel: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    디코딩 -> 모노/리샘플링 -> 노이즈 제거 -> 볼륨 정규화를 메모리에서 수행하는 함수
+    
+    Parameters:
+        input_path (str): 입력 오디오 파일 경로
+        noise_clip_duration (float): 노이즈 샘플로 사용할 오디오 시작 부분의 길이(초)
+        target_dBFS (float): 목표 볼륨 레벨 (ebu_r128이면 LUFS)
+        use_pydub_preprocessing (bool): pydub을 사용한 전처리 여부
+        loudness_method (str): 볼륨 정규화 방식
+            - "rms": float32 배열의 RMS 기준 (기본값)
+            - "ebu_r128": EBU R128 통합 라우드니스 기준
+            - "pcm": 16-bit PCM 정수 연산 (기존 pydub 결과와 바이트 단위로 동일)
+        true_peak_limit (float, optional): 최종 true-peak 한계 (dBTP, pcm 방식에서는 미사용)
+        channel (int, optional): 지정하면 모노로 합치지 않고 해당 채널만 전처리 (채널 분리 전사)
+    
+    Returns:
+        Tuple[np.ndarray, int]: (float32 모노 오디오 배열, 샘플레이트)
+    """
+    # 1단계: 디코딩 및 기본 전처리
+    audio_data, sample_rate = load_for_denoise(input_path, target_dBFS, use_pydub_preprocessing, loudness_method,
+                                               channel)
+    
+    # 2단계: noisereduce를 사용한 노이즈 제거
+    logging.info("노이즈 제거 시작 (noisereduce)")
+    
+    # 오디오 시작 부분에서 노이즈 샘플 추출
+    noise_clip = audio_data[:int(noise_clip_duration * sample_rate)]
+    
+    # 노이즈 제거 수행
+    reduced_noise = nr.reduce_noise(
+        y=audio_data,
+        sr=sample_rate,
+        y_noise=noise_clip,
+        stationary=True,
+        prop_decrease=0.8  # 1.0에서 0.8로 조정하여 과도한 제거 방지
+    )
+    
+    # 3단계: 최종 볼륨 정규화
+    logging.info("최종 볼륨 정규화")
+    if loudness_method == "pcm":
+        audio_int16 = (reduced_noise * 32767).astype(np.int16)
+        final_int16 = normalize_pcm(audio_int16, 2, target_dBFS)
+        return final_int16.astype(np.float32) / 32768.0, sample_rate
+    
+    reduced_noise = reduced_noise.astype(np.float32, copy=False)
+    normalize_loudness(reduced_noise, sample_rate, target_dBFS, loudness_method, true_peak_limit)
+    return reduced_noise, sample_rate
+
+def write_pcm16(output_path: str, audio_data: np.ndarray, sample_rate: int) -> None:
+    """
+    float 오디오 배열을 16-bit PCM WAV로 저장하는 함수 (범위를 벗어난 샘플은 제자리에서 클리핑)
+    
+    Parameters:
+        output_path (str): 출력 오디오 파일 경로
+        audio_data (np.ndarray): float 모노 오디오 배열
+        sample_rate (int): 샘플레이트
+    """
+    np.clip(audio_data, -1.0, 32767 / 32768, out=audio_data)
+    sf.write(output_path, audio_data, sample_rate, subtype='PCM_16')
+
 def reduce_noise_advanced(input_path: str, output_path: str, 
                          noise_clip_duration: float = 2.0, 
                          target_dBFS: float = -20.0,
-                         use_pydub_preprocessing: bool = True) -> bool:
+                         use_pydub_preprocessing: bool = True,
+                         loudness_method: str = "rms",
+                         true_peak_limit: Optional[float] = None) -> bool:
     """
     고급 오디오 전처리: 노이즈 제거 + 볼륨 정규화
     
+    모든 단계를 메모리에서 처리하고 결과 WAV 파일만 한 번 저장합니다.
+    
     Parameters:
         input_path (str): 입력 오디오 파일 경로
         output_path (str): 출력 오디오 파일 경로
         noise_clip_duration (float): 노이즈 샘플로 사용할 오디오 시작 부분의 길이(초)
-        target_dBFS (float): 목표 볼륨 레벨 (dBFS)
+        target_dBFS (float): 목표 볼륨 레벨 (ebu_r128이면 LUFS)
         use_pydub_preprocessing (bool): pydub을 사용한 전처리 여부
+        loudness_method (str): 볼륨 정규화 방식 ("rms", "ebu_r128", "pcm")
+        true_peak_limit (float, optional): 최종 true-peak 한계 (dBTP)
     
     Returns:
         bool: 처리 성공 여부
@@ -123,63 +343,201 @@ def reduce_noise_advanced(input_path: str, output_path: str,
     try:
         logging.info(f"고급 오디오 전처리 시작: {input_path}")
         
-        if use_pydub_preprocessing:
-            # 1단계: pydub을 사용한 기본 전처리
-            temp_path = output_path.replace('.wav', '_temp.wav')
-            if not preprocess_audio_pydub(input_path, temp_path, target_dBFS):
-                return False
-            input_for_denoise = temp_path
-        else:
-            input_for_denoise = input_path
+        audio_data, sample_rate = preprocess_to_array(
+            input_path, noise_clip_duration, target_dBFS, use_pydub_preprocessing,
+            loudness_method, true_peak_limit
+        )
         
-        # 2단계: librosa + noisereduce를 사용한 노이즈 제거
-        logging.info("노이즈 제거 시작 (librosa + noisereduce)")
+        # 4단계: 최종 저장
+        write_pcm16(output_path, audio_data, sample_rate)
         
-        # 오디오 파일 로드
-        audio_data, sample_rate = librosa.load(input_for_denoise, sr=None)
+        logging.info(f"고급 전처리 완료: {output_path}")
+        return True
         
-        # 오디오 시작 부분에서 노이즈 샘플 추출
-        noise_clip = audio_data[:int(noise_clip_duration * sample_rate)]
+    except Exception as e:
+        logging.error(f"고급 전처리 오류: {str(e)}")
+        return False
+
+def _iter_mono_blocks(input_path: str, block_frames: int,
+                      target_sr: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    soundfile로 오디오를 블록 단위로 읽어 모노(+리샘플링) float32 블록을 반환하는 제너레이터
+    
+    Parameters:
+        input_path (str): 입력 오디오 파일 경로
+        block_frames (int): 한 번에 읽을 입력 프레임 수
+        target_sr (int, optional): 리샘플링할 샘플레이트 (None이면 원본 유지)
+    
+    Yields:
+        np.ndarray: float32 모노 오디오 블록
+    """
+    with sf.SoundFile(input_path) as audio_file:
+        resampler = None
+        if target_sr and audio_file.samplerate != target_sr:
+            resampler = soxr.ResampleStream(audio_file.samplerate, target_sr, 1, dtype='float32')
+        
+        for block in audio_file.blocks(blocksize=block_frames, dtype='float32', always_2d=True):
+            mono = block.mean(axis=1, dtype=np.float32)
+            if resampler is not None:
+                mono = resampler.resample_chunk(mono)
+            if mono.size:
+                yield mono
         
-        # 노이즈 제거 수행
-        reduced_noise = nr.reduce_noise(
-            y=audio_data,
+        if resampler is not None:
+            tail = resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+            if tail.size:
+                yield tail
+
+def _denoise_overlap_add(blocks: Iterable[np.ndarray], sample_rate: int,
+                         noise_frames: int, hop_frames: int,
+                         overlap_frames: int) -> Iterator[np.ndarray]:
+    """
+    고정된 노이즈 프로파일로 오디오를 윈도우 단위로 노이즈 제거하고 overlap-add로 이어 붙이는 제너레이터
+    
+    각 윈도우는 hop_frames + overlap_frames 길이이며, 이웃한 윈도우의 겹치는 구간은
+    raised-cosine 크로스페이드로 합쳐 경계에서 불연속이 생기지 않도록 합니다.
+    노이즈 프로파일은 스트림 시작 부분 noise_frames 샘플로 한 번만 추출합니다.
+    
+    Parameters:
+        blocks (Iterable[np.ndarray]): float32 모노 입력 블록
+        sample_rate (int): 샘플레이트
+        noise_frames (int): 노이즈 샘플로 사용할 시작 부분 길이 (샘플)
+        hop_frames (int): 윈도우 간 간격 (샘플)
+        overlap_frames (int): 이웃 윈도우와 겹치는 길이 (샘플)
+    
+    Yields:
+        np.ndarray: 노이즈가 제거된 float32 출력 블록 (입력과 같은 총 길이)
+    """
+    window_frames = hop_frames + overlap_frames
+    fade_in = (0.5 - 0.5 * np.cos(np.linspace(0.0, np.pi, overlap_frames))).astype(np.float32)
+    fade_out = 1.0 - fade_in
+    
+    pending = np.zeros(0, dtype=np.float32)
+    noise_clip = None
+    previous_tail = None
+    blocks = iter(blocks)
+    exhausted = False
+    
+    while True:
+        # 윈도우 하나 (첫 윈도우는 노이즈 샘플 길이 이상)를 채울 때까지 읽기
+        required = window_frames if noise_clip is not None else max(window_frames, noise_frames)
+        chunks = [pending]
+        available = pending.size
+        while not exhausted and available < required:
+            try:
+                chunk = next(blocks)
+            except StopIteration:
+                exhausted = True
+                break
+            chunks.append(chunk)
+            available += chunk.size
+        pending = np.concatenate(chunks) if len(chunks) > 1 else pending
+        
+        if noise_clip is None:
+            if pending.size == 0:
+                return
+            noise_clip = pending[:noise_frames].copy()
+        
+        is_last = exhausted and pending.size <= window_frames
+        window = pending if is_last else pending[:window_frames]
+        
+        # 이전 윈도우에서 이미 출력한 겹침 구간만 남은 경우
+        if is_last and previous_tail is not None and window.size <= overlap_frames:
+            yield previous_tail[:window.size]
+            return
+        
+        denoised = nr.reduce_noise(
+            y=window,
             sr=sample_rate,
             y_noise=noise_clip,
             stationary=True,
-            prop_decrease=0.8  # 1.0에서 0.8로 조정하여 과도한 제거 방지
-        )
+            prop_decrease=0.8
+        ).astype(np.float32, copy=False)
         
-        # 3단계: 최종 볼륨 정규화 (pydub 사용)
-        logging.info("최종 볼륨 정규화")
+        if previous_tail is not None:
+            denoised[:overlap_frames] = previous_tail * fade_out + denoised[:overlap_frames] * fade_in
         
-        # numpy 배열을 AudioSegment로 변환
-        # 16-bit PCM으로 변환
-        audio_int16 = (reduced_noise * 32767).astype(np.int16)
+        if is_last:
+            yield denoised
+            return
         
-        final_audio = AudioSegment(
-            audio_int16.tobytes(),
-            frame_rate=sample_rate,
-            sample_width=2,  # 16-bit = 2 bytes
-            channels=1
-        )
+        yield denoised[:hop_frames]
+        previous_tail = denoised[hop_frames:].copy()
+        pending = pending[hop_frames:]
+
+def reduce_noise_streaming(input_path: str, output_path: str,
+                           noise_clip_duration: float = 2.0,
+                           target_dBFS: float = -20.0,
+                           block_duration: float = 30.0,
+                           overlap_duration: float = 1.0,
+                           target_sr: Optional[int] = 16000) -> bool:
+    """
+    긴 녹음용 스트리밍 전처리: 블록 단위 노이즈 제거 + 볼륨 정규화
+    
+    파일 전체를 메모리에 올리지 않고 soundfile로 블록을 읽어 처리하므로
+    최대 메모리 사용량이 녹음 길이가 아닌 블록 길이에 비례합니다.
+    최종 볼륨 정규화에는 전체 RMS가 필요하므로 노이즈 제거 결과를 float32 부분 파일에
+    먼저 기록한 뒤, 두 번째 패스에서 게인을 적용하여 16-bit PCM WAV로 저장합니다.
+    
+    Parameters:
+        input_path (str): 입력 오디오 파일 경로 (soundfile이 읽을 수 있는 포맷)
+        output_path (str): 출력 오디오 파일 경로
+        noise_clip_duration (float): 노이즈 샘플로 사용할 오디오 시작 부분의 길이(초)
+        target_dBFS (float): 목표 볼륨 레벨 (dBFS)
+        block_duration (float): 노이즈 제거 블록 길이(초)
+        overlap_duration (float): 블록 간 크로스페이드 길이(초)
+        target_sr (int, optional): 출력 샘플레이트 (None이면 원본 유지)
+    
+    Returns:
+        bool: 처리 성공 여부
+    """
+    partial_path = os.path.splitext(output_path)[0] + '_partial.wav'
+    try:
+        logging.info(f"스트리밍 오디오 전처리 시작: {input_path}")
         
-        # 최종 볼륨 정규화
-        final_normalized = normalize_volume(final_audio, target_dBFS)
+        with sf.SoundFile(input_path) as audio_file:
+            logging.info(f"원본 오디오 정보: {audio_file.samplerate}Hz, {audio_file.channels}ch, {audio_file.frames / audio_file.samplerate:.2f}s")
+            sample_rate = target_sr or audio_file.samplerate
+            read_frames = int(block_duration * audio_file.samplerate)
         
-        # 4단계: 최종 저장
-        final_normalized.export(output_path, format="wav")
+        hop_frames = int(block_duration * sample_rate)
+        overlap_frames = int(overlap_duration * sample_rate)
+        noise_frames = int(noise_clip_duration * sample_rate)
         
-        # 임시 파일 정리
-        if use_pydub_preprocessing and os.path.exists(temp_path):
-            os.remove(temp_path)
+        # 1차 패스: 블록 단위 노이즈 제거 결과를 부분 파일에 기록하며 RMS 누적
+        logging.info(f"블록 단위 노이즈 제거 시작 (블록 {block_duration}s, 겹침 {overlap_duration}s)")
+        sum_squares = 0.0
+        total_frames = 0
+        with sf.SoundFile(partial_path, 'w', samplerate=sample_rate, channels=1, subtype='FLOAT') as partial:
+            blocks = _iter_mono_blocks(input_path, read_frames, target_sr)
+            for block in _denoise_overlap_add(blocks, sample_rate, noise_frames, hop_frames, overlap_frames):
+                partial.write(block)
+                block64 = block.astype(np.float64)
+                sum_squares += float(np.dot(block64, block64))
+                total_frames += block.size
         
-        logging.info(f"고급 전처리 완료: {output_path}")
+        # 2차 패스: 최종 볼륨 정규화 및 16-bit PCM 저장
+        rms = math.sqrt(sum_squares / total_frames) if total_frames else 0.0
+        current_dBFS = pydub_utils.ratio_to_db(rms)
+        gain = pydub_utils.db_to_float(target_dBFS - current_dBFS) if rms > 0 else 1.0
+        logging.info(f"볼륨 정규화: {current_dBFS:.2f} dBFS -> {target_dBFS:.2f} dBFS")
+        
+        with sf.SoundFile(partial_path) as partial, \
+                sf.SoundFile(output_path, 'w', samplerate=sample_rate, channels=1, subtype='PCM_16') as output:
+            for block in partial.blocks(blocksize=hop_frames, dtype='float32'):
+                block *= gain
+                np.clip(block, -1.0, 32767 / 32768, out=block)
+                output.write(block)
+        
+        logging.info(f"스트리밍 전처리 완료: {output_path}")
         return True
         
     except Exception as e:
-        logging.error(f"고급 전처리 오류: {str(e)}")
+        logging.error(f"스트리밍 전처리 오류: {str(e)}")
         return False
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
 
 def reduce_noise(input_path, output_path, noise_clip_duration=2.0):
     """
@@ -187,20 +545,140 @@ def reduce_noise(input_path, output_path, noise_clip_duration=2.0):
     """
     return reduce_noise_advanced(input_path, output_path, noise_clip_duration, use_pydub_preprocessing=False)
 
+# 프로세스 풀 워커에서 스레드 수를 제한할 BLAS/FFT 관련 환경 변수
+THREAD_LIMIT_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+class _BufferingHandler(logging.Handler):
+    """워커 프로세스의 로그 레코드를 모아 두었다가 부모 프로세스로 전달하는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # 부모 프로세스로 pickle 전달이 가능하도록 메시지를 미리 포맷
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+def _init_worker(threads_per_worker: int) -> None:
+    """
+    프로세스 풀 워커 초기화 함수
+    
+    BLAS/FFT 스레드 수를 제한하여 워커 수 x 스레드 수가 코어 수를 넘지 않도록 하고,
+    워커의 로그가 직접 출력되어 순서가 섞이지 않도록 루트 핸들러를 비웁니다.
+    
+    Parameters:
+        threads_per_worker (int): 워커당 허용할 스레드 수
+    """
+    for env_var in THREAD_LIMIT_ENV_VARS:
+        os.environ[env_var] = str(threads_per_worker)
+    
+    # 이미 로드된 BLAS 라이브러리는 환경 변수를 다시 읽지 않으므로 threadpoolctl로 제한
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=threads_per_worker)
+    except ImportError:
+        pass
+    
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(logging.INFO)
+
+def check_streaming_options(loudness_method: str = "rms", true_peak_limit: Optional[float] = None) -> None:
+    """
+    스트리밍 모드에서 지원하지 않는 정규화 설정 거부
+    
+    reduce_noise_streaming은 전체 RMS 기준 게인만 적용하므로, 다른 정규화 방식이나
+    true-peak 한계를 지정하면 적용되지 않은 설정이 매니페스트에 기록되는 대신 오류를 발생시킵니다.
+    """
+    if loudness_method != "rms" or true_peak_limit is not None:
+        raise ValueError("스트리밍 모드는 loudness_method='rms'만 지원하며 true_peak_limit을 사용할 수 없습니다.")
+
+def _process_file(input_path: str, output_path: str,
+                  noise_clip_duration: float = 2.0,
+                  target_dBFS: float = -20.0,
+                  use_advanced_processing: bool = True,
+                  streaming: bool = False,
+                  block_duration: float = 30.0,
+                  loudness_method: str = "rms",
+                  true_peak_limit: Optional[float] = None) -> bool:
+    """
+    처리 방법에 따라 단일 파일을 전처리하는 함수 (순차/병렬 공통)
+    """
+    if streaming:
+        return reduce_noise_streaming(input_path, output_path, noise_clip_duration, target_dBFS,
+                                      block_duration=block_duration,
+                                      target_sr=16000 if use_advanced_processing else None)
+    if use_advanced_processing:
+        return reduce_noise_advanced(input_path, output_path, noise_clip_duration, target_dBFS,
+                                     loudness_method=loudness_method, true_peak_limit=true_peak_limit)
+    return reduce_noise(input_path, output_path, noise_clip_duration)
+
+def _process_file_in_worker(input_path: str, output_path: str,
+                            options: Dict[str, Any]) -> Tuple[bool, List[logging.LogRecord]]:
+    """
+    워커 프로세스에서 단일 파일을 처리하고 (성공 여부, 로그 레코드 목록)을 반환하는 함수
+    
+    예외는 워커 안에서 처리하여 한 파일의 실패가 다른 파일에 영향을 주지 않도록 합니다.
+    """
+    handler = _BufferingHandler()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        success = _process_file(input_path, output_path, **options)
+    except Exception as e:
+        logging.exception(f"워커 처리 오류: {str(e)}")
+        success = False
+    finally:
+        root_logger.removeHandler(handler)
+    return success, handler.records
+
 def process_directory(input_dir: str, output_dir: str, 
                      noise_clip_duration: float = 2.0, 
                      target_dBFS: float = -20.0,
-                     use_advanced_processing: bool = True) -> None:
+                     use_advanced_processing: bool = True,
+                     workers: int = 1,
+                     threads_per_worker: int = 1,
+                     streaming: bool = False,
+                     block_duration: float = 30.0,
+                     force: bool = False,
+                     loudness_method: str = "rms",
+                     true_peak_limit: Optional[float] = None) -> None:
     """
     지정된 디렉토리 내의 모든 오디오 파일에 대해 고급 전처리를 수행하는 함수
     
+    출력 디렉토리의 매니페스트에 입력 해시와 처리 설정을 기록하여,
+    다시 실행할 때 변경되지 않은 파일은 건너뜁니다.
+    
     Parameters:
         input_dir (str): 입력 오디오 파일들이 있는 디렉토리 경로
         output_dir (str): 처리된 오디오 파일들을 저장할 디렉토리 경로
         noise_clip_duration (float): 노이즈 샘플로 사용할 오디오 시작 부분의 길이(초)
         target_dBFS (float): 목표 볼륨 레벨 (dBFS)
         use_advanced_processing (bool): 고급 전처리 사용 여부
+        workers (int): 병렬 처리에 사용할 프로세스 수 (1이면 순차 처리)
+        threads_per_worker (int): 워커당 BLAS/FFT 스레드 수 (병렬 처리 시에만 적용)
+        streaming (bool): 블록 단위 스트리밍 노이즈 제거 사용 여부 (긴 녹음용)
+        block_duration (float): 스트리밍 모드의 블록 길이(초)
+        force (bool): 매니페스트와 관계없이 모든 파일을 다시 처리할지 여부
+        loudness_method (str): 볼륨 정규화 방식 ("rms", "ebu_r128", "pcm")
+        true_peak_limit (float, optional): 최종 true-peak 한계 (dBTP)
     """
+    if streaming:
+        check_streaming_options(loudness_method, true_peak_limit)
+    
     # 지원하는 오디오 파일 확장자
     AUDIO_EXTENSIONS = {'.wav', '.mp3', '.flac', '.m4a', '.ogg'}
     
@@ -209,52 +687,175 @@ def process_directory(input_dir: str, output_dir: str,
     
     # 입력 디렉토리의 모든 파일 처리
     input_path = Path(input_dir)
-    successful_count = 0
-    failed_count = 0
     
     # 오디오 파일 목록 수집
     audio_files = [f for f in input_path.rglob('*') if f.suffix.lower() in AUDIO_EXTENSIONS]
     
     logging.info(f"총 {len(audio_files)}개의 오디오 파일을 처리합니다.")
-    logging.info(f"설정: 노이즈 클립 길이={noise_clip_duration}s, 목표 볼륨={target_dBFS}dBFS, 고급 처리={use_advanced_processing}")
+    logging.info(f"설정: 노이즈 클립 길이={noise_clip_duration}s, 목표 볼륨={target_dBFS}dBFS, 고급 처리={use_advanced_processing}, 스트리밍={streaming}, 워커={workers}")
     
-    for idx, audio_file in enumerate(audio_files):
+    # 입력/출력 경로 쌍 생성
+    jobs = []
+    for audio_file in audio_files:
         # 출력 파일 경로 생성
         relative_path = audio_file.relative_to(input_path)
         output_path = Path(output_dir) / relative_path.with_suffix('.wav')  # 항상 wav로 저장
         
         # 출력 파일의 디렉토리가 없으면 생성
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        logging.info(f"\n[{idx + 1}/{len(audio_files)}] 처리 중: {audio_file}")
-        
-        # 처리 방법 선택
-        if use_advanced_processing:
-            success = reduce_noise_advanced(
-                str(audio_file), 
-                str(output_path), 
-                noise_clip_duration, 
-                target_dBFS
-            )
-        else:
-            success = reduce_noise(str(audio_file), str(output_path), noise_clip_duration)
-        
+        jobs.append((audio_file, output_path))
+    
+    # 처리 설정 (매니페스트 파라미터로도 사용)
+    options = {
+        "noise_clip_duration": noise_clip_duration,
+        "target_dBFS": target_dBFS,
+        "use_advanced_processing": use_advanced_processing,
+        "streaming": streaming,
+        "block_duration": block_duration,
+        "loudness_method": loudness_method,
+        "true_peak_limit": true_peak_limit,
+    }
+    
+    # 입력 해시와 설정이 같고 출력이 남아 있는 파일은 건너뛰기
+    manifest = StageManifest(output_dir, "preprocessing")
+    skipped_count = 0
+    if not force:
+        pending_jobs = []
+        for audio_file, output_path in jobs:
+            if manifest.is_up_to_date(str(audio_file), options):
+                skipped_count += 1
+                logging.info(f"⏭️ 변경 없음, 건너뜀: {audio_file}")
+            else:
+                pending_jobs.append((audio_file, output_path))
+        jobs = pending_jobs
+    
+    if workers > 1 and len(jobs) > 1:
+        results = _run_jobs_parallel(jobs, options, workers, threads_per_worker)
+    else:
+        results = _run_jobs_sequential(jobs, options)
+    
+    successful_count = 0
+    failed_count = 0
+    for (audio_file, output_path), success in zip(jobs, results):
         if success:
             successful_count += 1
-            logging.info(f"✅ 성공: {output_path}")
+            # 완료 즉시 기록하여 중단 후 재실행 시에도 이어서 처리
+            manifest.record(str(audio_file), options, [str(output_path)])
         else:
             failed_count += 1
-            logging.error(f"❌ 실패: {audio_file}")
     
     # 처리 결과 출력
     logging.info(f"\n🎯 처리 완료 요약:")
     logging.info(f"✅ 성공: {successful_count} 파일")
+    logging.info(f"⏭️ 건너뜀: {skipped_count} 파일")
     logging.info(f"❌ 실패: {failed_count} 파일")
     logging.info(f"📁 출력 디렉토리: {output_dir}")
 
+def _log_result(audio_file: Path, output_path: Path, success: bool) -> None:
+    """파일별 처리 결과 로그 출력"""
+    if success:
+        logging.info(f"✅ 성공: {output_path}")
+    else:
+        logging.error(f"❌ 실패: {audio_file}")
+
+def _run_jobs_sequential(jobs: List[Tuple[Path, Path]],
+                         options: Dict[str, Any]) -> Iterator[bool]:
+    """
+    파일들을 현재 프로세스에서 하나씩 처리하는 제너레이터
+    
+    Yields:
+        bool: jobs 순서대로의 처리 성공 여부
+    """
+    for idx, (audio_file, output_path) in enumerate(jobs):
+        logging.info(f"\n[{idx + 1}/{len(jobs)}] 처리 중: {audio_file}")
+        
+        success = _process_file(str(audio_file), str(output_path), **options)
+        _log_result(audio_file, output_path, success)
+        yield success
+
+def _run_jobs_parallel(jobs: List[Tuple[Path, Path]],
+                       options: Dict[str, Any],
+                       workers: int,
+                       threads_per_worker: int) -> Iterator[bool]:
+    """
+    파일들을 프로세스 풀에 분배하여 병렬로 처리하는 제너레이터
+    
+    워커의 로그는 버퍼링했다가 입력 순서대로 다시 출력하므로
+    순차 처리와 같은 순서의 로그와 요약을 얻을 수 있습니다.
+    
+    워커 프로세스가 비정상 종료되면(BrokenProcessPool) 풀의 남은 작업이 모두 실패하므로,
+    아직 결과를 받지 못한 첫 파일을 단독 워커에서 다시 실행하여 원인 파일인지 확인하고
+    (원인 파일만 실패로 집계) 나머지는 새 풀에서 이어서 처리합니다.
+    
+    Yields:
+        bool: jobs 순서대로의 처리 성공 여부
+    """
+    root_logger = logging.getLogger()
+    
+    def new_pool(max_workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                   initargs=(threads_per_worker,))
+    
+    def submit(executor: ProcessPoolExecutor, idx: int):
+        audio_file, output_path = jobs[idx]
+        return executor.submit(_process_file_in_worker, str(audio_file), str(output_path), options)
+    
+    def report(idx: int, result: Optional[Tuple[bool, List[logging.LogRecord]]], error: Optional[str] = None) -> bool:
+        audio_file, output_path = jobs[idx]
+        logging.info(f"\n[{idx + 1}/{len(jobs)}] 처리 중: {audio_file}")
+        success = False
+        if result is not None:
+            success, records = result
+            for record in records:
+                root_logger.handle(record)
+        else:
+            logging.error(f"워커 실행 오류: {error}")
+        _log_result(audio_file, output_path, success)
+        return success
+    
+    position = 0
+    finished: Dict[int, Tuple[bool, List[logging.LogRecord]]] = {}  # 풀이 깨지기 전에 끝난 결과
+    while position < len(jobs):
+        broken = False
+        with new_pool(workers) as executor:
+            futures = {idx: submit(executor, idx) for idx in range(position, len(jobs)) if idx not in finished}
+            # 완료 순서와 관계없이 입력 순서대로 결과와 로그를 출력
+            while position < len(jobs):
+                try:
+                    result = finished.pop(position, None) or futures[position].result()
+                except BrokenProcessPool:
+                    broken = True
+                    finished.update({idx: future.result() for idx, future in futures.items()
+                                     if idx > position and future.done() and future.exception() is None})
+                    break
+                except Exception as e:
+                    yield report(position, None, str(e))
+                else:
+                    yield report(position, result)
+                position += 1
+        if not broken:
+            break
+        
+        # 결과를 받지 못한 첫 파일을 단독 실행하여 워커를 종료시킨 파일인지 확인
+        logging.warning(f"워커 프로세스 비정상 종료, 남은 {len(jobs) - position}개 파일을 새 워커로 다시 처리합니다.")
+        with new_pool(1) as executor:
+            try:
+                result = submit(executor, position).result()
+            except BrokenProcessPool:
+                yield report(position, None, "워커 프로세스 비정상 종료")
+            except Exception as e:
+                yield report(position, None, str(e))
+            else:
+                yield report(position, result)
+        position += 1
+
 def process_single_file(input_path: str, output_path: str, 
                        noise_clip_duration: float = 2.0, 
-                       target_dBFS: float = -20.0) -> bool:
+                       target_dBFS: float = -20.0,
+                       streaming: bool = False,
+                       block_duration: float = 30.0,
+                       loudness_method: str = "rms",
+                       true_peak_limit: Optional[float] = None) -> bool:
     """
     단일 파일에 대한 고급 전처리 수행
     
@@ -263,6 +864,10 @@ def process_single_file(input_path: str, output_path: str,
         output_path (str): 출력 오디오 파일 경로
         noise_clip_duration (float): 노이즈 샘플 길이 (초)
         target_dBFS (float): 목표 볼륨 레벨
+        streaming (bool): 블록 단위 스트리밍 노이즈 제거 사용 여부
+        block_duration (float): 스트리밍 모드의 블록 길이(초)
+        loudness_method (str): 볼륨 정규화 방식 ("rms", "ebu_r128", "pcm")
+        true_peak_limit (float, optional): 최종 true-peak 한계 (dBTP)
     
     Returns:
         bool: 처리 성공 여부
@@ -270,7 +875,12 @@ def process_single_file(input_path: str, output_path: str,
     # 출력 디렉토리 생성
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    return reduce_noise_advanced(input_path, output_path, noise_clip_duration, target_dBFS)
+    if streaming:
+        check_streaming_options(loudness_method, true_peak_limit)
+        return reduce_noise_streaming(input_path, output_path, noise_clip_duration, target_dBFS,
+                                      block_duration=block_duration)
+    return reduce_noise_advanced(input_path, output_path, noise_clip_duration, target_dBFS,
+                                 loudness_method=loudness_method, true_peak_limit=true_peak_limit)
 
 if __name__ == "__main__":
     # 사용 예시
@@ -284,8 +894,22 @@ if __name__ == "__main__":
     parser.add_argument('--basic', action='store_true', help='기본 처리만 사용 (고급 처리 비활성화)')
     parser.add_argument('--single-file', '-f', help='단일 파일 처리 (입력 파일 경로)')
     parser.add_argument('--single-output', help='단일 파일 출력 경로 (--single-file과 함께 사용)')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='병렬 처리 프로세스 수 (기본값: 1, 순차 처리)')
+    parser.add_argument('--threads-per-worker', type=int, default=1, help='워커당 BLAS/FFT 스레드 수 (기본값: 1)')
+    parser.add_argument('--streaming', action='store_true', help='블록 단위 스트리밍 노이즈 제거 (긴 녹음의 메모리 사용량 제한)')
+    parser.add_argument('--block-duration', type=float, default=30.0, help='스트리밍 모드 블록 길이 (초, 기본값: 30)')
+    parser.add_argument('--force', action='store_true', help='매니페스트와 관계없이 모든 파일 다시 처리')
+    parser.add_argument('--loudness-method', choices=['rms', 'ebu_r128', 'pcm'], default='rms',
+                        help='볼륨 정규화 방식 (rms: RMS dBFS, ebu_r128: LUFS, pcm: 기존 pydub 호환, 기본값: rms)')
+    parser.add_argument('--true-peak-limit', type=float, default=None,
+                        help='true-peak 리미터 한계 (dBTP, 예: -1.0, 기본값: 미사용)')
     
     args = parser.parse_args()
+    if args.streaming:
+        try:
+            check_streaming_options(args.loudness_method, args.true_peak_limit)
+        except ValueError as e:
+            parser.error(str(e))
     
     if args.single_file:
         # 단일 파일 처리
@@ -294,7 +918,11 @@ if __name__ == "__main__":
             args.single_file, 
             output_path, 
             args.noise_duration, 
-            args.target_volume
+            args.target_volume,
+            args.streaming,
+            args.block_duration,
+            args.loudness_method,
+            args.true_peak_limit
         )
         if success:
             print(f"✅ 단일 파일 처리 완료: {output_path}")
@@ -307,7 +935,14 @@ if __name__ == "__main__":
             args.output, 
             args.noise_duration, 
             args.target_volume, 
-            not args.basic
+            not args.basic,
+            args.workers,
+            args.threads_per_worker,
+            args.streaming,
+            args.block_duration,
+            args.force,
+            args.loudness_method,
+            args.true_peak_limit
         )
     
     # 추가 사용 예시 (주석 처리)
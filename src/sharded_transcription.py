@@ -0,0 +1,182 @@
+"""
+긴 녹음을 무음 구간에서 나누어 병렬로 전사하는 모듈
+
+파일 하나를 model.transcribe 한 번으로 처리하면 코어 수와 관계없이 전체 디코딩 시간이
+그대로 지연 시간이 됩니다. 이 모듈은 긴 무음 지점에서 오디오를 샤드로 나누고,
+num_workers개의 모델 복제본(CTranslate2 워커)에 스레드로 나누어 전사한 뒤
+타임스탬프를 원래 파일 기준으로 옮겨 하나의 세그먼트 목록으로 이어 붙입니다.
+"""
+import dataclasses
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 무음 탐지 프레임 길이 (초)
+SILENCE_FRAME_SECONDS = 0.1
+
+# 상위 5% 프레임 레벨보다 이만큼 낮으면 무음으로 판단 (dB)
+SILENCE_RELATIVE_DB = -35.0
+
+# 레벨과 관계없이 무음으로 판단하는 절대 기준 (dBFS)
+SILENCE_ABSOLUTE_DBFS = -60.0
+
+
+def find_silences(audio: np.ndarray,
+                  sample_rate: int,
+                  min_silence_duration: float = 1.0) -> List[Tuple[float, float]]:
+    """
+    프레임 에너지 기준으로 긴 무음 구간을 찾는 함수
+
+    샤드 경계를 정하는 용도이므로 VAD보다 훨씬 가벼운 RMS 기준을 사용합니다
+    (각 샤드의 음성 구간 판단은 전사 시 VAD가 다시 수행).
+
+    Args:
+        audio (np.ndarray): 16kHz float32 모노 오디오
+        sample_rate (int): 샘플레이트
+        min_silence_duration (float): 샤드 경계로 사용할 최소 무음 길이 (초)
+
+    Returns:
+        List[Tuple[float, float]]: (시작, 끝) 초 단위 무음 구간 목록
+    """
+    frame = int(SILENCE_FRAME_SECONDS * sample_rate)
+    n_frames = audio.size // frame
+    if n_frames == 0:
+        return []
+
+    frames = audio[:n_frames * frame].reshape(n_frames, frame).astype(np.float64)
+    with np.errstate(divide="ignore"):
+        level_db = 10 * np.log10(np.einsum("ij,ij->i", frames, frames) / frame)
+    finite = level_db[np.isfinite(level_db)]
+    reference = np.percentile(finite, 95) if finite.size else SILENCE_ABSOLUTE_DBFS
+    threshold = max(reference + SILENCE_RELATIVE_DB, SILENCE_ABSOLUTE_DBFS)
+    silent = level_db < threshold
+
+    # 연속된 무음 프레임 구간 찾기
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    min_frames = math.ceil(min_silence_duration / SILENCE_FRAME_SECONDS)
+    return [
+        (start * SILENCE_FRAME_SECONDS, end * SILENCE_FRAME_SECONDS)
+        for start, end in zip(starts, ends)
+        if end - start >= min_frames
+    ]
+
+
+def plan_shards(audio: np.ndarray,
+                sample_rate: int,
+                num_shards: int,
+                min_silence_duration: float = 1.0) -> List[Tuple[int, int]]:
+    """
+    오디오를 비슷한 길이의 샤드로 나눌 경계를 무음 구간 중앙에서 고르는 함수
+
+    Args:
+        audio (np.ndarray): 16kHz float32 모노 오디오
+        sample_rate (int): 샘플레이트
+        num_shards (int): 목표 샤드 수
+        min_silence_duration (float): 샤드 경계로 사용할 최소 무음 길이 (초)
+
+    Returns:
+        List[Tuple[int, int]]: 샤드별 (시작, 끝) 샘플 범위 (파일 전체를 빈틈없이 덮음)
+    """
+    total = audio.size
+    if num_shards <= 1 or total == 0:
+        return [(0, total)]
+
+    candidates = [int((start + end) / 2 * sample_rate)
+                  for start, end in find_silences(audio, sample_rate, min_silence_duration)]
+    cuts = []
+    for k in range(1, num_shards):
+        target = total * k / num_shards
+        remaining = [c for c in candidates if (not cuts or c > cuts[-1]) and 0 < c < total]
+        if not remaining:
+            break
+        cuts.append(min(remaining, key=lambda c: abs(c - target)))
+
+    bounds = [0] + sorted(set(cuts)) + [total]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def shift_segment(segment: Any, offset: float) -> Any:
+    """세그먼트와 단어 타임스탬프를 offset(초)만큼 이동한 사본"""
+    words = getattr(segment, "words", None)
+    if words:
+        words = [dataclasses.replace(word, start=word.start + offset, end=word.end + offset)
+                 if dataclasses.is_dataclass(word) else
+                 type(word)(**{**vars(word), "start": word.start + offset, "end": word.end + offset})
+                 for word in words]
+    changes = {"start": segment.start + offset, "end": segment.end + offset, "words": words}
+    if dataclasses.is_dataclass(segment):
+        return dataclasses.replace(segment, **changes)
+    return type(segment)(**{**vars(segment), **changes})
+
+
+def transcribe_sharded(model: Any,
+                       audio: np.ndarray,
+                       workers: int,
+                       language: Optional[str] = "ko",
+                       shard_duration: float = 600.0,
+                       min_silence_duration: float = 1.0,
+                       sample_rate: int = 16000,
+                       **transcribe_options) -> Tuple[List[Any], Any]:
+    """
+    긴 오디오를 무음 지점에서 샤드로 나누어 병렬 전사한 뒤 하나로 이어 붙이는 함수
+
+    모델은 num_workers >= workers로 로드되어야 여러 스레드의 transcribe 호출이
+    실제로 병렬 실행됩니다. 샤드는 최소 workers개, 대략 shard_duration 길이로 나누어
+    먼저 끝난 워커가 다음 샤드를 가져가도록 합니다.
+
+    Args:
+        model (WhisperModel): 로드된 모델
+        audio (np.ndarray): 16kHz float32 모노 오디오
+        workers (int): 동시에 전사할 샤드 수 (모델 복제본 수)
+        language (str, optional): 언어 설정 (None이면 앞부분에서 한 번 감지하여 모든 샤드에 사용)
+        shard_duration (float): 목표 샤드 길이 (초)
+        min_silence_duration (float): 샤드 경계로 사용할 최소 무음 길이 (초)
+        sample_rate (int): 샘플레이트
+        **transcribe_options: model.transcribe에 전달할 옵션
+
+    Returns:
+        Tuple[List[Segment], TranscriptionInfo]: 원본 파일 기준 시간의 세그먼트 목록과 전사 정보
+    """
+    duration = audio.size / sample_rate
+    num_shards = max(workers, math.ceil(duration / shard_duration))
+    shards = plan_shards(audio, sample_rate, num_shards, min_silence_duration)
+    logging.info(f"샤드 전사: {duration:.1f}초 -> {len(shards)}개 샤드, 워커 {workers}개")
+
+    # 샤드마다 언어가 다르게 감지되지 않도록 한 번만 감지
+    language_probability = None
+    if language is None:
+        language, language_probability, _ = model.detect_language(
+            audio, vad_filter=True, language_detection_segments=1
+        )
+        logging.info(f"감지된 언어: {language} (확률: {language_probability:.2f})")
+
+    def run_shard(bounds: Tuple[int, int]):
+        start, end = bounds
+        segments, info = model.transcribe(audio[start:end], language=language, **transcribe_options)
+        # 디코딩은 세그먼트를 순회할 때 수행되므로 워커 스레드에서 끝까지 소비
+        offset = start / sample_rate
+        return [shift_segment(segment, offset) for segment in segments], info
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_shard, shards))
+
+    # 세그먼트 번호는 AudioTranscriptInfo.add_segment와 같이 파일 전체에서 1부터 다시 매김
+    stitched = []
+    for shard_segments, _ in results:
+        for segment in shard_segments:
+            if dataclasses.is_dataclass(segment):
+                segment = dataclasses.replace(segment, id=len(stitched) + 1)
+            stitched.append(segment)
+    info = results[0][1]
+    if dataclasses.is_dataclass(info):
+        changes: Dict[str, Any] = {"duration": duration}
+        if hasattr(info, "duration_after_vad"):
+            changes["duration_after_vad"] = sum(shard_info.duration_after_vad for _, shard_info in results)
+        if language_probability is not None:
+            changes["language_probability"] = language_probability
+        info = dataclasses.replace(info, **changes)
+    return stitched, info
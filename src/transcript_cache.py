@@ -0,0 +1,224 @@
+"""
+전사 결과 캐시 (내용 주소 기반)
+
+같은 녹음을 같은 설정으로 다시 전사하는 경우(추출 프롬프트 변경 후 재실행, 중복 업로드,
+재내보내기 등) 디코딩 없이 이전 결과를 재사용하기 위한 디스크 캐시입니다.
+
+키는 오디오 내용의 SHA-256과 전사 설정(model_size, language, 디코딩 옵션, VAD 옵션)으로 만들고,
+값은 AudioTranscriptInfo.save_to_json과 같은 구조의 JSON입니다.
+전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from src.audio_transcript_info import JsonSerializer
+
+# 캐시 항목 구조가 바뀌면 올려서 이전 항목을 무효화
+CACHE_VERSION = 1
+
+# 기본 캐시 크기 상한 (MB)
+DEFAULT_CACHE_SIZE_MB = 1024.0
+
+# 파일 해시 계산 시 읽기 단위
+HASH_CHUNK_SIZE = 1 << 20
+
+# 캐시 항목 직렬화 (사람이 읽을 일이 없으므로 항상 들여쓰기 없이, orjson이 있으면 사용)
+CACHE_SERIALIZER = JsonSerializer(compact=True)
+
+
+@lru_cache(maxsize=1024)
+def _file_sha256(path: str, size: int, mtime_ns: int) -> str:
+    """파일 내용의 SHA-256 (같은 프로세스에서 크기/수정 시각이 같으면 재계산하지 않음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def audio_sha256(audio: Union[str, np.ndarray]) -> str:
+    """
+    오디오 내용의 SHA-256 계산
+
+    Args:
+        audio: 오디오 파일 경로 또는 16kHz float32 모노 배열 (전처리+전사 통합 모드)
+
+    Returns:
+        str: 16진수 해시
+    """
+    if isinstance(audio, np.ndarray):
+        return hashlib.sha256(np.ascontiguousarray(audio, dtype=np.float32).tobytes()).hexdigest()
+    stat = os.stat(audio)
+    return _file_sha256(os.path.abspath(audio), stat.st_size, stat.st_mtime_ns)
+
+
+def cache_key(audio_hash: str,
+              model_size: str,
+              language: Optional[str],
+              decoding_options: Dict[str, Any],
+              vad_options: Dict[str, Any]) -> str:
+    """
+    오디오 해시와 전사 설정으로 캐시 키 생성
+
+    Args:
+        audio_hash (str): 오디오 내용의 SHA-256
+        model_size (str): 모델 크기
+        language (str, optional): 언어 설정
+        decoding_options (Dict): beam_size, patience 등 디코딩 옵션
+        vad_options (Dict): VadOptions 필드
+
+    Returns:
+        str: 캐시 키 (SHA-256)
+    """
+    params = {
+        "version": CACHE_VERSION,
+        "audio": audio_hash,
+        "model_size": model_size,
+        "language": language,
+        "decoding": decoding_options,
+        "vad": vad_options,
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TranscriptCache:
+    """크기 상한이 있는 LRU 전사 결과 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, max_size_mb: float = DEFAULT_CACHE_SIZE_MB):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = int(max_size_mb * 2 ** 20)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+
+        # 기존 항목을 마지막 사용 시각(mtime) 순으로 색인
+        entries = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(cache_dir, name))
+                entries.append((stat.st_mtime_ns, name[:-len(".json")], stat.st_size))
+        self.entries: "OrderedDict[str, int]" = OrderedDict(
+            (key, size) for _, key, size in sorted(entries)
+        )
+        # 항목 크기 합계 (삭제 루프에서 매번 다시 더하지 않도록 유지)
+        self._total_bytes: int = sum(self.entries.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 전사 결과 조회
+
+        Args:
+            key (str): cache_key로 만든 키
+
+        Returns:
+            Optional[Dict]: save_to_json과 같은 구조의 전사 결과 (없으면 None)
+        """
+        with self._lock:
+            if key not in self.entries:
+                self.stats["misses"] += 1
+                return None
+            path = self._path(key)
+            try:
+                data = CACHE_SERIALIZER.load_file(path)
+                os.utime(path)
+            except (OSError, ValueError):
+                # 외부에서 삭제되었거나 손상된 항목
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return data
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """
+        전사 결과 저장 (크기 상한을 넘으면 오래 사용하지 않은 항목부터 삭제)
+
+        Args:
+            key (str): cache_key로 만든 키
+            data (Dict): save_to_json과 같은 구조의 전사 결과
+        """
+        payload = CACHE_SERIALIZER.dumps(data)
+        with self._lock:
+            path = self._path(key)
+            tmp_path = f"{path}.tmp{threading.get_ident()}"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(payload) - self.entries.get(key, 0)
+            self.entries[key] = len(payload)
+            self.entries.move_to_end(key)
+            while self._total_bytes > self.max_bytes and len(self.entries) > 1:
+                self._remove(next(iter(self.entries)))
+                self.stats["evictions"] += 1
+
+    def _remove(self, key: str):
+        """항목 삭제"""
+        self._total_bytes -= self.entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def size_bytes(self) -> int:
+        """캐시 항목 전체 크기 (바이트)"""
+        return self._total_bytes
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            for key in list(self.entries):
+                self._remove(key)
+
+
+def _cache_from_env() -> Optional[TranscriptCache]:
+    """환경변수 설정으로 캐시 생성 (WHISPER_TRANSCRIPT_CACHE_DIR이 없으면 사용 안 함)"""
+    cache_dir = os.getenv("WHISPER_TRANSCRIPT_CACHE_DIR")
+    if not cache_dir:
+        return None
+    max_size_mb = float(os.getenv("WHISPER_TRANSCRIPT_CACHE_MB") or DEFAULT_CACHE_SIZE_MB)
+    return TranscriptCache(cache_dir, max_size_mb)
+
+
+# 프로세스 전역 캐시 (처음 요청될 때 환경변수로 생성)
+_transcript_cache: Optional[TranscriptCache] = None
+_configured = False
+
+
+def get_transcript_cache() -> Optional[TranscriptCache]:
+    """프로세스 전역 전사 캐시를 가져옵니다 (설정되지 않았으면 None)."""
+    global _transcript_cache, _configured
+    if not _configured:
+        _transcript_cache = _cache_from_env()
+        _configured = True
+    return _transcript_cache
+
+
+def configure_transcript_cache(cache_dir: Optional[str],
+                               max_size_mb: float = DEFAULT_CACHE_SIZE_MB) -> Optional[TranscriptCache]:
+    """
+    프로세스 전역 전사 캐시 설정
+
+    Args:
+        cache_dir (str, optional): 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        max_size_mb (float): 캐시 크기 상한 (MB)
+
+    Returns:
+        Optional[TranscriptCache]: 설정된 캐시
+    """
+    global _transcript_cache, _configured
+    _transcript_cache = TranscriptCache(cache_dir, max_size_mb) if cache_dir else None
+    _configured = True
+    logging.info(f"전사 캐시: {cache_dir or '사용 안 함'}")
+    return _transcript_cache
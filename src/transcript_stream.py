@@ -0,0 +1,411 @@
+"""
+전사 결과 스트리밍 기록 (JSONL)
+
+faster-whisper가 세그먼트를 생성하는 즉시 한 줄씩 `.jsonl` 파일에 추가 기록합니다.
+전사 도중 중단되어도 그때까지의 세그먼트가 남고, 다른 단계는 전사가 끝나기 전에
+기록된 세그먼트부터 읽어 처리를 시작할 수 있습니다.
+
+레코드 형식 (한 줄에 하나):
+    {"type": "header", "audio_file": ..., "started_at": ...}
+    {"type": "segment", "id": "1", "start": ..., "end": ..., "text": ..., "words": [...]}
+    {"type": "resume", "resumed_at": ..., "decoded_until": ...}
+    {"type": "end", "json_file": ...}
+
+종료 레코드가 없는 스트림은 중단된 전사의 체크포인트로 사용되어,
+다시 실행하면 마지막으로 디코딩된 시점부터 이어서 전사합니다.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from src.audio_transcript_info import AudioTranscriptInfo, WordTimestamp
+
+# 기록 중인 스트림은 배타적 잠금(flock)으로 표시 (fcntl이 없는 플랫폼에서는 잠금 없이 동작)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 스트림 파일 확장자
+STREAM_SUFFIX = ".jsonl"
+
+# 노드 장애에도 체크포인트가 남도록 디스크에 동기화하는 간격 (초)
+CHECKPOINT_INTERVAL = 30.0
+
+
+class StreamLockedError(RuntimeError):
+    """다른 writer(같은 프로세스 또는 다른 프로세스)가 기록 중인 스트림"""
+
+
+def _lock(f) -> None:
+    """스트림 파일에 배타적 잠금 (이미 잠겨 있으면 StreamLockedError)"""
+    if fcntl is None:
+        return
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        raise StreamLockedError(f"다른 writer가 기록 중인 스트림입니다: {f.name}") from None
+
+
+def is_stream_locked(stream_path: str) -> bool:
+    """스트림을 기록 중인 writer가 있는지 확인 (잠금을 잡았다가 바로 해제)"""
+    if fcntl is None:
+        return False
+    with open(stream_path, "rb") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+    return False
+
+
+class TranscriptStreamWriter:
+    """전사 세그먼트를 생성 즉시 JSONL 파일에 추가 기록하는 클래스"""
+
+    def __init__(self,
+                 audio_path: str,
+                 output_dir: str,
+                 params: Optional[Dict[str, Any]] = None,
+                 checkpoint_interval: float = CHECKPOINT_INTERVAL):
+        os.makedirs(output_dir, exist_ok=True)
+        self.audio_path: str = os.path.abspath(audio_path)
+        self.started_at: datetime = datetime.now()
+        base_name = os.path.splitext(os.path.basename(audio_path))[0]
+        timestamp = self.started_at.strftime("%Y%m%d_%H%M%S")
+        self.path: str = os.path.join(output_dir, f"{base_name}_{timestamp}{STREAM_SUFFIX}")
+        # 같은 초에 시작한 다른 스트림(체크포인트)을 덮어쓰지 않도록 번호 추가
+        count = 1
+        while True:
+            try:
+                self._file = open(self.path, "x", encoding="utf-8")
+                break
+            except FileExistsError:
+                self.path = os.path.join(output_dir, f"{base_name}_{timestamp}_{count}{STREAM_SUFFIX}")
+                count += 1
+        # 헤더를 쓰기 전에 잠가서 다른 전사가 기록 중인 스트림을 이어 받지 않도록 함
+        _lock(self._file)
+        self._lock_file = self._file
+        self.segment_count: int = 0
+        self.decoded_until: float = 0.0
+        self.checkpoint_interval: float = checkpoint_interval
+        self._last_sync: float = time.monotonic()
+        self._write({"type": "header", "audio_file": self.audio_path,
+                     "started_at": self.started_at.isoformat(), "params": params or {}})
+
+    @classmethod
+    def resume(cls, stream_path: str,
+               checkpoint_interval: float = CHECKPOINT_INTERVAL) -> "TranscriptStreamWriter":
+        """
+        중단된 스트림에 이어서 기록하는 writer 생성
+
+        기록 도중 끊긴 마지막 줄은 잘라내고, 이미 기록된 세그먼트 수와
+        마지막으로 디코딩된 시점(decoded_until)을 복원합니다.
+
+        Args:
+            stream_path (str): 종료 레코드가 없는 스트림 파일 경로
+            checkpoint_interval (float): 디스크 동기화 간격 (초)
+
+        Returns:
+            TranscriptStreamWriter: 이어서 기록할 writer
+
+        Raises:
+            StreamLockedError: 다른 writer가 아직 기록 중인 스트림인 경우
+        """
+        # 잠금은 writer를 닫을 때까지 유지
+        lock_file = open(stream_path, "rb+")
+        try:
+            _lock(lock_file)
+            data = lock_file.read()
+            lock_file.truncate(data.rfind(b"\n") + 1)
+        except BaseException:
+            lock_file.close()
+            raise
+
+        writer = cls.__new__(cls)
+        writer._lock_file = lock_file
+        writer.path = stream_path
+        writer.segment_count = 0
+        writer.decoded_until = 0.0
+        for record in iter_stream_records(stream_path):
+            if record["type"] == "header":
+                writer.audio_path = record["audio_file"]
+                writer.started_at = datetime.fromisoformat(record["started_at"])
+            elif record["type"] == "segment":
+                writer.segment_count += 1
+                writer.decoded_until = max(writer.decoded_until, _segment_end(record))
+            elif record["type"] == "end":
+                lock_file.close()
+                raise ValueError(f"이미 완료된 스트림입니다: {stream_path}")
+        writer.checkpoint_interval = checkpoint_interval
+        writer._last_sync = time.monotonic()
+        writer._file = open(stream_path, "a", encoding="utf-8")
+        writer._write({"type": "resume", "resumed_at": datetime.now().isoformat(),
+                       "decoded_until": writer.decoded_until})
+        return writer
+
+    def _write(self, record: Dict[str, Any]):
+        """레코드 한 줄 기록 (다른 프로세스가 바로 읽을 수 있도록 flush, 주기적으로 fsync)"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if time.monotonic() - self._last_sync >= self.checkpoint_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = time.monotonic()
+
+    def write_segment(self, segment: Any) -> Dict[str, Any]:
+        """
+        faster-whisper 세그먼트 하나를 기록
+
+        세그먼트 id는 AudioTranscriptInfo.add_segment와 같이 1부터 매기는 문자열입니다.
+
+        Args:
+            segment: start, end, text, words 속성을 가진 세그먼트
+
+        Returns:
+            Dict[str, Any]: 기록된 레코드
+        """
+        self.segment_count += 1
+        words = getattr(segment, "words", None) or []
+        record = {
+            "type": "segment",
+            "id": str(self.segment_count),
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "words": [
+                {"word": word.word, "start": word.start, "end": word.end, "is_pii": False}
+                for word in words
+            ],
+        }
+        self._write(record)
+        self.decoded_until = max(self.decoded_until, _segment_end(record))
+        return record
+
+    def tee(self, segments: Iterable[Any]) -> Iterator[Any]:
+        """세그먼트를 그대로 전달하면서 각 세그먼트를 기록하는 제너레이터"""
+        for segment in segments:
+            self.write_segment(segment)
+            yield segment
+
+    def finalize(self, transcript: AudioTranscriptInfo, output_dir: str) -> str:
+        """
+        기존 JSON 형식의 최종 결과를 저장하고 스트림에 종료 레코드 기록
+
+        Args:
+            transcript (AudioTranscriptInfo): 완성된 전사 정보
+            output_dir (str): JSON 파일이 저장될 디렉토리
+
+        Returns:
+            str: 저장된 JSON 파일 경로
+        """
+        output_path = transcript.save_to_json(output_dir)
+        self._write({"type": "end", "json_file": os.path.abspath(output_path)})
+        os.fsync(self._file.fileno())
+        self.close()
+        return output_path
+
+    def close(self):
+        """스트림 파일 닫기 (종료 레코드 없이 닫으면 미완료 스트림으로 남음, 잠금 해제)"""
+        if not self._file.closed:
+            self._file.close()
+        if not self._lock_file.closed:
+            self._lock_file.close()
+
+
+def _segment_end(record: Dict[str, Any]) -> float:
+    """세그먼트 레코드가 덮는 마지막 시점 (단어 끝이 세그먼트 끝을 넘는 경우 포함)"""
+    return max([record["end"]] + [word["end"] for word in record["words"]])
+
+
+def iter_stream_records(stream_path: str,
+                        follow: bool = False,
+                        poll_interval: float = 0.5,
+                        timeout: Optional[float] = None,
+                        stop: Optional[threading.Event] = None) -> Iterator[Dict[str, Any]]:
+    """
+    스트림 파일의 레코드를 순서대로 읽는 함수
+
+    follow=True이면 종료 레코드가 나올 때까지 새로 추가되는 줄을 기다리며 읽습니다
+    (전사가 진행 중인 파일을 다른 단계에서 따라 읽는 용도).
+
+    Args:
+        stream_path (str): 스트림 파일 경로
+        follow (bool): 종료 레코드까지 추가 기록을 기다릴지 여부
+        poll_interval (float): 새 줄 확인 간격 (초)
+        timeout (float, optional): 새 줄 없이 기다릴 최대 시간 (초, None이면 무제한)
+        stop (threading.Event, optional): 설정되면 남은 줄까지만 읽고 종료 (기록하던 쪽이 실패한 경우)
+
+    Yields:
+        Dict[str, Any]: header, segment, end 레코드
+    """
+    with open(stream_path, "r", encoding="utf-8") as f:
+        pending = ""
+        draining = False
+        idle_since = time.monotonic()
+        while True:
+            line = f.readline()
+            if line:
+                pending += line
+                if not pending.endswith("\n"):
+                    # 기록 중인 줄은 완성될 때까지 대기
+                    continue
+                record = json.loads(pending)
+                pending = ""
+                idle_since = time.monotonic()
+                yield record
+                if record.get("type") == "end":
+                    return
+                continue
+
+            if not follow:
+                return
+            if stop is not None and stop.is_set():
+                # 중지 직전에 기록된 줄까지 한 번 더 읽은 뒤 종료
+                if draining:
+                    return
+                draining = True
+                continue
+            if timeout is not None and time.monotonic() - idle_since > timeout:
+                raise TimeoutError(f"스트림에 새 기록이 없습니다: {stream_path}")
+            time.sleep(poll_interval)
+
+
+def iter_stream_segments(stream_path: str, follow: bool = False, **kwargs) -> Iterator[Dict[str, Any]]:
+    """스트림 파일에서 세그먼트 레코드만 읽는 함수 (인자는 iter_stream_records와 동일)"""
+    for record in iter_stream_records(stream_path, follow, **kwargs):
+        if record.get("type") == "segment":
+            yield record
+
+
+def load_stream(stream_path: str) -> AudioTranscriptInfo:
+    """
+    스트림 파일(완료 여부와 관계없이)에서 AudioTranscriptInfo를 구성하는 함수
+
+    Args:
+        stream_path (str): 스트림 파일 경로
+
+    Returns:
+        AudioTranscriptInfo: 기록된 세그먼트로 구성한 전사 정보
+    """
+    transcript = None
+    for record in iter_stream_records(stream_path):
+        if record["type"] == "header":
+            transcript = AudioTranscriptInfo(record["audio_file"])
+            transcript.processed_date = datetime.fromisoformat(record["started_at"])
+        elif record["type"] == "segment":
+            segment = transcript.add_segment(record["start"], record["end"], record["text"],
+                                             segment_id=record["id"])
+            segment.words = [
+                WordTimestamp(word["word"], word["start"], word["end"], word.get("is_pii", False))
+                for word in record["words"]
+            ]
+    if transcript is None:
+        raise ValueError(f"스트림 헤더가 없습니다: {stream_path}")
+    return transcript
+
+
+def finalize_stream(stream_path: str, output_dir: Optional[str] = None,
+                    model_info: Optional[str] = None) -> str:
+    """
+    중단된 스트림을 기존 JSON 형식으로 저장하는 함수 (기록된 세그먼트까지)
+
+    Args:
+        stream_path (str): 스트림 파일 경로
+        output_dir (str, optional): JSON 파일이 저장될 디렉토리 (기본값: 스트림 파일과 같은 디렉토리)
+        model_info (str, optional): 모델 정보
+
+    Returns:
+        str: 저장된 JSON 파일 경로
+    """
+    transcript = load_stream(stream_path)
+    processed_date = transcript.processed_date
+    full_text = " ".join(segment.text for segment in transcript.segments)
+    transcript.add_transcript(full_text.strip(), 0.0, model_info)
+    # 파일 이름은 스트림과 같은 시각 기준으로 유지
+    transcript.processed_date = processed_date
+    return transcript.save_to_json(output_dir or os.path.dirname(os.path.abspath(stream_path)))
+
+
+def find_resumable_stream(audio_path: str,
+                          output_dir: str,
+                          params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    같은 오디오 파일과 전사 설정으로 기록되다 중단된 스트림을 찾는 함수
+
+    종료 레코드가 없어도 다른 writer가 잠그고 기록 중인 스트림은 제외합니다.
+
+    Args:
+        audio_path (str): 오디오 파일 경로
+        output_dir (str): 스트림 파일이 저장된 디렉토리
+        params (Dict[str, Any], optional): 헤더에 기록된 전사 설정과 비교할 값
+            (모델이나 언어가 바뀐 경우 이어 붙이지 않음)
+
+    Returns:
+        Optional[str]: 가장 최근에 시작된 중단 스트림 경로 (없으면 None)
+    """
+    if not os.path.isdir(output_dir):
+        return None
+
+    audio_path = os.path.abspath(audio_path)
+    base_name = os.path.splitext(os.path.basename(audio_path))[0]
+    candidates = []
+    for name in os.listdir(output_dir):
+        if not (name.startswith(f"{base_name}_") and name.endswith(STREAM_SUFFIX)):
+            continue
+        stream_path = os.path.join(output_dir, name)
+        if is_stream_locked(stream_path):
+            continue
+        header, finished = None, False
+        for record in iter_stream_records(stream_path):
+            if record["type"] == "header":
+                header = record
+            finished = record["type"] == "end"
+        if (header is None or finished or header["audio_file"] != audio_path
+                or header.get("params", {}) != (params or {})):
+            continue
+        candidates.append((header["started_at"], stream_path))
+    return max(candidates)[1] if candidates else None
+
+
+def move_stream_output(audio_path: str, output_dir: str, json_path: str, target_path: str) -> Optional[str]:
+    """
+    완성된 결과 JSON을 다른 이름으로 옮기고 스트림 종료 레코드의 json_file도 새 경로로 바꾸는 함수
+    (내용 주소 기반 이름 등 전사가 끝난 뒤 이름을 정하는 경우)
+
+    Args:
+        audio_path (str): 오디오 파일 경로
+        output_dir (str): 스트림 파일이 저장된 디렉토리
+        json_path (str): finalize가 저장한 결과 JSON 경로
+        target_path (str): 옮길 경로
+
+    Returns:
+        Optional[str]: 종료 레코드를 바꾼 스트림 경로 (스트림 없이 저장된 결과면 None)
+    """
+    os.replace(json_path, target_path)
+    json_path = os.path.abspath(json_path)
+    base_name = os.path.splitext(os.path.basename(audio_path))[0]
+    for name in os.listdir(output_dir):
+        if not (name.startswith(f"{base_name}_") and name.endswith(STREAM_SUFFIX)):
+            continue
+        stream_path = os.path.join(output_dir, name)
+        with open(stream_path, "rb") as f:
+            data = f.read()
+        body, _, last_line = data.rstrip(b"\n").rpartition(b"\n")
+        try:
+            record = json.loads(last_line)
+        except ValueError:
+            continue
+        if record.get("type") != "end" or record.get("json_file") != json_path:
+            continue
+        # 종료 레코드만 바꾼 사본으로 원자적으로 교체 (중간에 멈춰도 미완료 스트림으로 보이지 않도록)
+        record["json_file"] = os.path.abspath(target_path)
+        tmp_path = f"{stream_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body + b"\n" + json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, stream_path)
+        return stream_path
+    return None
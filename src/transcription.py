@@ -1,26 +1,82 @@
 import os
-from faster_whisper import WhisperModel, vad
 import sys
 import time
+from datetime import datetime
 from pathlib import Path
 import argparse
+import itertools
 import logging
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy as np
 
 # AudioTranscript 클래스 import를 위한 경로 설정
 sys.path.append(str(Path(__file__).parent.parent))
-from src.audio_transcript_info import AudioTranscriptInfo
+from src.audio_buffer_cache import AUDIO_BUFFER_DECODER, DEFAULT_BUFFER_DIR, DEFAULT_BUFFER_SIZE_MB, \
+    configure_audio_buffer_cache, get_audio_buffer_cache
+from src.audio_transcript_info import AudioTranscriptInfo, configure_json_serializer
+from src.channel_transcription import STEREO_CHANNELS, channel_audit_paths, channel_count, transcribe_channels
+from src.decoding import (DECODING_OPTIONS, DECODING_PRESETS, DEFAULT_PRESET, VAD_OPTIONS, DecodingConfig,
+                          get_decoding_config, redecode_segments)
+from src.sharded_transcription import shift_segment, transcribe_sharded
+from src.transcript_cache import (TranscriptCache, audio_sha256, cache_key, configure_transcript_cache,
+                                  get_transcript_cache)
+from src.transcript_stream import StreamLockedError, TranscriptStreamWriter, find_resumable_stream, load_stream, \
+    move_stream_output
+from src.manifest import StageManifest
+from src.model_registry import get_model
+from src.lazy_import import lazy_import
+from src.preprocessing import preprocess_to_array, write_pcm16
+
+# faster-whisper(CTranslate2, PyAV)와 soxr는 실제로 전사할 때 import (--help, 인자 오류 시 빠르게 종료)
+soxr = lazy_import("soxr")
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Whisper 입력 샘플레이트 (ndarray 입력은 16kHz float32 모노여야 함)
+WHISPER_SAMPLE_RATE = 16000
+
+def load_audio(audio_file_path: str) -> np.ndarray:
+    """
+    오디오 파일을 Whisper 입력(16kHz float32 모노)으로 디코딩
+    
+    오디오 버퍼 캐시가 설정되어 있으면 내보내기 단계와 공유하는 디코딩 결과의 읽기 전용 배열을 반환합니다.
+    """
+    buffers = get_audio_buffer_cache()
+    if buffers is not None:
+        return buffers.load(audio_file_path, WHISPER_SAMPLE_RATE)[0]
+    from faster_whisper import decode_audio
+    return decode_audio(audio_file_path, sampling_rate=WHISPER_SAMPLE_RATE)
+
+def audio_decoder_params() -> dict:
+    """
+    파일 입력의 디코딩 방식 파라미터 (매니페스트/캐시/스트림 파라미터에 추가)
+    
+    오디오 버퍼 캐시는 PyAV 대신 soundfile+soxr로 디코딩하여 Whisper 입력이 달라질 수 있으므로
+    버퍼를 사용할 때만 표시합니다 (기본 디코딩의 기존 결과는 그대로 유효).
+    """
+    return {"audio_decoder": AUDIO_BUFFER_DECODER} if get_audio_buffer_cache() is not None else {}
+
+# 전처리+전사 통합 모드의 기본 전처리 설정 (preprocessing.preprocess_to_array 인자)
+PREPROCESS_OPTIONS = {
+    "noise_clip_duration": 2.0,
+    "target_dBFS": -20.0,
+    "loudness_method": "rms",
+    "true_peak_limit": None,
+}
+
 
 def transcribe_audio(audio_file_path: str, 
                     model_size: str = "medium", 
                     output_dir: str = "output/transcript",
                     language: Optional[str] = "ko",
                     device: Optional[str] = None,
-                    verbose: bool = True) -> str:
+                    verbose: bool = True,
+                    decoding: Union[str, DecodingConfig, None] = None,
+                    word_timestamps: bool = True) -> str:
     """
     faster-whisper를 사용하여 음성 파일을 전사하는 함수
     
@@ -31,10 +87,14 @@ def transcribe_audio(audio_file_path: str,
         language (str, optional): 언어 설정 (ko, en, None=자동감지)
         device (str, optional): 장치 설정 (cuda, cpu, None=자동선택)
         verbose (bool): 상세 출력 여부
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): False이면 세그먼트 단위로만 전사 (단어 정렬은 추출 단계에서 PII 세그먼트만 수행)
     
     Returns:
         str: 저장된 JSON 파일 경로
     """
+    config = get_decoding_config(decoding)
+    
     # 파일 존재 확인
     if not os.path.exists(audio_file_path):
         raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {audio_file_path}")
@@ -42,9 +102,7 @@ def transcribe_audio(audio_file_path: str,
     # 출력 디렉토리 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 모델 로드 (GPU 사용 시도, 실패하면 CPU로 대체)
-    logging.info(f"Whisper 모델 ({model_size}) 로딩 중...")
-    
+    # 모델 가져오기 (프로세스 전역 레지스트리에서 재사용, 처음이면 GPU 시도 후 CPU로 대체)
     model = load_whisper_model(model_size, device)
     
     if verbose:
@@ -53,24 +111,21 @@ def transcribe_audio(audio_file_path: str,
     # 전사 시작 시간 기록
     start_time = time.time()
     
+    # 적응형 디코딩은 세그먼트 구간을 다시 잘라 쓰므로 미리 디코딩
+    audio = load_audio(audio_file_path) if config.adaptive else None
+    
     # 음성 파일 전사
     segments, info = model.transcribe(
-        audio_file_path, 
+        audio_file_path if audio is None else audio,
         language=language,  # 언어 설정
-        beam_size=5,        # 빔 서치 크기
-        temperature=0.0,
-        patience=1.2,
-        word_timestamps=True,  # 단어별 타임스탬프 포함
+        word_timestamps=word_timestamps,  # 단어별 타임스탬프 포함
         vad_filter=True,
-        vad_parameters=vad.VadOptions(
-            threshold=0.3,
-            neg_threshold=0.15,
-            min_speech_duration_ms=1200,
-            max_speech_duration_s=30,
-            min_silence_duration_ms=2000,
-            speech_pad_ms=1000
-        )
+        vad_parameters=config.vad_parameters(),
+        **config.decoding_options()
     )
+    if config.adaptive:
+        segments = redecode_segments(model, audio, segments, config, language or info.language,
+                                     word_timestamps=word_timestamps)
     
     # 처리 시간 계산
     processing_time = time.time() - start_time
@@ -111,50 +166,59 @@ def transcribe_audio(audio_file_path: str,
         logging.info(f"전사 결과가 {output_path}에 저장되었습니다.")
     return output_path
 
-def load_whisper_model(model_size: str, device: Optional[str] = None) -> WhisperModel:
+def load_whisper_model(model_size: str,
+                       device: Optional[str] = None,
+                       compute_type: str = "int8",
+                       cpu_threads: int = 0,
+                       num_workers: int = 1) -> "WhisperModel":
     """
-    Whisper 모델을 로드하는 함수
+    Whisper 모델을 가져오는 함수
+    
+    프로세스 전역 모델 레지스트리(src/model_registry.py)를 사용하므로
+    같은 (모델 크기, 장치, 연산 타입, CPU 스레드 수, 워커 수) 조합은 한 번만 로드됩니다.
     
     Args:
         model_size (str): 모델 크기
-        device (str, optional): 장치 설정
+        device (str, optional): 장치 설정 (None=GPU 시도 후 CPU로 대체)
+        compute_type (str): 연산 타입
+        cpu_threads (int): CPU 스레드 수 (0=기본값)
+        num_workers (int): 병렬 transcribe 호출용 모델 복제본 수
     
     Returns:
         WhisperModel: 로드된 모델
     """
-    if device is None:
-        # 자동 장치 선택
-        try:
-            logging.info("GPU 모드로 시도 중...")
-            model = WhisperModel(model_size, device="cuda", compute_type="int8")
-            logging.info("✅ GPU 모드 로딩 완료!")
-            return model
-        except Exception as e:
-            logging.warning(f"GPU 모드 실패: {e}")
-            logging.info("CPU 모드로 대체 중...")
-            model = WhisperModel(model_size, device="cpu", compute_type="int8")
-            logging.info("✅ CPU 모드 로딩 완료!")
-            return model
-    else:
-        # 지정된 장치 사용
-        try:
-            compute_type = "int8" if device == "cuda" else "int8"
-            model = WhisperModel(model_size, device=device, compute_type=compute_type)
-            logging.info(f"✅ {device.upper()} 모드 로딩 완료!")
-            return model
-        except Exception as e:
-            logging.error(f"모델 로딩 실패: {e}")
-            raise
+    try:
+        return get_model(model_size, device, compute_type, cpu_threads, num_workers)
+    except Exception as e:
+        logging.error(f"모델 로딩 실패: {e}")
+        raise
 
 def process_directory(input_dir: str, 
                      output_dir: str = "output/transcript",
                      model_size: str = "medium",
                      language: Optional[str] = "ko",
                      device: Optional[str] = None,
-                     audio_extensions: Optional[List[str]] = None) -> None:
+                     audio_extensions: Optional[List[str]] = None,
+                     force: bool = False,
+                     preprocess: bool = False,
+                     preprocess_options: Optional[Dict[str, Any]] = None,
+                     audit_dir: Optional[str] = None,
+                     batch_size: int = 1,
+                     shard_workers: int = 1,
+                     shard_duration: float = 600.0,
+                     decoding: Union[str, DecodingConfig, None] = None,
+                     word_timestamps: bool = True,
+                     channel_split: bool = False,
+                     content_addressed: bool = False) -> None:
     """
     디렉토리 내의 모든 오디오 파일에 대해 전사를 수행하는 함수
     
+    출력 디렉토리의 매니페스트에 입력 해시와 전사 설정을 기록하여,
+    다시 실행할 때 변경되지 않은 파일은 건너뜁니다.
+    
+    preprocess=True이면 원본 녹음을 노이즈 제거한 배열을 그대로 모델에 전달합니다
+    (전처리 WAV 저장과 재디코딩 생략, audit_dir을 지정한 경우에만 WAV 저장).
+    
     Args:
         input_dir (str): 입력 오디오 파일들이 있는 디렉토리
         output_dir (str): 결과 JSON 파일들이 저장될 디렉토리
@@ -162,7 +226,27 @@ def process_directory(input_dir: str,
         language (str, optional): 언어 설정
         device (str, optional): 장치 설정
         audio_extensions (List[str], optional): 지원할 오디오 확장자
+        force (bool): 매니페스트와 관계없이 모든 파일을 다시 전사할지 여부
+        preprocess (bool): 전처리+전사 통합 모드 사용 여부
+        preprocess_options (Dict[str, Any], optional): 통합 모드 전처리 설정 (PREPROCESS_OPTIONS 덮어쓰기)
+        audit_dir (str, optional): 통합 모드에서 전처리 결과 WAV를 저장할 디렉토리
+        batch_size (int): 1보다 크면 여러 파일의 VAD 청크를 묶어 배치 전사 (BatchedInferencePipeline)
+        shard_workers (int): 1보다 크면 파일마다 무음 지점에서 샤드로 나누어 병렬 전사
+        shard_duration (float): 샤드 병렬 전사의 목표 샤드 길이 (초)
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): False이면 세그먼트 단위로만 전사 (단어 정렬은 추출 단계에서 PII 세그먼트만 수행)
+        channel_split (bool): 스테레오 녹음을 채널별로 병렬 전사하여 채널 번호와 함께 시간순으로 합침
+        content_addressed (bool): 결과 JSON 이름을 타임스탬프 대신 입력 해시와 전사 설정 지문으로 정함
+            ({파일명}_{입력 해시}_{설정 지문}.json, 같은 이름의 결과가 있으면 매니페스트 없이 건너뜀)
     """
+    if batch_size > 1 and shard_workers > 1:
+        raise ValueError("batch_size와 shard_workers는 함께 사용할 수 없습니다.")
+    if channel_split and (batch_size > 1 or shard_workers > 1):
+        raise ValueError("채널 분리 전사는 batch_size, shard_workers와 함께 사용할 수 없습니다.")
+    config = get_decoding_config(decoding)
+    if batch_size > 1 and config.adaptive:
+        raise ValueError("적응형 디코딩은 배치 전사와 함께 사용할 수 없습니다.")
+    
     if audio_extensions is None:
         audio_extensions = ['.wav', '.mp3', '.flac', '.m4a', '.ogg']
     
@@ -188,73 +272,368 @@ def process_directory(input_dir: str,
     logging.info(f"총 {len(audio_files)}개의 오디오 파일을 처리합니다.")
     logging.info(f"설정: 모델={model_size}, 언어={language}, 장치={device or '자동'}")
     
-    # 모델을 한 번만 로드 (성능 최적화)
-    model = load_whisper_model(model_size, device)
+    # 입력 해시와 전사 설정이 같고 결과 JSON이 남아 있는 파일은 건너뛰기
+    manifest = StageManifest(output_dir, "transcription")
+    params = transcription_params(model_size, language, config, word_timestamps)
+    if preprocess:
+        preprocess_options = {**PREPROCESS_OPTIONS, **(preprocess_options or {})}
+        params["preprocessing"] = preprocess_options
+    if batch_size > 1:
+        # 배치 전사는 이전 구간 텍스트를 조건으로 사용하지 않으므로 결과가 순차 전사와 다름
+        params["engine"] = "batched"
+    if shard_workers > 1:
+        # 샤드 경계에서는 이전 텍스트 조건이 끊기므로 순차 전사와 결과가 다를 수 있음
+        params["engine"] = "sharded"
+        params["shard_duration"] = shard_duration
+    if channel_split:
+        # 채널마다 따로 전사하므로 모노 전사와 결과가 다름
+        params["channel_split"] = True
+    if not preprocess and batch_size <= 1:
+        # 배치 전사는 파일을 faster-whisper가 직접 디코딩하므로 버퍼를 사용하지 않음
+        params.update(audio_decoder_params())
+    skipped_count = 0
+    # 내용 주소 기반 이름: 입력 해시(매니페스트에 기록된 크기/수정 시각이 같으면 재사용)로 결과 경로를 미리 정함
+    hashes = {audio_file: manifest.content_hash(audio_file) for audio_file in audio_files} if content_addressed else {}
+    if not force:
+        pending_files = []
+        for audio_file in audio_files:
+            if content_addressed:
+                up_to_date = os.path.exists(manifest.content_addressed_path(audio_file, params, hashes[audio_file]))
+            else:
+                up_to_date = manifest.is_up_to_date(audio_file, params)
+            if up_to_date:
+                skipped_count += 1
+                logging.info(f"⏭️ 변경 없음, 건너뜀: {audio_file}")
+            else:
+                pending_files.append(audio_file)
+        audio_files = pending_files
     
     successful_count = 0
     failed_count = 0
     
-    for idx, audio_file in enumerate(audio_files):
-        try:
-            logging.info(f"\n[{idx + 1}/{len(audio_files)}] 처리 중: {audio_file}")
-            
-            # 전사 수행 (모델 재로딩 없이)
-            output_path = transcribe_audio_with_model(
-                audio_file, model, output_dir, model_size, language, verbose=False
-            )
-            
-            successful_count += 1
-            logging.info(f"✅ 성공: {output_path}")
-            
-        except Exception as e:
+    if not audio_files:
+        logging.info(f"\n🎯 처리 완료 요약:")
+        logging.info(f"⏭️ 건너뜀: {skipped_count} 파일 (모두 최신 상태)")
+        return
+    
+    # 모델을 한 번만 로드 (성능 최적화)
+    model = load_whisper_model(model_size, device,
+                               **sharded_model_options(STEREO_CHANNELS if channel_split else shard_workers))
+    
+    # 통합 모드에서 감사용 전처리 WAV 저장 경로 (입력 디렉토리 구조 유지)
+    audit_paths = {}
+    if preprocess and audit_dir:
+        for audio_file in audio_files:
+            relative_path = Path(audio_file).relative_to(input_path)
+            audit_paths[audio_file] = str(Path(audit_dir) / relative_path.with_suffix('.wav'))
+    
+    if batch_size > 1:
+        results = _transcribe_files_batched(
+            audio_files, model, output_dir, model_size, language, batch_size,
+            preprocess, preprocess_options, audit_paths, config, word_timestamps
+        )
+    else:
+        results = _transcribe_files_sequential(
+            audio_files, model, output_dir, model_size, language,
+            preprocess, preprocess_options, audit_paths, shard_workers, shard_duration, config,
+            word_timestamps, channel_split
+        )
+    
+    for audio_file, outputs, error in results:
+        if error is not None:
             failed_count += 1
-            logging.error(f"❌ 실패: {audio_file} - {str(e)}")
+            logging.error(f"❌ 실패: {audio_file} - {str(error)}")
+            continue
+        
+        if content_addressed:
+            # 완성된 결과 JSON을 정해진 이름으로 원자적으로 이동 (스트림 종료 레코드도 새 경로로)
+            target_path = manifest.content_addressed_path(audio_file, params, hashes[audio_file])
+            move_stream_output(audio_file, output_dir, outputs[0], target_path)
+            outputs = [target_path] + outputs[1:]
+        
+        successful_count += 1
+        logging.info(f"✅ 성공: {outputs[0]}")
+        
+        # 완료 즉시 기록하여 중단 후 재실행 시에도 이어서 처리
+        manifest.record(audio_file, params, outputs, sha256=hashes.get(audio_file))
     
     # 처리 결과 출력
     logging.info(f"\n🎯 처리 완료 요약:")
     logging.info(f"✅ 성공: {successful_count} 파일")
+    logging.info(f"⏭️ 건너뜀: {skipped_count} 파일")
     logging.info(f"❌ 실패: {failed_count} 파일")
     logging.info(f"📁 출력 디렉토리: {output_dir}")
 
+def _transcribe_files_sequential(audio_files: List[str],
+                                 model: "WhisperModel",
+                                 output_dir: str,
+                                 model_size: str,
+                                 language: Optional[str],
+                                 preprocess: bool,
+                                 preprocess_options: Optional[Dict[str, Any]],
+                                 audit_paths: Dict[str, str],
+                                 shard_workers: int = 1,
+                                 shard_duration: float = 600.0,
+                                 decoding: Optional[DecodingConfig] = None,
+                                 word_timestamps: bool = True,
+                                 channel_split: bool = False) -> Iterator[Tuple[str, List[str], Optional[Exception]]]:
+    """
+    파일을 하나씩 전사하여 (입력 파일, 출력 파일 목록, 오류)를 순서대로 반환
+    """
+    for idx, audio_file in enumerate(audio_files):
+        try:
+            logging.info(f"\n[{idx + 1}/{len(audio_files)}] 처리 중: {audio_file}")
+            
+            audit_path = audit_paths.get(audio_file)
+            if channel_split:
+                # 채널마다 독립된 작업으로 병렬 전사
+                channels = load_channels(audio_file, preprocess, preprocess_options, audit_path)
+                output_path = transcribe_audio_channels(
+                    audio_file, model, output_dir, model_size, language, channels,
+                    decoding=decoding, word_timestamps=word_timestamps
+                )
+                yield audio_file, [output_path] + channel_audit_paths(audit_path, len(channels)), None
+                continue
+            if shard_workers > 1:
+                # 파일 하나를 샤드로 나누어 병렬 전사
+                audio = preprocess_for_whisper(audio_file, preprocess_options, audit_path) if preprocess else None
+                output_path = transcribe_audio_sharded(
+                    audio_file, model, output_dir, model_size, language,
+                    shard_workers, shard_duration, audio=audio, decoding=decoding,
+                    word_timestamps=word_timestamps
+                )
+            elif preprocess:
+                # 노이즈 제거 배열을 디스크를 거치지 않고 바로 전사
+                output_path = preprocess_and_transcribe(
+                    audio_file, model, output_dir, model_size, language,
+                    preprocess_options, audit_path, verbose=False, decoding=decoding,
+                    word_timestamps=word_timestamps
+                )
+            else:
+                # 전사 수행 (모델 재로딩 없이)
+                output_path = transcribe_audio_with_model(
+                    audio_file, model, output_dir, model_size, language, verbose=False, decoding=decoding,
+                    word_timestamps=word_timestamps
+                )
+            yield audio_file, [output_path] + ([audit_path] if audit_path else []), None
+            
+        except Exception as e:
+            yield audio_file, [], e
+
+def _transcribe_files_batched(audio_files: List[str],
+                              model: "WhisperModel",
+                              output_dir: str,
+                              model_size: str,
+                              language: Optional[str],
+                              batch_size: int,
+                              preprocess: bool,
+                              preprocess_options: Optional[Dict[str, Any]],
+                              audit_paths: Dict[str, str],
+                              decoding: Optional[DecodingConfig] = None,
+                              word_timestamps: bool = True) -> Iterator[Tuple[str, List[str], Optional[Exception]]]:
+    """
+    여러 파일의 VAD 청크를 배치로 묶어 전사하여 (입력 파일, 출력 파일 목록, 오류)를 순서대로 반환
+    """
+    # 배치 전사 모듈은 faster-whisper 내부 API를 직접 사용하므로 배치 모드에서만 import
+    from src.batched_transcription import BatchedTranscriber
+    
+    config = get_decoding_config(decoding)
+    transcriber = BatchedTranscriber(model, batch_size, language, config.decoding_options(), config.vad,
+                                     word_timestamps)
+    logging.info(f"배치 전사: {len(audio_files)}개 파일, 배치 크기 {batch_size}")
+    
+    def audio_source(audio_file: str):
+        if not preprocess:
+            return audio_file
+        # 전처리는 해당 파일이 배치 대기열에 들어갈 때 수행
+        return lambda: preprocess_for_whisper(audio_file, preprocess_options, audit_paths.get(audio_file))
+    
+    items = ((audio_file, audio_source(audio_file)) for audio_file in audio_files)
+    for result in transcriber.transcribe(items):
+        if result.error is not None:
+            yield result.key, [], result.error
+            continue
+        try:
+            transcript = build_transcript(result.key, result.segments, result.info,
+                                          model_size, result.processing_time)
+            output_path = transcript.save_to_json(output_dir)
+            audit_path = audit_paths.get(result.key)
+            yield result.key, [output_path] + ([audit_path] if audit_path else []), None
+        except Exception as e:
+            yield result.key, [], e
+
+def transcription_params(model_size: str,
+                         language: Optional[str],
+                         decoding: Union[str, DecodingConfig, None] = None,
+                         word_timestamps: bool = True) -> dict:
+    """
+    전사 결과에 영향을 주는 설정 (매니페스트 파라미터)
+    
+    Args:
+        model_size (str): Whisper 모델 크기
+        language (str, optional): 언어 설정
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정
+        word_timestamps (bool): 단어 타임스탬프 포함 여부
+    
+    Returns:
+        dict: 모델, 언어, 디코딩 및 VAD 설정
+    """
+    return {
+        "model_size": model_size,
+        "language": language,
+        "word_timestamps": word_timestamps,
+        **get_decoding_config(decoding).params(),
+    }
+
 def transcribe_audio_with_model(audio_file_path: str,
-                               model: WhisperModel,
+                               model: "WhisperModel",
                                output_dir: str,
                                model_size: str,
                                language: Optional[str] = "ko",
-                               verbose: bool = False) -> str:
+                               verbose: bool = False,
+                               audio: Optional[np.ndarray] = None,
+                               resume: bool = True,
+                               cache: Optional[TranscriptCache] = None,
+                               on_stream: Optional[Callable[[str], None]] = None,
+                               decoding: Union[str, DecodingConfig, None] = None,
+                               word_timestamps: bool = True) -> str:
     """
     이미 로드된 모델을 사용하여 전사를 수행하는 함수 (성능 최적화용)
+    
+    audio가 주어지면 파일을 다시 디코딩하지 않고 해당 배열(16kHz float32 모노)을 전사하며,
+    audio_file_path는 결과 JSON의 원본 파일 정보로만 사용됩니다.
+    
+    resume=True이면 같은 파일/설정으로 기록되다 중단된 JSONL 스트림을 찾아
+    이미 기록된 세그먼트는 재사용하고 마지막으로 디코딩된 시점부터 이어서 전사합니다.
+    
+    cache가 없으면 전역 전사 캐시(설정된 경우)를 사용하며, 같은 오디오 내용과 설정의
+    결과가 캐시에 있으면 디코딩 없이 저장합니다.
+    
+    on_stream이 주어지면 디코딩 전에 JSONL 스트림 경로를 전달합니다 (캐시 사용 시 호출되지 않음).
+    
+    decoding은 디코딩 프리셋 이름(fast, balanced, accurate, adaptive) 또는 DecodingConfig입니다.
+    word_timestamps=False이면 세그먼트 단위로만 전사하며, 단어 정렬은 align_segment_words로
+    PII가 있는 세그먼트에 대해서만 나중에 수행합니다.
     """
+    config = get_decoding_config(decoding)
+    
     # 파일 존재 확인
-    if not os.path.exists(audio_file_path):
+    if audio is None and not os.path.exists(audio_file_path):
         raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {audio_file_path}")
     
-    # 전사 시작 시간 기록
-    start_time = time.time()
+    # 전사 캐시 조회
+    cache = get_transcript_cache() if cache is None else cache
+    key = None
+    if cache is not None:
+        lookup_start = time.time()
+        decoding_params = {**config.decoding_options(), "word_timestamps": word_timestamps}
+        if audio is None:
+            decoding_params.update(audio_decoder_params())
+        if config.adaptive:
+            decoding_params["adaptive"] = config.params()["adaptive"]
+        key = cache_key(
+            audio_sha256(audio_file_path if audio is None else audio), model_size, language,
+            decoding_params, config.vad
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logging.info(f"⚡ 전사 캐시 사용: {os.path.basename(audio_file_path)}")
+            transcript = AudioTranscriptInfo(audio_file_path)
+            transcript.load_from_dict({
+                **cached,
+                "audio_file": transcript.audio_path,
+                "processing_time": time.time() - lookup_start,
+                "processed_date": datetime.now().isoformat(),
+            })
+            return transcript.save_to_json(output_dir)
     
-    # 음성 파일 전사
-    segments, info = model.transcribe(
-        audio_file_path, 
-        language=language,
-        beam_size=5,
-        temperature=0.0,
-        patience=1.2,
-        word_timestamps=True,
-        vad_filter=True,
-        vad_parameters=vad.VadOptions(
-            threshold=0.3,
-            neg_threshold=0.15,
-            min_speech_duration_ms=1200,
-            max_speech_duration_s=30,
-            min_silence_duration_ms=2000,
-            speech_pad_ms=1000
+    # 중단된 전사가 있으면 체크포인트(스트림)에서 이어서 기록
+    stream_params = {"model_size": model_size, "language": language,
+                     "word_timestamps": word_timestamps, **config.params()}
+    if audio is not None:
+        # 전처리 결과 등 배열로 받은 입력은 내용 해시로 구분 (전처리 설정이 다른 실행을 이어 받지 않도록)
+        stream_params["audio_sha256"] = audio_sha256(audio)
+    else:
+        stream_params.update(audio_decoder_params())
+    stream_path = find_resumable_stream(audio_file_path, output_dir, stream_params) if resume else None
+    writer = None
+    previous_segments = []
+    if stream_path:
+        try:
+            writer = TranscriptStreamWriter.resume(stream_path)
+            previous_segments = load_stream(stream_path).segments
+        except StreamLockedError:
+            # 검색 직후 다른 전사가 먼저 이어 받은 경우 새 스트림으로 시작
+            logging.info(f"🔒 다른 전사가 기록 중인 스트림, 새로 시작: {os.path.basename(stream_path)}")
+    if writer is None:
+        writer = TranscriptStreamWriter(audio_file_path, output_dir, stream_params)
+    resume_at = writer.decoded_until
+    
+    try:
+        if on_stream is not None:
+            on_stream(writer.path)
+        if (resume_at > 0 or config.adaptive or get_audio_buffer_cache() is not None) and audio is None:
+            # 오디오 버퍼 캐시를 사용하면 faster-whisper가 파일을 다시 디코딩하지 않도록 공유 배열을 전달
+            audio = load_audio(audio_file_path)
+        if resume_at > 0:
+            # clip_timestamps를 지정하면 faster-whisper가 VAD 필터를 끄므로
+            # 남은 구간만 잘라 같은 VAD 설정으로 전사하고 타임스탬프를 원래 위치로 이동
+            audio = audio[int(resume_at * WHISPER_SAMPLE_RATE):]
+            logging.info(f"↩️ 체크포인트에서 이어서 전사: {os.path.basename(audio_file_path)} "
+                         f"({len(previous_segments)}개 세그먼트, {resume_at:.1f}초부터)")
+        
+        # 전사 시작 시간 기록
+        start_time = time.time()
+        
+        # 음성 파일 전사
+        segments, info = model.transcribe(
+            audio_file_path if audio is None else audio,
+            language=language,
+            word_timestamps=word_timestamps,
+            vad_filter=True,
+            vad_parameters=config.vad_parameters(),
+            **config.decoding_options()
         )
-    )
+        if config.adaptive:
+            segments = redecode_segments(model, audio, segments, config, language or info.language,
+                                         word_timestamps=word_timestamps)
+        if resume_at > 0:
+            segments = (shift_segment(segment, resume_at) for segment in segments)
+        
+        # 처리 시간 계산
+        processing_time = time.time() - start_time
+        
+        # 세그먼트가 디코딩되는 즉시 JSONL 스트림에 기록하고, 끝나면 기존 JSON 형식으로 저장
+        # (이어서 전사한 경우 이전 세그먼트와 합쳐 세그먼트 번호를 1부터 다시 매김)
+        all_segments = itertools.chain(previous_segments, writer.tee(segments))
+        transcript = build_transcript(audio_file_path, all_segments, info, model_size, processing_time)
+        output_path = writer.finalize(transcript, output_dir)
+    finally:
+        writer.close()
     
-    # 처리 시간 계산
-    processing_time = time.time() - start_time
+    if key is not None:
+        cache.put(key, transcript.to_dict())
     
-    # AudioTranscript 객체 생성
+    return output_path
+
+def build_transcript(audio_file_path: str,
+                     segments: Iterable[Any],
+                     info: Any,
+                     model_size: str,
+                     processing_time: float) -> AudioTranscriptInfo:
+    """
+    faster-whisper 세그먼트로 AudioTranscriptInfo를 구성하는 함수 (순차/배치 전사 공통)
+    
+    Args:
+        audio_file_path (str): 원본 오디오 파일 경로
+        segments (Iterable): faster-whisper 세그먼트
+        info (TranscriptionInfo): 언어 감지 정보
+        model_size (str): 모델 크기
+        processing_time (float): 처리 시간 (초)
+    
+    Returns:
+        AudioTranscriptInfo: 전사 정보 객체
+    """
     transcript = AudioTranscriptInfo(audio_file_path)
     
     # 전체 텍스트 구성 및 세그먼트 추가
@@ -262,8 +641,9 @@ def transcribe_audio_with_model(audio_file_path: str,
     for segment in segments:
         full_text += segment.text + " "
         
-        # 세그먼트 추가
-        audio_segment = transcript.add_segment(segment.start, segment.end, segment.text)
+        # 세그먼트 추가 (채널 분리 전사이면 채널 번호 포함)
+        audio_segment = transcript.add_segment(segment.start, segment.end, segment.text,
+                                               getattr(segment, "channel", None))
         
         # 단어별 타임스탬프 추가
         if hasattr(segment, 'words') and segment.words:
@@ -273,17 +653,336 @@ def transcribe_audio_with_model(audio_file_path: str,
     # 전체 전사 텍스트 및 모델 정보 추가
     model_info = f"faster-whisper-{model_size} (lang: {info.language}, confidence: {info.language_probability:.2f})"
     transcript.add_transcript(full_text.strip(), processing_time, model_info)
+    return transcript
+
+def _normalize_text(text: str) -> str:
+    """공백과 문장부호를 제거한 비교용 텍스트"""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+def align_segment_words(transcript: AudioTranscriptInfo,
+                        segment_ids: Iterable[str],
+                        model: "WhisperModel",
+                        language: Optional[str] = "ko",
+                        decoding: Union[str, DecodingConfig, None] = None,
+                        audio: Optional[np.ndarray] = None) -> int:
+    """
+    지정한 세그먼트만 단어 타임스탬프를 계산하는 함수 (2단계 전사의 두 번째 단계)
     
-    # JSON 파일로 저장
-    output_path = transcript.save_to_json(output_dir)
+    word_timestamps=False로 전사한 결과에서 PII가 있는 세그먼트만 clip_timestamps로 구간을 지정해
+    단어 타임스탬프를 켜고 다시 디코딩합니다. 세그먼트 텍스트는 PII 추출에 사용한 원래 텍스트를 유지하고,
+    다시 디코딩한 텍스트가 원래 텍스트와 다르면 단어 위치를 믿을 수 없으므로
+    세그먼트 전체를 하나의 단어로 두어 구간 전체가 마스킹되도록 합니다.
     
-    return output_path
+    Args:
+        transcript (AudioTranscriptInfo): 세그먼트 단위 전사 결과
+        segment_ids (Iterable[str]): 단어 정렬할 세그먼트 ID
+        model (WhisperModel): 로드된 모델
+        language (str, optional): 언어 설정
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        audio (np.ndarray, optional): 16kHz float32 모노 오디오 (없으면 transcript.audio_path에서 디코딩)
+    
+    Returns:
+        int: 단어 정렬한 세그먼트 수
+    """
+    config = get_decoding_config(decoding)
+    targets = {str(segment_id) for segment_id in segment_ids}
+    segments = [seg for seg in transcript.segments if str(seg.id) in targets and not seg.words]
+    if not segments:
+        return 0
+    if audio is None:
+        audio = load_audio(transcript.audio_path)
+    
+    previous_text = {}
+    for prev, seg in zip([None] + transcript.segments[:-1], transcript.segments):
+        previous_text[seg.id] = prev.text if prev is not None else None
+    
+    mismatched = 0
+    for seg in segments:
+        new_segments, _ = model.transcribe(
+            audio,
+            language=language,
+            clip_timestamps=[seg.start, seg.end],
+            word_timestamps=True,
+            vad_filter=False,
+            initial_prompt=previous_text[seg.id],
+            **config.decoding_options()
+        )
+        new_segments = list(new_segments)
+        words = [word for new in new_segments for word in (new.words or [])]
+        new_text = "".join(new.text for new in new_segments)
+        if words and _normalize_text(new_text) == _normalize_text(seg.text):
+            for word in words:
+                seg.add_word(word.word, max(word.start, seg.start), min(word.end, seg.end))
+        else:
+            mismatched += 1
+            seg.add_word(seg.text, seg.start, seg.end)
+    
+    logging.info(f"단어 정렬: {len(segments)}개 세그먼트 (텍스트 불일치로 세그먼트 전체 사용 {mismatched}개)")
+    return len(segments)
+
+class WordAligner:
+    """
+    PII 추출 후 단어 정렬을 수행하는 호출 가능 객체 (extraction.process_file의 word_aligner)
+    
+    모델은 처음 호출될 때 프로세스 전역 레지스트리에서 가져옵니다.
+    """
+    
+    def __init__(self,
+                 model_size: str = "medium",
+                 language: Optional[str] = "ko",
+                 device: Optional[str] = None,
+                 decoding: Union[str, DecodingConfig, None] = None):
+        self.model_size = model_size
+        self.language = language
+        self.device = device
+        self.decoding = get_decoding_config(decoding)
+    
+    @property
+    def params(self) -> dict:
+        """단어 정렬 결과에 영향을 주는 설정 (매니페스트 파라미터)"""
+        return {"model_size": self.model_size, "language": self.language, **self.decoding.params()}
+    
+    def __call__(self, transcript: AudioTranscriptInfo, segment_ids: Iterable[str]) -> int:
+        model = load_whisper_model(self.model_size, self.device)
+        return align_segment_words(transcript, segment_ids, model, self.language, self.decoding)
+
+def sharded_model_options(shard_workers: int) -> Dict[str, int]:
+    """
+    샤드 병렬 전사용 모델 로드 옵션 (워커 수만큼 복제본, 코어를 워커끼리 나누어 사용)
+    
+    Args:
+        shard_workers (int): 동시에 전사할 샤드 수
+    
+    Returns:
+        Dict[str, int]: load_whisper_model에 전달할 cpu_threads, num_workers
+    """
+    if shard_workers <= 1:
+        return {}
+    return {
+        "cpu_threads": max(1, (os.cpu_count() or 1) // shard_workers),
+        "num_workers": shard_workers,
+    }
+
+def transcribe_audio_sharded(audio_file_path: str,
+                             model: "WhisperModel",
+                             output_dir: str,
+                             model_size: str,
+                             language: Optional[str] = "ko",
+                             shard_workers: int = 2,
+                             shard_duration: float = 600.0,
+                             audio: Optional[np.ndarray] = None,
+                             decoding: Union[str, DecodingConfig, None] = None,
+                             word_timestamps: bool = True) -> str:
+    """
+    긴 녹음을 무음 지점에서 샤드로 나누어 병렬 전사하고 JSON으로 저장하는 함수
+    
+    샤드별 세그먼트는 원본 파일 기준 시간으로 옮겨 이어 붙이며,
+    세그먼트 id는 파일 전체에서 1부터 다시 매겨집니다.
+    
+    Args:
+        audio_file_path (str): 오디오 파일 경로 (audio가 주어지면 결과 JSON의 원본 파일 정보로만 사용)
+        model (WhisperModel): num_workers >= shard_workers로 로드된 모델
+        output_dir (str): 결과 JSON 파일이 저장될 디렉토리
+        model_size (str): 모델 크기
+        language (str, optional): 언어 설정
+        shard_workers (int): 동시에 전사할 샤드 수
+        shard_duration (float): 목표 샤드 길이 (초)
+        audio (np.ndarray, optional): 이미 디코딩된 16kHz float32 오디오
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): 단어 타임스탬프 포함 여부
+    
+    Returns:
+        str: 저장된 JSON 파일 경로
+    """
+    config = get_decoding_config(decoding)
+    if audio is None:
+        if not os.path.exists(audio_file_path):
+            raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {audio_file_path}")
+        audio = load_audio(audio_file_path)
+    
+    start_time = time.time()
+    segments, info = transcribe_sharded(
+        model, audio, shard_workers, language, shard_duration,
+        sample_rate=WHISPER_SAMPLE_RATE,
+        word_timestamps=word_timestamps,
+        vad_filter=True,
+        vad_parameters=config.vad_parameters(),
+        **config.decoding_options()
+    )
+    if config.adaptive:
+        segments = list(redecode_segments(model, audio, segments, config, language or info.language,
+                                          word_timestamps=word_timestamps))
+    processing_time = time.time() - start_time
+    
+    transcript = build_transcript(audio_file_path, segments, info, model_size, processing_time)
+    return transcript.save_to_json(output_dir)
+
+def load_channels(input_path: str,
+                  preprocess: bool = False,
+                  preprocess_options: Optional[Dict[str, Any]] = None,
+                  audit_path: Optional[str] = None) -> List[np.ndarray]:
+    """
+    채널 분리 전사용 채널별 Whisper 입력 배열(16kHz float32 모노)을 만드는 함수
+    
+    스테레오(3채널 이상이면 앞의 두 채널)만 나누며, 모노 파일이면 채널 하나만 반환합니다.
+    
+    Args:
+        input_path (str): 원본 오디오 파일 경로
+        preprocess (bool): 채널마다 노이즈 제거/볼륨 정규화 수행 여부
+        preprocess_options (Dict[str, Any], optional): 전처리 설정 (PREPROCESS_OPTIONS 덮어쓰기)
+        audit_path (str, optional): 지정하면 채널별 전처리 결과를 {이름}_ch{채널}.wav로 저장
+    
+    Returns:
+        List[np.ndarray]: 채널 번호 순서의 오디오 배열
+    """
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {input_path}")
+    
+    count = min(channel_count(input_path), STEREO_CHANNELS)
+    if count < STEREO_CHANNELS:
+        logging.warning(f"모노 파일이므로 채널을 나누지 않고 전사합니다: {input_path}")
+        if not preprocess:
+            return [load_audio(input_path)]
+        return [preprocess_for_whisper(input_path, preprocess_options, audit_path)]
+    
+    if not preprocess:
+        from faster_whisper import decode_audio
+        return list(decode_audio(input_path, sampling_rate=WHISPER_SAMPLE_RATE, split_stereo=True))
+    
+    audit_paths = channel_audit_paths(audit_path, count) or [None] * count
+    return [
+        preprocess_for_whisper(input_path, {**(preprocess_options or {}), "channel": channel}, audit_paths[channel])
+        for channel in range(count)
+    ]
+
+def transcribe_audio_channels(audio_file_path: str,
+                              model: "WhisperModel",
+                              output_dir: str,
+                              model_size: str,
+                              language: Optional[str] = "ko",
+                              channels: Optional[List[np.ndarray]] = None,
+                              decoding: Union[str, DecodingConfig, None] = None,
+                              word_timestamps: bool = True) -> str:
+    """
+    스테레오 통화 녹음을 채널별로 병렬 전사하고 시간순으로 합쳐 JSON으로 저장하는 함수
+    
+    각 세그먼트에는 채널 번호(channel)가 기록되며, 세그먼트 id는 합친 순서대로 1부터 매겨집니다.
+    
+    Args:
+        audio_file_path (str): 오디오 파일 경로 (channels가 주어지면 결과 JSON의 원본 파일 정보로만 사용)
+        model (WhisperModel): num_workers >= 채널 수로 로드된 모델
+        output_dir (str): 결과 JSON 파일이 저장될 디렉토리
+        model_size (str): 모델 크기
+        language (str, optional): 언어 설정
+        channels (List[np.ndarray], optional): 이미 준비된 채널별 16kHz float32 오디오 (없으면 파일에서 디코딩)
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): 단어 타임스탬프 포함 여부
+    
+    Returns:
+        str: 저장된 JSON 파일 경로
+    """
+    config = get_decoding_config(decoding)
+    if channels is None:
+        channels = load_channels(audio_file_path)
+    
+    redecode = None
+    if config.adaptive:
+        redecode = lambda audio, segments, info: redecode_segments(
+            model, audio, segments, config, language or info.language, word_timestamps=word_timestamps
+        )
+    
+    start_time = time.time()
+    segments, info = transcribe_channels(
+        model, channels, language, redecode,
+        word_timestamps=word_timestamps,
+        vad_filter=True,
+        vad_parameters=config.vad_parameters(),
+        **config.decoding_options()
+    )
+    processing_time = time.time() - start_time
+    
+    transcript = build_transcript(audio_file_path, segments, info, model_size, processing_time)
+    return transcript.save_to_json(output_dir)
+
+def preprocess_for_whisper(input_path: str,
+                           preprocess_options: Optional[Dict[str, Any]] = None,
+                           audit_path: Optional[str] = None) -> np.ndarray:
+    """
+    원본 녹음을 메모리에서 전처리하여 Whisper 입력 배열(16kHz float32 모노)로 반환하는 함수
+    
+    Args:
+        input_path (str): 원본 오디오 파일 경로
+        preprocess_options (Dict[str, Any], optional): 전처리 설정 (PREPROCESS_OPTIONS 덮어쓰기)
+        audit_path (str, optional): 지정하면 전처리 결과를 16-bit PCM WAV로 저장 (감사용)
+    
+    Returns:
+        np.ndarray: 전처리된 오디오 배열
+    """
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {input_path}")
+    
+    options = {**PREPROCESS_OPTIONS, **(preprocess_options or {})}
+    audio, sample_rate = preprocess_to_array(input_path, **options)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio = soxr.resample(audio, sample_rate, WHISPER_SAMPLE_RATE)
+    
+    # WAV로 저장했을 때와 같은 범위로 맞춤 (감사용 WAV와 전사 입력이 일치)
+    np.clip(audio, -1.0, 32767 / 32768, out=audio)
+    if audit_path:
+        os.makedirs(os.path.dirname(audit_path) or ".", exist_ok=True)
+        write_pcm16(audit_path, audio, WHISPER_SAMPLE_RATE)
+        logging.info(f"전처리 결과 저장: {audit_path}")
+    return audio
+
+def preprocess_and_transcribe(input_path: str,
+                              model: "WhisperModel",
+                              output_dir: str,
+                              model_size: str,
+                              language: Optional[str] = "ko",
+                              preprocess_options: Optional[Dict[str, Any]] = None,
+                              audit_path: Optional[str] = None,
+                              verbose: bool = False,
+                              decoding: Union[str, DecodingConfig, None] = None,
+                              word_timestamps: bool = True) -> str:
+    """
+    원본 녹음을 메모리에서 전처리(노이즈 제거 + 볼륨 정규화)한 뒤 바로 전사하는 함수
+    
+    전처리 결과 WAV를 저장하고 다시 디코딩하는 과정 없이 16kHz float32 배열을
+    WhisperModel.transcribe에 그대로 전달합니다.
+    
+    Args:
+        input_path (str): 원본 오디오 파일 경로
+        model (WhisperModel): 로드된 모델
+        output_dir (str): 결과 JSON 파일이 저장될 디렉토리
+        model_size (str): 모델 크기
+        language (str, optional): 언어 설정
+        preprocess_options (Dict[str, Any], optional): 전처리 설정 (PREPROCESS_OPTIONS 덮어쓰기)
+        audit_path (str, optional): 지정하면 전처리 결과를 16-bit PCM WAV로 저장 (감사용)
+        verbose (bool): 상세 출력 여부
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): 단어 타임스탬프 포함 여부
+    
+    Returns:
+        str: 저장된 JSON 파일 경로
+    """
+    audio = preprocess_for_whisper(input_path, preprocess_options, audit_path)
+    return transcribe_audio_with_model(
+        input_path, model, output_dir, model_size, language, verbose, audio=audio, decoding=decoding,
+        word_timestamps=word_timestamps
+    )
 
 def process_single_file(input_path: str,
                        output_dir: str = "output/transcript",
                        model_size: str = "medium",
                        language: Optional[str] = "ko",
-                       device: Optional[str] = None) -> str:
+                       device: Optional[str] = None,
+                       preprocess: bool = False,
+                       audit_path: Optional[str] = None,
+                       shard_workers: int = 1,
+                       shard_duration: float = 600.0,
+                       decoding: Union[str, DecodingConfig, None] = None,
+                       word_timestamps: bool = True,
+                       channel_split: bool = False) -> str:
     """
     단일 파일에 대한 전사 수행
     
@@ -293,11 +992,45 @@ def process_single_file(input_path: str,
         model_size (str): 모델 크기
         language (str, optional): 언어 설정
         device (str, optional): 장치 설정
+        preprocess (bool): 전처리+전사 통합 모드 사용 여부
+        audit_path (str, optional): 통합 모드에서 전처리 결과 WAV 저장 경로
+        shard_workers (int): 1보다 크면 무음 지점에서 샤드로 나누어 병렬 전사
+        shard_duration (float): 목표 샤드 길이 (초)
+        decoding (str | DecodingConfig, optional): 디코딩 프리셋 이름 또는 설정 (기본값: balanced)
+        word_timestamps (bool): 단어 타임스탬프 포함 여부
+        channel_split (bool): 스테레오 녹음을 채널별로 병렬 전사
     
     Returns:
         str: 저장된 JSON 파일 경로
     """
-    return transcribe_audio(input_path, model_size, output_dir, language, device, verbose=True)
+    if channel_split:
+        model = load_whisper_model(model_size, device, **sharded_model_options(STEREO_CHANNELS))
+        channels = load_channels(input_path, preprocess, audit_path=audit_path)
+        return transcribe_audio_channels(
+            input_path, model, output_dir, model_size, language, channels,
+            decoding=decoding, word_timestamps=word_timestamps
+        )
+    if shard_workers > 1:
+        model = load_whisper_model(model_size, device, **sharded_model_options(shard_workers))
+        audio = preprocess_for_whisper(input_path, audit_path=audit_path) if preprocess else None
+        return transcribe_audio_sharded(
+            input_path, model, output_dir, model_size, language,
+            shard_workers, shard_duration, audio=audio, decoding=decoding,
+            word_timestamps=word_timestamps
+        )
+    if preprocess:
+        model = load_whisper_model(model_size, device)
+        return preprocess_and_transcribe(
+            input_path, model, output_dir, model_size, language,
+            audit_path=audit_path, verbose=True, decoding=decoding,
+            word_timestamps=word_timestamps
+        )
+    # 디렉토리 처리와 같은 경로로 전사 (전사 캐시와 체크포인트 이어서 하기 적용)
+    model = load_whisper_model(model_size, device)
+    return transcribe_audio_with_model(
+        input_path, model, output_dir, model_size, language, verbose=True,
+        decoding=decoding, word_timestamps=word_timestamps
+    )
 
 def main():
     """
@@ -315,6 +1048,10 @@ def main():
   # 디렉토리 일괄 처리
   python src/transcription.py --input data/audio --output output/transcripts
   python src/transcription.py -i data/ -o results/ --model large-v3 --language en
+  
+  # 원본 녹음을 전처리 후 바로 전사 (전처리 WAV는 요청 시에만 저장)
+  python src/transcription.py -i data/raw --preprocess
+  python src/transcription.py -i data/raw --preprocess --save-preprocessed data/preprocessed
         """
     )
     
@@ -366,6 +1103,109 @@ def main():
         help="지원할 오디오 확장자 (기본값: .wav .mp3 .flac .m4a .ogg)"
     )
     
+    # 재처리 설정
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="매니페스트와 관계없이 모든 파일 다시 전사"
+    )
+    
+    # 전처리+전사 통합 모드 설정
+    parser.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="원본 녹음을 메모리에서 전처리(노이즈 제거 + 볼륨 정규화)한 뒤 바로 전사"
+    )
+    parser.add_argument(
+        "--save-preprocessed",
+        metavar="PATH",
+        help="--preprocess 사용 시 전처리 결과 WAV 저장 위치 (디렉토리 처리: 디렉토리, 단일 파일: 파일 경로)"
+    )
+    
+    # 배치 전사 설정
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=1,
+        help="디렉토리 처리 시 여러 파일의 VAD 청크를 묶어 배치 전사할 크기 (기본값: 1, 순차 전사)"
+    )
+    
+    # 샤드 병렬 전사 설정
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        default=1,
+        help="긴 녹음을 무음 지점에서 나누어 병렬 전사할 모델 복제본 수 (기본값: 1, 사용 안 함)"
+    )
+    parser.add_argument(
+        "--shard-duration",
+        type=float,
+        default=600.0,
+        help="샤드 병렬 전사의 목표 샤드 길이 (초, 기본값: 600)"
+    )
+    
+    # 디코딩 프리셋 설정
+    parser.add_argument(
+        "--decoding",
+        choices=list(DECODING_PRESETS),
+        default=DEFAULT_PRESET,
+        help="디코딩 프리셋 (fast: greedy, balanced: 기본값, accurate: 넓은 빔, "
+             "adaptive: greedy 후 품질이 낮은 세그먼트만 빔 서치로 재디코딩)"
+    )
+    parser.add_argument(
+        "--channel-split",
+        action="store_true",
+        help="스테레오 통화 녹음을 채널(화자)별로 병렬 전사하고 채널 번호와 함께 시간순으로 합침"
+    )
+    parser.add_argument(
+        "--word-timestamps",
+        choices=["all", "deferred"],
+        default="all",
+        help="단어 타임스탬프 (all: 모든 세그먼트, deferred: 세그먼트 단위로만 전사하고 "
+             "extraction.py --align-words로 PII 세그먼트만 단어 정렬)"
+    )
+    
+    # 전사 캐시 설정
+    parser.add_argument(
+        "--cache-dir",
+        help="전사 결과 캐시 디렉토리 (오디오 내용과 설정이 같으면 디코딩 없이 재사용, "
+             "기본값: 환경변수 WHISPER_TRANSCRIPT_CACHE_DIR)"
+    )
+    parser.add_argument(
+        "--cache-size-mb",
+        type=float,
+        default=1024.0,
+        help="전사 결과 캐시 크기 상한 (MB, 기본값: 1024)"
+    )
+    
+    # 디코딩 오디오 공유 버퍼 설정
+    parser.add_argument(
+        "--audio-buffer-dir",
+        nargs="?",
+        const=DEFAULT_BUFFER_DIR,
+        help=f"디코딩한 오디오를 내보내기 단계와 공유할 버퍼 디렉토리 (값 없이 지정하면 {DEFAULT_BUFFER_DIR}, "
+             "기본값: 환경변수 AUDIO_BUFFER_CACHE_DIR)"
+    )
+    parser.add_argument(
+        "--audio-buffer-mb",
+        type=float,
+        default=DEFAULT_BUFFER_SIZE_MB,
+        help=f"오디오 버퍼 크기 상한 (MB, 기본값: {DEFAULT_BUFFER_SIZE_MB:.0f})"
+    )
+    
+    # 결과 JSON 형식 설정
+    parser.add_argument(
+        "--content-addressed-names",
+        action="store_true",
+        help="결과 JSON 이름을 타임스탬프 대신 입력 해시와 전사 설정 지문으로 정함 "
+             "(재실행해도 같은 이름, 결과가 있으면 건너뜀)"
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="결과 JSON을 들여쓰기 없이 저장 (파일 크기 약 40%% 감소, 기본값: 환경변수 TRANSCRIPT_JSON_COMPACT)"
+    )
+    
     # 상세 출력 설정
     parser.add_argument(
         "--verbose", "-v",
@@ -374,6 +1214,8 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.content_addressed_names and args.single_file:
+        parser.error("--content-addressed-names는 디렉토리 처리(--input)에서만 사용할 수 있습니다")
     
     # 언어 설정 처리
     language = None if args.language.lower() == "none" else args.language
@@ -382,6 +1224,13 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.cache_dir:
+        configure_transcript_cache(args.cache_dir, args.cache_size_mb)
+    if args.audio_buffer_dir:
+        configure_audio_buffer_cache(args.audio_buffer_dir, args.audio_buffer_mb)
+    if args.compact_json:
+        configure_json_serializer(compact=True)
+    
     try:
         if args.single_file:
             # 단일 파일 처리
@@ -390,7 +1239,14 @@ def main():
                 args.output,
                 args.model,
                 language,
-                args.device
+                args.device,
+                args.preprocess,
+                args.save_preprocessed,
+                args.shard_workers,
+                args.shard_duration,
+                args.decoding,
+                args.word_timestamps == "all",
+                args.channel_split
             )
             print(f"✅ 전사 완료: {output_path}")
             
@@ -402,7 +1258,17 @@ def main():
                 args.model,
                 language,
                 args.device,
-                args.extensions
+                args.extensions,
+                args.force,
+                args.preprocess,
+                audit_dir=args.save_preprocessed,
+                batch_size=args.batch_size,
+                shard_workers=args.shard_workers,
+                shard_duration=args.shard_duration,
+                decoding=args.decoding,
+                word_timestamps=args.word_timestamps == "all",
+                channel_split=args.channel_split,
+                content_addressed=args.content_addressed_names
             )
             print(f"✅ 디렉토리 처리 완료: {args.output}")
             
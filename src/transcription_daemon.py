@@ -0,0 +1,435 @@
+"""
+상주 전사 데몬 (localhost HTTP)
+
+CLI로 전사할 때마다 드는 Python 시작, faster_whisper/ctranslate2 import, 모델 로드 비용을 없애기 위해
+모델 레지스트리의 모델을 올려 둔 채로 작업을 받아 처리하는 상주 프로세스입니다.
+짧은 녹음에서는 이 콜드 스타트가 전사 시간보다 큽니다.
+
+엔드포인트:
+    POST /jobs                  작업 등록 ({"audio_path": ..., "wait": true이면 완료까지 대기})
+    GET  /jobs/<id>             작업 상태와 출력 경로
+    GET  /jobs/<id>/segments    디코딩되는 세그먼트를 NDJSON으로 스트리밍
+    GET  /health                대기열/모델/캐시 상태
+
+대기열이 가득 차면 503을 반환하며, 동시에 전사하는 작업 수는 workers로 제한됩니다.
+POST는 Content-Type: application/json만 받으며 (브라우저의 교차 출처 요청은 사전 요청에서 차단),
+작업별 output_dir은 데몬의 출력 디렉토리 아래로 제한됩니다.
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.audio_transcript_info import AudioTranscriptInfo
+from src.decoding import DECODING_PRESETS, DEFAULT_PRESET, get_decoding_config
+from src.model_registry import get_model, get_registry
+from src.transcript_cache import get_transcript_cache
+from src.transcript_stream import iter_stream_records
+from src.transcription import sharded_model_options, transcribe_audio_with_model
+
+# 기본 접속 주소 (외부에 노출하지 않도록 localhost만 사용)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 완료된 작업 정보를 보관할 최대 개수
+MAX_FINISHED_JOBS = 1000
+
+
+@dataclass
+class TranscriptionJob:
+    """데몬 전사 작업"""
+    audio_path: str
+    output_dir: str
+    model_size: str
+    language: Optional[str]
+    decoding: str = DEFAULT_PRESET
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued, running, done, failed
+    output_path: Optional[str] = None
+    stream_path: Optional[str] = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    started: threading.Event = field(default_factory=threading.Event, repr=False)
+    finished: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 작업 정보"""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "audio_path": self.audio_path,
+            "output_path": self.output_path,
+            "error": self.error,
+            "queued_seconds": ((self.started_at or time.time()) - self.submitted_at),
+            "processing_seconds": (((self.finished_at or time.time()) - self.started_at)
+                                   if self.started_at else None),
+        }
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+
+class TranscriptionDaemon:
+    """모델을 상주시키고 제한된 대기열과 워커로 전사 작업을 처리하는 클래스"""
+
+    def __init__(self,
+                 output_dir: str = "output/transcript",
+                 model_size: str = "medium",
+                 language: Optional[str] = "ko",
+                 device: Optional[str] = None,
+                 workers: int = 1,
+                 max_queue: int = 16,
+                 decoding: str = DEFAULT_PRESET):
+        self.output_dir = output_dir
+        self.model_size = model_size
+        self.language = language
+        self.device = device
+        self.workers = workers
+        self.decoding = decoding
+        self.queue: "queue.Queue[TranscriptionJob]" = queue.Queue(maxsize=max_queue)
+        self.jobs: "OrderedDict[str, TranscriptionJob]" = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def model_options(self) -> Dict[str, int]:
+        """워커 수만큼 동시에 transcribe를 호출할 수 있도록 모델 복제본 설정"""
+        return sharded_model_options(self.workers)
+
+    def start(self, warmup: bool = True):
+        """기본 모델을 미리 올리고 워커 스레드 시작"""
+        if warmup:
+            get_model(self.model_size, self.device, **self.model_options())
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"transcription-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logging.info(f"🚀 전사 데몬 시작: 모델={self.model_size}, 워커={self.workers}, "
+                     f"대기열={self.queue.maxsize}")
+
+    def stop(self):
+        """워커 종료 (진행 중인 작업은 끝까지 처리)"""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self,
+               audio_path: str,
+               output_dir: Optional[str] = None,
+               model_size: Optional[str] = None,
+               language: Optional[str] = "",
+               decoding: Optional[str] = None) -> TranscriptionJob:
+        """
+        전사 작업 등록
+
+        Args:
+            audio_path (str): 오디오 파일 경로
+            output_dir (str, optional): 출력 디렉토리 (데몬 출력 디렉토리 기준 상대 경로 또는 그 아래 경로)
+            model_size (str, optional): 모델 크기 (기본값: 데몬 설정)
+            language (str, optional): 언어 ("" 이면 데몬 설정, None이면 자동 감지)
+            decoding (str, optional): 디코딩 프리셋 (기본값: 데몬 설정)
+
+        Returns:
+            TranscriptionJob: 등록된 작업
+
+        Raises:
+            FileNotFoundError: 오디오 파일이 없는 경우
+            ValueError: 알 수 없는 디코딩 프리셋이거나 출력 디렉토리가 데몬 출력 디렉토리 밖인 경우
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"오류: 음성 파일을 찾을 수 없습니다 - {audio_path}")
+        decoding = decoding or self.decoding
+        get_decoding_config(decoding)
+        job = TranscriptionJob(
+            audio_path=os.path.abspath(audio_path),
+            output_dir=self._output_dir(output_dir),
+            model_size=model_size or self.model_size,
+            language=self.language if language == "" else language,
+            decoding=decoding,
+        )
+        with self._jobs_lock:
+            try:
+                self.queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFullError(f"대기열이 가득 찼습니다 ({self.queue.maxsize}개)")
+            self.jobs[job.id] = job
+            self._trim_jobs()
+        return job
+
+    def _output_dir(self, output_dir: Optional[str]) -> str:
+        """요청한 출력 디렉토리를 데몬 출력 디렉토리 아래 경로로 변환 (벗어나면 ValueError)"""
+        root = os.path.realpath(self.output_dir)
+        if not output_dir:
+            return root
+        path = os.path.realpath(os.path.join(root, output_dir))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError(f"출력 디렉토리는 {root} 아래여야 합니다: {output_dir}")
+        return path
+
+    def _trim_jobs(self):
+        """오래된 완료 작업 정보 삭제"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished.is_set()]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    def _worker(self):
+        while not self._stopping.is_set():
+            try:
+                job = self.queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            try:
+                self._run(job)
+            finally:
+                self.queue.task_done()
+
+    def _run(self, job: TranscriptionJob):
+        """작업 하나 전사"""
+        job.status = "running"
+        job.started_at = time.time()
+
+        def on_stream(stream_path: str):
+            job.stream_path = stream_path
+            job.started.set()
+
+        try:
+            model = get_model(job.model_size, self.device, **self.model_options())
+            # 같은 파일의 작업이 여러 워커에서 동시에 돌 수 있으므로 다른 작업의 스트림을 이어 받지 않음
+            job.output_path = transcribe_audio_with_model(
+                job.audio_path, model, job.output_dir, job.model_size, job.language,
+                resume=False, on_stream=on_stream, decoding=job.decoding
+            )
+            job.status = "done"
+            logging.info(f"✅ 작업 완료: {os.path.basename(job.audio_path)} "
+                         f"({time.time() - job.started_at:.2f}초)")
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logging.error(f"❌ 작업 실패: {os.path.basename(job.audio_path)} - {e}")
+        finally:
+            job.finished_at = time.time()
+            job.finished.set()
+            job.started.set()
+
+    def iter_segments(self, job: TranscriptionJob, poll_interval: float = 0.05) -> Iterator[Dict[str, Any]]:
+        """
+        작업의 세그먼트를 디코딩되는 대로 반환 (캐시된 결과는 완료 후 한 번에)
+
+        Yields:
+            Dict[str, Any]: 세그먼트 레코드 (마지막은 {"type": "end", "job": ...})
+        """
+        job.started.wait()
+        if job.stream_path:
+            for record in iter_stream_records(job.stream_path, follow=True,
+                                              poll_interval=poll_interval, stop=job.finished):
+                if record["type"] == "segment":
+                    yield record
+        else:
+            job.finished.wait()
+            if job.output_path:
+                transcript = AudioTranscriptInfo(job.audio_path)
+                if transcript.load_from_json(job.output_path):
+                    for segment in transcript.to_dict()["segments"]:
+                        yield {"type": "segment", **segment}
+        job.finished.wait()
+        yield {"type": "end", "job": job.to_dict()}
+
+    def health(self) -> Dict[str, Any]:
+        """대기열, 상주 모델, 캐시 상태"""
+        cache = get_transcript_cache()
+        return {
+            "queued": self.queue.qsize(),
+            "max_queue": self.queue.maxsize,
+            "workers": self.workers,
+            "models": [key._asdict() for key in get_registry().resident()],
+            "cache": cache.stats if cache is not None else None,
+        }
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """전사 데몬 HTTP 요청 처리"""
+
+    @property
+    def daemon(self) -> TranscriptionDaemon:
+        return self.server.transcription_daemon
+
+    def _send_json(self, status: int, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self._send_json(404, {"error": "알 수 없는 경로입니다"})
+        if self.headers.get_content_type() != "application/json":
+            return self._send_json(415, {"error": "Content-Type은 application/json이어야 합니다"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job = self.daemon.submit(
+                request["audio_path"],
+                request.get("output_dir"),
+                request.get("model_size"),
+                request.get("language", ""),
+                request.get("decoding"),
+            )
+        except QueueFullError as e:
+            return self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+        except FileNotFoundError as e:
+            return self._send_json(404, {"error": str(e)})
+        except (KeyError, ValueError) as e:
+            return self._send_json(400, {"error": f"잘못된 요청입니다: {e}"})
+
+        if request.get("wait"):
+            job.finished.wait()
+            return self._send_json(200 if job.status == "done" else 500, job.to_dict())
+        return self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        parts = [part for part in self.path.split("/") if part]
+        if parts == ["health"]:
+            return self._send_json(200, self.daemon.health())
+        if len(parts) not in (2, 3) or parts[0] != "jobs" or (len(parts) == 3 and parts[2] != "segments"):
+            return self._send_json(404, {"error": "알 수 없는 경로입니다"})
+
+        job = self.daemon.get_job(parts[1])
+        if job is None:
+            return self._send_json(404, {"error": f"작업을 찾을 수 없습니다: {parts[1]}"})
+        if len(parts) == 2:
+            return self._send_json(200, job.to_dict())
+
+        # 세그먼트 스트리밍 (한 줄에 하나, 연결 종료로 끝을 알림)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for record in self.daemon.iter_segments(job):
+            self.wfile.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+    def log_message(self, format, *args):
+        logging.debug(f"HTTP {self.address_string()} - {format % args}")
+
+
+def create_server(daemon: TranscriptionDaemon,
+                  host: str = DEFAULT_HOST,
+                  port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """데몬을 연결한 HTTP 서버 생성 (port=0이면 빈 포트 사용)"""
+    server = ThreadingHTTPServer((host, port), DaemonRequestHandler)
+    server.daemon_threads = True
+    server.transcription_daemon = daemon
+    return server
+
+
+def submit_job(audio_path: str,
+               url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+               wait: bool = True,
+               timeout: Optional[float] = None,
+               **options) -> Dict[str, Any]:
+    """
+    실행 중인 데몬에 전사 작업을 보내는 클라이언트 함수
+
+    Args:
+        audio_path (str): 오디오 파일 경로 (데몬에서 접근 가능한 경로)
+        url (str): 데몬 주소
+        wait (bool): 완료까지 기다릴지 여부
+        timeout (float, optional): HTTP 요청 제한 시간 (초)
+        **options: output_dir, model_size, language, decoding
+
+    Returns:
+        Dict[str, Any]: 작업 정보 (wait=True이면 output_path 포함)
+    """
+    body = json.dumps({"audio_path": os.path.abspath(audio_path), "wait": wait, **options}).encode("utf-8")
+    request = urllib.request.Request(f"{url}/jobs", data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def stream_job_segments(job_id: str,
+                        url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+                        timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """데몬에서 작업의 세그먼트를 디코딩되는 대로 받는 클라이언트 함수"""
+    with urllib.request.urlopen(f"{url}/jobs/{job_id}/segments", timeout=timeout) as response:
+        for line in response:
+            yield json.loads(line)
+
+
+def main():
+    """
+    명령줄에서 전사 데몬을 실행하는 메인 함수
+    """
+    parser = argparse.ArgumentParser(
+        description="모델을 상주시키고 localhost HTTP로 전사 작업을 받는 데몬",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python src/transcription_daemon.py --model medium --workers 2
+  curl -X POST localhost:8765/jobs -H 'Content-Type: application/json' \\
+       -d '{"audio_path": "/data/call.wav", "wait": true}'
+  curl localhost:8765/jobs/<id>/segments
+        """
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"접속 주소 (기본값: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument("--output", "-o", default="output/transcript",
+                        help="기본 출력 디렉토리 (기본값: output/transcript)")
+    parser.add_argument("--model", "-m", default="medium", help="기본 Whisper 모델 크기 (기본값: medium)")
+    parser.add_argument("--language", "-l", default="ko", help="기본 언어 설정 (기본값: ko, 자동 감지: none)")
+    parser.add_argument("--device", "-d", choices=["cuda", "cpu"],
+                        help="사용할 장치 (cuda, cpu, 기본값: 자동선택)")
+    parser.add_argument("--decoding", choices=list(DECODING_PRESETS), default=DEFAULT_PRESET,
+                        help=f"기본 디코딩 프리셋 (기본값: {DEFAULT_PRESET})")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="동시에 전사할 작업 수 (기본값: 1)")
+    parser.add_argument("--max-queue", type=int, default=16, help="대기열 최대 길이 (기본값: 16)")
+    args = parser.parse_args()
+
+    daemon = TranscriptionDaemon(
+        output_dir=args.output,
+        model_size=args.model,
+        language=None if args.language.lower() == "none" else args.language,
+        device=args.device,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        decoding=args.decoding,
+    )
+    daemon.start()
+    server = create_server(daemon, args.host, args.port)
+    logging.info(f"🎧 http://{args.host}:{server.server_port} 에서 작업 대기 중")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("⏹️ 종료 중...")
+    finally:
+        server.server_close()
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+전사 결과 열 기반(columnar) 바이너리 저장 형식 (단어 테이블)
+
+코퍼스 전체 분석(시간당 PII 밀도, 단어 길이 분포 등)을 위해 여러 전사 결과를
+한 행에 단어 하나(파일, 세그먼트, 시작, 끝, 텍스트, is_pii)인 테이블로 저장합니다.
+각 열은 .npy 파일이므로 np.load(mmap_mode="r")로 복사 없이 읽고, JSON을 파싱하지 않고 필터링합니다.
+
+디렉토리 구조:
+    word_table/
+      part-00000/
+        meta.json               파일 목록(헤더 정보와 행 범위), 행 그룹 통계
+        file.npy, segment.npy   단어가 속한 파일 번호, 파일 내 세그먼트 번호 (segments[segment])
+        start.npy, end.npy      단어 시작/끝 시간 (초)
+        is_pii.npy              개인정보 여부
+        text.npy, text.offsets.npy  UTF-8 단어 텍스트 버퍼와 바이트 오프셋
+        segment_*.npy, transcript.npy ...  AudioTranscriptInfo 복원용 세그먼트/파일 열
+      part-00001/
+        ...
+
+- 파트 하나는 write_word_table 한 번의 결과이며, 임시 디렉토리에 쓴 뒤 이름을 바꿔 원자적으로 추가됩니다.
+- 단어는 파일 순서대로 저장되고, 행 그룹(기본 65536행)마다 파일 범위, 시작 시간 최솟값,
+  끝 시간 최댓값, PII 단어 수를 기록하여 조건에 맞지 않는 행 그룹은 읽지 않고 건너뜁니다.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.audio_transcript_info import AudioTranscriptInfo
+
+# 형식 버전 (meta.json에 기록)
+FORMAT_VERSION = 1
+
+# 행 그룹당 기본 단어 수
+DEFAULT_ROW_GROUP_SIZE = 1 << 16
+
+# 파트 메타데이터 파일 이름
+META_FILENAME = "meta.json"
+
+# select()가 반환할 수 있는 단어 열
+WORD_COLUMNS = ("file", "segment", "start", "end", "is_pii", "text")
+
+# 채널 정보가 없는 세그먼트의 segment_channel 값
+NO_CHANNEL = -1
+
+
+def _encode_texts(texts: Sequence[str]):
+    """문자열 목록을 (UTF-8 바이트 배열, 바이트 오프셋 배열)로 변환"""
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(data) for data in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_texts(data: np.ndarray, offsets: np.ndarray, rows: np.ndarray) -> List[str]:
+    """행 번호 목록의 문자열 복원 (연속 범위는 한 번에 읽음)"""
+    if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+        first = int(offsets[rows[0]])
+        raw = data[first:int(offsets[rows[-1] + 1])].tobytes()
+        bounds = (offsets[rows[0]:rows[-1] + 2] - first).tolist()
+        return [raw[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+    return [data[offsets[row]:offsets[row + 1]].tobytes().decode("utf-8") for row in rows]
+
+
+class WordTablePart:
+    """단어 테이블 파트 하나 (열은 처음 사용할 때 메모리 매핑으로 열림)"""
+
+    def __init__(self, path: str):
+        self.path: str = path
+        with open(os.path.join(path, META_FILENAME), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 단어 테이블 버전: {meta.get('version')} ({path})")
+        self.files: List[Dict[str, Any]] = meta["files"]
+        self.row_groups: List[Dict[str, Any]] = meta["row_groups"]
+        self.rows: int = meta["rows"]
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def column(self, name: str) -> np.ndarray:
+        """열 배열 (읽기 전용 메모리 매핑)"""
+        if name not in self._columns:
+            column_path = os.path.join(self.path, f"{name}.npy")
+            try:
+                self._columns[name] = np.load(column_path, mmap_mode="r")
+            except ValueError:
+                # 빈 배열은 메모리 매핑할 수 없음
+                self._columns[name] = np.load(column_path)
+        return self._columns[name]
+
+    def texts(self, name: str, rows: np.ndarray) -> List[str]:
+        """텍스트 열에서 행 번호 목록의 문자열 읽기"""
+        return _decode_texts(self.column(name), self.column(f"{name}.offsets"), np.asarray(rows))
+
+
+def _write_part(path: str, transcripts: Iterable[AudioTranscriptInfo], row_group_size: int):
+    """파트 디렉토리에 열 파일과 meta.json 저장"""
+    files = []
+    columns: Dict[str, List[np.ndarray]] = {name: [] for name in (
+        "file", "segment", "start", "end", "is_pii", "segment_file", "segment_start", "segment_end",
+        "segment_channel",
+    )}
+    texts: Dict[str, List[str]] = {"text": [], "segment_id": [], "segment_text": [], "transcript": []}
+    rows = segment_rows = 0
+
+    for file_index, transcript in enumerate(transcripts):
+        word_lists = [segment.words for segment in transcript.segments]
+        sizes = np.array([len(words) for words in word_lists], dtype=np.int64)
+        count = int(sizes.sum())
+        if count:
+            columns["start"].append(np.concatenate([words.starts for words in word_lists]))
+            columns["end"].append(np.concatenate([words.ends for words in word_lists]))
+            columns["is_pii"].append(np.concatenate([words.is_pii for words in word_lists]))
+        columns["file"].append(np.full(count, file_index, dtype=np.int32))
+        columns["segment"].append(np.repeat(np.arange(len(sizes), dtype=np.int32), sizes))
+        for words in word_lists:
+            texts["text"].extend(words.texts)
+
+        segments = transcript.segments
+        columns["segment_file"].append(np.full(len(segments), file_index, dtype=np.int32))
+        columns["segment_start"].append(np.array([segment.start for segment in segments], dtype=np.float64))
+        columns["segment_end"].append(np.array([segment.end for segment in segments], dtype=np.float64))
+        columns["segment_channel"].append(np.array(
+            [NO_CHANNEL if segment.channel is None else segment.channel for segment in segments], dtype=np.int16
+        ))
+        texts["segment_id"].extend(str(segment.id) for segment in segments)
+        texts["segment_text"].extend(segment.text for segment in segments)
+        texts["transcript"].append(transcript.transcript)
+
+        files.append({
+            "audio_file": transcript.audio_path,
+            "processing_time": transcript.processing_time,
+            "processed_date": transcript.processed_date.isoformat(),
+            "model_info": transcript.model_info,
+            "words": [rows, rows + count],
+            "segments": [segment_rows, segment_rows + len(segments)],
+        })
+        rows += count
+        segment_rows += len(segments)
+
+    dtypes = {"file": np.int32, "segment": np.int32, "start": np.float64, "end": np.float64, "is_pii": bool,
+              "segment_file": np.int32, "segment_start": np.float64, "segment_end": np.float64,
+              "segment_channel": np.int16}
+    arrays = {name: np.concatenate(parts).astype(dtypes[name], copy=False) if parts
+              else np.zeros(0, dtype=dtypes[name]) for name, parts in columns.items()}
+    for name, values in texts.items():
+        arrays[name], arrays[f"{name}.offsets"] = _encode_texts(values)
+    for name, values in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), values)
+
+    # 행 그룹 통계 (파일 범위, 시작 시간 최솟값, 끝 시간 최댓값, PII 단어 수)
+    row_groups = []
+    for first in range(0, rows, row_group_size):
+        last = min(first + row_group_size, rows)
+        row_groups.append({
+            "rows": [first, last],
+            "files": [int(arrays["file"][first]), int(arrays["file"][last - 1])],
+            "start_min": float(arrays["start"][first:last].min()),
+            "end_max": float(arrays["end"][first:last].max()),
+            "pii_count": int(arrays["is_pii"][first:last].sum()),
+        })
+
+    meta = {"version": FORMAT_VERSION, "rows": rows, "files": files, "row_groups": row_groups}
+    with open(os.path.join(path, META_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def write_word_table(transcripts: Iterable[AudioTranscriptInfo], dataset_dir: str,
+                     row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> str:
+    """
+    전사 결과들을 단어 테이블 데이터셋에 새 파트로 추가
+
+    Args:
+        transcripts (Iterable[AudioTranscriptInfo]): 저장할 전사 결과
+        dataset_dir (str): 데이터셋 디렉토리 (없으면 생성)
+        row_group_size (int): 행 그룹당 단어 수
+
+    Returns:
+        str: 생성된 파트 디렉토리 경로
+    """
+    os.makedirs(dataset_dir, exist_ok=True)
+    tmp_path = os.path.join(dataset_dir, f".part-{os.getpid()}.tmp")
+    os.makedirs(tmp_path, exist_ok=True)
+    _write_part(tmp_path, transcripts, row_group_size)
+
+    # 다른 프로세스와 같은 번호를 쓰려 하면 다음 번호로 다시 시도 (rename은 기존 디렉토리를 덮어쓰지 않음)
+    index = len([name for name in os.listdir(dataset_dir) if name.startswith("part-")])
+    while True:
+        part_path = os.path.join(dataset_dir, f"part-{index:05d}")
+        try:
+            os.rename(tmp_path, part_path)
+            return part_path
+        except OSError:
+            if not os.path.exists(part_path):
+                raise
+            index += 1
+
+
+class WordTable:
+    """
+    단어 테이블 데이터셋 (하나 이상의 파트)
+
+    사용 예시:
+        table = WordTable("output/word_table")
+        pii = table.select(is_pii=True, columns=("file", "start", "end"))
+        durations = pii["end"] - pii["start"]
+        transcript = table.load_transcript("call_001.wav")
+    """
+
+    def __init__(self, path: str):
+        if os.path.exists(os.path.join(path, META_FILENAME)):
+            part_paths = [path]
+        else:
+            part_paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.startswith("part-") and os.path.isdir(os.path.join(path, name)))
+        self.parts: List[WordTablePart] = [WordTablePart(part_path) for part_path in part_paths]
+
+        # 데이터셋 전체 파일 번호 = 파트 시작 번호 + 파트 내 파일 번호
+        self.files: List[str] = []
+        self._file_offsets: List[int] = []
+        for part in self.parts:
+            self._file_offsets.append(len(self.files))
+            self.files.extend(entry["audio_file"] for entry in part.files)
+
+    def __len__(self) -> int:
+        return sum(part.rows for part in self.parts)
+
+    def file_indices(self, files: Iterable[str]) -> np.ndarray:
+        """파일 경로 또는 파일명에 해당하는 데이터셋 전체 파일 번호"""
+        wanted = set(files)
+        return np.array([index for index, audio_file in enumerate(self.files)
+                         if audio_file in wanted or os.path.basename(audio_file) in wanted], dtype=np.int32)
+
+    def select(self, files: Optional[Iterable[str]] = None, start: Optional[float] = None,
+               end: Optional[float] = None, is_pii: Optional[bool] = None,
+               columns: Sequence[str] = WORD_COLUMNS) -> Dict[str, np.ndarray]:
+        """
+        조건에 맞는 단어 행의 열을 가져옴 (통계로 제외되는 행 그룹은 읽지 않음)
+
+        Args:
+            files (Iterable[str], optional): 파일 경로 또는 파일명 목록
+            start (float, optional): 이 시간 이후에 끝나는 단어만 (초)
+            end (float, optional): 이 시간 이전에 시작하는 단어만 (초)
+            is_pii (bool, optional): 개인정보 여부
+            columns (Sequence[str]): 가져올 열 (WORD_COLUMNS 중에서 선택)
+
+        Returns:
+            Dict[str, np.ndarray]: 열 이름별 배열 ("file"은 self.files의 번호, "text"는 object 배열)
+        """
+        unknown = set(columns) - set(WORD_COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 열: {', '.join(sorted(unknown))} (사용 가능: {', '.join(WORD_COLUMNS)})")
+        wanted_files = self.file_indices(files) if files is not None else None
+
+        results: Dict[str, List[Any]] = {name: [] for name in columns}
+        for part, file_offset in zip(self.parts, self._file_offsets):
+            local_files = None if wanted_files is None else wanted_files[
+                (wanted_files >= file_offset) & (wanted_files < file_offset + len(part.files))] - file_offset
+            if local_files is not None and not len(local_files):
+                continue
+
+            selected = []
+            for group in part.row_groups:
+                first, last = group["rows"]
+                if local_files is not None and not np.any(
+                        (local_files >= group["files"][0]) & (local_files <= group["files"][1])):
+                    continue
+                if start is not None and group["end_max"] <= start:
+                    continue
+                if end is not None and group["start_min"] >= end:
+                    continue
+                if is_pii is not None and group["pii_count"] == (0 if is_pii else last - first):
+                    continue
+
+                mask = np.ones(last - first, dtype=bool)
+                if local_files is not None:
+                    mask &= np.isin(part.column("file")[first:last], local_files)
+                if start is not None:
+                    mask &= part.column("end")[first:last] > start
+                if end is not None:
+                    mask &= part.column("start")[first:last] < end
+                if is_pii is not None:
+                    mask &= part.column("is_pii")[first:last] == is_pii
+                selected.append(np.flatnonzero(mask) + first)
+
+            rows = np.concatenate(selected) if selected else np.zeros(0, dtype=np.int64)
+            for name in columns:
+                if name == "text":
+                    results[name].append(np.array(part.texts("text", rows), dtype=object))
+                elif name == "file":
+                    results[name].append(part.column("file")[rows] + np.int32(file_offset))
+                else:
+                    results[name].append(part.column(name)[rows])
+
+        return {name: np.concatenate(values) if values else np.zeros(0)
+                for name, values in results.items()}
+
+    def load_transcript(self, audio_file: str) -> AudioTranscriptInfo:
+        """
+        파일 하나의 전사 결과를 AudioTranscriptInfo로 복원
+
+        Args:
+            audio_file (str): 파일 경로 또는 파일명
+
+        Returns:
+            AudioTranscriptInfo: 복원된 전사 결과
+        """
+        indices = self.file_indices([audio_file])
+        if not len(indices):
+            raise KeyError(f"단어 테이블에 없는 파일: {audio_file}")
+        part_index = int(np.searchsorted(self._file_offsets, indices[0], side="right")) - 1
+        part = self.parts[part_index]
+        entry = part.files[int(indices[0]) - self._file_offsets[part_index]]
+
+        transcript = AudioTranscriptInfo("")
+        transcript.load_from_dict({
+            "audio_file": entry["audio_file"],
+            "transcript": part.texts("transcript", [int(indices[0]) - self._file_offsets[part_index]])[0],
+            "processing_time": entry["processing_time"],
+            "processed_date": entry["processed_date"],
+            "model_info": entry["model_info"],
+            "segments": [],
+        })
+
+        seg_first, seg_last = entry["segments"]
+        seg_rows = np.arange(seg_first, seg_last)
+        for segment_id, text, seg_start, seg_end, channel in zip(
+                part.texts("segment_id", seg_rows), part.texts("segment_text", seg_rows),
+                part.column("segment_start")[seg_first:seg_last].tolist(),
+                part.column("segment_end")[seg_first:seg_last].tolist(),
+                part.column("segment_channel")[seg_first:seg_last].tolist()):
+            transcript.add_segment(seg_start, seg_end, text, None if channel == NO_CHANNEL else channel, segment_id)
+
+        first, last = entry["words"]
+        segment_sizes = np.bincount(part.column("segment")[first:last], minlength=seg_last - seg_first)
+        transcript.word_store.load_columns(
+            part.texts("text", np.arange(first, last)),
+            part.column("start")[first:last],
+            part.column("end")[first:last],
+            part.column("is_pii")[first:last],
+            segment_sizes.tolist(),
+        )
+        return transcript
+
+
+def convert_json_directory(input_path: str, dataset_dir: str, files_per_part: int = 1000,
+                           row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> List[str]:
+    """
+    전사 JSON 파일(폴더 전체)을 단어 테이블로 변환
+
+    Args:
+        input_path (str): JSON 파일 또는 JSON 파일들이 포함된 폴더
+        dataset_dir (str): 단어 테이블 데이터셋 디렉토리
+        files_per_part (int): 파트 하나에 넣을 파일 수
+        row_group_size (int): 행 그룹당 단어 수
+
+    Returns:
+        List[str]: 생성된 파트 디렉토리 경로
+    """
+    if os.path.isfile(input_path):
+        json_paths = [input_path]
+    else:
+        json_paths = sorted(os.path.join(root, file) for root, _, files in os.walk(input_path)
+                            for file in files if file.endswith(".json"))
+
+    part_paths = []
+    for first in range(0, len(json_paths), files_per_part):
+        transcripts = []
+        for json_path in json_paths[first:first + files_per_part]:
+            transcript = AudioTranscriptInfo("")
+            if transcript.load_from_json(json_path):
+                transcripts.append(transcript)
+        part_path = write_word_table(transcripts, dataset_dir, row_group_size)
+        print(f"💾 단어 테이블 파트 저장: {part_path} ({len(transcripts)}개 파일)")
+        part_paths.append(part_path)
+    return part_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="전사 JSON 파일을 열 기반 단어 테이블로 변환합니다.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python src/word_table.py --input output/processed_local --output output/word_table
+        """
+    )
+    parser.add_argument("--input", "-i", required=True,
+                        help="입력 경로 (JSON 파일 또는 JSON 파일들이 포함된 폴더)")
+    parser.add_argument("--output", "-o", required=True, help="단어 테이블 데이터셋 디렉토리")
+    parser.add_argument("--files-per-part", type=int, default=1000,
+                        help="파트 하나에 넣을 파일 수 (기본값: 1000)")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE,
+                        help=f"행 그룹당 단어 수 (기본값: {DEFAULT_ROW_GROUP_SIZE})")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 입력 경로가 존재하지 않습니다: {args.input}")
+        return
+    convert_json_directory(args.input, args.output, args.files_per_part, args.row_group_size)
+
+
+if __name__ == "__main__":
+    main()
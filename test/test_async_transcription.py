@@ -0,0 +1,132 @@
+import asyncio
+import sys
+import threading
+import time
+from contextlib import aclosing
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.async_transcription as async_transcription
+from src.async_transcription import AsyncTranscriber
+from src.audio_transcript_info import AudioSegment
+
+
+class SlowModel:
+    """세그먼트마다 잠시 멈추며 동시 디코딩 수와 생성한 세그먼트 수를 기록하는 모델"""
+
+    def __init__(self, count=3, delay=0.05):
+        self.count = count
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.produced = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, language=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+
+        def segments():
+            with self._lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                for index in range(self.count):
+                    time.sleep(self.delay)
+                    with self._lock:
+                        self.produced += 1
+                    words = [SimpleNamespace(word=f" 문장{index}", start=float(index), end=index + 0.5)]
+                    yield SimpleNamespace(start=float(index), end=index + 0.5, text=f" 문장{index}", words=words)
+            finally:
+                with self._lock:
+                    self.active -= 1
+
+        return segments(), SimpleNamespace(language=language, language_probability=1.0, duration=3.0)
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "call.wav"
+    path.write_bytes(b"RIFF")
+    return str(path)
+
+
+def _transcriber(monkeypatch, model, replicas=1):
+    loads = []
+    monkeypatch.setattr(async_transcription, "get_model", lambda *args, **kwargs: loads.append(kwargs) or model)
+    return AsyncTranscriber("tiny", replicas=replicas), loads
+
+
+def test_requests_share_replicas_without_blocking_loop(monkeypatch, audio_file):
+    model = SlowModel()
+    transcriber, loads = _transcriber(monkeypatch, model, replicas=2)
+
+    async def collect():
+        return [segment async for segment in transcriber.transcribe(audio_file)]
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        async with transcriber:
+            results = await asyncio.gather(*(collect() for _ in range(4)))
+        ticking.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+
+    assert model.max_active == 2 and loads[0]["num_workers"] == 2
+    assert ticks > 10
+    for segments in results:
+        assert all(isinstance(segment, AudioSegment) for segment in segments)
+        assert [segment.id for segment in segments] == ["1", "2", "3"]
+        assert segments[1].words[0].word == " 문장1"
+
+
+def test_cancellation_stops_decoding_and_skips_queued_requests(monkeypatch, audio_file):
+    model = SlowModel(count=20)
+    transcriber, _ = _transcriber(monkeypatch, model, replicas=1)
+
+    async def first_segment():
+        async with aclosing(transcriber.transcribe(audio_file)) as segments:
+            async for segment in segments:
+                return segment
+
+    async def main():
+        waiting = asyncio.create_task(first_segment())
+        queued = asyncio.create_task(first_segment())
+        segment = await waiting
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await asyncio.sleep(0.3)
+        return segment
+
+    segment = asyncio.run(main())
+    transcriber.close()
+
+    assert segment.text == " 문장0"
+    assert model.calls == 1 and model.active == 0
+    assert model.produced < model.count
+
+
+def test_missing_file_raises_from_iterator(monkeypatch, tmp_path):
+    transcriber, _ = _transcriber(monkeypatch, SlowModel())
+
+    async def main():
+        async for _ in transcriber.transcribe(str(tmp_path / "missing.wav")):
+            pass
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(main())
+    transcriber.close()
@@ -0,0 +1,104 @@
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.audio_buffer_cache as audio_buffer_cache
+from src.audio_buffer_cache import AudioBufferCache
+from src.export import mute_audio_segments
+import src.transcription as transcription
+from src.transcription import WHISPER_SAMPLE_RATE, load_audio
+
+SR = 22050
+
+
+def _write_tone(path, seconds=1.0, sr=SR):
+    t = np.arange(int(seconds * sr)) / sr
+    sf.write(str(path), (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), sr, subtype="FLOAT")
+    return str(path)
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """read_audio 호출(실제 디코딩) 기록"""
+    calls = []
+    read_audio = audio_buffer_cache.read_audio
+    monkeypatch.setattr(audio_buffer_cache, "read_audio", lambda path: calls.append(path) or read_audio(path))
+    return calls
+
+
+@pytest.fixture
+def shared_cache(tmp_path, monkeypatch):
+    cache = AudioBufferCache(str(tmp_path / "buffers"), max_size_mb=16)
+    monkeypatch.setattr(audio_buffer_cache, "_audio_buffer_cache", cache)
+    monkeypatch.setattr(audio_buffer_cache, "_configured", True)
+    return cache
+
+
+def test_transcription_and_export_share_one_decode(tmp_path, decodes, shared_cache):
+    audio_path = _write_tone(tmp_path / "call.wav")
+
+    whisper_input = load_audio(audio_path)
+    assert len(whisper_input) == WHISPER_SAMPLE_RATE
+    assert whisper_input.dtype == np.float32 and not whisper_input.flags.writeable
+
+    output_path = str(tmp_path / "deid" / "call.wav")
+    assert mute_audio_segments(audio_path, [(0.25, 0.5)], output_path)
+    muted, sr = sf.read(output_path, dtype="float32")
+    assert sr == SR
+    assert np.all(muted[int(0.25 * SR):int(0.5 * SR)] == 0) and np.abs(muted[:int(0.2 * SR)]).max() > 0.4
+
+    assert decodes == [audio_path]
+    assert shared_cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+    # 같은 디렉토리를 사용하는 다른 프로세스(새 인스턴스)도 디코딩 없이 재사용
+    reused, _ = AudioBufferCache(shared_cache.cache_dir).load(audio_path, WHISPER_SAMPLE_RATE)
+    assert np.array_equal(reused, whisper_input) and len(decodes) == 1
+
+
+def test_least_recently_used_buffers_are_evicted(tmp_path, decodes):
+    # 1초짜리 22.05kHz float32 배열 ≈ 86KB, 상한 200KB이면 두 개까지 보관
+    cache = AudioBufferCache(str(tmp_path / "buffers"), max_size_mb=200 / 1024)
+    paths = [_write_tone(tmp_path / f"call{index}.wav", seconds=1.0 + index * 0.01) for index in range(3)]
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])
+
+    assert cache.stats["evictions"] == 1 and cache.size_bytes() <= cache.max_bytes
+    cache.load(paths[0])
+    assert decodes == paths[:2] + [paths[2]]
+    cache.load(paths[1])
+    assert decodes[-1] == paths[1]
+
+
+def test_buffers_are_private_to_owner(tmp_path):
+    (tmp_path / "buffers").mkdir(mode=0o755)
+    cache = AudioBufferCache(str(tmp_path / "buffers"))
+    cache.load(_write_tone(tmp_path / "call.wav"), WHISPER_SAMPLE_RATE)
+
+    assert stat.S_IMODE(os.stat(cache.cache_dir).st_mode) == 0o700
+    for path in Path(cache.cache_dir).iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+class OneSegmentModel:
+    def transcribe(self, audio, **kwargs):
+        segment = SimpleNamespace(start=0.0, end=1.0, text=" 안녕하세요", words=[])
+        return iter([segment]), SimpleNamespace(language="ko", language_probability=0.99, duration=1.0)
+
+
+def test_buffer_decoding_is_recorded_in_stream_params(tmp_path, shared_cache):
+    audio_path = _write_tone(tmp_path / "call.wav")
+    transcription.transcribe_audio_with_model(audio_path, OneSegmentModel(), str(tmp_path / "out"), "medium", "ko")
+
+    (stream_path,) = (tmp_path / "out").glob("*.jsonl")
+    header = json.loads(stream_path.read_text(encoding="utf-8").splitlines()[0])
+    assert header["params"]["audio_decoder"] == "soundfile+soxr"
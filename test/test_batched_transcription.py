@@ -0,0 +1,104 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from faster_whisper.feature_extractor import FeatureExtractor
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.batched_transcription as batched_transcription
+import src.transcription as transcription
+from src.batched_transcription import BatchedTranscriber
+
+SR = 16000
+
+
+class FakeModel:
+    """BatchedTranscriber가 사용하는 속성만 가진 모델"""
+
+    def __init__(self):
+        self.feature_extractor = FeatureExtractor()
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    # 파일마다 1~21초, 40~55초 구간을 음성으로 감지 -> 30초 청크 2개 (20초 + 15초)
+    monkeypatch.setattr(batched_transcription, "get_speech_timestamps",
+                        lambda audio, options: [{"start": 1 * SR, "end": 21 * SR},
+                                                {"start": 40 * SR, "end": 55 * SR}])
+    options = SimpleNamespace(word_timestamps=True, temperatures=[0.0])
+    monkeypatch.setattr(BatchedTranscriber, "_decoding_context", lambda self, language: (None, options))
+
+    batches = []
+
+    def forward(features, tokenizer, chunks_metadata, options):
+        batches.append([(m["offset"], m["duration"]) for m in chunks_metadata])
+        assert features.shape[0] == len(chunks_metadata)
+        outputs = []
+        for m in chunks_metadata:
+            start, end = m["offset"] + 0.5, m["offset"] + m["duration"] - 0.5
+            outputs.append([dict(
+                text=f" chunk@{m['offset']:.0f}", tokens=[1], start=start, end=end, seek=0,
+                avg_logprob=-0.1, no_speech_prob=0.01, compression_ratio=1.0,
+                words=[dict(start=start, end=end, word=f" chunk@{m['offset']:.0f}", probability=0.9)],
+            )])
+        return outputs
+
+    return forward, batches
+
+
+def test_chunks_from_several_files_share_batches(fake_engine):
+    forward, batches = fake_engine
+    engine = BatchedTranscriber(FakeModel(), batch_size=4)
+    engine.pipeline.forward = forward
+
+    def broken():
+        raise RuntimeError("decode failed")
+
+    items = [("a", np.zeros(60 * SR, np.float32)), ("broken", broken),
+             ("b", np.zeros(60 * SR, np.float32)), ("c", np.zeros(60 * SR, np.float32))]
+    results = list(engine.transcribe(items))
+
+    # 6개 청크가 4 + 2로 묶이고 첫 배치에 두 파일의 청크가 섞임
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert [r.key for r in results] == ["a", "broken", "b", "c"]
+    assert isinstance(results[1].error, RuntimeError)
+
+    for result in (results[0], results[2], results[3]):
+        assert result.error is None
+        assert [s.id for s in result.segments] == [1, 2]
+        # VAD로 제거된 무음을 되돌려 원본 파일 시간으로 복원
+        first, second = result.segments
+        assert (first.start, first.end) == pytest.approx((1.5, 20.5))
+        assert (second.start, second.end) == pytest.approx((40.5, 54.5))
+        assert second.words[0].start == pytest.approx(40.5)
+        assert result.info.duration == pytest.approx(60.0)
+        assert result.info.duration_after_vad == pytest.approx(35.0)
+
+
+def test_process_directory_batched_writes_per_file_transcripts(tmp_path, monkeypatch, fake_engine):
+    forward, batches = fake_engine
+    monkeypatch.setattr(batched_transcription.BatchedInferencePipeline, "forward",
+                        lambda self, *args: forward(*args))
+    monkeypatch.setattr(batched_transcription, "decode_audio",
+                        lambda path, sampling_rate: np.zeros(60 * SR, np.float32))
+    monkeypatch.setattr(transcription, "load_whisper_model", lambda *args, **kwargs: FakeModel())
+
+    input_dir = tmp_path / "audio"
+    input_dir.mkdir()
+    for name in ("call_1.wav", "call_2.wav", "call_3.wav"):
+        (input_dir / name).write_bytes(b"RIFF")
+    output_dir = tmp_path / "transcript"
+
+    transcription.process_directory(str(input_dir), str(output_dir), batch_size=3)
+
+    assert [len(batch) for batch in batches] == [3, 3]
+    transcripts = sorted(output_dir.glob("*.json"))
+    assert [p.name.rsplit("_", 2)[0] for p in transcripts] == ["call_1", "call_2", "call_3"]
+    data = json.loads(transcripts[1].read_text(encoding="utf-8"))
+    assert data["audio_file"].endswith("call_2.wav")
+    assert [s["id"] for s in data["segments"]] == ["1", "2"]
+    assert data["segments"][1]["start"] == pytest.approx(40.5)
+    assert data["transcript"] == "chunk@0  chunk@20"
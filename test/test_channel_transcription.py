@@ -0,0 +1,104 @@
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.audio_transcript_info import AudioTranscriptInfo
+from src.channel_transcription import channel_audit_paths, interleave_channels
+from src.export import extract_pii_segments
+from src.preprocessing import load_for_denoise
+
+SR = 16000
+
+
+class ChannelModel:
+    """채널(왼쪽 0.1 진폭, 오른쪽 0.3 진폭)마다 다른 시각의 세그먼트를 반환하는 모델
+
+    두 채널의 transcribe가 동시에 실행되어야 Barrier를 통과하므로 병렬 실행을 확인할 수 있음
+    """
+
+    def __init__(self):
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def transcribe(self, audio, language=None, **kwargs):
+        self.barrier.wait()
+        channel = 0 if np.abs(audio).max() < 0.2 else 1
+        starts = [0.0, 4.0] if channel == 0 else [1.5, 5.0]
+        segments = [
+            SimpleNamespace(start=start, end=start + 1.0, text=f" 채널{channel} {start}",
+                            words=[SimpleNamespace(word=f" 채널{channel}", start=start, end=start + 1.0)])
+            for start in starts
+        ]
+        info = SimpleNamespace(language=language, language_probability=1.0, duration=len(audio) / SR)
+        return iter(segments), info
+
+
+def _stereo(seconds=6.0):
+    n = int(seconds * SR)
+    return np.stack([np.full(n, 0.1, dtype=np.float32), np.full(n, 0.3, dtype=np.float32)])
+
+
+def test_interleave_orders_by_start_then_channel():
+    left = [SimpleNamespace(start=0.0, end=1.0), SimpleNamespace(start=2.0, end=3.0)]
+    right = [SimpleNamespace(start=0.0, end=0.5), SimpleNamespace(start=1.0, end=2.0)]
+
+    merged = interleave_channels([left, right])
+
+    assert [(s.start, s.channel) for s in merged] == [(0.0, 0), (0.0, 1), (1.0, 1), (2.0, 0)]
+    assert not hasattr(left[0], "channel")
+    assert channel_audit_paths("audit/call.wav", 2) == ["audit/call_ch0.wav", "audit/call_ch1.wav"]
+
+
+def test_channels_are_transcribed_in_parallel_and_interleaved(tmp_path):
+    output_path = transcription.transcribe_audio_channels(
+        "call.wav", ChannelModel(), str(tmp_path), "tiny", "ko", channels=list(_stereo())
+    )
+
+    with open(output_path, encoding="utf-8") as f:
+        data = json.load(f)
+    segments = data["segments"]
+    assert [(s["start"], s["channel"]) for s in segments] == [(0.0, 0), (1.5, 1), (4.0, 0), (5.0, 1)]
+    assert [s["id"] for s in segments] == ["1", "2", "3", "4"]
+
+    restored = AudioTranscriptInfo("")
+    assert restored.load_from_json(output_path)
+    assert [s.channel for s in restored.segments] == [0, 1, 0, 1]
+
+
+def test_mono_transcript_has_no_channel_field():
+    transcript = AudioTranscriptInfo("mono.wav")
+    transcript.add_segment(0.0, 1.0, "안녕하세요")
+
+    assert "channel" not in transcript.to_dict()["segments"][0]
+
+
+def test_pii_boundaries_stay_within_channel():
+    def word(text, start, end, is_pii=False):
+        return {"word": text, "start": start, "end": end, "is_pii": is_pii}
+
+    data = {"segments": [
+        {"text": "번호는", "start": 0.0, "end": 2.0, "channel": 0,
+         "words": [word("번호는", 0.0, 1.0), word("1234", 1.0, 2.0, True)]},
+        {"text": "네", "start": 1.2, "end": 1.5, "channel": 1, "words": [word("네", 1.2, 1.5)]},
+        {"text": "입니다", "start": 2.5, "end": 3.0, "channel": 0, "words": [word("입니다", 2.5, 3.0)]},
+    ]}
+
+    # 같은 채널의 앞뒤 단어(번호는, 입니다) 사이로 확장되며 다른 채널의 "네"에 걸리지 않음
+    assert extract_pii_segments(data) == [pytest.approx((1.0, 2.5))]
+
+
+def test_load_for_denoise_selects_channel(tmp_path):
+    path = tmp_path / "call.wav"
+    sf.write(str(path), _stereo(1.0).T, SR, subtype="FLOAT")
+
+    left, _ = load_for_denoise(str(path), use_pydub_preprocessing=False, channel=0)
+    right, _ = load_for_denoise(str(path), use_pydub_preprocessing=False, channel=1)
+
+    assert left.ndim == 1 and np.allclose(left, 0.1) and np.allclose(right, 0.3)
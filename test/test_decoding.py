@@ -0,0 +1,67 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.decoding import DECODING_OPTIONS, VAD_OPTIONS, get_decoding_config
+
+
+class LowConfidenceModel:
+    """greedy 디코딩에서 두 번째 세그먼트만 낮은 로그 확률을 반환하는 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append({"length": len(audio), **kwargs})
+        info = SimpleNamespace(language="ko", language_probability=0.99, duration=len(audio) / 16000)
+        if kwargs["vad_filter"]:
+            segments = [
+                SimpleNamespace(start=0.0, end=1.0, text=" 첫째", words=[], avg_logprob=-0.2, compression_ratio=1.1),
+                SimpleNamespace(start=2.0, end=3.5, text=" 틀림", words=[], avg_logprob=-1.6, compression_ratio=1.2),
+                SimpleNamespace(start=4.0, end=5.0, text=" 셋째", words=[], avg_logprob=-0.3, compression_ratio=1.0),
+            ]
+        else:
+            word = SimpleNamespace(word=" 둘째", start=0.1, end=1.2)
+            segments = [SimpleNamespace(start=0.0, end=1.5, text=" 둘째", words=[word],
+                                        avg_logprob=-0.4, compression_ratio=1.2)]
+        return iter(segments), info
+
+
+def test_presets_and_legacy_params():
+    assert get_decoding_config("fast").decoding_options()["beam_size"] == 1
+    assert get_decoding_config(None) is get_decoding_config("balanced")
+    with pytest.raises(ValueError):
+        get_decoding_config("fastest")
+
+    # 기본 프리셋의 매니페스트 파라미터는 이전 버전과 같아야 기존 결과가 재사용됨
+    assert transcription.transcription_params("medium", "ko") == {
+        "model_size": "medium", "language": "ko", "word_timestamps": True,
+        "decoding": DECODING_OPTIONS, "vad": VAD_OPTIONS,
+    }
+    assert "adaptive" in transcription.transcription_params("medium", "ko", "adaptive")
+
+
+def test_adaptive_redecodes_only_low_confidence_segments(tmp_path):
+    model = LowConfidenceModel()
+    output_path = transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), model, str(tmp_path), "medium", "ko",
+        audio=np.zeros(16000 * 6, dtype=np.float32), decoding="adaptive"
+    )
+
+    first, second = model.calls
+    assert first["beam_size"] == 1 and first["vad_filter"]
+    assert second["beam_size"] == 5 and not second["vad_filter"]
+    assert second["length"] == int(1.5 * 16000)
+    assert second["initial_prompt"] == " 첫째"
+
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert [s["text"] for s in data["segments"]] == [" 첫째", " 둘째", " 셋째"]
+    assert data["segments"][1]["start"] == pytest.approx(2.0)
+    assert data["segments"][1]["words"][0]["start"] == pytest.approx(2.1)
+    assert [s["id"] for s in data["segments"]] == ["1", "2", "3"]
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.loudness import (integrated_loudness, normalize_loudness, rms_dbfs,
+                          true_peak_dbfs)
+from src.preprocessing import reduce_noise_advanced
+
+
+def _sine(sr, seconds, freq=997.0, amplitude=1.0):
+    t = np.arange(int(sr * seconds)) / sr
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def test_rms_normalization_is_in_place_and_hits_target():
+    rng = np.random.default_rng(0)
+    audio = (0.05 * rng.standard_normal(16000 * 5)).astype(np.float32)
+    buffer_address = audio.__array_interface__["data"][0]
+
+    normalize_loudness(audio, 16000, target=-20.0, method="rms")
+
+    assert audio.dtype == np.float32
+    assert audio.__array_interface__["data"][0] == buffer_address
+    assert rms_dbfs(audio) == pytest.approx(-20.0, abs=1e-3)
+
+
+def test_ebu_r128_matches_bs1770_reference_tone():
+    # BS.1770: 0 dBFS 997Hz 사인파는 -3.01 LUFS
+    assert integrated_loudness(_sine(48000, 5.0), 48000) == pytest.approx(-3.01, abs=0.01)
+
+    audio = _sine(16000, 10.0, amplitude=0.1)
+    normalize_loudness(audio, 16000, target=-23.0, method="ebu_r128")
+    assert integrated_loudness(audio, 16000) == pytest.approx(-23.0, abs=0.01)
+
+
+def test_silence_and_invalid_input_are_rejected_gracefully():
+    silence = np.zeros(16000, dtype=np.float32)
+    assert normalize_loudness(silence, 16000) == 0.0
+    assert not silence.any()
+
+    with pytest.raises(ValueError):
+        normalize_loudness(np.zeros(16000, dtype=np.int16), 16000)
+    with pytest.raises(ValueError):
+        normalize_loudness(_sine(16000, 1.0), 16000, method="peak")
+
+
+def test_true_peak_limiter_only_touches_peaks():
+    sr = 16000
+    audio = _sine(sr, 4.0, freq=440.0, amplitude=0.05)
+    burst = slice(2 * sr, 2 * sr + 1600)
+    audio[burst] = _sine(sr, 0.1, freq=3000.0, amplitude=0.5)[:1600]
+    quiet = audio[:sr].copy()
+
+    # 버스트가 풀스케일을 넘도록 +12dB 적용 후 -1 dBTP로 제한
+    normalize_loudness(audio, sr, target=rms_dbfs(audio) + 12.0, method="rms", true_peak_limit=-1.0)
+
+    assert true_peak_dbfs(audio, sr) <= -1.0 + 0.05
+    np.testing.assert_allclose(audio[:sr], quiet * np.float32(10 ** (12 / 20)), rtol=1e-5)
+
+
+@pytest.mark.parametrize("method", ["rms", "ebu_r128"])
+def test_reduce_noise_advanced_float_methods(tmp_path, method):
+    sr = 16000
+    rng = np.random.default_rng(3)
+    t = np.arange(sr * 4) / sr
+    y = 0.25 * np.sin(2 * np.pi * 220 * t) * (t > 1.5) + 0.02 * rng.standard_normal(len(t))
+    input_path = tmp_path / "call.wav"
+    sf.write(str(input_path), y.astype(np.float32), sr, subtype="PCM_16")
+
+    output_path = tmp_path / "out.wav"
+    assert reduce_noise_advanced(str(input_path), str(output_path), loudness_method=method,
+                                 true_peak_limit=-1.0)
+
+    out, out_sr = sf.read(str(output_path), dtype="float32")
+    assert out_sr == sr and sf.info(str(output_path)).subtype == "PCM_16"
+    measured = rms_dbfs(out) if method == "rms" else integrated_loudness(out, sr)
+    assert measured == pytest.approx(-20.0, abs=0.1)
+    assert true_peak_dbfs(out, sr) <= -1.0 + 0.05
@@ -0,0 +1,154 @@
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.audio_transcript_info import JsonSerializer
+from src.manifest import MANIFEST_FILENAME, StageManifest, content_addressed_name, file_sha256
+from src.preprocessing import process_directory
+
+
+def test_manifest_tracks_content_params_and_outputs(tmp_path):
+    input_path = tmp_path / "call.wav"
+    output_path = tmp_path / "out" / "call.json"
+    input_path.write_bytes(b"audio v1")
+    output_path.parent.mkdir()
+    output_path.write_text("{}")
+    params = {"model_size": "medium", "language": "ko"}
+
+    manifest = StageManifest(str(tmp_path / "out"), "transcription")
+    assert not manifest.is_up_to_date(str(input_path), params)
+    manifest.record(str(input_path), params, [str(output_path)])
+
+    # 새로 로드해도 기록이 유지되어야 함 (다른 단계의 기록과는 분리)
+    reloaded = StageManifest(str(tmp_path / "out"), "transcription")
+    assert reloaded.is_up_to_date(str(input_path), params)
+    assert reloaded.outputs(str(input_path)) == [str(output_path)]
+    assert not StageManifest(str(tmp_path / "out"), "extraction").is_up_to_date(str(input_path), params)
+
+    assert not reloaded.is_up_to_date(str(input_path), {**params, "model_size": "small"})
+
+    input_path.write_bytes(b"audio v2")
+    assert not reloaded.is_up_to_date(str(input_path), params)
+
+    input_path.write_bytes(b"audio v1")
+    assert reloaded.is_up_to_date(str(input_path), params)
+    output_path.unlink()
+    assert not reloaded.is_up_to_date(str(input_path), params)
+
+
+def test_manifest_ignores_truncated_last_line(tmp_path):
+    input_path = tmp_path / "a.json"
+    input_path.write_text("{}")
+    manifest = StageManifest(str(tmp_path), "export")
+    manifest.record(str(input_path), {"merge_margin": 0.1})
+    with open(tmp_path / MANIFEST_FILENAME, "a", encoding="utf-8") as f:
+        f.write('{"stage": "export", "input": ')
+
+    assert StageManifest(str(tmp_path), "export").is_up_to_date(str(input_path), {"merge_margin": 0.1})
+
+
+def test_preprocessing_rerun_skips_unchanged_files(tmp_path, caplog):
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    t = np.arange(16000 * 3) / 16000
+    for i in range(2):
+        y = 0.2 * np.sin(2 * np.pi * (300 + 100 * i) * t) + 0.01 * np.random.default_rng(i).standard_normal(len(t))
+        sf.write(str(input_dir / f"call_{i}.wav"), y.astype(np.float32), 16000, subtype="PCM_16")
+    output_dir = tmp_path / "preprocessed"
+
+    process_directory(str(input_dir), str(output_dir), use_advanced_processing=False)
+    first_mtime = os.stat(output_dir / "call_0.wav").st_mtime_ns
+
+    # 한 파일만 변경
+    sf.write(str(input_dir / "call_1.wav"), np.zeros(16000 * 3, dtype=np.float32) + 0.1, 16000, subtype="PCM_16")
+    with caplog.at_level(logging.INFO):
+        process_directory(str(input_dir), str(output_dir), use_advanced_processing=False)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "✅ 성공: 1 파일" in messages
+    assert "⏭️ 건너뜀: 1 파일" in messages
+    assert os.stat(output_dir / "call_0.wav").st_mtime_ns == first_mtime
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        process_directory(str(input_dir), str(output_dir), use_advanced_processing=False, target_dBFS=-18.0)
+    assert "✅ 성공: 2 파일" in [r.getMessage() for r in caplog.records]
+
+
+def test_content_addressed_name_depends_on_content_and_params(tmp_path):
+    input_path = tmp_path / "call.wav"
+    input_path.write_bytes(b"audio v1")
+    sha256 = file_sha256(str(input_path))
+    params = {"model_size": "medium"}
+
+    name = content_addressed_name(str(input_path), sha256, params)
+    assert name == content_addressed_name(str(tmp_path / "copy" / "call.wav"), sha256, dict(params))
+    assert name.startswith("call_" + sha256[:16]) and name.endswith(".json")
+    assert name != content_addressed_name(str(input_path), sha256, {"model_size": "small"})
+    assert name != content_addressed_name(str(input_path), file_sha256(__file__), params)
+
+    manifest = StageManifest(str(tmp_path / "out"), "transcription")
+    assert manifest.content_addressed_path(str(input_path), params) == str(tmp_path / "out" / name)
+
+
+def test_json_is_written_atomically(tmp_path, monkeypatch):
+    path = tmp_path / "result.json"
+    serializer = JsonSerializer("json")
+    serializer.dump_file({"segments": []}, str(path))
+
+    def failing_dumps(data):
+        raise RuntimeError("인코딩 실패")
+
+    monkeypatch.setattr(serializer, "dumps", failing_dumps)
+    try:
+        serializer.dump_file({"segments": [1]}, str(path))
+    except RuntimeError:
+        pass
+    # 실패해도 기존 파일은 그대로, 임시 파일은 남지 않음
+    assert serializer.load_file(str(path)) == {"segments": []}
+    assert os.listdir(tmp_path) == ["result.json"]
+
+
+def test_transcription_content_addressed_outputs_are_stable(tmp_path, monkeypatch):
+    class FakeWhisperModel:
+        calls = 0
+
+        def transcribe(self, audio, **kwargs):
+            FakeWhisperModel.calls += 1
+            segment = SimpleNamespace(start=0.0, end=1.0, text="안녕하세요", words=[])
+            return iter([segment]), SimpleNamespace(language="ko", language_probability=0.99, duration=1.0)
+
+    monkeypatch.setattr(transcription, "load_whisper_model", lambda *args, **kwargs: FakeWhisperModel())
+    monkeypatch.setattr(transcription, "load_audio", lambda path: np.zeros(16000, dtype=np.float32))
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    (input_dir / "call.wav").write_bytes(b"audio v1")
+    output_dir = tmp_path / "transcript"
+
+    transcription.process_directory(str(input_dir), str(output_dir), content_addressed=True)
+    names = sorted(name for name in os.listdir(output_dir) if name.endswith(".json"))
+    params = transcription.transcription_params("medium", "ko")
+    assert names == [content_addressed_name("call.wav", file_sha256(str(input_dir / "call.wav")), params)]
+    # 스트림 종료 레코드도 옮긴 경로를 가리킴
+    (stream_name,) = [name for name in os.listdir(output_dir) if name.startswith("call_") and name.endswith(".jsonl")]
+    end = json.loads((output_dir / stream_name).read_text(encoding="utf-8").splitlines()[-1])
+    assert end == {"type": "end", "json_file": str(output_dir / names[0])}
+
+    # 매니페스트가 없어도 같은 이름의 결과가 있으면 건너뜀
+    os.remove(output_dir / MANIFEST_FILENAME)
+    transcription.process_directory(str(input_dir), str(output_dir), content_addressed=True)
+    assert FakeWhisperModel.calls == 1
+
+    # 입력이 바뀌면 새 이름으로 저장
+    (input_dir / "call.wav").write_bytes(b"audio v2")
+    transcription.process_directory(str(input_dir), str(output_dir), content_addressed=True)
+    assert FakeWhisperModel.calls == 2
+    assert len([name for name in os.listdir(output_dir) if name.endswith(".json")]) == 2
@@ -0,0 +1,101 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.model_registry as model_registry
+import src.transcription as transcription
+from src.model_registry import ModelKey, ModelRegistry
+
+
+class CountingLoader:
+    """로드 횟수를 세는 가짜 모델 로더"""
+
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, key):
+        self.loaded.append(key)
+        return object()
+
+
+def test_models_are_loaded_once_per_key():
+    loader = CountingLoader()
+    registry = ModelRegistry(loader=loader)
+
+    first = registry.get("medium", "cpu")
+    assert registry.get("medium", "cpu") is first
+    assert registry.get("medium", "cpu", cpu_threads=4) is not first
+    assert registry.get("medium", "cpu", compute_type="float32") is not first
+
+    assert len(loader.loaded) == 3
+    assert registry.stats == {"hits": 1, "loads": 3, "evictions": 0}
+
+
+def test_memory_cap_evicts_least_recently_used():
+    loader = CountingLoader()
+    # small(244MB) + medium(769MB)은 허용, large-v3(1550MB)가 올라오면 LRU부터 해제
+    registry = ModelRegistry(max_memory_mb=2000, loader=loader)
+
+    registry.get("small", "cpu")
+    registry.get("medium", "cpu")
+    registry.get("small", "cpu")
+    registry.get("large-v3", "cpu")
+
+    assert [key.model_size for key in registry.resident()] == ["small", "large-v3"]
+    assert registry.memory_mb() <= 2000
+
+    count_limited = ModelRegistry(max_models=1, loader=loader)
+    count_limited.get("tiny", "cpu")
+    count_limited.get("base", "cpu")
+    assert count_limited.resident() == [ModelKey("base", "cpu", "int8", 0)]
+
+
+def test_explicit_eviction():
+    registry = ModelRegistry(loader=CountingLoader())
+    registry.get("small", "cpu")
+    registry.get("small", "cuda")
+    registry.get("medium", "cpu")
+
+    assert registry.evict("small", device="cuda") == 1
+    assert registry.evict("small") == 1
+    assert [key.model_size for key in registry.resident()] == ["medium"]
+    assert registry.evict() == 1
+    assert registry.resident() == []
+
+
+def test_transcription_entry_points_share_the_global_registry(monkeypatch):
+    loader = CountingLoader()
+    monkeypatch.setattr(model_registry, "_registry", ModelRegistry(loader=loader))
+
+    assert transcription.load_whisper_model("medium") is transcription.load_whisper_model("medium")
+    assert loader.loaded == [ModelKey("medium", None, "int8", 0)]
+
+
+def test_slow_load_does_not_block_other_keys():
+    release = threading.Event()
+    loader = CountingLoader()
+
+    def gated_loader(key):
+        if key.model_size == "large-v3":
+            release.wait(5)
+        return loader(key)
+
+    registry = ModelRegistry(loader=gated_loader)
+    small = registry.get("small", "cpu")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("large-v3", "cpu"))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+
+    # 느린 로드 중에도 이미 올라간 모델과 다른 키는 바로 반환
+    assert registry.get("small", "cpu") is small
+    registry.get("tiny", "cpu")
+    assert not any(key.model_size == "large-v3" for key in loader.loaded)
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    # 같은 키는 한 번만 로드되고 두 요청이 같은 인스턴스를 받음
+    assert [key.model_size for key in loader.loaded].count("large-v3") == 1
+    assert len(results) == 2 and results[0] is results[1]
@@ -0,0 +1,79 @@
+import os
+import sys
+from pathlib import Path
+
+import librosa
+import noisereduce as nr
+import numpy as np
+import pytest
+import soundfile as sf
+from pydub import AudioSegment
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.preprocessing import normalize_volume, pcm_apply_gain, pcm_dbfs, reduce_noise_advanced
+
+
+def _legacy_reduce_noise_advanced(input_path, output_path, noise_clip_duration=2.0,
+                                  target_dBFS=-20.0, use_pydub_preprocessing=True):
+    """임시 WAV 파일을 경유하던 기존 구현 (비교 기준)"""
+    if use_pydub_preprocessing:
+        temp_path = output_path.replace('.wav', '_temp.wav')
+        audio = AudioSegment.from_file(input_path)
+        if audio.channels > 1:
+            audio = audio.set_channels(1)
+        if audio.frame_rate != 16000:
+            audio = audio.set_frame_rate(16000)
+        normalize_volume(audio, target_dBFS).export(temp_path, format="wav")
+        input_for_denoise = temp_path
+    else:
+        input_for_denoise = input_path
+
+    audio_data, sample_rate = librosa.load(input_for_denoise, sr=None)
+    noise_clip = audio_data[:int(noise_clip_duration * sample_rate)]
+    reduced_noise = nr.reduce_noise(y=audio_data, sr=sample_rate, y_noise=noise_clip,
+                                    stationary=True, prop_decrease=0.8)
+    audio_int16 = (reduced_noise * 32767).astype(np.int16)
+    final_audio = AudioSegment(audio_int16.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1)
+    normalize_volume(final_audio, target_dBFS).export(output_path, format="wav")
+    if use_pydub_preprocessing:
+        os.remove(temp_path)
+
+
+def _write_call(path: Path, sr: int, channels: int, seconds: float = 4.0):
+    rng = np.random.default_rng(sr + channels)
+    t = np.arange(int(sr * seconds)) / sr
+    speech = 0.25 * np.sin(2 * np.pi * 220 * t) * (t > 1.5)
+    tracks = [speech * (ch + 1) / channels + 0.02 * rng.standard_normal(len(t)) for ch in range(channels)]
+    sf.write(str(path), np.stack(tracks, axis=1).astype(np.float32), sr, subtype="PCM_16")
+
+
+@pytest.mark.parametrize("sr,channels,use_pydub", [
+    (16000, 1, True),
+    (44100, 2, True),
+    (8000, 1, True),
+    (22050, 2, False),
+])
+def test_output_is_byte_identical_to_legacy_pipeline(tmp_path, sr, channels, use_pydub):
+    input_path = tmp_path / "call.wav"
+    _write_call(input_path, sr, channels)
+
+    legacy_path = str(tmp_path / "legacy.wav")
+    new_path = str(tmp_path / "new.wav")
+    _legacy_reduce_noise_advanced(str(input_path), legacy_path, use_pydub_preprocessing=use_pydub)
+    assert reduce_noise_advanced(str(input_path), new_path, use_pydub_preprocessing=use_pydub,
+                                 loudness_method="pcm")
+
+    assert Path(new_path).read_bytes() == Path(legacy_path).read_bytes()
+    # 임시 파일을 만들지 않아야 함
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["call.wav", "legacy.wav", "new.wav"]
+
+
+def test_pcm_helpers_match_pydub():
+    rng = np.random.default_rng(1)
+    samples = (rng.standard_normal(48000) * 12000).clip(-32768, 32767).astype(np.int16)
+    segment = AudioSegment(samples.tobytes(), frame_rate=16000, sample_width=2, channels=1)
+
+    assert pcm_dbfs(samples, 2) == segment.dBFS
+    for gain in (-12.5, 0.0, 3.0, 18.0):
+        expected = np.frombuffer(segment.apply_gain(gain).raw_data, dtype=np.int16)
+        np.testing.assert_array_equal(pcm_apply_gain(samples, 2, gain), expected)
@@ -0,0 +1,72 @@
+import logging
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.preprocessing as preprocessing
+from src.preprocessing import process_directory
+
+
+def _write_tone(path: Path, sr: int = 16000, seconds: float = 3.0):
+    t = np.arange(int(sr * seconds)) / sr
+    y = 0.3 * np.sin(2 * np.pi * 440 * t) + 0.01 * np.random.default_rng(0).standard_normal(len(t))
+    sf.write(str(path), y.astype(np.float32), sr, subtype="PCM_16")
+
+
+def test_parallel_matches_sequential(tmp_path, caplog):
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for i in range(3):
+        _write_tone(input_dir / f"call_{i}.wav")
+    # 디코딩할 수 없는 파일은 다른 파일에 영향 없이 실패로 집계되어야 함
+    (input_dir / "broken.wav").write_bytes(b"not a wav file")
+
+    process_directory(str(input_dir), str(tmp_path / "seq"), use_advanced_processing=False)
+
+    with caplog.at_level(logging.INFO):
+        process_directory(str(input_dir), str(tmp_path / "par"), use_advanced_processing=False, workers=2)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "✅ 성공: 3 파일" in messages
+    assert "❌ 실패: 1 파일" in messages
+
+    # 파일별 로그는 입력 순서대로 출력
+    started = [m.strip() for m in messages if "처리 중:" in m]
+    assert [m.split("] ")[0] for m in started] == ["[1/4", "[2/4", "[3/4", "[4/4"]
+
+    for i in range(3):
+        seq, _ = sf.read(str(tmp_path / "seq" / f"call_{i}.wav"), dtype="int16")
+        par, _ = sf.read(str(tmp_path / "par" / f"call_{i}.wav"), dtype="int16")
+        np.testing.assert_array_equal(seq, par)
+
+
+def _crash_on_marked_file(process_file):
+    def run(input_path, output_path, **options):
+        if "crash" in Path(input_path).name:
+            os._exit(1)
+        return process_file(input_path, output_path, **options)
+    return run
+
+
+def test_crashed_worker_only_fails_its_own_file(tmp_path, caplog, monkeypatch):
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for name in ("a_call", "b_crash", "c_call", "d_call", "e_call"):
+        _write_tone(input_dir / f"{name}.wav", seconds=1.0)
+    # 워커는 fork로 시작하므로 패치된 함수를 그대로 사용
+    monkeypatch.setattr(preprocessing, "_process_file", _crash_on_marked_file(preprocessing._process_file))
+
+    with caplog.at_level(logging.INFO):
+        process_directory(str(input_dir), str(tmp_path / "par"), use_advanced_processing=False, workers=2)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "✅ 성공: 4 파일" in messages
+    assert "❌ 실패: 1 파일" in messages
+    assert f"❌ 실패: {input_dir / 'b_crash.wav'}" in messages
+    assert sorted(p.name for p in (tmp_path / "par").glob("*.wav")) == [
+        "a_call.wav", "c_call.wav", "d_call.wav", "e_call.wav"
+    ]
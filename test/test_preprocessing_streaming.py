@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import noisereduce as nr
+import numpy as np
+import pytest
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.preprocessing as preprocessing
+from src.preprocessing import reduce_noise_streaming
+
+
+def _write_recording(path: Path, sr: int, seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sr * seconds)) / sr
+    speech = 0.3 * np.sin(2 * np.pi * 300 * t + 3 * np.sin(2 * np.pi * 0.5 * t)) * (t > 2)
+    y = (speech + 0.03 * rng.standard_normal(len(t))).astype(np.float32)
+    sf.write(str(path), np.stack([y, y], axis=1), sr, subtype="PCM_16")
+    return y
+
+
+def test_streaming_matches_whole_file_denoise(tmp_path, monkeypatch):
+    sr = 16000
+    input_path = tmp_path / "ward.wav"
+    output_path = tmp_path / "ward_out.wav"
+    _write_recording(input_path, sr, seconds=20.0)
+
+    # 노이즈 제거는 항상 블록 + 겹침 길이 이하의 배열에만 수행되어야 함
+    window_sizes = []
+    original_reduce_noise = nr.reduce_noise
+
+    def spy(**kwargs):
+        window_sizes.append(len(kwargs["y"]))
+        return original_reduce_noise(**kwargs)
+
+    monkeypatch.setattr(preprocessing.nr, "reduce_noise", spy)
+    assert reduce_noise_streaming(str(input_path), str(output_path),
+                                  block_duration=4.0, overlap_duration=0.5)
+    monkeypatch.undo()
+
+    assert max(window_sizes) <= int(4.5 * sr)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ward.wav", "ward_out.wav"]
+
+    out, out_sr = sf.read(str(output_path), dtype="float32")
+    info = sf.info(str(output_path))
+    assert out_sr == sr and info.subtype == "PCM_16" and info.channels == 1
+
+    # 기준: 파일 전체에 한 번에 노이즈 제거 후 같은 레벨로 정규화
+    x = sf.read(str(input_path), dtype="float32")[0].mean(axis=1)
+    ref = nr.reduce_noise(y=x, sr=sr, y_noise=x[:2 * sr], stationary=True, prop_decrease=0.8)
+    ref *= 10 ** (-20 / 20) / np.sqrt(np.mean(ref.astype(np.float64) ** 2))
+    assert len(out) == len(ref)
+
+    def relative_error(segment):
+        err = out[segment] - ref[segment]
+        return np.sqrt(np.mean(err ** 2)) / np.sqrt(np.mean(ref[segment] ** 2))
+
+    assert relative_error(slice(None)) < 0.01
+    # 블록 경계 주변에도 불연속이 없어야 함
+    for k in range(1, 5):
+        seam = k * 4 * sr
+        assert relative_error(slice(seam - 2000, seam + 10000)) < 0.01
+
+
+def test_streaming_resamples_to_16k(tmp_path):
+    input_path = tmp_path / "call.wav"
+    output_path = tmp_path / "call_out.wav"
+    _write_recording(input_path, 44100, seconds=6.0)
+
+    assert reduce_noise_streaming(str(input_path), str(output_path), block_duration=2.0, overlap_duration=0.25)
+    info = sf.info(str(output_path))
+    assert info.samplerate == 16000
+    assert abs(info.frames - 6 * 16000) <= 16
+
+
+def test_streaming_rejects_unsupported_loudness_options(tmp_path):
+    with pytest.raises(ValueError):
+        preprocessing.process_directory(str(tmp_path), str(tmp_path / "out"), streaming=True,
+                                        loudness_method="ebu_r128")
+    with pytest.raises(ValueError):
+        preprocessing.process_single_file(str(tmp_path / "call.wav"), str(tmp_path / "out.wav"),
+                                          streaming=True, true_peak_limit=-1.0)
+    # 매니페스트에 적용되지 않은 설정이 기록되지 않음
+    assert not (tmp_path / "out").exists()
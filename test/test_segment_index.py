@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+import extraction
+from extraction import PIISentence, PIISentences
+from src.audio_transcript_info import AudioTranscriptInfo
+
+
+def _transcript():
+    transcript = AudioTranscriptInfo("call.wav")
+    for index, text in enumerate([" 안녕하세요", " 제 이름은  홍길동 입니다", " 번호는 010-1234-5678", " 감사합니다"]):
+        segment = transcript.add_segment(index * 2.0, index * 2.0 + 2.0, text)
+        segment.add_word(text, index * 2.0, index * 2.0 + 2.0)
+    return transcript
+
+
+def test_segment_ids_are_strings_and_indexed():
+    transcript = AudioTranscriptInfo("")
+    transcript.load_from_dict({
+        "audio_file": "call.wav", "transcript": "", "processing_time": 0.0,
+        "processed_date": "2025-01-01T12:00:00", "model_info": None,
+        "segments": [{"id": 7, "start": 0.0, "end": 1.0, "text": " 가"}, {"start": 1.0, "end": 2.0, "text": " 나"}],
+    })
+
+    assert [segment.id for segment in transcript.segments] == ["7", "2"]
+    assert transcript.segment_by_id(7) is transcript.segments[0]
+    assert transcript.segment_by_id("2") is transcript.segments[1]
+    assert transcript.segment_by_id(3) is None
+
+    # 색인 생성 후 추가하거나 id를 바꿔도 반영됨
+    added = transcript.add_segment(2.0, 3.0, " 다")
+    assert transcript.segment_by_id(3) is added
+    added.id = "30"
+    assert transcript.segment_by_id(3) is None
+    assert transcript.segment_by_id("30") is added
+
+
+def test_text_index_ignores_case_and_whitespace():
+    transcript = _transcript()
+    transcript.add_segment(8.0, 9.0, " ABC Def")
+
+    assert transcript.find_segment_by_text("홍길동") is transcript.segments[1]
+    assert transcript.find_segment_by_text("이름은 홍길동") is transcript.segments[1]
+    assert transcript.find_segment_by_text("abc  DEF") is transcript.segments[4]
+    # 세그먼트 경계를 넘는 일치는 없음
+    assert transcript.find_segment_by_text("입니다 번호는") is None
+    assert transcript.find_segment_by_text("  ") is None
+
+
+def test_de_identification_uses_id_then_text_fallback():
+    transcript = _transcript()
+    pii = PIISentences(pii_sentences=[
+        PIISentence(sentence_id=2, pii_text="홍길동", pii_type="NAME"),
+        PIISentence(sentence_id=99, pii_text="010-1234-5678", pii_type="PHONE"),
+    ])
+
+    extraction.de_identification(transcript, pii)
+
+    assert [bool(segment.words[0].is_pii) for segment in transcript.segments] == [False, True, True, False]
+    assert extraction.pii_segment_ids(transcript, pii) == ["2", "3"]
@@ -0,0 +1,90 @@
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.sharded_transcription import find_silences, plan_shards, transcribe_sharded
+
+SR = 16000
+
+
+def _speech_with_pauses(talk_seconds, pause_seconds, repeats):
+    """talk_seconds 길이의 발화와 pause_seconds 길이의 무음을 반복한 오디오"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(talk_seconds * SR)) / SR
+    talk = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+    pause = (0.0005 * rng.standard_normal(int(pause_seconds * SR))).astype(np.float32)
+    return np.concatenate([np.concatenate([talk, pause]) for _ in range(repeats)])
+
+
+class ShardRecordingModel:
+    """샤드마다 발화 구간 하나를 세그먼트로 반환하고 동시 실행 수를 기록하는 모델"""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, language=None, **kwargs):
+        with self._lock:
+            self.calls.append((len(audio), language))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        def segments():
+            time.sleep(0.05)
+            duration = len(audio) / SR
+            words = [SimpleNamespace(word=" 말", start=0.5, end=duration - 0.5)]
+            yield SimpleNamespace(id=1, start=0.5, end=duration - 0.5, text=" 말", words=words)
+            with self._lock:
+                self.active -= 1
+
+        info = SimpleNamespace(language=language, language_probability=1.0, duration=len(audio) / SR)
+        return segments(), info
+
+
+def test_shards_are_cut_in_the_middle_of_long_pauses():
+    # 8초 발화 + 2초 무음 x 6 = 60초
+    audio = _speech_with_pauses(8.0, 2.0, 6)
+    silences = find_silences(audio, SR, min_silence_duration=1.0)
+    assert [start for start, _ in silences] == pytest.approx([8, 18, 28, 38, 48, 58], abs=0.11)
+
+    shards = plan_shards(audio, SR, num_shards=3, min_silence_duration=1.0)
+    assert shards[0][0] == 0 and shards[-1][1] == len(audio)
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+    # 목표 경계(20초, 40초)에 가장 가까운 무음 중앙(19초, 39초)에서 분할
+    assert [end / SR for _, end in shards[:-1]] == pytest.approx([19.0, 39.0], abs=0.11)
+
+
+def test_sharded_transcription_offsets_and_renumbers_segments():
+    audio = _speech_with_pauses(8.0, 2.0, 6)
+    model = ShardRecordingModel()
+
+    segments, info = transcribe_sharded(model, audio, workers=2, language="ko", shard_duration=20.0)
+
+    assert len(model.calls) == 3 and model.max_active == 2
+    assert all(language == "ko" for _, language in model.calls)
+    assert [s.start for s in segments] == pytest.approx([0.5, 19.5, 39.5], abs=0.11)
+    assert segments[1].words[0].start == pytest.approx(19.5, abs=0.11)
+    assert segments[-1].end == pytest.approx(59.5)
+
+
+def test_transcribe_audio_sharded_writes_single_transcript(tmp_path):
+    audio = _speech_with_pauses(8.0, 2.0, 6)
+    output_path = transcription.transcribe_audio_sharded(
+        str(tmp_path / "long_call.wav"), ShardRecordingModel(), str(tmp_path), "medium", "ko",
+        shard_workers=2, shard_duration=20.0, audio=audio
+    )
+
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert [s["id"] for s in data["segments"]] == ["1", "2", "3"]
+    assert [s["start"] for s in data["segments"]] == pytest.approx([0.5, 19.5, 39.5], abs=0.11)
+    assert data["transcript"] == "말  말  말"
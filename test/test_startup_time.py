@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.startup_benchmark import (ENTRY_POINTS, HELP_BUDGET_S, IMPORT_BUDGET_S, heavy_imports,
+                                          measure_help, measure_import)
+
+
+@pytest.mark.parametrize("module,script", ENTRY_POINTS)
+def test_entry_point_imports_within_budget(module, script):
+    import_s, modules = measure_import(module)
+
+    assert module in modules
+    assert heavy_imports(modules) == []
+    assert import_s < IMPORT_BUDGET_S
+
+
+@pytest.mark.parametrize("module,script", ENTRY_POINTS)
+def test_help_within_budget(module, script):
+    assert measure_help(script, repeat=1) < HELP_BUDGET_S
@@ -0,0 +1,110 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.transcript_cache import TranscriptCache, cache_key
+
+
+class CountingModel:
+    """호출 횟수를 세고 고정된 세그먼트를 반환하는 모델"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio, **kwargs):
+        self.calls += 1
+        word = SimpleNamespace(word=" 안녕하세요", start=0.2, end=0.8)
+        segment = SimpleNamespace(start=0.0, end=1.0, text=" 안녕하세요", words=[word])
+        info = SimpleNamespace(language="ko", language_probability=0.99, duration=1.0)
+        return iter([segment]), info
+
+
+def _without_run_fields(data):
+    return {k: v for k, v in data.items() if k not in ("audio_file", "processing_time", "processed_date")}
+
+
+def test_duplicate_audio_is_served_from_cache(tmp_path):
+    (tmp_path / "a.wav").write_bytes(b"RIFF-same-content")
+    (tmp_path / "b.wav").write_bytes(b"RIFF-same-content")
+    cache = TranscriptCache(str(tmp_path / "cache"))
+    model = CountingModel()
+
+    first = transcription.transcribe_audio_with_model(
+        str(tmp_path / "a.wav"), model, str(tmp_path / "out1"), "medium", "ko", cache=cache
+    )
+    second = transcription.transcribe_audio_with_model(
+        str(tmp_path / "b.wav"), model, str(tmp_path / "out2"), "medium", "ko", cache=cache
+    )
+
+    assert model.calls == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+    first_data = json.loads(Path(first).read_text(encoding="utf-8"))
+    second_data = json.loads(Path(second).read_text(encoding="utf-8"))
+    assert second_data["audio_file"] == str((tmp_path / "b.wav").resolve())
+    assert _without_run_fields(first_data) == _without_run_fields(second_data)
+
+
+def test_decoding_parameters_are_part_of_the_key(tmp_path, monkeypatch):
+    (tmp_path / "a.wav").write_bytes(b"RIFF-content")
+    cache = TranscriptCache(str(tmp_path / "cache"))
+    model = CountingModel()
+
+    transcription.transcribe_audio_with_model(
+        str(tmp_path / "a.wav"), model, str(tmp_path / "out"), "medium", "ko", cache=cache
+    )
+    monkeypatch.setitem(transcription.VAD_OPTIONS, "threshold", 0.5)
+    transcription.transcribe_audio_with_model(
+        str(tmp_path / "a.wav"), model, str(tmp_path / "out"), "medium", "ko", cache=cache
+    )
+    transcription.transcribe_audio_with_model(
+        str(tmp_path / "a.wav"), model, str(tmp_path / "out"), "small", "ko", cache=cache
+    )
+
+    assert model.calls == 3 and cache.stats["hits"] == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    payload = {"transcript": "x" * 400_000, "segments": []}
+    keys = [cache_key(f"{i:064x}", "medium", "ko", {}, {}) for i in range(3)]
+    cache = TranscriptCache(str(tmp_path), max_size_mb=1.0)
+
+    cache.put(keys[0], payload)
+    cache.put(keys[1], payload)
+    assert cache.get(keys[0]) == payload
+    cache.put(keys[2], payload)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == payload and cache.get(keys[2]) == payload
+    assert cache.stats["evictions"] == 1
+
+    # 다시 열어도 마지막 사용 순서와 크기가 유지됨
+    reopened = TranscriptCache(str(tmp_path), max_size_mb=1.0)
+    assert list(reopened.entries) == [keys[0], keys[2]]
+    assert reopened.size_bytes() == cache.size_bytes()
+
+
+def test_overwritten_entry_keeps_size_total(tmp_path):
+    key = cache_key("0" * 64, "medium", "ko", {}, {})
+    cache = TranscriptCache(str(tmp_path))
+
+    cache.put(key, {"transcript": "x" * 1000, "segments": []})
+    cache.put(key, {"transcript": "x" * 10, "segments": []})
+
+    assert cache.size_bytes() == sum(path.stat().st_size for path in tmp_path.glob("*.json"))
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_single_file_uses_global_cache(tmp_path, monkeypatch):
+    (tmp_path / "a.wav").write_bytes(b"RIFF-content")
+    model = CountingModel()
+    monkeypatch.setattr(transcription, "load_whisper_model", lambda *args, **kwargs: model)
+    monkeypatch.setattr(transcription, "get_transcript_cache", lambda: TranscriptCache(str(tmp_path / "cache")))
+
+    transcription.process_single_file(str(tmp_path / "a.wav"), str(tmp_path / "out1"))
+    transcription.process_single_file(str(tmp_path / "a.wav"), str(tmp_path / "out2"))
+
+    assert model.calls == 1
@@ -0,0 +1,87 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.audio_transcript_info as audio_transcript_info
+from src.audio_transcript_info import AudioTranscriptInfo, JsonSerializer, TranscriptJsonReader
+
+BACKENDS = ["json"] + (["orjson"] if audio_transcript_info.orjson is not None else [])
+
+
+def _transcript(segments=40):
+    transcript = AudioTranscriptInfo("call.wav")
+    transcript.add_transcript("통화 녹음", processing_time=1.5, model_info="whisper-tiny")
+    for index in range(segments):
+        segment = transcript.add_segment(index * 2.0, index * 2.0 + 1.5, f" 문장 {index} \"따옴표\"")
+        segment.add_word(" 문장", index * 2.0, index * 2.0 + 0.5)
+        segment.add_word(f" {index}", index * 2.0 + 0.5, index * 2.0 + 1.5)
+    transcript.segments[3].words[1].is_pii = True
+    return transcript
+
+
+@pytest.fixture
+def serializer(monkeypatch):
+    def use(backend, compact):
+        monkeypatch.setattr(audio_transcript_info, "_json_serializer", JsonSerializer(backend, compact))
+    return use
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("compact", [False, True])
+def test_round_trip_and_streaming_reader(tmp_path, serializer, backend, compact):
+    serializer(backend, compact)
+    transcript = _transcript()
+    json_path = transcript.save_to_json(str(tmp_path))
+
+    restored = AudioTranscriptInfo("")
+    assert restored.load_from_json(json_path)
+    assert restored.to_dict() == transcript.to_dict()
+
+    # 청크 경계가 값 중간에 걸리도록 작은 청크로 읽기
+    reader = TranscriptJsonReader(json_path, chunk_size=7)
+    assert reader.header["audio_file"].endswith("call.wav") and reader.header["processing_time"] == 1.5
+    assert list(reader.iter_segment_dicts()) == transcript.to_dict()["segments"]
+    segments = list(reader.iter_segments())
+    assert [segment.text for segment in segments] == [segment.text for segment in transcript.segments]
+    assert segments[3].words[1].is_pii and not segments[3].words[0].is_pii
+
+
+def test_compact_output_is_smaller_and_reads_legacy_files(tmp_path):
+    data = _transcript().to_dict()
+    pretty = JsonSerializer(compact=False).dumps(data)
+    compact = JsonSerializer(compact=True).dumps(data)
+    assert len(compact) < len(pretty) * 0.7
+
+    # 기존 방식(json.dump, indent=2)으로 저장한 파일
+    legacy_path = tmp_path / "legacy.json"
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    for backend in BACKENDS:
+        assert JsonSerializer(backend, compact=True).load_file(str(legacy_path)) == data
+    assert list(TranscriptJsonReader(str(legacy_path)).iter_segment_dicts()) == data["segments"]
+
+
+def test_invalid_backend_and_truncated_file(tmp_path):
+    with pytest.raises(ValueError):
+        JsonSerializer("yaml")
+
+    truncated = tmp_path / "truncated.json"
+    truncated.write_bytes(JsonSerializer(compact=True).dumps(_transcript().to_dict())[:-40])
+    with pytest.raises(ValueError):
+        list(TranscriptJsonReader(str(truncated), chunk_size=16).iter_segment_dicts())
+
+
+def test_numbers_split_across_chunks(tmp_path):
+    # 기존 방식(indent=2) 파일에서 "processing_time": 1.5 가 청크 경계에서 "1."로 잘리는 경우
+    data = _transcript(segments=4).to_dict()
+    legacy_path = tmp_path / "legacy.json"
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    for chunk_size in list(range(1, 80)) + [128, 1 << 16]:
+        reader = TranscriptJsonReader(str(legacy_path), chunk_size=chunk_size)
+        assert reader.header["processing_time"] == 1.5, chunk_size
+        assert list(reader.iter_segment_dicts()) == data["segments"], chunk_size
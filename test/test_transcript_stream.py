@@ -0,0 +1,175 @@
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.transcript_stream import (StreamLockedError, TranscriptStreamWriter, finalize_stream,
+                                   find_resumable_stream, iter_stream_records, iter_stream_segments)
+
+
+def _segment(index):
+    start = float(index * 2)
+    words = [SimpleNamespace(word=f" 단어{index}", start=start + 0.1, end=start + 0.9)]
+    return SimpleNamespace(start=start, end=start + 1.0, text=f" 문장{index}", words=words)
+
+
+class GatedModel:
+    """세그먼트를 하나씩, gate가 열릴 때마다 생성하는 모델"""
+
+    def __init__(self, count, gate=None, fail_after=None):
+        self.count = count
+        self.gate = gate
+        self.fail_after = fail_after
+
+    def transcribe(self, audio, **kwargs):
+        def segments():
+            for index in range(self.count):
+                if self.fail_after is not None and index == self.fail_after:
+                    raise RuntimeError("디코딩 중단")
+                if self.gate is not None:
+                    self.gate.acquire()
+                yield _segment(index)
+
+        info = SimpleNamespace(language="ko", language_probability=0.98, duration=self.count * 2.0)
+        return segments(), info
+
+
+def test_stream_and_final_json_match(tmp_path):
+    output_path = transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), GatedModel(3), str(tmp_path), "medium", "ko",
+        audio=np.zeros(16000, dtype=np.float32)
+    )
+
+    (stream_path,) = tmp_path.glob("*.jsonl")
+    records = list(iter_stream_records(str(stream_path)))
+    assert [r["type"] for r in records] == ["header", "segment", "segment", "segment", "end"]
+    assert records[-1]["json_file"] == str(Path(output_path).resolve())
+
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert [s["id"] for s in data["segments"]] == ["1", "2", "3"]
+    streamed = [{k: r[k] for k in ("id", "start", "end", "text", "words")} for r in records[1:-1]]
+    assert streamed == [{k: s[k] for k in ("id", "start", "end", "text", "words")} for s in data["segments"]]
+
+
+def test_reader_follows_segments_while_decoding(tmp_path):
+    gate = threading.Semaphore(0)
+    worker = threading.Thread(target=transcription.transcribe_audio_with_model, args=(
+        str(tmp_path / "call.wav"), GatedModel(3, gate), str(tmp_path), "medium", "ko", False,
+        np.zeros(16000, dtype=np.float32)
+    ))
+    worker.start()
+    try:
+        while not list(tmp_path.glob("*.jsonl")):
+            pass
+        (stream_path,) = tmp_path.glob("*.jsonl")
+        reader = iter_stream_segments(str(stream_path), follow=True, poll_interval=0.01, timeout=5.0)
+
+        # 디코딩이 끝나기 전에 세그먼트를 하나씩 받을 수 있어야 함
+        for index in range(3):
+            gate.release()
+            assert next(reader)["text"] == f" 문장{index}"
+        assert list(reader) == []
+    finally:
+        for _ in range(3):
+            gate.release()
+        worker.join()
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_interrupted_stream_can_be_finalized(tmp_path):
+    with pytest.raises(RuntimeError):
+        transcription.transcribe_audio_with_model(
+            str(tmp_path / "call.wav"), GatedModel(5, fail_after=2), str(tmp_path), "medium", "ko",
+            audio=np.zeros(16000, dtype=np.float32)
+        )
+    assert list(tmp_path.glob("*.json")) == []
+
+    (stream_path,) = tmp_path.glob("*.jsonl")
+    output_path = finalize_stream(str(stream_path))
+
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert Path(output_path).stem == stream_path.stem
+    assert data["audio_file"] == str((tmp_path / "call.wav").resolve())
+    assert data["transcript"] == "문장0  문장1"
+    assert [s["words"][0]["word"] for s in data["segments"]] == [" 단어0", " 단어1"]
+
+
+class SliceRecordingModel:
+    """입력 길이를 기록하고 입력 기준 0.5초에 세그먼트 하나를 반환하는 모델"""
+
+    def __init__(self):
+        self.lengths = []
+
+    def transcribe(self, audio, **kwargs):
+        self.lengths.append(len(audio))
+        words = [SimpleNamespace(word=" 이어서", start=0.6, end=0.9)]
+        segment = SimpleNamespace(start=0.5, end=1.0, text=" 이어서", words=words)
+        info = SimpleNamespace(language="ko", language_probability=0.97, duration=len(audio) / 16000)
+        return iter([segment]), info
+
+
+def test_interrupted_transcription_resumes_from_checkpoint(tmp_path):
+    audio = np.zeros(16000 * 10, dtype=np.float32)
+    with pytest.raises(RuntimeError):
+        transcription.transcribe_audio_with_model(
+            str(tmp_path / "call.wav"), GatedModel(5, fail_after=2), str(tmp_path), "medium", "ko", audio=audio
+        )
+
+    model = SliceRecordingModel()
+    output_path = transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), model, str(tmp_path), "medium", "ko", audio=audio
+    )
+
+    # 마지막으로 기록된 세그먼트 끝(3.0초)부터 남은 구간만 디코딩
+    assert model.lengths == [16000 * 7]
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert [s["id"] for s in data["segments"]] == ["1", "2", "3"]
+    assert [s["start"] for s in data["segments"]] == pytest.approx([0.0, 2.0, 3.5])
+    assert data["segments"][2]["words"][0]["start"] == pytest.approx(3.6)
+    assert data["transcript"] == "문장0  문장1  이어서"
+
+    (stream_path,) = tmp_path.glob("*.jsonl")
+    types = [r["type"] for r in iter_stream_records(str(stream_path))]
+    assert types == ["header", "segment", "segment", "resume", "segment", "end"]
+
+
+def test_changed_settings_start_a_new_stream(tmp_path):
+    audio = np.zeros(16000 * 10, dtype=np.float32)
+    with pytest.raises(RuntimeError):
+        transcription.transcribe_audio_with_model(
+            str(tmp_path / "call.wav"), GatedModel(5, fail_after=2), str(tmp_path), "medium", "ko", audio=audio
+        )
+
+    model = SliceRecordingModel()
+    transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), model, str(tmp_path), "large-v3", "ko", audio=audio
+    )
+    assert model.lengths == [16000 * 10]
+    assert len(list(tmp_path.glob("*.jsonl"))) == 2
+
+    # 입력 오디오(전처리 결과)가 달라도 이어 받지 않음
+    model = SliceRecordingModel()
+    transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), model, str(tmp_path), "medium", "ko", audio=audio + 0.1
+    )
+    assert model.lengths == [16000 * 10]
+    assert len(list(tmp_path.glob("*.jsonl"))) == 3
+
+
+def test_live_stream_is_not_resumed(tmp_path):
+    writer = TranscriptStreamWriter(str(tmp_path / "call.wav"), str(tmp_path), {"model_size": "medium"})
+    writer.write_segment(_segment(0))
+
+    # 기록 중인 writer가 잠근 스트림은 검색과 이어 쓰기에서 제외
+    assert find_resumable_stream(str(tmp_path / "call.wav"), str(tmp_path), {"model_size": "medium"}) is None
+    with pytest.raises(StreamLockedError):
+        TranscriptStreamWriter.resume(writer.path)
+
+    writer.close()
+    assert find_resumable_stream(str(tmp_path / "call.wav"), str(tmp_path), {"model_size": "medium"}) == writer.path
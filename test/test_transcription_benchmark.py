@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import benchmarks.transcription.run as run
+from benchmarks.transcription.corpus import CorpusItem, load_corpus, synthetic_corpus
+from benchmarks.transcription.metrics import char_error_rate, word_error_rate
+
+
+class FixedTextModel:
+    """입력과 관계없이 고정된 텍스트의 세그먼트 두 개를 반환하는 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        segments = [SimpleNamespace(start=0.0, end=0.5, text=" 안녕하세요 고객님", words=[]),
+                    SimpleNamespace(start=0.5, end=1.0, text=" 반갑습니다", words=[])]
+        info = SimpleNamespace(language="ko", language_probability=0.99, duration=1.0)
+        return iter(segments), info
+
+
+def test_error_rates():
+    assert word_error_rate("안녕하세요 고객님 반갑습니다", "안녕하세요, 고객님 반가워요") == pytest.approx(1 / 3)
+    assert char_error_rate("안녕 하세요", "안녕하세요") == 0.0
+    assert word_error_rate("", "아무 말") is None
+
+
+def test_run_configuration_reports_metrics(tmp_path, monkeypatch):
+    corpus_dir = tmp_path / "corpus"
+    items = synthetic_corpus(str(corpus_dir), count=2, seconds=1.0)
+    Path(items[0].audio_path).with_suffix(".txt").write_text("안녕하세요 고객님 반갑습니다", encoding="utf-8")
+    corpus = load_corpus(str(corpus_dir))
+    assert [item.reference for item in corpus] == ["안녕하세요 고객님 반갑습니다", None]
+    assert corpus[0].duration == pytest.approx(1.0)
+
+    model = FixedTextModel()
+    loads = []
+    monkeypatch.setattr(run, "load_whisper_model", lambda *args: loads.append(args) or model)
+    config = run.BenchmarkConfig("small", "int8", cpu_threads=2, num_workers=2, beam_size=1)
+
+    result = run.run_configuration(config, corpus, language="ko")
+
+    assert loads == [("small", "cpu", "int8", 2, 2)]
+    assert {call["beam_size"] for call in model.calls} == {1}
+    assert result["label"] == "small/int8/threads=2/workers=2/beam=1"
+    assert result["audio_seconds"] == pytest.approx(2.0)
+    assert result["rtf"] == pytest.approx(result["wall_seconds"] / 2.0)
+    assert result["first_segment_latency"]["max"] >= result["first_segment_latency"]["mean"] > 0
+    assert result["wer"] == 0.0 and result["files"][1]["wer"] is None
+    assert result["peak_rss_mb"] > 0
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"results": [{"label": "a", "rtf": 0.20, "wer": 0.10}, {"label": "b", "rtf": 0.5, "wer": None}]}
+    current = {"results": [{"label": "a", "rtf": 0.25, "wer": 0.10}, {"label": "b", "rtf": 0.52, "wer": None},
+                           {"label": "c", "rtf": 9.0, "wer": 0.9}]}
+
+    assert run.compare_results(baseline, current) == ["a: RTF 0.200 -> 0.250"]
+    assert run.compare_results(baseline, current, rtf_tolerance=0.5) == []
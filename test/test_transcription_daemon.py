@@ -0,0 +1,117 @@
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription_daemon as transcription_daemon
+from src.transcription_daemon import TranscriptionDaemon, create_server, stream_job_segments, submit_job
+
+
+class GatedModel:
+    """gate가 열릴 때마다 세그먼트를 하나씩 생성하는 모델"""
+
+    def __init__(self, count=2):
+        self.count = count
+        self.gate = threading.Semaphore(0)
+
+    def transcribe(self, audio, **kwargs):
+        def segments():
+            for index in range(self.count):
+                self.gate.acquire()
+                yield SimpleNamespace(start=float(index), end=index + 0.5, text=f" 문장{index}", words=[])
+
+        return segments(), SimpleNamespace(language="ko", language_probability=0.99, duration=2.0)
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    model = GatedModel()
+    loads = []
+    monkeypatch.setattr(transcription_daemon, "get_model", lambda *args, **kwargs: loads.append(args) or model)
+    daemon = TranscriptionDaemon(output_dir=str(tmp_path / "out"), workers=1, max_queue=1)
+    daemon.start()
+    server = create_server(daemon, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield daemon, model, loads, f"http://127.0.0.1:{server.server_port}"
+    for _ in range(10):
+        model.gate.release()
+    server.shutdown()
+    server.server_close()
+    daemon.stop()
+
+
+def test_job_streams_segments_and_returns_output_path(tmp_path, running_daemon):
+    daemon, model, loads, url = running_daemon
+    (tmp_path / "call.wav").write_bytes(b"RIFF")
+
+    job = submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5)
+    assert job["status"] in ("queued", "running")
+
+    records = stream_job_segments(job["id"], url, timeout=5)
+    model.gate.release()
+    assert next(records)["text"] == " 문장0"
+    model.gate.release()
+    assert next(records)["text"] == " 문장1"
+    end = next(records)
+    assert end["type"] == "end" and end["job"]["status"] == "done"
+
+    data = json.loads(Path(end["job"]["output_path"]).read_text(encoding="utf-8"))
+    assert [s["text"] for s in data["segments"]] == [" 문장0", " 문장1"]
+    # 기동 시 한 번 올린 모델을 작업마다 레지스트리에서 다시 가져옴
+    assert len(loads) == 2
+
+
+def test_full_queue_is_rejected(tmp_path, running_daemon):
+    daemon, model, loads, url = running_daemon
+    (tmp_path / "call.wav").write_bytes(b"RIFF")
+
+    running = submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5)
+    daemon.get_job(running["id"]).started.wait(5)
+    submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5)  # 대기열 1칸 사용
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5)
+    assert error.value.code == 503
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        submit_job(str(tmp_path / "missing.wav"), url, wait=False, timeout=5)
+    assert error.value.code == 404
+
+
+def test_jobs_do_not_resume_other_streams(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(transcription_daemon, "get_model", lambda *args, **kwargs: None)
+    monkeypatch.setattr(transcription_daemon, "transcribe_audio_with_model",
+                        lambda *args, **kwargs: calls.append(kwargs) or "out.json")
+    (tmp_path / "call.wav").write_bytes(b"RIFF")
+    daemon = TranscriptionDaemon(output_dir=str(tmp_path / "out"))
+
+    daemon._run(transcription_daemon.TranscriptionJob(str(tmp_path / "call.wav"), str(tmp_path / "out"),
+                                                      "medium", "ko"))
+    assert calls[0]["resume"] is False
+
+
+def test_post_requires_json_and_output_under_root(tmp_path, running_daemon):
+    daemon, model, loads, url = running_daemon
+    (tmp_path / "call.wav").write_bytes(b"RIFF")
+    body = json.dumps({"audio_path": str(tmp_path / "call.wav")}).encode("utf-8")
+
+    # 사전 요청 없이 보낼 수 있는 form/text 요청은 거부
+    request = urllib.request.Request(f"{url}/jobs", data=body, headers={"Content-Type": "text/plain"})
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request, timeout=5)
+    assert error.value.code == 415
+
+    for output_dir in ("../elsewhere", str(tmp_path / "elsewhere")):
+        with pytest.raises(urllib.error.HTTPError) as error:
+            submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5, output_dir=output_dir)
+        assert error.value.code == 400
+
+    job = submit_job(str(tmp_path / "call.wav"), url, wait=False, timeout=5, output_dir="batch1")
+    assert daemon.get_job(job["id"]).output_dir == str((tmp_path / "out" / "batch1").resolve())
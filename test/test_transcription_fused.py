@@ -0,0 +1,83 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.transcription as transcription
+from src.preprocessing import preprocess_to_array
+
+
+class FakeWhisperModel:
+    """transcribe 입력을 기록하고 고정된 세그먼트를 반환하는 모델"""
+
+    def __init__(self):
+        self.inputs = []
+
+    def transcribe(self, audio, **kwargs):
+        self.inputs.append(audio)
+        word = SimpleNamespace(word="안녕하세요", start=1.6, end=2.1)
+        segment = SimpleNamespace(start=1.5, end=2.5, text="안녕하세요", words=[word])
+        info = SimpleNamespace(language="ko", language_probability=0.99, duration=4.0)
+        return iter([segment]), info
+
+
+def _write_raw_call(path: Path, sr: int = 44100):
+    rng = np.random.default_rng(0)
+    t = np.arange(sr * 4) / sr
+    y = 0.25 * np.sin(2 * np.pi * 220 * t) * (t > 1.5) + 0.02 * rng.standard_normal(len(t))
+    sf.write(str(path), np.stack([y, y], axis=1).astype(np.float32), sr, subtype="PCM_16")
+
+
+def test_fused_mode_passes_array_without_writing_wav(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    _write_raw_call(raw / "call.wav")
+    output_dir = tmp_path / "transcript"
+    model = FakeWhisperModel()
+
+    output_path = transcription.preprocess_and_transcribe(
+        str(raw / "call.wav"), model, str(output_dir), "medium", "ko"
+    )
+
+    (audio,) = model.inputs
+    assert isinstance(audio, np.ndarray) and audio.dtype == np.float32
+    expected, sr = preprocess_to_array(str(raw / "call.wav"))
+    assert sr == transcription.WHISPER_SAMPLE_RATE
+    np.testing.assert_allclose(audio, np.clip(expected, -1.0, 32767 / 32768))
+
+    data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+    assert data["audio_file"] == str(raw / "call.wav")
+    assert data["segments"][0]["words"][0]["word"] == "안녕하세요"
+    # 전처리 WAV는 요청하지 않으면 만들지 않음
+    assert sorted(p.name for p in tmp_path.rglob("*.wav")) == ["call.wav"]
+
+
+def test_fused_directory_mode_writes_audit_wav_on_request(tmp_path, monkeypatch):
+    raw = tmp_path / "raw"
+    (raw / "ward").mkdir(parents=True)
+    _write_raw_call(raw / "ward" / "call.wav", sr=16000)
+    model = FakeWhisperModel()
+    monkeypatch.setattr(transcription, "load_whisper_model", lambda *args, **kwargs: model)
+
+    audit_dir = tmp_path / "preprocessed"
+    transcription.process_directory(str(raw), str(tmp_path / "transcript"), preprocess=True,
+                                    audit_dir=str(audit_dir))
+
+    audit_path = audit_dir / "ward" / "call.wav"
+    written, sr = sf.read(str(audit_path), dtype="float32")
+    assert sr == 16000 and sf.info(str(audit_path)).subtype == "PCM_16"
+    # 감사용 WAV는 모델에 전달된 배열을 16-bit로 저장한 것
+    np.testing.assert_allclose(written, model.inputs[0], atol=1 / 32768)
+
+    # 같은 설정으로 다시 실행하면 건너뜀, 전처리 설정이 바뀌면 다시 처리
+    transcription.process_directory(str(raw), str(tmp_path / "transcript"), preprocess=True,
+                                    audit_dir=str(audit_dir))
+    assert len(model.inputs) == 1
+    transcription.process_directory(str(raw), str(tmp_path / "transcript"), preprocess=True,
+                                    preprocess_options={"target_dBFS": -18.0},
+                                    audit_dir=str(audit_dir))
+    assert len(model.inputs) == 2
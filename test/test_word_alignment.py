@@ -0,0 +1,101 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+import src.transcription as transcription
+import extraction
+from src.export import extract_pii_segments, mask_text_in_json
+
+
+class SegmentModel:
+    """vad_filter=True이면 세그먼트 단위 결과를, clip_timestamps가 있으면 해당 구간의 단어를 반환하는 모델"""
+
+    TEXTS = [" 안녕하세요", " 제 이름은 홍길동입니다", " 감사합니다"]
+
+    def __init__(self, redecoded_text=None):
+        self.calls = []
+        self.redecoded_text = redecoded_text
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        info = SimpleNamespace(language="ko", language_probability=0.99, duration=len(audio) / 16000)
+        if "clip_timestamps" not in kwargs:
+            words_on = kwargs["word_timestamps"]
+            segments = [
+                SimpleNamespace(start=i * 3.0, end=i * 3.0 + 2.0, text=text,
+                                words=[SimpleNamespace(word=text, start=i * 3.0, end=i * 3.0 + 2.0)] if words_on else None)
+                for i, text in enumerate(self.TEXTS)
+            ]
+            return iter(segments), info
+        start, end = kwargs["clip_timestamps"]
+        words = [SimpleNamespace(word=" 제", start=start + 0.1, end=start + 0.4),
+                 SimpleNamespace(word=" 이름은", start=start + 0.5, end=start + 1.0),
+                 SimpleNamespace(word=" 홍길동입니다", start=start + 1.1, end=end + 0.3)]
+        text = self.redecoded_text or "".join(word.word for word in words)
+        return iter([SimpleNamespace(start=start, end=end, text=text, words=words)]), info
+
+
+def _transcribe_deferred(tmp_path, model):
+    output_path = transcription.transcribe_audio_with_model(
+        str(tmp_path / "call.wav"), model, str(tmp_path), "medium", "ko",
+        audio=np.zeros(16000 * 8, dtype=np.float32), word_timestamps=False
+    )
+    transcript = transcription.AudioTranscriptInfo("dummy_audio_path")
+    assert transcript.load_from_json(output_path)
+    return transcript
+
+
+def test_only_flagged_segments_are_redecoded_with_word_timestamps(tmp_path):
+    model = SegmentModel()
+    transcript = _transcribe_deferred(tmp_path, model)
+    assert model.calls[0]["word_timestamps"] is False
+    assert all(not seg.words for seg in transcript.segments)
+
+    aligned = transcription.align_segment_words(
+        transcript, ["2"], model, audio=np.zeros(16000 * 8, dtype=np.float32)
+    )
+
+    assert aligned == 1
+    (clip_call,) = model.calls[1:]
+    assert clip_call["clip_timestamps"] == [3.0, 5.0]
+    assert clip_call["word_timestamps"] is True and clip_call["vad_filter"] is False
+    assert clip_call["initial_prompt"] == " 안녕하세요"
+    segment = transcript.segments[1]
+    assert [w.word for w in segment.words] == [" 제", " 이름은", " 홍길동입니다"]
+    assert segment.words[-1].end == pytest.approx(5.0)  # 세그먼트 구간으로 제한
+    assert transcript.segments[0].words == [] and transcript.segments[2].words == []
+
+
+def test_mismatched_redecode_falls_back_to_whole_segment(tmp_path):
+    model = SegmentModel(redecoded_text=" 제 이름은 홍길순입니다")
+    transcript = _transcribe_deferred(tmp_path, model)
+
+    transcription.align_segment_words(transcript, ["2"], model, audio=np.zeros(16000 * 8, dtype=np.float32))
+
+    (word,) = transcript.segments[1].words
+    assert (word.word, word.start, word.end) == (" 제 이름은 홍길동입니다", 3.0, 5.0)
+    assert transcript.segments[1].text == " 제 이름은 홍길동입니다"
+
+
+def test_export_boundaries_stay_within_flagged_segment(tmp_path):
+    transcript = _transcribe_deferred(tmp_path, SegmentModel())
+    pii = extraction.PIISentences(pii_sentences=[
+        extraction.PIISentence(sentence_id=2, pii_text="홍길동", pii_type="NAME")
+    ])
+
+    segment_ids = extraction.pii_segment_ids(transcript, pii)
+    assert segment_ids == ["2"]
+    assert extraction.ensure_segment_words(transcript, segment_ids) == 1  # 정렬기 없음 -> 세그먼트 전체
+    extraction.de_identification(transcript, pii)
+    data = json.loads(json.dumps(transcript.to_dict()))
+
+    # 앞뒤 세그먼트는 단어가 없어도 경계로 사용됨
+    assert extract_pii_segments(data) == [(2.0, 6.0)]
+    masked = mask_text_in_json(data)
+    assert masked["transcript"] == " 안녕하세요 ***  감사합니다"
@@ -0,0 +1,113 @@
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+import extraction
+from src.audio_transcript_info import AudioSegment, AudioTranscriptInfo, WordTimestamp
+from src.export import extract_pii_segments
+
+
+def _transcript():
+    transcript = AudioTranscriptInfo("call.wav")
+    first = transcript.add_segment(0.0, 2.0, " 제 번호는")
+    first.add_word(" 제", 0.0, 0.5)
+    first.add_word(" 번호는", 0.5, 2.0)
+    transcript.add_segment(2.0, 3.0, " 공일공")
+    last = transcript.add_segment(3.0, 5.0, " 입니다")
+    last.add_word(" 입니다", 3.0, 5.0)
+    return transcript
+
+
+def test_segment_word_views_share_columnar_store():
+    transcript = _transcript()
+    store = transcript.word_store
+
+    # 앞쪽 세그먼트에 단어를 채워도(단어 정렬) 뒤쪽 세그먼트의 뷰는 같은 단어를 가리킴
+    last_word = transcript.segments[2].words[0]
+    transcript.segments[1].words.append(WordTimestamp(" 공일공", 2.0, 3.0))
+    assert store.segment_offsets.tolist() == [0, 2, 3, 4]
+    assert store.text == " 제 번호는 공일공 입니다"
+    assert last_word.word == " 입니다" and last_word.start == 3.0
+
+    transcript.segments[1].words[0].is_pii = True
+    transcript.segments[2].words.is_pii[:] = True
+    assert store.is_pii.tolist() == [False, False, True, True]
+    assert transcript.segments[1].words == [WordTimestamp(" 공일공", 2.0, 3.0, True)]
+
+    transcript.segments[0].words = [WordTimestamp(" 제번호는", 0.0, 2.0)]
+    assert store.size == 3 and store.text == " 제번호는 공일공 입니다"
+    assert [w.word for w in transcript.segments[2].words] == [" 입니다"]
+
+    restored = AudioTranscriptInfo("")
+    restored.load_from_dict(transcript.to_dict())
+    assert restored.to_dict()["segments"] == transcript.to_dict()["segments"]
+    assert restored.to_dict()["segments"][1]["words"] == [
+        {"word": " 공일공", "start": 2.0, "end": 3.0, "is_pii": True}
+    ]
+
+
+def test_standalone_segment_keeps_list_api():
+    segment = AudioSegment(id="1", text=" 안녕", start=0.0, end=1.0, words=[WordTimestamp(" 안녕", 0.0, 1.0)])
+    segment.add_word(" 하세요", 1.0, 1.5)
+
+    assert len(segment.words) == 2 and segment.words[-1].end == 1.5
+    assert segment.words.texts == [" 안녕", " 하세요"]
+    with pytest.raises(IndexError):
+        segment.words[2]
+
+
+def test_mark_pii_sets_flags_on_whole_array():
+    transcript = _transcript()
+    transcript.segments[0].add_word(" 공일공-", 2.0, 2.5)
+    transcript.segments[0].add_word(" ", 2.5, 2.6)
+    transcript.segments[0].add_word(" 1234", 2.6, 3.0)
+    words = transcript.segments[0].words
+    plain = [WordTimestamp(w.word, w.start, w.end) for w in words]
+
+    extraction.mark_pii_in_words(words, "공일공-1234")
+    extraction.mark_pii_in_words(plain, "공일공-1234")
+
+    assert words.is_pii.tolist() == [False, False, True, False, True]
+    assert [w.is_pii for w in plain] == words.is_pii.tolist()
+
+
+def test_pii_blocks_extend_to_neighbouring_words():
+    def word(text, start, end, is_pii=False):
+        return {"word": text, "start": start, "end": end, "is_pii": is_pii}
+
+    data = {"segments": [
+        {"text": "a", "start": 0.0, "end": 4.0, "words": [
+            word("010", 0.0, 0.5, True), word("번호", 0.7, 1.0), word("홍", 1.2, 1.4, True),
+            word("길동", 1.4, 1.8, True), word("님", 2.0, 2.2), word("1234", 3.0, 4.0, True),
+        ]},
+    ]}
+
+    assert extract_pii_segments(data) == [(0.0, 0.7), (1.0, 2.0), (2.2, 4.0)]
+
+
+def test_columnar_store_is_smaller_than_word_objects():
+    count = 60_000
+
+    tracemalloc.start()
+    transcript = AudioTranscriptInfo("long.wav")
+    for index in range(0, count, 15):
+        segment = transcript.add_segment(index * 0.3, (index + 15) * 0.3, "")
+        for offset in range(15):
+            segment.add_word(" 단어", (index + offset) * 0.3, (index + offset + 1) * 0.3)
+    columnar, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    objects = [WordTimestamp(" 단어", index * 0.3, (index + 1) * 0.3) for index in range(count)]
+    per_object, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert transcript.word_store.size == count
+    assert np.all(np.diff(transcript.word_store.starts) > 0)
+    assert columnar < per_object / 2
+    del objects
@@ -0,0 +1,94 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+import src.word_table as word_table
+from src.audio_transcript_info import AudioTranscriptInfo
+from src.word_table import WordTable, convert_json_directory, write_word_table
+
+
+def _transcript(name, segments=3, pii_segment=None, channel=None):
+    transcript = AudioTranscriptInfo(name)
+    transcript.add_transcript(f"{name} 전사", processing_time=2.5, model_info="whisper-tiny")
+    for index in range(segments):
+        segment = transcript.add_segment(index * 10.0, index * 10.0 + 5.0, f" 문장{index}", channel)
+        segment.add_word(" 제 번호는", index * 10.0, index * 10.0 + 1.0)
+        segment.add_word(" 공일공", index * 10.0 + 1.0, index * 10.0 + 5.0)
+    if pii_segment is not None:
+        transcript.segments[pii_segment].words[1].is_pii = True
+    transcript.add_segment(100.0, 101.0, " 단어 없음")
+    return transcript
+
+
+def test_round_trip_across_parts(tmp_path):
+    first = [_transcript("a.wav", pii_segment=1), _transcript("b.wav", channel=1)]
+    second = [_transcript("c.wav", segments=5, pii_segment=4)]
+    dataset = str(tmp_path / "words")
+    write_word_table(first, dataset, row_group_size=4)
+    write_word_table(second, dataset, row_group_size=4)
+
+    table = WordTable(dataset)
+    assert len(table.parts) == 2 and len(table) == 22
+    assert [Path(path).name for path in table.files] == ["a.wav", "b.wav", "c.wav"]
+    assert isinstance(table.parts[0].column("start"), np.memmap)
+
+    for original in first + second:
+        restored = table.load_transcript(original.file_name)
+        assert restored.to_dict() == original.to_dict()
+    with pytest.raises(KeyError):
+        table.load_transcript("missing.wav")
+
+
+def test_select_filters_and_skips_row_groups(tmp_path, monkeypatch):
+    dataset = str(tmp_path / "words")
+    write_word_table([_transcript("a.wav", pii_segment=1), _transcript("b.wav"),
+                      _transcript("c.wav", segments=5, pii_segment=4)], dataset, row_group_size=4)
+    table = WordTable(dataset)
+
+    pii = table.select(is_pii=True)
+    assert [Path(table.files[index]).name for index in pii["file"]] == ["a.wav", "c.wav"]
+    assert pii["text"].tolist() == [" 공일공", " 공일공"]
+    assert pii["segment"].tolist() == [1, 4] and pii["start"].tolist() == [11.0, 41.0]
+
+    in_range = table.select(files=["c.wav"], start=15.0, end=30.0, columns=("segment", "end"))
+    assert set(in_range) == {"segment", "end"}
+    assert in_range["segment"].tolist() == [2, 2] and in_range["end"].tolist() == [21.0, 25.0]
+
+    # 행 그룹 통계로 제외되는 그룹은 열을 읽지 않음 (PII가 있는 그룹 2개만 읽음)
+    part = table.parts[0]
+    sliced = []
+    column = part.column
+
+    def tracking_column(name):
+        values = column(name)
+        if name == "is_pii":
+            class Tracker:
+                def __getitem__(self, key):
+                    sliced.append(key)
+                    return values[key]
+            return Tracker()
+        return values
+
+    monkeypatch.setattr(part, "column", tracking_column)
+    table.select(is_pii=True, columns=("start",))
+    assert len(sliced) == 2 < len(part.row_groups)
+
+    with pytest.raises(ValueError):
+        table.select(columns=("duration",))
+
+
+def test_convert_json_directory(tmp_path):
+    json_dir = tmp_path / "processed"
+    json_dir.mkdir()
+    for name in ("a.wav", "b.wav", "c.wav"):
+        _transcript(name, pii_segment=0).save_to_json(str(json_dir))
+
+    parts = convert_json_directory(str(json_dir), str(tmp_path / "words"), files_per_part=2)
+    table = WordTable(str(tmp_path / "words"))
+
+    assert [Path(path).name for path in parts] == ["part-00000", "part-00001"]
+    assert len(table.files) == 3 and table.select(is_pii=True, columns=("file",))["file"].tolist() == [0, 1, 2]
+    assert word_table.WordTable(parts[1]).files == table.files[2:]